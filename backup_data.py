@@ -6,8 +6,11 @@ import os
 import shutil
 from datetime import datetime
 
+from common import backup
+from common.config import BACKUP_DIR
+
 def backup_database():
-    """데이터베이스 파일을 백업"""
+    """데이터베이스 파일을 백업 (봇 실행 중에도 안전한 온라인 백업)"""
     db_file = 'bot_data.db'
     json_file = 'data.json'
     
@@ -16,22 +19,17 @@ def backup_database():
         return
     
     # 백업 폴더 생성
-    backup_dir = 'backups'
-    if not os.path.exists(backup_dir):
-        os.makedirs(backup_dir)
-    
-    # 타임스탬프 추가한 백업 파일명
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    if not os.path.exists(BACKUP_DIR):
+        os.makedirs(BACKUP_DIR)
     
     if os.path.exists(db_file):
-        backup_name = f'bot_data_backup_{timestamp}.db'
-        backup_path = os.path.join(backup_dir, backup_name)
-        shutil.copy2(db_file, backup_path)
+        backup_path = backup.backup_database()
         print(f"✅ 데이터베이스 백업 완료: {backup_path}")
     
     if os.path.exists(json_file):
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         backup_name = f'data_backup_{timestamp}.json'
-        backup_path = os.path.join(backup_dir, backup_name)
+        backup_path = os.path.join(BACKUP_DIR, backup_name)
         shutil.copy2(json_file, backup_path)
         print(f"✅ JSON 데이터 백업 완료: {backup_path}")
 
@@ -41,12 +39,17 @@ def restore_database(backup_file):
         print(f"❌ 백업 파일을 찾을 수 없습니다: {backup_file}")
         return
     
-    if backup_file.endswith('.db'):
-        target = 'bot_data.db'
+    if backup_file.endswith('.db') or backup_file.endswith('.db.gz'):
+        # integrity_check 통과 후에만 교체
+        if backup.restore_database(backup_file):
+            print("✅ 데이터 복원 완료: bot_data.db")
+        else:
+            print("❌ 백업 파일 검증(integrity_check)에 실패해 복원하지 않았습니다.")
+        return
     elif backup_file.endswith('.json'):
         target = 'data.json'
     else:
-        print("❌ 지원하지 않는 파일 형식입니다. (.db 또는 .json)")
+        print("❌ 지원하지 않는 파일 형식입니다. (.db, .db.gz 또는 .json)")
         return
     
     # 기존 파일 백업 (덮어쓰기 전)
@@ -59,10 +62,31 @@ def restore_database(backup_file):
     shutil.copy2(backup_file, target)
     print(f"✅ 데이터 복원 완료: {target}")
 
+def import_json(json_file):
+    """JSON 데이터(data.json 또는 JSON 백업)를 SQLite에 한 번에 가져오기"""
+    if not os.path.exists(json_file):
+        print(f"❌ JSON 파일을 찾을 수 없습니다: {json_file}")
+        return
+    
+    import json
+    from common import database
+    
+    with open(json_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    database.init_database()
+    result = database.import_data(data)
+    elapsed = result.pop('elapsed')
+    summary = ", ".join(f"{table} {count}" for table, count in result.items())
+    print(f"✅ 가져오기 완료 ({elapsed:.2f}초): {summary}")
+
 if __name__ == '__main__':
     import sys
     
-    if len(sys.argv) > 1:
+    if len(sys.argv) > 2 and sys.argv[1] == '--import':
+        # JSON -> SQLite 가져오기 모드
+        import_json(sys.argv[2])
+    elif len(sys.argv) > 1:
         # 복원 모드
         restore_database(sys.argv[1])
     else:
@@ -71,4 +95,6 @@ if __name__ == '__main__':
         print("\n💡 사용법:")
         print("  백업: python backup_data.py")
         print("  복원: python backup_data.py <백업파일경로>")
+        print("  가져오기: python backup_data.py --import <JSON파일경로>")
+        print("  (봇 실행 중에도 백업 가능, 복원은 봇을 종료한 뒤 실행)")
 
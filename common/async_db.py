@@ -0,0 +1,221 @@
+"""
+비동기 데이터베이스 접근 계층
+common.database의 동기 함수들을 전용 스레드에서 실행해 Discord 이벤트 루프(하트비트/인터랙션)를 막지 않도록 한다.
+
+- 쓰기 함수(_write): 쓰기 전용 스레드 1개에서 순서대로 실행
+- 읽기 함수(_read): 읽기 스레드 풀에서 실행
+- 메모리 캐시(common.table_cache)로 처리되는 조회: 캐시가 채워져 있으면 바로 실행
+
+Usage:
+    from common import async_db
+    users = await async_db.get_role_users(role_name)
+"""
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, ParamSpec, TypeVar
+
+from common import database
+from common import utils
+from common.config import DB_READER_POOL_SIZE
+
+_writer_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='db-writer')
+_reader_executor = ThreadPoolExecutor(max_workers=DB_READER_POOL_SIZE, thread_name_prefix='db-reader')
+
+
+async def run_read(func, *args, **kwargs):
+    """동기 읽기 함수를 읽기 스레드 풀에서 실행"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_reader_executor, functools.partial(func, *args, **kwargs))
+
+
+async def run_write(func, *args, **kwargs):
+    """동기 쓰기 함수를 쓰기 전용 스레드에서 실행"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_writer_executor, functools.partial(func, *args, **kwargs))
+
+
+P = ParamSpec('P')
+R = TypeVar('R')
+
+
+def _make_async(func: Callable[P, R], runner) -> Callable[P, Awaitable[R]]:
+    cache = getattr(func, 'table_cache', None)
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        # 메모리 캐시만 읽는 함수는 캐시가 채워져 있으면 스레드 전환 없이 바로 실행
+        if cache is not None and cache.is_loaded:
+            return func(*args, **kwargs)
+        return await runner(func, *args, **kwargs)
+
+    return wrapper
+
+
+def _read(func: Callable[P, R]) -> Callable[P, Awaitable[R]]:
+    """읽기 스레드 풀에서 실행하는 비동기 버전 (읽기 전용 연결만 쓰는 함수)"""
+    return _make_async(func, run_read)
+
+
+def _write(func: Callable[P, R]) -> Callable[P, Awaitable[R]]:
+    """쓰기 전용 스레드에서 실행하는 비동기 버전 (get_connection()을 쓰는 함수)"""
+    return _make_async(func, run_write)
+
+
+# ==================== 비동기 버전 선언 ====================
+# common.database의 공개 함수를 읽기/쓰기 중 어디서 실행할지 이름이 아니라 여기서 명시한다.
+# database에 함수를 추가하면 여기에도 _read/_write로 추가해야 async_db에서 쓸 수 있다.
+# (연결 관리/스키마 함수 get_connection, init_database, migrate_database, reset_database 등은 제외)
+
+# 스키마 마이그레이션
+get_schema_version = _read(database.get_schema_version)
+
+# 사용자 관리
+get_user = _read(database.get_user)
+create_or_update_user = _write(database.create_or_update_user)
+get_user_by_boj_handle = _read(database.get_user_by_boj_handle)
+
+# 역할 관리
+get_role_token = _read(database.get_role_token)
+save_role_token = _write(database.save_role_token)
+get_all_role_tokens = _read(database.get_all_role_tokens)
+delete_role_token = _write(database.delete_role_token)
+
+# 사용자 역할 관리
+add_user_role = _write(database.add_user_role)
+remove_user_role = _write(database.remove_user_role)
+get_user_roles = _read(database.get_user_roles)
+get_role_users = _read(database.get_role_users)
+
+# 블로그 링크 관리
+add_blog_link = _write(database.add_blog_link)
+get_user_blog_links = _read(database.get_user_blog_links)
+
+# 스터디 관리
+create_study = _write(database.create_study)
+get_study = _read(database.get_study)
+
+# 과제 관리
+create_assignment = _write(database.create_assignment)
+get_assignment = _read(database.get_assignment)
+get_study_assignments = _read(database.get_study_assignments)
+update_assignment = _write(database.update_assignment)
+delete_assignment = _write(database.delete_assignment)
+
+# 제출 관리
+add_submission = _write(database.add_submission)
+get_user_submissions = _read(database.get_user_submissions)
+get_study_submissions = _read(database.get_study_submissions)
+
+# 주간 현황 메시지 관리
+save_weekly_status_message = _write(database.save_weekly_status_message)
+save_group_weekly_status = _write(database.save_group_weekly_status)
+get_group_weekly_status = _read(database.get_group_weekly_status)
+get_group_weekly_status_by_message = _read(database.get_group_weekly_status_by_message)
+get_all_group_weekly_status = _read(database.get_all_group_weekly_status)
+delete_group_weekly_status = _write(database.delete_group_weekly_status)
+
+# 문제집 과제 상태 관리
+save_group_problem_set_status = _write(database.save_group_problem_set_status)
+get_group_problem_set_status = _read(database.get_group_problem_set_status)
+get_all_group_problem_set_status = _read(database.get_all_group_problem_set_status)
+get_group_problem_set_statuses = _read(database.get_group_problem_set_statuses)
+get_group_problem_set_status_by_message = _read(database.get_group_problem_set_status_by_message)
+delete_group_problem_set_status = _write(database.delete_group_problem_set_status)
+
+# 문제집 과제 진행 상황
+get_problem_set_progress = _read(database.get_problem_set_progress)
+save_problem_set_progress = _write(database.save_problem_set_progress)
+
+# 모의테스트 과제 상태 관리
+save_group_mock_test_status = _write(database.save_group_mock_test_status)
+get_group_mock_test_status = _read(database.get_group_mock_test_status)
+get_all_group_mock_test_status = _read(database.get_all_group_mock_test_status)
+get_group_mock_test_statuses = _read(database.get_group_mock_test_statuses)
+get_group_mock_test_status_by_message = _read(database.get_group_mock_test_status_by_message)
+delete_group_mock_test_status = _write(database.delete_group_mock_test_status)
+
+# 전체과제현황 관리
+save_group_all_assignment_status = _write(database.save_group_all_assignment_status)
+get_group_all_assignment_status = _read(database.get_group_all_assignment_status)
+get_group_all_assignment_status_by_message = _read(database.get_group_all_assignment_status_by_message)
+get_all_group_all_assignment_status = _read(database.get_all_group_all_assignment_status)
+delete_group_all_assignment_status = _write(database.delete_group_all_assignment_status)
+
+# 전체과제현황 표
+get_assignment_status_matrix = _read(database.get_assignment_status_matrix)
+replace_assignment_status_matrix = _write(database.replace_assignment_status_matrix)
+save_assignment_status_column = _write(database.save_assignment_status_column)
+
+# 그룹 주간 링크 제출 관리
+save_group_link_submission_status = _write(database.save_group_link_submission_status)
+get_group_link_submission_status = _read(database.get_group_link_submission_status)
+get_group_link_submission_status_by_message = _read(database.get_group_link_submission_status_by_message)
+get_all_group_link_submission_status = _read(database.get_all_group_link_submission_status)
+delete_group_link_submission_status = _write(database.delete_group_link_submission_status)
+save_link_submission = _write(database.save_link_submission)
+get_link_submissions = _read(database.get_link_submissions)
+get_user_link_submission = _read(database.get_user_link_submission)
+get_link_submission_counts = _read(database.get_link_submission_counts)
+delete_link_submissions_by_week = _write(database.delete_link_submissions_by_week)
+delete_all_link_submissions_by_group = _write(database.delete_all_link_submissions_by_group)
+
+# 문제집 관리
+create_problem_set = _write(database.create_problem_set)
+get_problem_set = _read(database.get_problem_set)
+get_all_problem_sets = _read(database.get_all_problem_sets)
+get_problem_sets_containing = _read(database.get_problem_sets_containing)
+update_problem_set = _write(database.update_problem_set)
+delete_problem_set = _write(database.delete_problem_set)
+
+# 모의테스트 관리
+create_mock_test = _write(database.create_mock_test)
+get_mock_test = _read(database.get_mock_test)
+get_all_mock_tests = _read(database.get_all_mock_tests)
+get_mock_tests_containing = _read(database.get_mock_tests_containing)
+update_mock_test = _write(database.update_mock_test)
+delete_mock_test = _write(database.delete_mock_test)
+get_weekly_status_message = _read(database.get_weekly_status_message)
+delete_weekly_status_message = _write(database.delete_weekly_status_message)
+
+# 상태 메시지 편집 기록
+get_message_render_state = _read(database.get_message_render_state)
+save_message_render_state = _write(database.save_message_render_state)
+
+# 스케줄러 작업 실행 기록
+get_scheduler_job_runs = _read(database.get_scheduler_job_runs)
+save_scheduler_job_run = _write(database.save_scheduler_job_run)
+
+# solved.ac 히스토리 캐시
+get_solved_history_cache = _read(database.get_solved_history_cache)
+save_solved_history_cache = _write(database.save_solved_history_cache)
+
+# 해결한 문제 인덱스
+get_solved_problem_index = _read(database.get_solved_problem_index)
+save_solved_problem_index = _write(database.save_solved_problem_index)
+
+# 문제 정보 캐시
+get_problem_metadata = _read(database.get_problem_metadata)
+save_problem_metadata = _write(database.save_problem_metadata)
+
+# 주간 결과 기록
+record_weekly_snapshot = _write(database.record_weekly_snapshot)
+record_problem_set_snapshot = _write(database.record_problem_set_snapshot)
+get_snapshot_weeks = _read(database.get_snapshot_weeks)
+get_weekly_snapshot = _read(database.get_weekly_snapshot)
+get_season_totals = _read(database.get_season_totals)
+get_member_history = _read(database.get_member_history)
+
+# 호환성 함수 (기존 JSON 방식과 호환) - load_*/save_data는 JSON 폴백이 있는 common.utils 버전을 사용
+load_users = _read(utils.load_users)
+load_role_tokens = _read(utils.load_role_tokens)
+load_studies = _read(utils.load_studies)
+load_data = _read(utils.load_data)
+import_data = _write(database.import_data)
+save_data = _write(utils.save_data)
+
+
+def shutdown():
+    """실행 중인 DB 작업을 마치고 스레드 종료"""
+    _writer_executor.shutdown(wait=True)
+    _reader_executor.shutdown(wait=True)
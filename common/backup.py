@@ -0,0 +1,202 @@
+"""
+SQLite 온라인 백업
+봇을 멈추지 않고 sqlite3 backup API로 일정 페이지씩 나눠 복사한다. (단계 사이에 쉬어서 봇 쓰기를 막지 않음)
+
+- 결과는 gzip 압축(선택), 보관 개수를 넘는 오래된 백업은 삭제
+- 복원 전에는 integrity_check로 백업 파일을 검증한 뒤 교체
+- 봇 안에서는 통합 스케줄러(db_backup 작업)로 매일 자동 백업, 밖에서는 backup_data.py로 실행
+"""
+import asyncio
+import glob
+import gzip
+import os
+import shutil
+import sqlite3
+from datetime import datetime
+from typing import List, Optional
+
+from common.config import (
+    BACKUP_DIR, BACKUP_KEEP, BACKUP_COMPRESS, BACKUP_PAGES_PER_STEP, BACKUP_STEP_SLEEP, BACKUP_HOUR,
+)
+from common.database import DB_FILE
+from common.logger import get_logger
+
+logger = get_logger()
+
+BACKUP_PREFIX = 'bot_data_backup_'
+
+
+def _integrity_check(db_path: str) -> str:
+    """PRAGMA integrity_check 결과 ('ok'면 정상)"""
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute('PRAGMA integrity_check').fetchall()
+    finally:
+        conn.close()
+    return '\n'.join(str(row[0]) for row in rows)
+
+
+def _gzip_file(src: str, dest: str):
+    with open(src, 'rb') as f_in, gzip.open(dest, 'wb', compresslevel=6) as f_out:
+        shutil.copyfileobj(f_in, f_out, 1024 * 1024)
+
+
+def _gunzip_file(src: str, dest: str):
+    with gzip.open(src, 'rb') as f_in, open(dest, 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out, 1024 * 1024)
+
+
+def backup_database(backup_dir: str = BACKUP_DIR, compress: bool = BACKUP_COMPRESS,
+                    keep: Optional[int] = BACKUP_KEEP) -> Optional[str]:
+    """
+    DB 파일을 온라인 백업
+
+    Args:
+        backup_dir: 백업 폴더
+        compress: gzip 압축 여부
+        keep: 보관할 최근 백업 수 (None이면 정리하지 않음)
+
+    Returns:
+        백업 파일 경로 (DB 파일이 없으면 None)
+    """
+    if not os.path.exists(DB_FILE):
+        return None
+    os.makedirs(backup_dir, exist_ok=True)
+
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    db_path = os.path.join(backup_dir, f'{BACKUP_PREFIX}{timestamp}.db')
+    # 같은 초에 여러 번 백업하면 _1, _2 ... (이름순 정렬이 시간순과 같도록)
+    sequence = 0
+    while os.path.exists(db_path) or os.path.exists(db_path + '.gz'):
+        sequence += 1
+        db_path = os.path.join(backup_dir, f'{BACKUP_PREFIX}{timestamp}_{sequence}.db')
+    tmp_path = db_path + '.tmp'
+
+    started = datetime.now()
+    src = sqlite3.connect(DB_FILE)
+    dest = sqlite3.connect(tmp_path)
+    try:
+        # 한 번에 BACKUP_PAGES_PER_STEP 페이지씩 복사하고 단계 사이에 잠금을 풀어 둠
+        src.backup(dest, pages=BACKUP_PAGES_PER_STEP, sleep=BACKUP_STEP_SLEEP)
+    except Exception:
+        dest.close()
+        src.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    dest.close()
+    src.close()
+
+    if compress:
+        final_path = db_path + '.gz'
+        _gzip_file(tmp_path, final_path + '.tmp')
+        os.remove(tmp_path)
+        os.replace(final_path + '.tmp', final_path)
+    else:
+        final_path = db_path
+        os.replace(tmp_path, final_path)
+
+    elapsed = (datetime.now() - started).total_seconds()
+    logger.info(f"[DB 백업] 완료: {final_path} ({os.path.getsize(final_path):,} bytes, {elapsed:.1f}초)")
+
+    if keep is not None:
+        prune_backups(backup_dir, keep)
+    return final_path
+
+
+def list_backups(backup_dir: str = BACKUP_DIR) -> List[str]:
+    """백업 파일 목록 (오래된 것부터)"""
+    paths = glob.glob(os.path.join(backup_dir, f'{BACKUP_PREFIX}*.db')) + \
+        glob.glob(os.path.join(backup_dir, f'{BACKUP_PREFIX}*.db.gz'))
+    # 파일 이름에 타임스탬프가 있으므로 이름순 = 시간순
+    return sorted(paths, key=os.path.basename)
+
+
+def prune_backups(backup_dir: str = BACKUP_DIR, keep: int = BACKUP_KEEP) -> List[str]:
+    """최근 keep개만 남기고 오래된 백업 삭제, 삭제한 경로 반환"""
+    backups = list_backups(backup_dir)
+    removed = backups[:-keep] if keep > 0 else backups
+    for path in removed:
+        try:
+            os.remove(path)
+        except OSError as e:
+            logger.warning(f"[DB 백업] 오래된 백업 삭제 실패: {path} ({e})")
+    if removed:
+        logger.info(f"[DB 백업] 오래된 백업 {len(removed)}개 삭제")
+    return removed
+
+
+def restore_database(backup_file: str, target: str = DB_FILE) -> bool:
+    """
+    백업 파일(.db 또는 .db.gz)로 DB 복원
+
+    integrity_check를 통과한 경우에만 교체하며, 기존 파일은 .old_<시각>으로 남긴다.
+    봇이 실행 중이면 먼저 종료해야 한다.
+
+    Returns:
+        복원 성공 여부
+    """
+    if not os.path.exists(backup_file):
+        logger.error(f"[DB 복원] 백업 파일을 찾을 수 없습니다: {backup_file}")
+        return False
+
+    tmp_path = target + '.restore.tmp'
+    if backup_file.endswith('.gz'):
+        _gunzip_file(backup_file, tmp_path)
+    else:
+        shutil.copy2(backup_file, tmp_path)
+
+    try:
+        result = _integrity_check(tmp_path)
+    except sqlite3.DatabaseError as e:
+        result = str(e)
+    if result != 'ok':
+        os.remove(tmp_path)
+        logger.error(f"[DB 복원] integrity_check 실패, 복원하지 않습니다: {result}")
+        return False
+
+    # 열려 있는 연결/캐시 정리 후 교체
+    from common.database import close_all_connections
+    close_all_connections()
+
+    if os.path.exists(target):
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        old_backup = f'{target}.old_{timestamp}'
+        # WAL에 남은 변경까지 합친 뒤 보관
+        try:
+            conn = sqlite3.connect(target)
+            conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"[DB 복원] 기존 DB WAL 체크포인트 실패: {e}")
+        shutil.copy2(target, old_backup)
+        logger.info(f"[DB 복원] 기존 파일을 백업했습니다: {old_backup}")
+
+    # 이전 DB의 WAL/SHM이 새 파일에 적용되지 않도록 제거
+    for suffix in ('-wal', '-shm'):
+        if os.path.exists(target + suffix):
+            os.remove(target + suffix)
+    os.replace(tmp_path, target)
+    logger.info(f"[DB 복원] 완료: {backup_file} -> {target}")
+    return True
+
+
+async def backup_database_async(**kwargs) -> Optional[str]:
+    """이벤트 루프를 막지 않도록 별도 스레드에서 백업"""
+    return await asyncio.to_thread(backup_database, **kwargs)
+
+
+# ==================== 자동 백업 스케줄 ====================
+
+async def daily_database_backup(slot=None):
+    """매일 자동 백업"""
+    try:
+        await backup_database_async()
+    except Exception as e:
+        logger.error(f"[DB 백업] 자동 백업 실패: {e}", exc_info=True)
+
+
+def register_scheduled_jobs(bot_instance=None):
+    """매일 BACKUP_HOUR:30 (KST) 자동 백업 작업 등록"""
+    from common.scheduler import register_job
+    register_job('db_backup', run=daily_database_backup, hours=[BACKUP_HOUR], minute=30, priority=9, spread=0)
@@ -6,8 +6,25 @@ from bs4 import BeautifulSoup
 import re
 import os
 import asyncio
-from typing import List, Dict, Optional
-from datetime import datetime, timedelta, timezone
+import copy
+import functools
+import time
+from typing import Any, Callable, List, Dict, Optional
+from datetime import datetime
+
+from common.config import (
+    SINGLE_FLIGHT_RESULT_TTL,
+    SOLVED_AC_SEARCH_PAGE_SIZE,
+    SOLVED_AC_SEARCH_MAX_PAGES,
+    SOLVED_AC_SEARCH_ID_CHUNK,
+)
+from common import async_db
+from common.http_client import http_get
+from common.circuit_breaker import CircuitOpenError, is_available
+from common.history_cache import SolvedHistory, get_cached_history, store_history
+from common.problem_meta import get_problem_metadata
+from common.solved_index import SolvedIndex, load_solved_index, save_solved_index
+from common import rate_limiter
 
 # 로거 가져오기
 try:
@@ -22,6 +39,9 @@ except ImportError:
         logger.addHandler(handler)
         logger.setLevel(logging.INFO)
 
+# 서버 연결 실패로 처리하는 오류 (서킷 브레이커가 open이라 요청하지 않은 경우 포함)
+_CONNECTION_ERRORS = (aiohttp.ClientConnectorError, aiohttp.ServerTimeoutError, asyncio.TimeoutError, CircuitOpenError)
+
 # solved.ac tier 매핑 (숫자 -> 이름)
 TIER_MAPPING = {
     0: "Unrated",
@@ -107,21 +127,91 @@ def number_to_tier_short(tier_num: int) -> str:
     
     return f"{tier_letter}{level}"
 
+# ==================== 동일 요청 합치기 (single-flight) ====================
+
+# 진행 중인 요청: key -> asyncio.Task
+_inflight_requests: Dict[tuple, asyncio.Task] = {}
+# 방금 끝난 요청 결과: key -> (만료 시각, 결과)
+_recent_results: Dict[tuple, tuple] = {}
+
+
+def _freeze(value):
+    """캐시 키로 쓸 수 있도록 리스트/셋/딕셔너리를 해시 가능한 형태로 변환"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(value))
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def single_flight(func=None, *, copy_result: bool = True, cache_if: Optional[Callable[[Any], bool]] = None):
+    """
+    같은 (함수, 인자) 조회를 하나의 요청으로 합치는 데코레이터
+
+    - 동시에 들어온 같은 호출은 진행 중인 요청 하나의 결과를 공유
+    - 요청이 끝난 뒤 SINGLE_FLIGHT_RESULT_TTL초 안에 들어온 같은 호출도 그 결과를 재사용
+      (정각에 그룹 주간 현황 -> 전체 과제 현황이 같은 핸들/기간을 연달아 조회하는 경우)
+    - 예외로 끝난 요청이나 cache_if(결과)가 False인 결과(조회 실패를 뜻하는 None 등)는 재사용하지 않음
+    - 결과는 호출자마다 복사본을 돌려주므로 호출자가 수정해도 다른 호출자에 영향 없음
+      (copy_result=False면 읽기 전용 객체를 그대로 공유)
+
+    Usage:
+        @single_flight
+        async def f(...): ...
+
+        @single_flight(copy_result=False, cache_if=lambda result: result is not None)
+        async def g(...): ...
+    """
+    if func is None:
+        return functools.partial(single_flight, copy_result=copy_result, cache_if=cache_if)
+
+    copy_fn = copy.deepcopy if copy_result else (lambda value: value)
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        key = (func.__name__, _freeze(args), _freeze(kwargs))
+        now = time.monotonic()
+
+        cached = _recent_results.get(key)
+        if cached is not None:
+            if cached[0] > now:
+                return copy_fn(cached[1])
+            del _recent_results[key]
+
+        task = _inflight_requests.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            _inflight_requests[key] = task
+
+            def _on_done(t, key=key):
+                _inflight_requests.pop(key, None)
+                if t.cancelled() or t.exception() is not None or SINGLE_FLIGHT_RESULT_TTL <= 0:
+                    return
+                if cache_if is not None and not cache_if(t.result()):
+                    return
+                done_at = time.monotonic()
+                # 만료된 결과 정리
+                for k in [k for k, (expires, _) in _recent_results.items() if expires <= done_at]:
+                    del _recent_results[k]
+                _recent_results[key] = (done_at + SINGLE_FLIGHT_RESULT_TTL, t.result())
+
+            task.add_done_callback(_on_done)
+
+        # 한 호출자가 취소되어도 공유 중인 요청은 계속 진행
+        result = await asyncio.shield(task)
+        return copy_fn(result)
+
+    return wrapper
+
+@single_flight
 async def get_problem_tier(problem_id: int) -> Optional[int]:
-    """문제의 티어 정보 가져오기 (solved.ac)"""
+    """문제의 티어 정보 가져오기 (solved.ac, 문제 정보 캐시 사용)"""
     try:
-        url = f"https://solved.ac/api/v3/problem/show?problemId={problem_id}"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        async with aiohttp.ClientSession(headers=headers) as session:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    level = data.get('level', 0)
-                    return level
-        return None
+        metadata = await get_problem_metadata([problem_id])
+        meta = metadata.get(int(problem_id))
+        return meta['level'] if meta else None
     except Exception as e:
         print(f"티어 정보 가져오기 오류: {e}")
         return None
@@ -134,34 +224,112 @@ async def get_user_solved_problems(baekjoon_id: str, start_date: datetime = None
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         
-        async with aiohttp.ClientSession(headers=headers) as session:
-            async with session.get(url) as response:
-                if response.status != 200:
-                    return []
+        async with http_get(url, headers=headers) as response:
+            if response.status != 200:
+                return []
                 
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
+            html = await response.text()
+            soup = BeautifulSoup(html, 'html.parser')
                 
-                # 해결한 문제 목록 추출
-                solved_problems = []
-                problem_panels = soup.find_all('div', class_='problem-list')
+            # 해결한 문제 목록 추출
+            solved_problems = []
+            problem_panels = soup.find_all('div', class_='problem-list')
                 
-                for panel in problem_panels:
-                    problem_links = panel.find_all('a', href=re.compile(r'/problem/\d+'))
-                    for link in problem_links:
-                        problem_id = int(re.search(r'/problem/(\d+)', link['href']).group(1))
-                        solved_problems.append(problem_id)
+            for panel in problem_panels:
+                problem_links = panel.find_all('a', href=re.compile(r'/problem/\d+'))
+                for link in problem_links:
+                    problem_id = int(re.search(r'/problem/(\d+)', link['href']).group(1))
+                    solved_problems.append(problem_id)
                 
-                # 날짜 필터링이 필요한 경우 (추후 구현)
-                # 현재는 전체 목록 반환
-                return solved_problems
+            # 날짜 필터링이 필요한 경우 (추후 구현)
+            # 현재는 전체 목록 반환
+            return solved_problems
     except Exception as e:
         print(f"해결한 문제 목록 가져오기 오류: {e}")
         return []
 
+@single_flight
 async def get_user_solved_problems_from_solved_ac(baekjoon_id: str, target_problems: List[int] = None) -> List[int]:
     """
-    solved.ac에서 사용자가 해결한 문제 목록 가져오기
+    solved.ac에서 사용자가 해결한 문제 목록 가져오기 (로컬 인덱스 우선)
+    
+    핸들별 해결한 문제 인덱스(solved_problem_index)를 solvedCount로 검증해서 사용한다.
+    - solvedCount가 인덱스 동기화 시점과 같으면 네트워크 요청 없이 집합 연산으로 응답
+    - 달라졌으면 target_problems 중 아직 해결 기록이 없는 문제만 solved.ac에서 확인
+    - 인덱스가 없거나 전체 재수집 간격(SOLVED_INDEX_FULL_SYNC_INTERVAL)이 지났으면 전체 목록을 다시 수집
+    solved.ac 목록은 푼 시각 순이 아니라서 "이미 아는 문제가 나올 때까지만" 읽는 방식은 쓸 수 없다.
+    
+    Args:
+        baekjoon_id: 백준 아이디
+        target_problems: 확인할 문제 번호 리스트 (None이면 전체 가져오기)
+    
+    Returns:
+        해결한 문제 번호 리스트
+    """
+    try:
+        current_count = await get_user_solved_count(baekjoon_id)
+    except Exception as e:
+        logger.warning(f"[solved.ac 인덱스] {baekjoon_id} - solvedCount 조회 실패: {e}")
+        current_count = None
+    if current_count is None:
+        # solvedCount를 모르면 인덱스가 최신인지 알 수 없으므로 기존 방식으로 조회
+        return await _fetch_solved_problems(baekjoon_id, target_problems)
+    
+    try:
+        index = await async_db.run_read(load_solved_index, baekjoon_id)
+    except Exception as e:
+        logger.error(f"[solved.ac 인덱스] {baekjoon_id} - 인덱스 로드 오류: {e}")
+        return await _fetch_solved_problems(baekjoon_id, target_problems)
+    
+    if index is not None and index.is_up_to_date(current_count):
+        return index.filter(target_problems)
+    
+    need_full_sync = (
+        index is None
+        or target_problems is None
+        or (index.synced_count is not None and current_count < index.synced_count)  # 재채점 등으로 감소
+        or index.full_sync_due()
+    )
+    
+    if need_full_sync:
+        problems = await _fetch_solved_problems(baekjoon_id)
+        if not problems and current_count > 0:
+            # 수집 실패 - 해결 기록은 사라지지 않으므로 기존 인덱스로 응답
+            return index.filter(target_problems) if index else []
+        complete = len(problems) >= current_count
+        known = set(problems)
+        if not complete and index is not None:
+            known |= index.problems
+        index = SolvedIndex(known, current_count if complete else None, time.time())
+        logger.info(f"[solved.ac 인덱스] {baekjoon_id} - 전체 수집 {len(problems)}/{current_count}개")
+    else:
+        # 증분 확인: 아직 해결 기록이 없는 목표 문제만 조회
+        unknown = [p for p in target_problems if p not in index.problems]
+        found = await _fetch_solved_problems(baekjoon_id, unknown) if unknown else []
+        index.problems.update(found)
+        if index.synced_count is not None and len(found) >= current_count - index.synced_count:
+            # 늘어난 만큼 모두 찾았으면 인덱스가 다시 빠짐없는 상태
+            index.synced_count = current_count
+        logger.debug(f"[solved.ac 인덱스] {baekjoon_id} - 미확인 {len(unknown)}개 중 {len(found)}개 새로 해결")
+    
+    try:
+        await async_db.run_write(save_solved_index, baekjoon_id, index)
+    except Exception as e:
+        logger.error(f"[solved.ac 인덱스] {baekjoon_id} - 인덱스 저장 오류: {e}")
+    return index.filter(target_problems)
+
+
+async def get_user_solved_count(baekjoon_id: str) -> Optional[int]:
+    """현재 solvedCount (캐시된 히스토리의 최신 누적값, 조회 실패 시 None)"""
+    history = await get_solved_history(baekjoon_id)
+    if history is None:
+        return None
+    return history.latest_count()
+
+
+async def _fetch_solved_problems(baekjoon_id: str, target_problems: List[int] = None) -> List[int]:
+    """
+    solved.ac에서 직접 해결한 문제 목록 가져오기 (인덱스를 거치지 않음)
     
     Args:
         baekjoon_id: 백준 아이디
@@ -178,7 +346,13 @@ async def get_user_solved_problems_from_solved_ac(baekjoon_id: str, target_probl
             'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
         }
         
-        # target_problems가 제공되면 문제 검색 API 사용 (더 효율적)
+        # JSON 검색 API 우선 (HTML 페이지보다 훨씬 작고 DOM 파싱이 필요 없음)
+        json_result = await _search_solved_problems_json(baekjoon_id, target_problems)
+        if json_result is not None:
+            return json_result
+        logger.info(f"[solved.ac 크롤링] {baekjoon_id} - JSON 검색 API 실패, HTML 크롤링으로 폴백")
+        
+        # target_problems가 제공되면 문제 검색 페이지 사용 (더 효율적)
         # 예: https://solved.ac/problems?query=s%40beans3142+1000%7C1001%7C1002
         if target_problems and len(target_problems) <= 50:  # URL 길이 제한 고려
             return await _check_problems_via_search_api(baekjoon_id, target_problems, headers)
@@ -186,7 +360,7 @@ async def get_user_solved_problems_from_solved_ac(baekjoon_id: str, target_probl
         # 전체 목록이 필요하거나 문제가 많으면 페이지 크롤링 사용
         return await _get_all_solved_problems_via_pages(baekjoon_id, target_problems, headers)
                 
-    except (aiohttp.ClientConnectorError, aiohttp.ServerTimeoutError, asyncio.TimeoutError) as e:
+    except _CONNECTION_ERRORS as e:
         logger.error(f"[solved.ac 크롤링] solved.ac 서버 연결 실패: {e} (서버 다운 가능성)")
         return []
     except Exception as e:
@@ -194,6 +368,95 @@ async def get_user_solved_problems_from_solved_ac(baekjoon_id: str, target_probl
         return []
 
 
+async def _search_problem_ids_json(query: str) -> Optional[List[int]]:
+    """
+    solved.ac JSON 검색 API로 query에 맞는 모든 문제 번호 가져오기
+    https://solved.ac/api/v3/search/problem?query={query}&page={page}&sort=id&direction=asc
+
+    첫 페이지의 count로 전체 페이지 수를 계산한 뒤 나머지 페이지를 동시에 요청한다.
+    (요청 속도는 rate_limiter가 호스트 단위로 제한)
+
+    Returns:
+        문제 번호 리스트, 요청 실패 시 None
+    """
+    import urllib.parse
+
+    encoded_query = urllib.parse.quote(query)
+
+    async def fetch_page(page: int) -> Optional[Dict]:
+        url = f"https://solved.ac/api/v3/search/problem?query={encoded_query}&page={page}&sort=id&direction=asc"
+        async with http_get(url, headers={'Accept': 'application/json'}, timeout=10) as response:
+            if response.status != 200:
+                logger.warning(f"[solved.ac 검색 API] HTTP {response.status} 에러: {url} (solved.ac 서버 문제 가능성)")
+                return None
+            return await response.json()
+
+    first = await fetch_page(1)
+    if first is None:
+        return None
+
+    total = int(first.get('count', 0))
+    pages = [first]
+    last_page = min(SOLVED_AC_SEARCH_MAX_PAGES, -(-total // SOLVED_AC_SEARCH_PAGE_SIZE))
+    if last_page > 1:
+        rest = await asyncio.gather(*(fetch_page(page) for page in range(2, last_page + 1)))
+        if any(data is None for data in rest):
+            return None
+        pages.extend(rest)
+
+    problem_ids = []
+    for data in pages:
+        for item in data.get('items', []):
+            problem_id = item.get('problemId')
+            if problem_id is not None:
+                problem_ids.append(int(problem_id))
+    return problem_ids
+
+
+async def _search_solved_problems_json(baekjoon_id: str, target_problems: List[int] = None) -> Optional[List[int]]:
+    """
+    solved.ac JSON 검색 API로 사용자가 해결한 문제 목록 가져오기
+
+    - target_problems가 없으면 s@{handle} 전체 목록
+    - 있으면 s@{handle} (id:1000|id:1001|...) 형태로 목표 문제만 나눠서 검색
+
+    Returns:
+        해결한 문제 번호 리스트 (정렬), 요청 실패 시 None (호출자는 HTML 크롤링으로 폴백)
+    """
+    try:
+        if not target_problems:
+            problem_ids = await _search_problem_ids_json(f"s@{baekjoon_id}")
+            if problem_ids is None:
+                return None
+            solved_problems = sorted(set(problem_ids))
+            logger.info(f"[solved.ac 검색 API] {baekjoon_id} - 해결한 문제 {len(solved_problems)}개 발견 (JSON)")
+            return solved_problems
+
+        target_list = sorted(set(target_problems))
+        target_set = set(target_list)
+        solved_problems = set()
+        for i in range(0, len(target_list), SOLVED_AC_SEARCH_ID_CHUNK):
+            chunk = target_list[i:i + SOLVED_AC_SEARCH_ID_CHUNK]
+            id_filter = "|".join(f"id:{problem_id}" for problem_id in chunk)
+            problem_ids = await _search_problem_ids_json(f"s@{baekjoon_id} ({id_filter})")
+            if problem_ids is None:
+                return None
+            if len(problem_ids) > len(chunk):
+                # 쿼리가 의도와 다르게 해석됨 - 결과를 믿을 수 없으므로 폴백
+                logger.warning(f"[solved.ac 검색 API] {baekjoon_id} - id 필터 결과가 예상보다 많음 ({len(problem_ids)}>{len(chunk)})")
+                return None
+            solved_problems.update(problem_id for problem_id in problem_ids if problem_id in target_set)
+
+        logger.info(f"[solved.ac 검색 API] {baekjoon_id} - 목표 문제 중 {len(solved_problems)}/{len(target_set)}개 해결 (JSON)")
+        return sorted(solved_problems)
+    except _CONNECTION_ERRORS as e:
+        logger.error(f"[solved.ac 검색 API] solved.ac 서버 연결 실패: {e} (서버 다운 가능성)")
+        return None
+    except Exception as e:
+        logger.error(f"[solved.ac 검색 API] JSON 응답 처리 오류: {e}", exc_info=True)
+        return None
+
+
 async def check_problems_individual_queries(baekjoon_id: str, target_problems: List[int], headers: dict) -> List[int]:
     """
     각 문제마다 개별 query를 날려서 해결 여부 확인
@@ -209,64 +472,60 @@ async def check_problems_individual_queries(baekjoon_id: str, target_problems: L
         
         logger.info(f"[개별 문제 확인] {baekjoon_id} - {len(target_problems)}개 문제 개별 확인 시작")
         
-        timeout = aiohttp.ClientTimeout(total=10)
-        async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
-            for problem_id in target_problems:
-                # 각 문제마다 query: s@{handle}+{problem_id}
-                query = f"s@{baekjoon_id}+{problem_id}"
-                encoded_query = urllib.parse.quote(query)
-                url = f"https://solved.ac/problems?query={encoded_query}&page=1"
+        for problem_id in target_problems:
+            # 각 문제마다 query: s@{handle}+{problem_id}
+            query = f"s@{baekjoon_id}+{problem_id}"
+            encoded_query = urllib.parse.quote(query)
+            url = f"https://solved.ac/problems?query={encoded_query}&page=1"
                 
-                try:
-                    async with session.get(url) as response:
-                        if response.status != 200:
-                            logger.debug(f"[개별 문제 확인] {baekjoon_id} - 문제 {problem_id}: HTTP {response.status} (서버 문제 가능성)")
-                            await asyncio.sleep(0.2)
-                            continue
+            try:
+                async with http_get(url, headers=headers, timeout=10) as response:
+                    if response.status != 200:
+                        logger.debug(f"[개별 문제 확인] {baekjoon_id} - 문제 {problem_id}: HTTP {response.status} (서버 문제 가능성)")
+                        continue
                         
-                        html = await response.text()
-                        soup = BeautifulSoup(html, 'html.parser')
+                    html = await response.text()
+                    soup = BeautifulSoup(html, 'html.parser')
                         
-                        # "해당하는 문제가 없습니다" 메시지 확인
-                        no_problems_text = soup.find(string=re.compile(r'해당하는 문제가 없습니다|문제가 없습니다'))
-                        if no_problems_text:
-                            logger.debug(f"[개별 문제 확인] {baekjoon_id} - 문제 {problem_id}: 미해결")
-                            await asyncio.sleep(0.2)
-                            continue
+                    # "해당하는 문제가 없습니다" 메시지 확인
+                    no_problems_text = soup.find(string=re.compile(r'해당하는 문제가 없습니다|문제가 없습니다'))
+                    if no_problems_text:
+                        logger.debug(f"[개별 문제 확인] {baekjoon_id} - 문제 {problem_id}: 미해결")
+                        continue
                         
-                        # 문제 번호가 결과에 있는지 확인
-                        problem_links = soup.find_all('a', href=re.compile(r'(?:www\.)?acmicpc\.net/problem/\d+|/problem/\d+'))
-                        found = False
-                        for link in problem_links:
-                            href = link.get('href', '')
-                            match = re.search(r'(?:www\.)?acmicpc\.net/problem/(\d+)|/problem/(\d+)', href)
-                            if match:
-                                found_id = int(match.group(1) or match.group(2))
-                                if found_id == problem_id:
-                                    solved_problems.append(problem_id)
-                                    found = True
-                                    logger.debug(f"[개별 문제 확인] {baekjoon_id} - 문제 {problem_id}: 해결됨")
-                                    break
+                    # 문제 번호가 결과에 있는지 확인
+                    problem_links = soup.find_all('a', href=re.compile(r'(?:www\.)?acmicpc\.net/problem/\d+|/problem/\d+'))
+                    found = False
+                    for link in problem_links:
+                        href = link.get('href', '')
+                        match = re.search(r'(?:www\.)?acmicpc\.net/problem/(\d+)|/problem/(\d+)', href)
+                        if match:
+                            found_id = int(match.group(1) or match.group(2))
+                            if found_id == problem_id:
+                                solved_problems.append(problem_id)
+                                found = True
+                                logger.debug(f"[개별 문제 확인] {baekjoon_id} - 문제 {problem_id}: 해결됨")
+                                break
                         
-                        if not found:
-                            logger.debug(f"[개별 문제 확인] {baekjoon_id} - 문제 {problem_id}: 미해결")
+                    if not found:
+                        logger.debug(f"[개별 문제 확인] {baekjoon_id} - 문제 {problem_id}: 미해결")
                         
-                        await asyncio.sleep(0.2)  # Rate limiting 방지
                         
-                except (aiohttp.ClientConnectorError, aiohttp.ServerTimeoutError, asyncio.TimeoutError) as e:
-                    logger.error(f"[개별 문제 확인] {baekjoon_id} - 문제 {problem_id}: solved.ac 서버 연결 실패: {e} (서버 다운 가능성)")
-                    await asyncio.sleep(0.2)
-                    continue
-                except Exception as e:
-                    logger.error(f"[개별 문제 확인] {baekjoon_id} - 문제 {problem_id} 확인 중 오류: {e}")
-                    await asyncio.sleep(0.2)
-                    continue
+            except CircuitOpenError:
+                # 장애로 판단된 상태면 남은 문제도 요청하지 않음
+                raise
+            except _CONNECTION_ERRORS as e:
+                logger.error(f"[개별 문제 확인] {baekjoon_id} - 문제 {problem_id}: solved.ac 서버 연결 실패: {e} (서버 다운 가능성)")
+                continue
+            except Exception as e:
+                logger.error(f"[개별 문제 확인] {baekjoon_id} - 문제 {problem_id} 확인 중 오류: {e}")
+                continue
         
         solved_problems = sorted(list(set(solved_problems)))
         logger.info(f"[개별 문제 확인] {baekjoon_id} - {len(solved_problems)}/{len(target_problems)}개 해결")
         return solved_problems
         
-    except (aiohttp.ClientConnectorError, aiohttp.ServerTimeoutError, asyncio.TimeoutError) as e:
+    except _CONNECTION_ERRORS as e:
         logger.error(f"[개별 문제 확인] solved.ac 서버 연결 실패: {e} (서버 다운 가능성)")
         return []
     except Exception as e:
@@ -298,103 +557,100 @@ async def _check_problems_via_search_api(baekjoon_id: str, target_problems: List
         logger.debug(f"[solved.ac 검색 API] {baekjoon_id} - 쿼리: {query} -> 인코딩: {encoded_query}")
         
         # 타임아웃 설정 (10초)
-        timeout = aiohttp.ClientTimeout(total=10)
-        async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
-            while page <= max_pages:
-                url = f"https://solved.ac/problems?query={encoded_query}&page={page}"
-                logger.debug(f"[solved.ac 검색 API] {baekjoon_id} - 페이지 {page} 크롤링: {url}")
+        while page <= max_pages:
+            url = f"https://solved.ac/problems?query={encoded_query}&page={page}"
+            logger.debug(f"[solved.ac 검색 API] {baekjoon_id} - 페이지 {page} 크롤링: {url}")
                 
-                try:
-                    async with session.get(url) as response:
-                        if response.status != 200:
-                            if page == 1:
-                                logger.warning(f"[solved.ac 검색 API] HTTP {response.status} 에러: {url} (solved.ac 서버 문제 가능성)")
-                                return []
-                            # 첫 페이지가 아니면 더 이상 페이지가 없는 것으로 간주
-                            break
+            try:
+                async with http_get(url, headers=headers, timeout=10) as response:
+                    if response.status != 200:
+                        if page == 1:
+                            logger.warning(f"[solved.ac 검색 API] HTTP {response.status} 에러: {url} (solved.ac 서버 문제 가능성)")
+                            return []
+                        # 첫 페이지가 아니면 더 이상 페이지가 없는 것으로 간주
+                        break
                     
                     html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    # 첫 페이지에서 마지막 페이지 번호 파싱
-                    if page == 1 and last_page is None:
-                        # 페이지네이션 버튼에서 마지막 페이지 번호 찾기
-                        # 예: <a role="button" href="/problems?query=...&page=42">42</a>
-                        pagination_links = soup.find_all('a', href=re.compile(r'[?&]page=\d+'))
-                        page_numbers = []
-                        for link in pagination_links:
-                            href = link.get('href', '')
-                            match = re.search(r'[?&]page=(\d+)', href)
-                            if match:
-                                page_num = int(match.group(1))
-                                page_numbers.append(page_num)
-                        
-                        if page_numbers:
-                            last_page = max(page_numbers)
-                            logger.info(f"[solved.ac 검색 API] {baekjoon_id} - 총 {last_page}페이지 발견")
-                            # max_pages를 last_page로 제한
-                            max_pages = min(max_pages, last_page)
-                    
-                    # 페이지에서 문제 번호 추출
-                    # https://www.acmicpc.net/problem/XXXX 형식의 모든 링크 찾기
-                    page_problems = []
-                    problem_links = soup.find_all('a', href=re.compile(r'(?:www\.)?acmicpc\.net/problem/\d+|/problem/\d+'))
+                soup = BeautifulSoup(html, 'html.parser')
                     
-                    for link in problem_links:
+                # 첫 페이지에서 마지막 페이지 번호 파싱
+                if page == 1 and last_page is None:
+                    # 페이지네이션 버튼에서 마지막 페이지 번호 찾기
+                    # 예: <a role="button" href="/problems?query=...&page=42">42</a>
+                    pagination_links = soup.find_all('a', href=re.compile(r'[?&]page=\d+'))
+                    page_numbers = []
+                    for link in pagination_links:
                         href = link.get('href', '')
-                        # 전체 URL 또는 상대 경로에서 문제 번호 추출
-                        # 예: https://www.acmicpc.net/problem/1000 또는 /problem/1000
-                        match = re.search(r'(?:www\.)?acmicpc\.net/problem/(\d+)|/problem/(\d+)', href)
+                        match = re.search(r'[?&]page=(\d+)', href)
                         if match:
-                            # 두 그룹 중 하나는 None이므로 or로 처리
-                            problem_id = int(match.group(1) or match.group(2))
-                            page_problems.append(problem_id)
+                            page_num = int(match.group(1))
+                            page_numbers.append(page_num)
+                        
+                    if page_numbers:
+                        last_page = max(page_numbers)
+                        logger.info(f"[solved.ac 검색 API] {baekjoon_id} - 총 {last_page}페이지 발견")
+                        # max_pages를 last_page로 제한
+                        max_pages = min(max_pages, last_page)
                     
-                    if not page_problems:
-                        # 페이지에 문제가 없으면 더 이상 페이지가 없는 것으로 간주
-                        if page == 1:
-                            logger.warning(f"[solved.ac 검색 API] {baekjoon_id} - 첫 페이지에 문제가 없음 (사용자가 문제를 풀지 않았거나 크롤링 실패)")
-                            # "해당하는 문제가 없습니다" 메시지 확인
-                            no_problems_text = soup.find(string=re.compile(r'해당하는 문제가 없습니다|문제가 없습니다'))
-                            if no_problems_text:
-                                logger.info(f"[solved.ac 검색 API] {baekjoon_id} - 사용자가 푼 문제가 없음")
-                        break
+                # 페이지에서 문제 번호 추출
+                # https://www.acmicpc.net/problem/XXXX 형식의 모든 링크 찾기
+                page_problems = []
+                problem_links = soup.find_all('a', href=re.compile(r'(?:www\.)?acmicpc\.net/problem/\d+|/problem/\d+'))
                     
-                    # target_problems에 있는 문제만 필터링하여 추가
-                    found_in_page = []
-                    for problem_id in page_problems:
-                        if problem_id in target_set:
-                            solved_problems.append(problem_id)
-                            found_in_page.append(problem_id)
+                for link in problem_links:
+                    href = link.get('href', '')
+                    # 전체 URL 또는 상대 경로에서 문제 번호 추출
+                    # 예: https://www.acmicpc.net/problem/1000 또는 /problem/1000
+                    match = re.search(r'(?:www\.)?acmicpc\.net/problem/(\d+)|/problem/(\d+)', href)
+                    if match:
+                        # 두 그룹 중 하나는 None이므로 or로 처리
+                        problem_id = int(match.group(1) or match.group(2))
+                        page_problems.append(problem_id)
                     
-                    if found_in_page:
-                        logger.debug(f"[solved.ac 검색 API] {baekjoon_id} - 페이지 {page}에서 목표 문제 {len(found_in_page)}개 발견: {found_in_page[:5]}")
-                    else:
-                        logger.debug(f"[solved.ac 검색 API] {baekjoon_id} - 페이지 {page}에서 {len(page_problems)}개 문제 발견 (목표 문제 없음)")
+                if not page_problems:
+                    # 페이지에 문제가 없으면 더 이상 페이지가 없는 것으로 간주
+                    if page == 1:
+                        logger.warning(f"[solved.ac 검색 API] {baekjoon_id} - 첫 페이지에 문제가 없음 (사용자가 문제를 풀지 않았거나 크롤링 실패)")
+                        # "해당하는 문제가 없습니다" 메시지 확인
+                        no_problems_text = soup.find(string=re.compile(r'해당하는 문제가 없습니다|문제가 없습니다'))
+                        if no_problems_text:
+                            logger.info(f"[solved.ac 검색 API] {baekjoon_id} - 사용자가 푼 문제가 없음")
+                    break
                     
-                    # 모든 목표 문제를 찾았으면 조기 종료
-                    found_set = set(solved_problems)
-                    if len(found_set) == len(target_set):
-                        logger.info(f"[solved.ac 검색 API] {baekjoon_id} - 목표 문제 {len(target_set)}개를 모두 찾아 조기 종료 (페이지 {page}/{last_page or '?'})")
-                        break
+                # target_problems에 있는 문제만 필터링하여 추가
+                found_in_page = []
+                for problem_id in page_problems:
+                    if problem_id in target_set:
+                        solved_problems.append(problem_id)
+                        found_in_page.append(problem_id)
                     
-                    # 마지막 페이지에 도달했으면 종료
-                    if last_page and page >= last_page:
-                        break
+                if found_in_page:
+                    logger.debug(f"[solved.ac 검색 API] {baekjoon_id} - 페이지 {page}에서 목표 문제 {len(found_in_page)}개 발견: {found_in_page[:5]}")
+                else:
+                    logger.debug(f"[solved.ac 검색 API] {baekjoon_id} - 페이지 {page}에서 {len(page_problems)}개 문제 발견 (목표 문제 없음)")
                     
-                    page += 1
-                    await asyncio.sleep(0.3)  # Rate limiting 방지
-                except (aiohttp.ClientConnectorError, aiohttp.ServerTimeoutError, asyncio.TimeoutError) as e:
-                    if page == 1:
-                        logger.error(f"[solved.ac 검색 API] solved.ac 서버 연결 실패: {e} (서버 다운 가능성)")
-                        return []
-                    # 첫 페이지가 아니면 더 이상 페이지가 없는 것으로 간주
+                # 모든 목표 문제를 찾았으면 조기 종료
+                found_set = set(solved_problems)
+                if len(found_set) == len(target_set):
+                    logger.info(f"[solved.ac 검색 API] {baekjoon_id} - 목표 문제 {len(target_set)}개를 모두 찾아 조기 종료 (페이지 {page}/{last_page or '?'})")
                     break
-                except Exception as e:
-                    if page == 1:
-                        logger.error(f"[solved.ac 검색 API] 예상치 못한 오류: {e}")
-                        return []
+                    
+                # 마지막 페이지에 도달했으면 종료
+                if last_page and page >= last_page:
                     break
+                    
+                page += 1
+            except _CONNECTION_ERRORS as e:
+                if page == 1:
+                    logger.error(f"[solved.ac 검색 API] solved.ac 서버 연결 실패: {e} (서버 다운 가능성)")
+                    return []
+                # 첫 페이지가 아니면 더 이상 페이지가 없는 것으로 간주
+                break
+            except Exception as e:
+                if page == 1:
+                    logger.error(f"[solved.ac 검색 API] 예상치 못한 오류: {e}")
+                    return []
+                break
         
         # 중복 제거 및 정렬
         solved_problems = sorted(list(set(solved_problems)))
@@ -402,7 +658,7 @@ async def _check_problems_via_search_api(baekjoon_id: str, target_problems: List
         logger.info(f"[solved.ac 검색 API] {baekjoon_id} - 목표 문제 중 {len(solved_problems)}/{len(target_problems)}개 해결 (페이지 {page-1}개 크롤링)")
         return solved_problems
                 
-    except (aiohttp.ClientConnectorError, aiohttp.ServerTimeoutError, asyncio.TimeoutError) as e:
+    except _CONNECTION_ERRORS as e:
         logger.error(f"[solved.ac 검색 API] solved.ac 서버 연결 실패: {e} (서버 다운 가능성)")
         return []
     except Exception as e:
@@ -427,86 +683,83 @@ async def _get_all_solved_problems_via_pages(baekjoon_id: str, target_problems:
     target_set = set(target_problems) if target_problems else None
     last_page = None  # 마지막 페이지 번호
     
-    timeout = aiohttp.ClientTimeout(total=10)
-    async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
-        while page <= max_pages:
-            url = f"https://solved.ac/profile/{baekjoon_id}/solved"
-            if page > 1:
-                url += f"?page={page}"
+    while page <= max_pages:
+        url = f"https://solved.ac/profile/{baekjoon_id}/solved"
+        if page > 1:
+            url += f"?page={page}"
             
-            try:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        if page == 1:
-                            logger.warning(f"[solved.ac 크롤링] HTTP {response.status} 에러: {url} (서버 문제 가능성)")
-                            return []
-                        # 첫 페이지가 아니면 더 이상 페이지가 없는 것으로 간주
-                        break
+        try:
+            async with http_get(url, headers=headers, timeout=10) as response:
+                if response.status != 200:
+                    if page == 1:
+                        logger.warning(f"[solved.ac 크롤링] HTTP {response.status} 에러: {url} (서버 문제 가능성)")
+                        return []
+                    # 첫 페이지가 아니면 더 이상 페이지가 없는 것으로 간주
+                    break
                 
                 html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                # 첫 페이지에서 마지막 페이지 번호 파싱
-                if page == 1 and last_page is None:
-                    # 페이지네이션 버튼에서 마지막 페이지 번호 찾기
-                    # 예: <a role="button" href="/profile/beans3142/solved?page=42" class="css-13gyek6">42</a>
-                    pagination_links = soup.find_all('a', href=re.compile(r'/profile/[^/]+/solved\?page=\d+'))
-                    page_numbers = []
-                    for link in pagination_links:
-                        href = link.get('href', '')
-                        match = re.search(r'page=(\d+)', href)
-                        if match:
-                            page_num = int(match.group(1))
-                            page_numbers.append(page_num)
-                    
-                    if page_numbers:
-                        last_page = max(page_numbers)
-                        logger.info(f"[solved.ac 크롤링] {baekjoon_id} - 총 {last_page}페이지 발견")
-                        # max_pages를 last_page로 제한
-                        max_pages = min(max_pages, last_page)
-                
-                # 문제 번호 추출 (테이블에서)
-                page_problems = []
-                problem_links = soup.find_all('a', href=re.compile(r'/problem/\d+'))
+            soup = BeautifulSoup(html, 'html.parser')
                 
-                for link in problem_links:
+            # 첫 페이지에서 마지막 페이지 번호 파싱
+            if page == 1 and last_page is None:
+                # 페이지네이션 버튼에서 마지막 페이지 번호 찾기
+                # 예: <a role="button" href="/profile/beans3142/solved?page=42" class="css-13gyek6">42</a>
+                pagination_links = soup.find_all('a', href=re.compile(r'/profile/[^/]+/solved\?page=\d+'))
+                page_numbers = []
+                for link in pagination_links:
                     href = link.get('href', '')
-                    match = re.search(r'/problem/(\d+)', href)
+                    match = re.search(r'page=(\d+)', href)
                     if match:
-                        problem_id = int(match.group(1))
-                        page_problems.append(problem_id)
+                        page_num = int(match.group(1))
+                        page_numbers.append(page_num)
+                    
+                if page_numbers:
+                    last_page = max(page_numbers)
+                    logger.info(f"[solved.ac 크롤링] {baekjoon_id} - 총 {last_page}페이지 발견")
+                    # max_pages를 last_page로 제한
+                    max_pages = min(max_pages, last_page)
                 
-                if not page_problems:
-                    # 페이지에 문제가 없으면 더 이상 페이지가 없는 것으로 간주
-                    break
+            # 문제 번호 추출 (테이블에서)
+            page_problems = []
+            problem_links = soup.find_all('a', href=re.compile(r'/problem/\d+'))
                 
-                solved_problems.extend(page_problems)
+            for link in problem_links:
+                href = link.get('href', '')
+                match = re.search(r'/problem/(\d+)', href)
+                if match:
+                    problem_id = int(match.group(1))
+                    page_problems.append(problem_id)
                 
-                # target_problems가 제공되고, 모든 문제를 찾았으면 조기 종료
-                if target_set:
-                    found_problems = set(solved_problems) & target_set
-                    if len(found_problems) == len(target_set):
-                        logger.info(f"[solved.ac 크롤링] {baekjoon_id} - 목표 문제 {len(target_set)}개를 모두 찾아 조기 종료 (페이지 {page}/{last_page or '?'})")
-                        # 목표 문제만 반환
-                        return sorted(list(found_problems))
+            if not page_problems:
+                # 페이지에 문제가 없으면 더 이상 페이지가 없는 것으로 간주
+                break
                 
-                # 마지막 페이지에 도달했으면 종료
-                if last_page and page >= last_page:
-                    break
+            solved_problems.extend(page_problems)
                 
-                page += 1
-                await asyncio.sleep(0.3)  # Rate limiting 방지
-            except (aiohttp.ClientConnectorError, aiohttp.ServerTimeoutError, asyncio.TimeoutError) as e:
-                if page == 1:
-                    logger.error(f"[solved.ac 크롤링] solved.ac 서버 연결 실패: {e} (서버 다운 가능성)")
-                    return []
-                # 첫 페이지가 아니면 더 이상 페이지가 없는 것으로 간주
-                break
-            except Exception as e:
-                if page == 1:
-                    logger.error(f"[solved.ac 크롤링] 예상치 못한 오류: {e}")
-                    return []
+            # target_problems가 제공되고, 모든 문제를 찾았으면 조기 종료
+            if target_set:
+                found_problems = set(solved_problems) & target_set
+                if len(found_problems) == len(target_set):
+                    logger.info(f"[solved.ac 크롤링] {baekjoon_id} - 목표 문제 {len(target_set)}개를 모두 찾아 조기 종료 (페이지 {page}/{last_page or '?'})")
+                    # 목표 문제만 반환
+                    return sorted(list(found_problems))
+                
+            # 마지막 페이지에 도달했으면 종료
+            if last_page and page >= last_page:
                 break
+                
+            page += 1
+        except _CONNECTION_ERRORS as e:
+            if page == 1:
+                logger.error(f"[solved.ac 크롤링] solved.ac 서버 연결 실패: {e} (서버 다운 가능성)")
+                return []
+            # 첫 페이지가 아니면 더 이상 페이지가 없는 것으로 간주
+            break
+        except Exception as e:
+            if page == 1:
+                logger.error(f"[solved.ac 크롤링] 예상치 못한 오류: {e}")
+                return []
+            break
     
     # 중복 제거 및 정렬
     solved_problems = sorted(list(set(solved_problems)))
@@ -523,34 +776,20 @@ async def _get_all_solved_problems_via_pages(baekjoon_id: str, target_problems:
 async def check_solved_ac_server_available() -> bool:
     """
     solved.ac 서버가 응답 가능한지 확인
-    
+
+    따로 확인 요청을 보내지 않고, 실제 요청 결과로 추적하는 서킷 브레이커 상태를 본다.
+    (장애 후 대기 시간이 지났으면 True - 이어지는 실제 요청 하나가 시험 요청이 됨)
+
     Returns:
         True: 서버가 정상 응답
         False: 서버가 다운되었거나 응답 없음
     """
-    try:
-        # 간단한 API 호출로 서버 상태 확인 (존재하는 사용자로 테스트)
-        url = "https://solved.ac/api/v3/user/show?handle=wookje"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-
-        timeout = aiohttp.ClientTimeout(total=5)  # 빠른 확인을 위해 5초
-        async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
-            async with session.get(url) as response:
-                # 200 또는 404 모두 서버가 응답하는 것이므로 정상
-                if response.status in [200, 404]:
-                    return True
-                # 기타 상태코드는 서버 문제 가능성
-                logger.warning(f"[solved.ac 서버 확인] HTTP {response.status} 응답 (서버 문제 가능성)")
-                return False
-    except (aiohttp.ClientConnectorError, aiohttp.ServerTimeoutError, asyncio.TimeoutError) as e:
-        logger.error(f"[solved.ac 서버 확인] 서버 연결 실패: {e} (서버 다운 가능성)")
-        return False
-    except Exception as e:
-        logger.error(f"[solved.ac 서버 확인] 오류: {e}", exc_info=True)
-        return False
+    if is_available('solved.ac'):
+        return True
+    logger.warning("[solved.ac 서버 확인] 최근 요청이 계속 실패해 서버 장애로 판단 중")
+    return False
 
+@single_flight
 async def verify_user_exists(baekjoon_id: str) -> bool:
     """
     백준(BOJ) 사용자 존재 여부 확인
@@ -562,136 +801,100 @@ async def verify_user_exists(baekjoon_id: str) -> bool:
       - GET /api/v3/user/show?handle={handle}
       - 200: 사용자 존재
       - 404: 사용자 없음
+
+    그 밖의 응답이나 연결 실패는 '사용자 없음'으로 캐시되지 않도록 예외로 전달한다. (호출하는 쪽에서 처리)
     """
-    try:
-        url = f"https://solved.ac/api/v3/user/show?handle={baekjoon_id}"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+    url = f"https://solved.ac/api/v3/user/show?handle={baekjoon_id}"
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    }
 
-        timeout = aiohttp.ClientTimeout(total=10)
-        async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    return True
-                if response.status == 404:
-                    return False
-                # 기타 상태코드는 보수적으로 False 처리
-                logger.warning(f"[solved.ac API] HTTP {response.status} 에러: {url} (서버 문제 가능성)")
-                return False
-    except (aiohttp.ClientConnectorError, aiohttp.ServerTimeoutError, asyncio.TimeoutError) as e:
+    try:
+        async with http_get(url, headers=headers, timeout=10) as response:
+            status = response.status
+    except _CONNECTION_ERRORS as e:
         logger.error(f"[solved.ac API] solved.ac 서버 연결 실패: {e} (서버 다운 가능성)")
-        return False
+        raise
     except Exception as e:
         logger.error(f"[solved.ac API] 사용자 확인 오류: {e}", exc_info=True)
+        raise
+
+    if status == 200:
+        return True
+    if status == 404:
         return False
+    logger.warning(f"[solved.ac API] HTTP {status} 에러: {url} (서버 문제 가능성)")
+    raise RuntimeError(f"solved.ac 응답 오류 (HTTP {status})")
 
 async def check_problem_solved(baekjoon_id: str, problem_id: int) -> bool:
     """특정 문제를 해결했는지 확인 (status 페이지에서 확인)"""
     result = await check_problem_solved_from_status(baekjoon_id, problem_id)
     return result['solved'] if result else False
 
-async def get_weekly_solved_count(baekjoon_id: str, start_date: datetime, end_date: datetime) -> Dict:
+@single_flight(copy_result=False, cache_if=lambda history: history is not None)
+async def get_solved_history(baekjoon_id: str) -> Optional[SolvedHistory]:
     """
-    특정 기간 동안 해결한 문제 수 및 문제 목록 가져오기
-
-    기존 구현은 BOJ status 페이지(HTML)를 여러 페이지 크롤링했지만,
-    현재 서버 IP가 BOJ에서 403이기 때문에 solved.ac의 user history API로 대체한다.
+    핸들의 solvedCount 누적 히스토리 가져오기 (캐시 우선)
 
     solved.ac history API:
       - GET /api/v3/user/history?handle={handle}&topic=solvedCount
-      - 응답: 날짜별 누적 solvedCount 목록
-        예시: [{ "date": "2025-12-30", "value": 2044 }, ...]
+      - 응답: [{"timestamp": "2021-09-12T04:37:27.000Z", "value": 445}, ...]
 
-    누적 값이므로,
-      기간 [start, end] 에 푼 문제 수 = value(end) - value(start - 1일)
-    으로 계산한다.
+    TTL 안의 캐시(메모리/SQLite)가 있으면 요청하지 않는다.
+    반환된 객체는 여러 호출자가 공유하므로 수정하면 안 된다.
+
+    Returns:
+        SolvedHistory, 조회 실패 시 None
     """
-    try:
-        url = f"https://solved.ac/api/v3/user/history?handle={baekjoon_id}&topic=solvedCount"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+    history = await get_cached_history(baekjoon_id)
+    if history is not None:
+        return history
 
-        timeout = aiohttp.ClientTimeout(total=10)
-        async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
-            async with session.get(url) as response:
-                if response.status != 200:
-                    logger.warning(f"[solved.ac API] HTTP {response.status} 에러: {url} (서버 문제 가능성)")
-                    return {'count': 0, 'problems': []}
-
-                data = await response.json()
-
-        # solved.ac history API 응답 형식:
-        # [{"timestamp": "2021-09-12T04:37:27.000Z", "value": 445}, ...]
-        # timestamp는 ISO 8601(UTC) 형식이며, 같은 날에 여러 항목이 있을 수 있다.
-        # 여기서는 시각 단위 누적값을 그대로 사용해 주어진 시각 범위로 정확히 잘라낸다.
-        history = []  # [(dt_utc, value)]
-        for entry in data:
-            timestamp_str = entry.get('timestamp')
-            value = entry.get('value')
-            if not timestamp_str or value is None:
-                continue
-            try:
-                # "2021-09-12T04:37:27.000Z" 형식 → UTC naive datetime
-                dt = datetime.fromisoformat(
-                    timestamp_str.replace("Z", "+00:00")
-                ).replace(tzinfo=None)
-                v = int(value)
-                history.append((dt, v))
-            except Exception:
-                continue
+    url = f"https://solved.ac/api/v3/user/history?handle={baekjoon_id}&topic=solvedCount"
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    }
 
-        if not history:
-            return {'count': 0, 'problems': []}
+    async with http_get(url, headers=headers, timeout=10) as response:
+        if response.status != 200:
+            logger.warning(f"[solved.ac API] HTTP {response.status} 에러: {url} (서버 문제 가능성)")
+            return None
 
-        # 시각 순 정렬
-        history.sort(key=lambda x: x[0])
+        data = await response.json()
 
-        # channel.py 에서는 KST(UTC+9) 기준 start/end 를 넘기므로,
-        # 비교를 위해 UTC 로 변환해서 사용한다.
-        def to_utc(dt: datetime) -> datetime:
-            if dt.tzinfo is not None:
-                # timezone-aware면 UTC로 변환
-                return dt.astimezone(timezone.utc).replace(tzinfo=None)
-            else:
-                # timezone-naive면 9시간 빼기 (KST → UTC)
-                return dt - timedelta(hours=9)
-
-        start_utc = to_utc(start_date)
-        end_utc = to_utc(end_date)
-
-        def cumulative_before(target_dt: datetime, inclusive: bool) -> int:
-            """
-            target_dt 이전(또는 이하)까지의 누적 solvedCount.
-            history 는 시간 증가에 따라 value 가 증가/유지되는 누적값 시계열이라고 가정.
-            """
-            last_val = 0
-            for dt, v in history:
-                if dt < target_dt or (inclusive and dt <= target_dt):
-                    last_val = v
-                else:
-                    break
-            return last_val
+    history = SolvedHistory.from_api(data)
+    await store_history(baekjoon_id, history)
+    return history
 
-        # 시작 시각 직전까지의 누적과 종료 시각까지의 누적 차이로 기간 내 풀이 수 계산
-        total_before = cumulative_before(start_utc, inclusive=False)
-        total_end = cumulative_before(end_utc, inclusive=True)
+@single_flight
+async def get_weekly_solved_count(baekjoon_id: str, start_date: datetime, end_date: datetime) -> Dict:
+    """
+    특정 기간 동안 해결한 문제 수 및 문제 목록 가져오기
 
-        count = max(0, total_end - total_before)
+    기존 구현은 BOJ status 페이지(HTML)를 여러 페이지 크롤링했지만,
+    현재 서버 IP가 BOJ에서 403이기 때문에 solved.ac의 user history API로 대체한다.
 
-        # solved.ac history로는 개별 문제 번호까지는 알 수 없으므로,
-        # count만 채우고 problems 리스트는 비워둔다.
-        return {
-            'count': count,
-            'problems': []
-        }
-    except (aiohttp.ClientConnectorError, aiohttp.ServerTimeoutError, asyncio.TimeoutError) as e:
+    누적 값이므로,
+      기간 [start, end] 에 푼 문제 수 = value(end) - value(start 직전)
+    으로 계산한다. 히스토리는 핸들별로 캐시되므로 같은 핸들의 여러 기간을 한 번의 요청으로 계산할 수 있다.
+    (timezone-naive start/end는 KST로 간주)
+
+    조회에 실패하면 0개로 표시/캐시되지 않도록 예외로 전달한다. (호출하는 쪽에서 오류로 표시)
+    """
+    try:
+        history = await get_solved_history(baekjoon_id)
+    except _CONNECTION_ERRORS as e:
         logger.error(f"[solved.ac API] solved.ac 서버 연결 실패: {e} (서버 다운 가능성)")
-        return {'count': 0, 'problems': []}
-    except Exception as e:
-        logger.error(f"[solved.ac API] 주간 해결한 문제 수 조회 오류: {e}", exc_info=True)
-        return {'count': 0, 'problems': []}
+        raise
+    if history is None:
+        raise RuntimeError("solved.ac 히스토리 조회 실패")
+
+    # solved.ac history로는 개별 문제 번호까지는 알 수 없으므로,
+    # count만 채우고 problems 리스트는 비워둔다.
+    return {
+        'count': history.solved_between(start_date, end_date),
+        'problems': []
+    }
 
 async def get_weekly_solved_from_boj_status(baekjoon_id: str, start_date: datetime, end_date: datetime, status_callback=None) -> Dict:
     """
@@ -729,164 +932,159 @@ async def get_weekly_solved_from_boj_status(baekjoon_id: str, start_date: dateti
             'Referer': 'https://www.acmicpc.net/',
         }
         
-        import asyncio
-        
-        async with aiohttp.ClientSession(headers=headers) as session:
-            # 첫 페이지는 top 파라미터 없이 시작
-            top = None
-            max_pages = 50  # 최대 50페이지까지 확인 (약 5000개 제출)
-            page_count = 0
+        # 첫 페이지는 top 파라미터 없이 시작
+        top = None
+        max_pages = 50  # 최대 50페이지까지 확인 (약 5000개 제출)
+        page_count = 0
             
-            while page_count < max_pages:
-                # result_id=4는 "맞았습니다" 결과
-                if top is None:
-                    url = f"https://www.acmicpc.net/status?user_id={baekjoon_id}&result_id=4"
-                else:
-                    url = f"https://www.acmicpc.net/status?user_id={baekjoon_id}&result_id=4&top={top}"
+        while page_count < max_pages:
+            # result_id=4는 "맞았습니다" 결과
+            if top is None:
+                url = f"https://www.acmicpc.net/status?user_id={baekjoon_id}&result_id=4"
+            else:
+                url = f"https://www.acmicpc.net/status?user_id={baekjoon_id}&result_id=4&top={top}"
                 
-                async with session.get(url) as response:
-                    # 403 FORBIDDEN 에러 처리
-                    if response.status == 403:
-                        status_msg = "❌ 403 FORBIDDEN 에러 발생 - IP 차단 가능성"
-                        logger.warning(f"[백준 크롤링] 403 FORBIDDEN 에러 발생 - IP 차단 가능성")
+            async with http_get(url, headers=headers) as response:
+                # 403 FORBIDDEN 에러 처리
+                if response.status == 403:
+                    status_msg = "❌ 403 FORBIDDEN 에러 발생 - IP 차단 가능성"
+                    logger.warning(f"[백준 크롤링] 403 FORBIDDEN 에러 발생 - IP 차단 가능성")
+                    if status_callback:
+                        await status_callback(status_msg)
+                        
+                    # 첫 번째 요청에서 403이면 전체 실패로 처리
+                    if page_count == 0:
+                        status_msg = "🔄 solved.ac API로 폴백 시도..."
+                        logger.info(f"[백준 크롤링] solved.ac API로 폴백 시도...")
                         if status_callback:
                             await status_callback(status_msg)
-                        
-                        # 첫 번째 요청에서 403이면 전체 실패로 처리
-                        if page_count == 0:
-                            status_msg = "🔄 solved.ac API로 폴백 시도..."
-                            logger.info(f"[백준 크롤링] solved.ac API로 폴백 시도...")
-                            if status_callback:
-                                await status_callback(status_msg)
-                            # solved.ac로 폴백 (문제 번호는 없지만 개수는 알 수 있음)
-                            fallback_result = await get_weekly_solved_count(baekjoon_id, start_date, end_date)
-                            return fallback_result
-                        break
+                        # solved.ac로 폴백 (문제 번호는 없지만 개수는 알 수 있음)
+                        fallback_result = await get_weekly_solved_count(baekjoon_id, start_date, end_date)
+                        return fallback_result
+                    break
                     
-                    if response.status != 200:
-                        print(f"[백준 크롤링] HTTP {response.status} 에러")
-                        break
+                if response.status != 200:
+                    print(f"[백준 크롤링] HTTP {response.status} 에러")
+                    break
                     
-                    html = await response.text()
+                html = await response.text()
                     
-                    # AWS WAF 챌린지 페이지 확인
-                    if 'awsWafCookieDomainList' in html or 'gokuProps' in html:
-                        print(f"[백준 크롤링] AWS WAF 챌린지 페이지 감지")
-                        if page_count == 0:
-                            # 첫 페이지에서 WAF 감지되면 폴백
-                            print(f"[백준 크롤링] solved.ac API로 폴백 시도...")
-                            fallback_result = await get_weekly_solved_count(baekjoon_id, start_date, end_date)
-                            return fallback_result
-                        await asyncio.sleep(5)  # WAF 챌린지 대기
-                        continue
+                # AWS WAF 챌린지 페이지 확인
+                if 'awsWafCookieDomainList' in html or 'gokuProps' in html:
+                    print(f"[백준 크롤링] AWS WAF 챌린지 페이지 감지")
+                    if page_count == 0:
+                        # 첫 페이지에서 WAF 감지되면 폴백
+                        print(f"[백준 크롤링] solved.ac API로 폴백 시도...")
+                        fallback_result = await get_weekly_solved_count(baekjoon_id, start_date, end_date)
+                        return fallback_result
+                    # WAF 챌린지 대기 (acmicpc.net 요청 전체를 잠시 멈춤)
+                    rate_limiter.block_host(url, 5)
+                    continue
                     
-                    soup = BeautifulSoup(html, 'html.parser')
+                soup = BeautifulSoup(html, 'html.parser')
                     
-                    # status 테이블 찾기
-                    status_table = soup.find('table', id='status-table')
-                    if not status_table:
-                        break
+                # status 테이블 찾기
+                status_table = soup.find('table', id='status-table')
+                if not status_table:
+                    break
                     
-                    tbody = status_table.find('tbody')
-                    if not tbody:
-                        break
+                tbody = status_table.find('tbody')
+                if not tbody:
+                    break
                     
-                    rows = tbody.find_all('tr')
-                    if not rows:
-                        break
+                rows = tbody.find_all('tr')
+                if not rows:
+                    break
                     
-                    # 이 페이지의 모든 제출이 기간을 벗어나면 중단
-                    page_has_valid = False
-                    last_submission_id = None
+                # 이 페이지의 모든 제출이 기간을 벗어나면 중단
+                page_has_valid = False
+                last_submission_id = None
                     
-                    for tr in rows:
-                        # 제출 ID 찾기 (다음 페이지를 위한 top 값)
-                        # 백준 status 페이지에서 첫 번째 td가 제출 번호입니다
-                        tds = tr.find_all('td')
-                        if tds and len(tds) > 0:
-                            try:
-                                # 첫 번째 td의 텍스트가 제출 번호
-                                submission_id = int(tds[0].get_text(strip=True))
-                                if last_submission_id is None or submission_id < last_submission_id:
-                                    last_submission_id = submission_id
-                            except:
-                                pass
+                for tr in rows:
+                    # 제출 ID 찾기 (다음 페이지를 위한 top 값)
+                    # 백준 status 페이지에서 첫 번째 td가 제출 번호입니다
+                    tds = tr.find_all('td')
+                    if tds and len(tds) > 0:
+                        try:
+                            # 첫 번째 td의 텍스트가 제출 번호
+                            submission_id = int(tds[0].get_text(strip=True))
+                            if last_submission_id is None or submission_id < last_submission_id:
+                                last_submission_id = submission_id
+                        except:
+                            pass
                         
-                        # 결과 확인
-                        result_td = tr.find('td', class_='result')
-                        if not result_td:
-                            continue
+                    # 결과 확인
+                    result_td = tr.find('td', class_='result')
+                    if not result_td:
+                        continue
                         
-                        result_text = result_td.get_text(strip=True)
-                        if '맞았습니다' not in result_text:
-                            continue
+                    result_text = result_td.get_text(strip=True)
+                    if '맞았습니다' not in result_text:
+                        continue
                         
-                        # 제출 시간 찾기
-                        time_td = tr.find('td', class_='real-time-update')
-                        if not time_td:
-                            time_elem = tr.find('a', class_='real-time-update')
-                            if time_elem and time_elem.get('title'):
-                                time_str = time_elem.get('title')
-                            else:
-                                continue
+                    # 제출 시간 찾기
+                    time_td = tr.find('td', class_='real-time-update')
+                    if not time_td:
+                        time_elem = tr.find('a', class_='real-time-update')
+                        if time_elem and time_elem.get('title'):
+                            time_str = time_elem.get('title')
                         else:
-                            time_str = time_td.get_text(strip=True)
+                            continue
+                    else:
+                        time_str = time_td.get_text(strip=True)
                         
-                        # 시간 파싱
-                        try:
-                            if '-' in time_str and ':' in time_str:
-                                # "2024-01-01 12:34:56" 형식
-                                submitted_dt = datetime.strptime(time_str, '%Y-%m-%d %H:%M:%S')
-                            else:
-                                # 상대 시간인 경우 현재 시간 사용 (정확하지 않을 수 있음)
-                                continue
-                        except:
+                    # 시간 파싱
+                    try:
+                        if '-' in time_str and ':' in time_str:
+                            # "2024-01-01 12:34:56" 형식
+                            submitted_dt = datetime.strptime(time_str, '%Y-%m-%d %H:%M:%S')
+                        else:
+                            # 상대 시간인 경우 현재 시간 사용 (정확하지 않을 수 있음)
                             continue
+                    except:
+                        continue
                         
-                        # 기간 확인
-                        if start_date <= submitted_dt <= end_date:
-                            # 문제 번호 찾기
-                            problem_link = tr.find('a', href=re.compile(r'/problem/\d+'))
-                            if problem_link:
-                                match = re.search(r'/problem/(\d+)', problem_link.get('href', ''))
-                                if match:
-                                    problem_id = int(match.group(1))
-                                    solved_problems.add(problem_id)
-                                    page_has_valid = True
-                        elif submitted_dt < start_date:
-                            # 시작 날짜보다 이전이면 더 이상 확인할 필요 없음
-                            # (페이지는 최신순이므로)
-                            return {
-                                'count': len(solved_problems),
-                                'problems': sorted(list(solved_problems))
-                            }
+                    # 기간 확인
+                    if start_date <= submitted_dt <= end_date:
+                        # 문제 번호 찾기
+                        problem_link = tr.find('a', href=re.compile(r'/problem/\d+'))
+                        if problem_link:
+                            match = re.search(r'/problem/(\d+)', problem_link.get('href', ''))
+                            if match:
+                                problem_id = int(match.group(1))
+                                solved_problems.add(problem_id)
+                                page_has_valid = True
+                    elif submitted_dt < start_date:
+                        # 시작 날짜보다 이전이면 더 이상 확인할 필요 없음
+                        # (페이지는 최신순이므로)
+                        return {
+                            'count': len(solved_problems),
+                            'problems': sorted(list(solved_problems))
+                        }
                     
-                    # 다음 페이지를 위한 top 값 설정
-                    if last_submission_id is not None:
-                        top = last_submission_id
-                    else:
-                        # submission_id를 찾을 수 없으면 첫 번째 행의 제출 번호를 사용
-                        if rows:
-                            first_row = rows[0]
-                            first_tds = first_row.find_all('td')
-                            if first_tds and len(first_tds) > 0:
-                                try:
-                                    top = int(first_tds[0].get_text(strip=True))
-                                except:
-                                    break
-                            else:
+                # 다음 페이지를 위한 top 값 설정
+                if last_submission_id is not None:
+                    top = last_submission_id
+                else:
+                    # submission_id를 찾을 수 없으면 첫 번째 행의 제출 번호를 사용
+                    if rows:
+                        first_row = rows[0]
+                        first_tds = first_row.find_all('td')
+                        if first_tds and len(first_tds) > 0:
+                            try:
+                                top = int(first_tds[0].get_text(strip=True))
+                            except:
                                 break
                         else:
                             break
-                    
-                    # 이 페이지에 유효한 제출이 없으면 더 이상 확인하지 않음
-                    if not page_has_valid:
+                    else:
                         break
                     
-                    # 요청 간 딜레이 추가 (403 우회 및 Rate limiting 방지)
-                    await asyncio.sleep(0.5)
+                # 이 페이지에 유효한 제출이 없으면 더 이상 확인하지 않음
+                if not page_has_valid:
+                    break
                     
-                    page_count += 1
+                page_count += 1
         
         return {
             'count': len(solved_problems),
@@ -896,6 +1094,7 @@ async def get_weekly_solved_from_boj_status(baekjoon_id: str, start_date: dateti
         print(f"백준 status 페이지 크롤링 오류: {e}")
         return {'count': 0, 'problems': []}
 
+@single_flight
 async def get_recent_solved_count(baekjoon_id: str, start_date: datetime, end_date: datetime) -> int:
     """
     특정 기간 동안 해결한 문제 수 가져오기
@@ -918,87 +1117,87 @@ async def get_recent_solved_count(baekjoon_id: str, start_date: datetime, end_da
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         
-        async with aiohttp.ClientSession(headers=headers) as session:
-            # 최대 10페이지까지 확인 (최근 1000개 제출)
-            for page in range(1, 11):
-                url = f"https://www.acmicpc.net/status?user_id={baekjoon_id}&result_id=4&page={page}"
-                # result_id=4는 "맞았습니다" 결과
+        # 최대 10페이지까지 확인 (최근 1000개 제출)
+        for page in range(1, 11):
+            url = f"https://www.acmicpc.net/status?user_id={baekjoon_id}&result_id=4&page={page}"
+            # result_id=4는 "맞았습니다" 결과
                 
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        break
+            async with http_get(url, headers=headers) as response:
+                if response.status != 200:
+                    break
                     
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
+                html = await response.text()
+                soup = BeautifulSoup(html, 'html.parser')
                     
-                    # status 테이블 찾기
-                    status_table = soup.find('table', id='status-table')
-                    if not status_table:
-                        break
+                # status 테이블 찾기
+                status_table = soup.find('table', id='status-table')
+                if not status_table:
+                    break
                     
-                    tbody = status_table.find('tbody')
-                    if not tbody:
-                        break
+                tbody = status_table.find('tbody')
+                if not tbody:
+                    break
                     
-                    rows = tbody.find_all('tr')
-                    if not rows:
-                        break
+                rows = tbody.find_all('tr')
+                if not rows:
+                    break
                     
-                    # 이 페이지의 모든 제출이 기간을 벗어나면 중단
-                    page_has_valid = False
+                # 이 페이지의 모든 제출이 기간을 벗어나면 중단
+                page_has_valid = False
                     
-                    for tr in rows:
-                        # 결과 확인
-                        result_td = tr.find('td', class_='result')
-                        if not result_td:
-                            continue
+                for tr in rows:
+                    # 결과 확인
+                    result_td = tr.find('td', class_='result')
+                    if not result_td:
+                        continue
                         
-                        result_text = result_td.get_text(strip=True)
-                        if '맞았습니다' not in result_text:
-                            continue
+                    result_text = result_td.get_text(strip=True)
+                    if '맞았습니다' not in result_text:
+                        continue
                         
-                        # 제출 시간 찾기
-                        time_td = tr.find('td', class_='real-time-update')
-                        if not time_td:
-                            time_elem = tr.find('a', class_='real-time-update')
-                            if time_elem and time_elem.get('title'):
-                                time_str = time_elem.get('title')
-                            else:
-                                continue
+                    # 제출 시간 찾기
+                    time_td = tr.find('td', class_='real-time-update')
+                    if not time_td:
+                        time_elem = tr.find('a', class_='real-time-update')
+                        if time_elem and time_elem.get('title'):
+                            time_str = time_elem.get('title')
                         else:
-                            time_str = time_td.get_text(strip=True)
+                            continue
+                    else:
+                        time_str = time_td.get_text(strip=True)
                         
-                        # 시간 파싱
-                        try:
-                            if '-' in time_str and ':' in time_str:
-                                # "2024-01-01 12:34:56" 형식
-                                submitted_dt = datetime.strptime(time_str, '%Y-%m-%d %H:%M:%S')
-                            else:
-                                # 상대 시간인 경우 현재 시간 사용 (정확하지 않을 수 있음)
-                                continue
-                        except:
+                    # 시간 파싱
+                    try:
+                        if '-' in time_str and ':' in time_str:
+                            # "2024-01-01 12:34:56" 형식
+                            submitted_dt = datetime.strptime(time_str, '%Y-%m-%d %H:%M:%S')
+                        else:
+                            # 상대 시간인 경우 현재 시간 사용 (정확하지 않을 수 있음)
                             continue
+                    except:
+                        continue
                         
-                        # 기간 확인
-                        if start_date <= submitted_dt <= end_date:
-                            # 문제 번호 찾기
-                            problem_link = tr.find('a', href=re.compile(r'/problem/\d+'))
-                            if problem_link:
-                                match = re.search(r'/problem/(\d+)', problem_link.get('href', ''))
-                                if match:
-                                    problem_id = int(match.group(1))
-                                    solved_problems.add(problem_id)
-                                    page_has_valid = True
+                    # 기간 확인
+                    if start_date <= submitted_dt <= end_date:
+                        # 문제 번호 찾기
+                        problem_link = tr.find('a', href=re.compile(r'/problem/\d+'))
+                        if problem_link:
+                            match = re.search(r'/problem/(\d+)', problem_link.get('href', ''))
+                            if match:
+                                problem_id = int(match.group(1))
+                                solved_problems.add(problem_id)
+                                page_has_valid = True
                     
-                    # 이 페이지에 유효한 제출이 없으면 더 이상 확인하지 않음
-                    if not page_has_valid:
-                        break
+                # 이 페이지에 유효한 제출이 없으면 더 이상 확인하지 않음
+                if not page_has_valid:
+                    break
         
         return len(solved_problems)
     except Exception as e:
         print(f"최근 해결한 문제 수 조회 오류: {e}")
         return 0
 
+@single_flight(cache_if=lambda result: result is not None)
 async def check_problem_solved_from_status(baekjoon_id: str, problem_id: int) -> Optional[Dict]:
     """
     BOJ status 페이지에서 문제 해결 여부 및 제출 시간 확인
@@ -1017,73 +1216,72 @@ async def check_problem_solved_from_status(baekjoon_id: str, problem_id: int) ->
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         
-        async with aiohttp.ClientSession(headers=headers) as session:
-            async with session.get(url) as response:
-                if response.status != 200:
-                    return None
+        async with http_get(url, headers=headers) as response:
+            if response.status != 200:
+                return None
                 
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
+            html = await response.text()
+            soup = BeautifulSoup(html, 'html.parser')
                 
-                # status 테이블 찾기
-                status_table = soup.find('table', id='status-table')
-                if not status_table:
-                    return {'solved': False, 'submitted_at': None, 'result': None}
+            # status 테이블 찾기
+            status_table = soup.find('table', id='status-table')
+            if not status_table:
+                return {'solved': False, 'submitted_at': None, 'result': None}
                 
-                # 테이블 행 찾기 (첫 번째 행이 가장 최근 제출)
-                rows = status_table.find('tbody')
-                if not rows:
-                    return {'solved': False, 'submitted_at': None, 'result': None}
+            # 테이블 행 찾기 (첫 번째 행이 가장 최근 제출)
+            rows = status_table.find('tbody')
+            if not rows:
+                return {'solved': False, 'submitted_at': None, 'result': None}
                 
-                trs = rows.find_all('tr')
-                if not trs:
-                    return {'solved': False, 'submitted_at': None, 'result': None}
+            trs = rows.find_all('tr')
+            if not trs:
+                return {'solved': False, 'submitted_at': None, 'result': None}
                 
-                # 각 행을 확인하여 맞은 제출 찾기
-                for tr in trs:
-                    # 결과 확인 (맞았습니다!!, 맞았습니다, etc.)
-                    result_td = tr.find('td', class_='result')
-                    if not result_td:
-                        continue
+            # 각 행을 확인하여 맞은 제출 찾기
+            for tr in trs:
+                # 결과 확인 (맞았습니다!!, 맞았습니다, etc.)
+                result_td = tr.find('td', class_='result')
+                if not result_td:
+                    continue
                     
-                    result_text = result_td.get_text(strip=True)
+                result_text = result_td.get_text(strip=True)
                     
-                    # 맞은 제출인지 확인
-                    if '맞았습니다' in result_text or '정답' in result_text:
-                        # 제출 시간 찾기
-                        time_td = tr.find('td', class_='real-time-update')
-                        if not time_td:
-                            # 대체 방법: title 속성에서 시간 찾기
-                            time_elem = tr.find('a', class_='real-time-update')
-                            if time_elem and time_elem.get('title'):
-                                time_str = time_elem.get('title')
-                            else:
-                                time_str = None
+                # 맞은 제출인지 확인
+                if '맞았습니다' in result_text or '정답' in result_text:
+                    # 제출 시간 찾기
+                    time_td = tr.find('td', class_='real-time-update')
+                    if not time_td:
+                        # 대체 방법: title 속성에서 시간 찾기
+                        time_elem = tr.find('a', class_='real-time-update')
+                        if time_elem and time_elem.get('title'):
+                            time_str = time_elem.get('title')
                         else:
-                            time_str = time_td.get_text(strip=True)
+                            time_str = None
+                    else:
+                        time_str = time_td.get_text(strip=True)
                         
-                        # 시간 파싱 (BOJ 형식: "2024-01-01 12:34:56" 또는 상대 시간)
-                        submitted_at = None
-                        if time_str:
-                            try:
-                                # 절대 시간 형식인 경우
-                                if '-' in time_str and ':' in time_str:
-                                    # "2024-01-01 12:34:56" 형식
-                                    submitted_at = datetime.strptime(time_str, '%Y-%m-%d %H:%M:%S').isoformat()
-                                else:
-                                    # 상대 시간인 경우 (예: "1분 전") 현재 시간 사용
-                                    submitted_at = datetime.now().isoformat()
-                            except:
+                    # 시간 파싱 (BOJ 형식: "2024-01-01 12:34:56" 또는 상대 시간)
+                    submitted_at = None
+                    if time_str:
+                        try:
+                            # 절대 시간 형식인 경우
+                            if '-' in time_str and ':' in time_str:
+                                # "2024-01-01 12:34:56" 형식
+                                submitted_at = datetime.strptime(time_str, '%Y-%m-%d %H:%M:%S').isoformat()
+                            else:
+                                # 상대 시간인 경우 (예: "1분 전") 현재 시간 사용
                                 submitted_at = datetime.now().isoformat()
+                        except:
+                            submitted_at = datetime.now().isoformat()
                         
-                        return {
-                            'solved': True,
-                            'submitted_at': submitted_at,
-                            'result': result_text
-                        }
+                    return {
+                        'solved': True,
+                        'submitted_at': submitted_at,
+                        'result': result_text
+                    }
                 
-                # 맞은 제출이 없으면 해결하지 않음
-                return {'solved': False, 'submitted_at': None, 'result': None}
+            # 맞은 제출이 없으면 해결하지 않음
+            return {'solved': False, 'submitted_at': None, 'result': None}
                 
     except Exception as e:
         print(f"status 페이지 확인 오류: {e}")
@@ -1094,10 +1292,16 @@ async def check_problems_solved_with_tier(baekjoon_id: str, problem_ids: List[in
     solved_problems = await get_user_solved_problems(baekjoon_id)
     result = {}
     
+    # 난이도가 필요하면 해결한 문제들의 정보를 한 번에 조회
+    metadata = {}
+    if min_tier is not None:
+        metadata = await get_problem_metadata([p for p in problem_ids if p in solved_problems])
+    
     for problem_id in problem_ids:
         if problem_id in solved_problems:
             if min_tier is not None:
-                tier = await get_problem_tier(problem_id)
+                meta = metadata.get(problem_id)
+                tier = meta['level'] if meta else None
                 if tier is not None and tier >= min_tier:
                     result[problem_id] = True
                 else:
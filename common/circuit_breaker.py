@@ -0,0 +1,163 @@
+"""
+호스트별 상태 추적 (서킷 브레이커)
+실제 요청 결과(성공/실패, 응답 시간)로 solved.ac / acmicpc.net 상태를 추적해서,
+갱신 전에 따로 확인 요청을 보내지 않고 메모리의 상태만 보고 판단한다.
+
+- closed: 정상. 모든 요청 허용
+- open: 연속 실패가 많거나 오류율이 높아 장애로 판단. 요청을 보내지 않고 바로 CircuitOpenError
+- half_open: open 후 대기 시간이 지남. 요청 하나만 시험으로 보내고, 성공하면 closed / 실패하면 다시 open (대기 시간 2배)
+"""
+import time
+from typing import Dict, Optional
+
+import aiohttp
+
+from common.config import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_ERROR_RATE,
+    CIRCUIT_MIN_SAMPLES,
+    CIRCUIT_EWMA_ALPHA,
+    CIRCUIT_OPEN_SECONDS,
+    CIRCUIT_OPEN_MAX_SECONDS,
+)
+from common.logger import get_logger
+from common.rate_limiter import normalize_host
+
+logger = get_logger()
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(aiohttp.ClientConnectionError):
+    """장애로 판단된 호스트로의 요청 (실제로 보내지 않음)"""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"{host} 서킷 open (약 {max(int(retry_in), 0)}초 후 재시도)")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class HostHealth:
+    """호스트 하나의 요청 결과 통계와 서킷 상태"""
+
+    def __init__(self, host: str):
+        self.host = host
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.samples = 0                 # closed가 된 뒤 기록한 요청 수
+        self.error_rate = 0.0            # 실패율 EWMA (0~1)
+        self.latency: Optional[float] = None  # 응답 시간 EWMA (초)
+        self.opened_at = 0.0             # open된 시각 (monotonic)
+        self.open_for = CIRCUIT_OPEN_SECONDS
+        self.trial_in_flight = False     # half_open 시험 요청이 진행 중인지
+
+    def retry_in(self, now: float) -> float:
+        """open 상태에서 시험 요청까지 남은 시간 (초)"""
+        return self.opened_at + self.open_for - now
+
+    def available(self, now: float) -> bool:
+        """지금 요청을 보낼 수 있는 상태인지 (open이어도 대기 시간이 지났으면 시험 요청 가능)"""
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN:
+            return self.retry_in(now) <= 0
+        return not self.trial_in_flight
+
+    def before_request(self) -> bool:
+        """
+        요청 직전 호출: 보낼 수 없으면 CircuitOpenError
+
+        Returns:
+            이 요청이 half_open 시험 요청인지 (결과 기록/release에 그대로 넘김)
+        """
+        now = time.monotonic()
+        if self.state == OPEN:
+            if self.retry_in(now) > 0:
+                raise CircuitOpenError(self.host, self.retry_in(now))
+            self.state = HALF_OPEN
+            self.trial_in_flight = False
+        if self.state == HALF_OPEN:
+            if self.trial_in_flight:
+                raise CircuitOpenError(self.host, 0)
+            self.trial_in_flight = True
+            logger.info(f"[서킷 브레이커] {self.host} 시험 요청")
+            return True
+        return False
+
+    def _observe(self, failed: bool, latency: Optional[float]):
+        alpha = CIRCUIT_EWMA_ALPHA
+        self.samples += 1
+        self.error_rate = (1 - alpha) * self.error_rate + alpha * (1.0 if failed else 0.0)
+        if latency is not None:
+            self.latency = latency if self.latency is None else (1 - alpha) * self.latency + alpha * latency
+
+    def record_success(self, latency: Optional[float], trial: bool = False):
+        """
+        요청 성공 (서버가 정상 응답)
+
+        open/half_open 상태는 시험 요청의 결과로만 바뀐다.
+        (open 전에 보낸 요청이 늦게 끝난 결과는 통계에만 반영)
+        """
+        self._observe(False, latency)
+        self.consecutive_failures = 0
+        if trial and self.state == HALF_OPEN:
+            logger.info(f"[서킷 브레이커] {self.host} 복구됨 (closed, {self.describe()})")
+            self._close()
+
+    def record_failure(self, latency: Optional[float], reason: str, trial: bool = False):
+        """요청 실패 (연결 실패, 타임아웃, 5xx)"""
+        self._observe(True, latency)
+        self.consecutive_failures += 1
+        if self.state == HALF_OPEN:
+            if trial:
+                self._open(min(self.open_for * 2, CIRCUIT_OPEN_MAX_SECONDS), reason)
+        elif self.state == CLOSED and (
+            self.consecutive_failures >= CIRCUIT_FAILURE_THRESHOLD
+            or (self.samples >= CIRCUIT_MIN_SAMPLES and self.error_rate >= CIRCUIT_ERROR_RATE)
+        ):
+            self._open(CIRCUIT_OPEN_SECONDS, reason)
+
+    def release(self, trial: bool):
+        """요청 종료 시 호출 - 결과 없이 끝난 시험 요청(취소 등)이면 다음 요청이 다시 시험하도록 함"""
+        if trial and self.state == HALF_OPEN:
+            self.trial_in_flight = False
+
+    def _open(self, seconds: float, reason: str):
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+        self.open_for = seconds
+        self.trial_in_flight = False
+        logger.warning(f"[서킷 브레이커] {self.host} 장애로 판단 (open {int(seconds)}초, {self.describe()}): {reason}")
+
+    def _close(self):
+        self.state = CLOSED
+        self.open_for = CIRCUIT_OPEN_SECONDS
+        self.trial_in_flight = False
+        self.samples = 0
+        self.error_rate = 0.0
+
+    def describe(self) -> str:
+        """로그용 상태 요약"""
+        latency = f"{self.latency:.2f}초" if self.latency is not None else "-"
+        return f"연속 실패 {self.consecutive_failures}회, 오류율 {self.error_rate:.0%}, 응답 시간 {latency}"
+
+
+# 호스트별 상태 (프로세스 전역)
+_hosts: Dict[str, HostHealth] = {}
+
+
+def get_health(url_or_host: str) -> HostHealth:
+    """호스트에 해당하는 상태 반환 (없으면 closed로 생성)"""
+    host = normalize_host(url_or_host)
+    health = _hosts.get(host)
+    if health is None:
+        health = HostHealth(host)
+        _hosts[host] = health
+    return health
+
+
+def is_available(url_or_host: str) -> bool:
+    """요청 없이 메모리의 상태로 호스트 사용 가능 여부 판단"""
+    return get_health(url_or_host).available(time.monotonic())
@@ -11,6 +11,87 @@ DATA_FILE = 'data.json'
 # 백준 크롤링 설정
 BAEKJOON_CRAWL_LIMIT = 100  # 최대 가져올 문제 수
 
+# HTTP 클라이언트 설정 (solved.ac / BOJ 공용 커넥션 풀)
+HTTP_POOL_LIMIT = 100            # 전체 동시 커넥션 수
+HTTP_POOL_LIMIT_PER_HOST = 20    # 호스트별 동시 커넥션 수
+HTTP_DNS_CACHE_TTL = 300         # DNS 캐시 유지 시간 (초)
+HTTP_KEEPALIVE_TIMEOUT = 60      # 유휴 커넥션 유지 시간 (초)
+HTTP_DEFAULT_TIMEOUT = 10        # 기본 요청 타임아웃 (초)
+HTTP_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# 호스트별 요청 속도 제한 (초당 요청 수, 버스트)
+RATE_LIMITS = {
+    'solved.ac': (5.0, 5),
+    'acmicpc.net': (2.0, 2),
+}
+RATE_LIMIT_DEFAULT = (5.0, 5)    # 위에 없는 호스트
+RATE_LIMIT_MAX_RETRIES = 2       # 429 응답 시 재시도 횟수
+RATE_LIMIT_429_BACKOFF = 5       # Retry-After 헤더가 없을 때 대기 시간 (초)
+RATE_LIMIT_MAX_RETRY_AFTER = 60  # Retry-After 최대 대기 시간 (초)
+
+# 호스트별 서킷 브레이커 (common/circuit_breaker.py, 실제 요청 결과로 장애 판단)
+CIRCUIT_FAILURE_THRESHOLD = 5    # 이 횟수만큼 연속 실패하면 open
+CIRCUIT_ERROR_RATE = 0.5         # 오류율 EWMA가 이 값 이상이면 open
+CIRCUIT_MIN_SAMPLES = 10         # 오류율로 판단하기 전 최소 요청 수
+CIRCUIT_EWMA_ALPHA = 0.2         # 오류율/응답 시간 EWMA 가중치
+CIRCUIT_OPEN_SECONDS = 30        # open 후 시험 요청까지 대기 시간 (초)
+CIRCUIT_OPEN_MAX_SECONDS = 600   # 시험 요청이 계속 실패할 때 대기 시간 최대값 (초, 실패마다 2배)
+
+# 같은 solved.ac/BOJ 조회 결과를 재사용하는 시간 (초, 0이면 진행 중인 요청만 공유)
+SINGLE_FLIGHT_RESULT_TTL = 60
+
+# solved.ac solvedCount 히스토리 캐시
+HISTORY_CACHE_TTL = 600          # 히스토리 재사용 시간 (초)
+HISTORY_CACHE_MAX_HANDLES = 500  # 메모리에 보관할 최대 핸들 수 (LRU)
+HISTORY_CACHE_PERSIST = True     # SQLite(solved_history_cache)에도 저장할지 여부
+
+# solved.ac JSON 검색 API (/api/v3/search/problem)
+SOLVED_AC_SEARCH_PAGE_SIZE = 50   # API 한 페이지 결과 수 (고정 최대값)
+SOLVED_AC_SEARCH_MAX_PAGES = 200  # 한 쿼리에서 읽을 최대 페이지 수 (약 10000문제)
+SOLVED_AC_SEARCH_ID_CHUNK = 40    # id: 필터 하나에 넣을 문제 수 (URL 길이 제한 고려)
+
+# solved.ac 문제 정보 캐시 (SQLite problem_metadata)
+PROBLEM_LOOKUP_BATCH = 100               # /problem/lookup 한 번에 조회할 문제 수
+PROBLEM_META_TTL = 7 * 24 * 3600         # 난이도가 있는 문제 정보 갱신 주기 (초)
+PROBLEM_META_UNRATED_TTL = 24 * 3600     # Unrated 문제 정보 갱신 주기 (초)
+
+# 핸들별 해결한 문제 인덱스 (SQLite solved_problem_index)
+SOLVED_INDEX_FULL_SYNC_INTERVAL = 12 * 3600  # solvedCount가 바뀌었을 때 전체 재수집 최소 간격 (초)
+
+# 멤버별 병렬 조회 설정 (그룹/역할 주간 현황 등)
+FANOUT_MAX_IN_FLIGHT = 8         # 호스트별 동시 진행 요청 수
+FANOUT_MEMBER_TIMEOUT = 20       # 멤버 한 명당 조회 제한 시간 (초)
+
+# SQLite 연결 설정
+DB_CACHE_SIZE_KB = 16 * 1024         # 연결당 페이지 캐시 크기 (KB)
+DB_MMAP_SIZE = 64 * 1024 * 1024      # mmap 크기 (바이트)
+DB_BUSY_TIMEOUT_MS = 5000            # 잠금 대기 시간 (ms)
+DB_STATEMENT_CACHE_SIZE = 256        # 연결당 prepared statement 캐시 수
+DB_READER_POOL_SIZE = 4              # 재사용할 읽기 전용 연결 수
+
+# DB 백업 (sqlite3 backup API)
+BACKUP_DIR = 'backups'               # 백업 폴더
+BACKUP_KEEP = 14                     # 보관할 최근 백업 수
+BACKUP_COMPRESS = True               # gzip 압축 여부
+BACKUP_PAGES_PER_STEP = 256          # 한 단계에 복사할 페이지 수
+BACKUP_STEP_SLEEP = 0.05             # 단계 사이 대기 시간 (초)
+BACKUP_HOUR = 4                      # 자동 백업 시각 (KST, 매일 HH:30)
+
+# 상태 메시지 편집 생략 (내용이 같으면 '마지막 갱신' 시각만 바꾸는 편집을 하지 않음)
+RENDER_TIMESTAMP_REFRESH_HOURS = 6   # 내용이 같아도 이 시간이 지나면 시각 갱신을 위해 편집
+
+# 통합 작업 스케줄러 (common/scheduler.py)
+SCHEDULER_WORKERS = 4                # 동시에 실행할 작업 단위 수
+SCHEDULER_TICK_SECONDS = 20          # 실행 시각 확인 주기 (초)
+SCHEDULER_SPREAD = 40 * 60           # 매시 작업 단위를 나눠 실행할 시간 (초)
+SCHEDULER_JITTER = 30                # 작업 단위별 추가 무작위 지연 최대값 (초)
+SCHEDULER_CATCHUP_MAX_AGE = 12 * 3600  # 재시작 후 보충할 놓친 실행의 최대 경과 시간 (초)
+SCHEDULER_MANUAL_PRIORITY = 2       # 갱신 버튼 요청의 우선순위 (월요일 01시 작업 다음, 매시 갱신보다 먼저)
+
+# 갱신 버튼 (common/refresh_queue.py)
+REFRESH_BUTTON_COOLDOWN = 60         # 같은 메시지/컬럼을 다시 갱신하기까지 최소 간격 (초)
+REFRESH_ETA_DEFAULT = 15             # 소요 시간 기록이 없을 때 예상 소요 시간 (초)
+
 # Tistory 도메인 검증
 TISTORY_DOMAINS = ['tistory.com']
 
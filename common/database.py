@@ -4,278 +4,766 @@ SQLite 데이터베이스 관리 모듈
 """
 import sqlite3
 import json
+import threading
+import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import os
 
+from common.table_cache import TableCache
+from common.config import (
+    DB_CACHE_SIZE_KB,
+    DB_MMAP_SIZE,
+    DB_BUSY_TIMEOUT_MS,
+    DB_STATEMENT_CACHE_SIZE,
+    DB_READER_POOL_SIZE,
+)
+
 DB_FILE = 'bot_data.db'
 
-def get_connection():
-    """데이터베이스 연결"""
-    conn = sqlite3.connect(DB_FILE, check_same_thread=False)
+# ==================== 연결 관리 ====================
+# 매 쿼리마다 connect/close 하지 않도록 연결을 재사용한다.
+# - 쓰기: 프로세스 전체에서 연결 하나 (락으로 한 번에 한 작업만 사용)
+# - 읽기: 읽기 전용 연결 풀 (WAL 모드라 쓰기 중에도 읽기가 막히지 않음)
+# 함수들은 get_connection() 후 try ... finally: conn.close()로 반드시 반납하고,
+# close()는 실제로 닫지 않고 연결을 반납한다.
+# (가비지 컬렉션으로 반납하지 않음 - 쓰기 락은 빌린 스레드에서만 풀 수 있음)
+
+_writer_conn: Optional[sqlite3.Connection] = None
+_writer_lock = threading.RLock()
+_writer_depth = 0  # 같은 스레드에서 중첩해서 빌린 횟수
+_reader_pool: List[sqlite3.Connection] = []
+_pool_lock = threading.Lock()
+
+
+def _open_connection(readonly: bool = False) -> sqlite3.Connection:
+    """pragma가 적용된 새 연결 생성"""
+    conn = sqlite3.connect(DB_FILE, check_same_thread=False, cached_statements=DB_STATEMENT_CACHE_SIZE)
     conn.row_factory = sqlite3.Row
+    conn.execute(f'PRAGMA busy_timeout = {int(DB_BUSY_TIMEOUT_MS)}')
+    if not readonly:
+        conn.execute('PRAGMA journal_mode = WAL')
+    conn.execute('PRAGMA synchronous = NORMAL')
+    conn.execute(f'PRAGMA cache_size = -{int(DB_CACHE_SIZE_KB)}')
+    conn.execute(f'PRAGMA mmap_size = {int(DB_MMAP_SIZE)}')
+    conn.execute('PRAGMA temp_store = MEMORY')
+    if readonly:
+        conn.execute('PRAGMA query_only = ON')
     return conn
 
+
+class _PooledConnection:
+    """close() 시 연결을 닫지 않고 반납하는 래퍼 (나머지는 sqlite3.Connection과 동일)"""
+
+    def __init__(self, conn: sqlite3.Connection, release):
+        self._conn = conn
+        self._release = release
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def __enter__(self):
+        return self._conn.__enter__()
+
+    def __exit__(self, *exc):
+        return self._conn.__exit__(*exc)
+
+    def close(self):
+        if self._release is not None:
+            release, self._release = self._release, None
+            release(self._conn)
+
+
+def _release_writer(conn: sqlite3.Connection):
+    global _writer_depth
+    _writer_depth -= 1
+    if _writer_depth == 0 and conn.in_transaction:
+        # 커밋하지 않고 반납된 작업은 다음 사용자에게 넘기지 않음
+        conn.rollback()
+    _writer_lock.release()
+
+
+def _release_reader(conn: sqlite3.Connection):
+    if conn.in_transaction:
+        conn.rollback()
+    with _pool_lock:
+        if len(_reader_pool) < DB_READER_POOL_SIZE:
+            _reader_pool.append(conn)
+            return
+    conn.close()
+
+
+def get_connection():
+    """데이터베이스 연결 (쓰기용 공유 연결, 사용 후 close()로 반납)"""
+    global _writer_conn, _writer_depth
+    _writer_lock.acquire()
+    try:
+        if _writer_conn is None:
+            _writer_conn = _open_connection()
+        _writer_depth += 1
+    except Exception:
+        _writer_lock.release()
+        raise
+    return _PooledConnection(_writer_conn, _release_writer)
+
+
+def get_read_connection():
+    """읽기 전용 연결 (풀에서 재사용, 사용 후 close()로 반납)"""
+    with _pool_lock:
+        conn = _reader_pool.pop() if _reader_pool else None
+    if conn is None:
+        conn = _open_connection(readonly=True)
+    return _PooledConnection(conn, _release_reader)
+
+
+def close_all_connections():
+    """열려 있는 모든 연결 종료 (복원/종료 시 사용)"""
+    global _writer_conn
+    with _writer_lock:
+        if _writer_conn is not None:
+            _writer_conn.close()
+            _writer_conn = None
+    with _pool_lock:
+        while _reader_pool:
+            _reader_pool.pop().close()
+    invalidate_caches()
+
+# ==================== 메모리 캐시 ====================
+# 매 시간 루프/버튼 콜백마다 읽는 작은 테이블은 TableCache에 두고 읽는다.
+# 아래 테이블에 쓰는 함수는 커밋 후 반드시 해당 캐시의 put/remove를 호출해야 한다.
+
+def _select_all(table: str) -> List[Dict]:
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(f'SELECT * FROM {table}')
+        rows = [dict(row) for row in cursor.fetchall()]
+        return rows
+    finally:
+        conn.close()
+
+def _select_problem_collections(parent: str, items: str, key_column: str) -> List[Dict]:
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(f'SELECT * FROM {parent}')
+        rows = [dict(row) for row in cursor.fetchall()]
+        problem_ids = _load_problem_items(cursor, items, key_column)
+        for row in rows:
+            row['problem_ids'] = problem_ids.get(row['name'], [])
+        return rows
+    finally:
+        conn.close()
+
+_role_token_cache = TableCache('role_tokens', lambda: _select_all('role_tokens'), ('role_name',))
+_group_weekly_status_cache = TableCache(
+    'group_weekly_status', lambda: _select_all('group_weekly_status'),
+    ('group_name',), group_field='group_name', message_index=True)
+_group_problem_set_status_cache = TableCache(
+    'group_problem_set_status', lambda: _select_all('group_problem_set_status'),
+    ('group_name', 'problem_set_name'), group_field='group_name', message_index=True)
+_group_mock_test_status_cache = TableCache(
+    'group_mock_test_status', lambda: _select_all('group_mock_test_status'),
+    ('group_name', 'mock_test_name'), group_field='group_name', message_index=True)
+_group_all_assignment_status_cache = TableCache(
+    'group_all_assignment_status', lambda: _select_all('group_all_assignment_status'),
+    ('group_name',), group_field='group_name', message_index=True)
+_group_link_submission_status_cache = TableCache(
+    'group_link_submissions', lambda: _select_all('group_link_submissions'),
+    ('group_name',), group_field='group_name', message_index=True)
+_problem_set_cache = TableCache(
+    'problem_sets', lambda: _select_problem_collections('problem_sets', 'problem_set_items', 'problem_set_name'),
+    ('name',))
+_mock_test_cache = TableCache(
+    'mock_tests', lambda: _select_problem_collections('mock_tests', 'mock_test_items', 'mock_test_name'),
+    ('name',))
+
+_TABLE_CACHES = [
+    _role_token_cache, _group_weekly_status_cache, _group_problem_set_status_cache,
+    _group_mock_test_status_cache, _group_all_assignment_status_cache,
+    _group_link_submission_status_cache, _problem_set_cache, _mock_test_cache,
+]
+
+def _cached(cache: TableCache):
+    """캐시만 읽는 조회 함수 표시 (async_db가 캐시가 채워져 있으면 스레드 전환 없이 바로 호출)"""
+    def decorator(func):
+        func.table_cache = cache
+        return func
+    return decorator
+
+def invalidate_caches():
+    """모든 메모리 캐시 비우기 (DB 파일을 외부에서 바꾼 경우: 복원/일괄 가져오기 등)"""
+    for cache in _TABLE_CACHES:
+        cache.invalidate()
+
 def init_database():
     """데이터베이스 초기화"""
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
     
-    # 사용자 테이블
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS users (
-            user_id TEXT PRIMARY KEY,
-            username TEXT,
-            boj_handle TEXT,
-            created_at TEXT,
-            updated_at TEXT
-        )
-    ''')
+        # 사용자 테이블
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS users (
+                user_id TEXT PRIMARY KEY,
+                username TEXT,
+                boj_handle TEXT,
+                created_at TEXT,
+                updated_at TEXT
+            )
+        ''')
+    
+        # 역할 토큰 테이블
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS role_tokens (
+                role_name TEXT PRIMARY KEY,
+                token_hash TEXT,
+                original_token TEXT,
+                created_at TEXT
+            )
+        ''')
+    
+        # 사용자 역할 테이블
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS user_roles (
+                user_id TEXT,
+                role_name TEXT,
+                PRIMARY KEY (user_id, role_name)
+            )
+        ''')
+    
+        # 블로그 링크 테이블
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS blog_links (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id TEXT,
+                link TEXT,
+                submitted_at TEXT,
+                UNIQUE(user_id, link)
+            )
+        ''')
+    
+        # 스터디 테이블
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS studies (
+                study_name TEXT PRIMARY KEY,
+                created_at TEXT
+            )
+        ''')
     
-    # 역할 토큰 테이블
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS role_tokens (
-            role_name TEXT PRIMARY KEY,
-            token_hash TEXT,
-            original_token TEXT,
-            created_at TEXT
-        )
-    ''')
+        # 과제 테이블
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS assignments (
+                assignment_id TEXT PRIMARY KEY,
+                study_name TEXT,
+                type TEXT,
+                name TEXT,
+                config TEXT,
+                created_at TEXT,
+                created_by TEXT,
+                FOREIGN KEY (study_name) REFERENCES studies(study_name)
+            )
+        ''')
+    
+        # 제출 테이블
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS submissions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id TEXT,
+                assignment_id TEXT,
+                type TEXT,
+                content TEXT,
+                problem_id INTEGER,
+                verified INTEGER DEFAULT 0,
+                submitted_at TEXT,
+                FOREIGN KEY (user_id) REFERENCES users(user_id),
+                FOREIGN KEY (assignment_id) REFERENCES assignments(assignment_id)
+            )
+        ''')
+
+        # 주간 현황 메시지 테이블 (역할 기준)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS weekly_status_messages (
+                role_name TEXT PRIMARY KEY,
+                channel_id TEXT,
+                message_id TEXT,
+                week_start_date TEXT,
+                created_at TEXT
+            )
+        ''')
+
+        # 그룹 주간 현황 메시지 테이블 (그룹 기준)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS group_weekly_status (
+                group_name TEXT PRIMARY KEY,
+                role_name TEXT,
+                channel_id TEXT,
+                message_id TEXT,
+                week_start TEXT,
+                week_end TEXT,
+                last_updated TEXT
+            )
+        ''')
+    
+        # 문제집 과제 상태 테이블
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS group_problem_set_status (
+                group_name TEXT,
+                problem_set_name TEXT,
+                role_name TEXT,
+                channel_id TEXT,
+                message_id TEXT,
+                week_start TEXT,
+                week_end TEXT,
+                last_updated TEXT,
+                PRIMARY KEY (group_name, problem_set_name)
+            )
+        ''')
+    
+        # 모의테스트 과제 상태 테이블
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS group_mock_test_status (
+                group_name TEXT,
+                mock_test_name TEXT,
+                role_name TEXT,
+                channel_id TEXT,
+                message_id TEXT,
+                week_start TEXT,
+                week_end TEXT,
+                last_updated TEXT,
+                PRIMARY KEY (group_name, mock_test_name)
+            )
+        ''')
+    
+        # 그룹 주간 링크 제출 메시지 테이블
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS group_link_submissions (
+                group_name TEXT PRIMARY KEY,
+                role_name TEXT,
+                channel_id TEXT,
+                message_id TEXT,
+                week_start TEXT,
+                week_end TEXT,
+                last_updated TEXT
+            )
+        ''')
+    
+        # 그룹 주간 링크 제출 데이터 테이블
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS link_submission_data (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                group_name TEXT,
+                user_id TEXT,
+                week_start TEXT,
+                links TEXT,
+                submitted_at TEXT,
+                updated_at TEXT,
+                UNIQUE(group_name, user_id, week_start)
+            )
+        ''')
+    
+        # 문제집 테이블
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS problem_sets (
+                name TEXT PRIMARY KEY,
+                problem_ids TEXT,
+                created_at TEXT,
+                created_by TEXT,
+                updated_at TEXT
+            )
+        ''')
+    
+        # 전체과제현황 테이블
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS group_all_assignment_status (
+                group_name TEXT PRIMARY KEY,
+                role_name TEXT,
+                channel_id TEXT,
+                message_id TEXT,
+                week_start TEXT,
+                week_end TEXT,
+                last_updated TEXT
+            )
+        ''')
+    
+        # 모의테스트 테이블
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS mock_tests (
+                name TEXT PRIMARY KEY,
+                problem_ids TEXT,
+                created_at TEXT,
+                created_by TEXT,
+                updated_at TEXT
+            )
+        ''')
+    
+        # solved.ac 누적 풀이 수 히스토리 캐시 테이블 (핸들별 정렬된 시각/값 배열)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS solved_history_cache (
+                boj_handle TEXT PRIMARY KEY,
+                times BLOB,
+                solved_values BLOB,
+                fetched_at REAL
+            )
+        ''')
+    
+        # 핸들별 해결한 문제 인덱스 테이블 (정렬된 문제 번호 배열, 동기화 시점의 solvedCount)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS solved_problem_index (
+                boj_handle TEXT PRIMARY KEY,
+                problem_ids BLOB,
+                synced_count INTEGER,
+                full_synced_at REAL,
+                updated_at TEXT
+            )
+        ''')
+    
+        # solved.ac 문제 정보 캐시 테이블 (난이도/제목/태그)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS problem_metadata (
+                problem_id INTEGER PRIMARY KEY,
+                title TEXT,
+                level INTEGER,
+                tags TEXT,
+                fetched_at REAL
+            )
+        ''')
     
-    # 사용자 역할 테이블
+        conn.commit()
+
+        # 기본 테이블 생성 이후의 스키마 변경은 마이그레이션으로 적용
+        migrate_database()
+    finally:
+        conn.close()
+
+# ==================== 스키마 마이그레이션 ====================
+# 새 스키마 변경은 init_database의 CREATE TABLE을 고치지 말고 _MIGRATIONS 끝에 추가한다.
+# 적용된 버전은 schema_version 테이블에 기록되어 봇 시작 시 새 단계만 순서대로 실행된다.
+
+def _migration_001_indexes(cursor):
+    """자주 쓰는 조회 조건에 인덱스 추가"""
+    # get_user_by_boj_handle
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_users_boj_handle ON users(boj_handle)')
+    # get_role_users (role_name으로 찾고 user_id로 users 조인)
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_user_roles_role ON user_roles(role_name, user_id)')
+    # get_user_submissions(user_id) ORDER BY submitted_at
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_submissions_user_time ON submissions(user_id, submitted_at)')
+    # get_user_submissions(user_id, assignment_id), add_submission 중복 체크
     cursor.execute('''
-        CREATE TABLE IF NOT EXISTS user_roles (
-            user_id TEXT,
-            role_name TEXT,
-            PRIMARY KEY (user_id, role_name)
-        )
+        CREATE INDEX IF NOT EXISTS idx_submissions_user_assignment
+        ON submissions(user_id, assignment_id, type, problem_id)
     ''')
-    
-    # 블로그 링크 테이블
+    # get_study_submissions (assignments 조인)
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_submissions_assignment ON submissions(assignment_id, submitted_at)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_assignments_study ON assignments(study_name)')
+    # persistent view 버튼에서 메시지로 현황 찾기
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_group_weekly_status_message ON group_weekly_status(channel_id, message_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_group_link_submissions_message ON group_link_submissions(channel_id, message_id)')
     cursor.execute('''
-        CREATE TABLE IF NOT EXISTS blog_links (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id TEXT,
-            link TEXT,
-            submitted_at TEXT,
-            UNIQUE(user_id, link)
-        )
+        CREATE INDEX IF NOT EXISTS idx_group_all_assignment_status_message
+        ON group_all_assignment_status(channel_id, message_id)
     ''')
-    
-    # 스터디 테이블
+
+
+def _parse_problem_ids(text: Optional[str]) -> List[int]:
+    """쉼표로 이어 붙인 문제 번호 문자열을 리스트로 변환 (예전 problem_ids 컬럼 형식)"""
+    if not text:
+        return []
+    return [int(x) for x in text.split(',') if x.strip().isdigit()]
+
+
+def _migration_002_item_tables(cursor):
+    """문제집/모의테스트 문제 목록과 링크 제출 목록을 하위 테이블로 분리"""
     cursor.execute('''
-        CREATE TABLE IF NOT EXISTS studies (
-            study_name TEXT PRIMARY KEY,
-            created_at TEXT
+        CREATE TABLE IF NOT EXISTS problem_set_items (
+            problem_set_name TEXT,
+            ordinal INTEGER,
+            problem_id INTEGER,
+            PRIMARY KEY (problem_set_name, ordinal)
         )
     ''')
-    
-    # 과제 테이블
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_problem_set_items_problem ON problem_set_items(problem_id)')
     cursor.execute('''
-        CREATE TABLE IF NOT EXISTS assignments (
-            assignment_id TEXT PRIMARY KEY,
-            study_name TEXT,
-            type TEXT,
-            name TEXT,
-            config TEXT,
-            created_at TEXT,
-            created_by TEXT,
-            FOREIGN KEY (study_name) REFERENCES studies(study_name)
+        CREATE TABLE IF NOT EXISTS mock_test_items (
+            mock_test_name TEXT,
+            ordinal INTEGER,
+            problem_id INTEGER,
+            PRIMARY KEY (mock_test_name, ordinal)
         )
     ''')
-    
-    # 제출 테이블
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_mock_test_items_problem ON mock_test_items(problem_id)')
     cursor.execute('''
-        CREATE TABLE IF NOT EXISTS submissions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
+        CREATE TABLE IF NOT EXISTS link_submission_items (
+            group_name TEXT,
+            week_start TEXT,
             user_id TEXT,
-            assignment_id TEXT,
-            type TEXT,
-            content TEXT,
-            problem_id INTEGER,
-            verified INTEGER DEFAULT 0,
-            submitted_at TEXT,
-            FOREIGN KEY (user_id) REFERENCES users(user_id),
-            FOREIGN KEY (assignment_id) REFERENCES assignments(assignment_id)
+            ordinal INTEGER,
+            link TEXT,
+            PRIMARY KEY (group_name, week_start, user_id, ordinal)
         )
     ''')
 
-    # 주간 현황 메시지 테이블 (역할 기준)
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS weekly_status_messages (
-            role_name TEXT PRIMARY KEY,
-            channel_id TEXT,
-            message_id TEXT,
-            week_start_date TEXT,
-            created_at TEXT
+    # 기존 텍스트/JSON 컬럼 데이터 옮기기 (기존 컬럼은 더 이상 읽지 않음)
+    for parent, items, key_column in (('problem_sets', 'problem_set_items', 'problem_set_name'),
+                                      ('mock_tests', 'mock_test_items', 'mock_test_name')):
+        cursor.execute(f'SELECT name, problem_ids FROM {parent}')
+        rows = [
+            (row['name'], ordinal, problem_id)
+            for row in cursor.fetchall()
+            for ordinal, problem_id in enumerate(_parse_problem_ids(row['problem_ids']))
+        ]
+        cursor.executemany(
+            f'INSERT OR REPLACE INTO {items} ({key_column}, ordinal, problem_id) VALUES (?, ?, ?)', rows
         )
-    ''')
 
-    # 그룹 주간 현황 메시지 테이블 (그룹 기준)
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS group_weekly_status (
-            group_name TEXT PRIMARY KEY,
-            role_name TEXT,
-            channel_id TEXT,
-            message_id TEXT,
-            week_start TEXT,
-            week_end TEXT,
-            last_updated TEXT
+    cursor.execute('SELECT group_name, week_start, user_id, links FROM link_submission_data')
+    rows = []
+    for row in cursor.fetchall():
+        try:
+            links = json.loads(row['links']) if row['links'] else []
+        except ValueError:
+            links = []
+        rows.extend(
+            (row['group_name'], row['week_start'], row['user_id'], ordinal, link)
+            for ordinal, link in enumerate(links)
         )
-    ''')
-    
-    # 문제집 과제 상태 테이블
+    cursor.executemany('''
+        INSERT OR REPLACE INTO link_submission_items (group_name, week_start, user_id, ordinal, link)
+        VALUES (?, ?, ?, ?, ?)
+    ''', rows)
+
+
+def _migration_003_weekly_snapshots(cursor):
+    """주간 결과 기록 테이블 (추가만 하고 수정/삭제하지 않음)"""
+    # 그룹/문제집 이름을 정수 id로 바꿔 기록 행을 작게 유지
     cursor.execute('''
-        CREATE TABLE IF NOT EXISTS group_problem_set_status (
-            group_name TEXT,
-            problem_set_name TEXT,
-            role_name TEXT,
-            channel_id TEXT,
-            message_id TEXT,
-            week_start TEXT,
-            week_end TEXT,
-            last_updated TEXT,
-            PRIMARY KEY (group_name, problem_set_name)
+        CREATE TABLE IF NOT EXISTS snapshot_names (
+            id INTEGER PRIMARY KEY,
+            name TEXT UNIQUE NOT NULL
         )
     ''')
-    
-    # 모의테스트 과제 상태 테이블
+    # 멤버-주 한 행 (week는 주 시작일 YYYYMMDD, user_id는 Discord ID 정수)
     cursor.execute('''
-        CREATE TABLE IF NOT EXISTS group_mock_test_status (
-            group_name TEXT,
-            mock_test_name TEXT,
-            role_name TEXT,
-            channel_id TEXT,
-            message_id TEXT,
-            week_start TEXT,
-            week_end TEXT,
-            last_updated TEXT,
-            PRIMARY KEY (group_name, mock_test_name)
-        )
+        CREATE TABLE IF NOT EXISTS weekly_snapshots (
+            group_id INTEGER NOT NULL,
+            week INTEGER NOT NULL,
+            user_id INTEGER NOT NULL,
+            boj_handle TEXT,
+            solved_count INTEGER NOT NULL,
+            PRIMARY KEY (group_id, week, user_id)
+        ) WITHOUT ROWID
     ''')
-    
-    # 그룹 주간 링크 제출 메시지 테이블
     cursor.execute('''
-        CREATE TABLE IF NOT EXISTS group_link_submissions (
-            group_name TEXT PRIMARY KEY,
-            role_name TEXT,
-            channel_id TEXT,
-            message_id TEXT,
-            week_start TEXT,
-            week_end TEXT,
-            last_updated TEXT
-        )
+        CREATE TABLE IF NOT EXISTS problem_set_snapshots (
+            group_id INTEGER NOT NULL,
+            week INTEGER NOT NULL,
+            user_id INTEGER NOT NULL,
+            problem_set_id INTEGER NOT NULL,
+            solved_count INTEGER NOT NULL,
+            total INTEGER NOT NULL,
+            PRIMARY KEY (group_id, week, user_id, problem_set_id)
+        ) WITHOUT ROWID
     ''')
-    
-    # 그룹 주간 링크 제출 데이터 테이블
+    # 멤버별 기록 조회
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_weekly_snapshots_user ON weekly_snapshots(user_id, week)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_problem_set_snapshots_user ON problem_set_snapshots(user_id, week)')
+
+
+def _migration_004_problem_set_progress(cursor):
+    """문제집 과제 멤버별 진행 상황 (solvedCount가 그대로인 멤버는 다시 크롤링하지 않기 위해)"""
     cursor.execute('''
-        CREATE TABLE IF NOT EXISTS link_submission_data (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
+        CREATE TABLE IF NOT EXISTS problem_set_progress (
             group_name TEXT,
+            problem_set_name TEXT,
             user_id TEXT,
-            week_start TEXT,
-            links TEXT,
-            submitted_at TEXT,
+            boj_handle TEXT,
+            solved_problems TEXT,
+            observed_count INTEGER,
             updated_at TEXT,
-            UNIQUE(group_name, user_id, week_start)
+            PRIMARY KEY (group_name, problem_set_name, user_id)
         )
     ''')
-    
-    # 문제집 테이블
+
+
+def _migration_005_assignment_status_cells(cursor):
+    """전체과제현황 표 (그룹, 멤버, 컬럼)별 값 - 부분 갱신 때 이전 메시지를 파싱하지 않기 위해"""
     cursor.execute('''
-        CREATE TABLE IF NOT EXISTS problem_sets (
-            name TEXT PRIMARY KEY,
-            problem_ids TEXT,
-            created_at TEXT,
-            created_by TEXT,
-            updated_at TEXT
+        CREATE TABLE IF NOT EXISTS assignment_status_cells (
+            group_name TEXT,
+            user_id TEXT,
+            column_name TEXT,
+            column_order INTEGER,
+            value TEXT,
+            updated_at TEXT,
+            PRIMARY KEY (group_name, user_id, column_name)
         )
     ''')
-    
-    # 전체과제현황 테이블
+
+
+def _migration_006_message_render_state(cursor):
+    """상태 메시지별 마지막으로 편집한 내용의 해시"""
     cursor.execute('''
-        CREATE TABLE IF NOT EXISTS group_all_assignment_status (
-            group_name TEXT PRIMARY KEY,
-            role_name TEXT,
+        CREATE TABLE IF NOT EXISTS message_render_state (
             channel_id TEXT,
             message_id TEXT,
-            week_start TEXT,
-            week_end TEXT,
-            last_updated TEXT
+            content_hash TEXT,
+            edited_at REAL,
+            PRIMARY KEY (channel_id, message_id)
         )
     ''')
-    
-    # 모의테스트 테이블
+
+
+def _migration_007_scheduler_job_runs(cursor):
+    """스케줄러 작업별 마지막 실행 시각 (재시작 후 놓친 실행 보충용)"""
     cursor.execute('''
-        CREATE TABLE IF NOT EXISTS mock_tests (
-            name TEXT PRIMARY KEY,
-            problem_ids TEXT,
-            created_at TEXT,
-            created_by TEXT,
-            updated_at TEXT
+        CREATE TABLE IF NOT EXISTS scheduler_job_runs (
+            job_name TEXT PRIMARY KEY,
+            last_slot TEXT,
+            finished_at TEXT
         )
     ''')
-    
-    conn.commit()
-    conn.close()
+
+
+# (버전, 설명, 적용 함수) - 버전은 1부터 순서대로 증가
+_MIGRATIONS = [
+    (1, '조회용 보조 인덱스 추가', _migration_001_indexes),
+    (2, '문제집/모의테스트/링크 제출 목록 하위 테이블 분리', _migration_002_item_tables),
+    (3, '주간 결과 기록 테이블 추가', _migration_003_weekly_snapshots),
+    (4, '문제집 과제 멤버별 진행 상황 테이블 추가', _migration_004_problem_set_progress),
+    (5, '전체과제현황 표 테이블 추가', _migration_005_assignment_status_cells),
+    (6, '상태 메시지 내용 해시 테이블 추가', _migration_006_message_render_state),
+    (7, '스케줄러 작업 실행 기록 테이블 추가', _migration_007_scheduler_job_runs),
+]
+
+
+def get_schema_version() -> int:
+    """현재 적용된 스키마 버전 (마이그레이션 전이면 0)"""
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'schema_version'")
+        if cursor.fetchone() is None:
+            return 0
+        cursor.execute('SELECT MAX(version) AS version FROM schema_version')
+        row = cursor.fetchone()
+
+        return row['version'] or 0
+    finally:
+        conn.close()
+
+def migrate_database() -> int:
+    """
+    아직 적용되지 않은 마이그레이션을 버전 순서대로 실행
+
+    각 단계는 한 트랜잭션으로 적용되며, 실패하면 해당 단계만 롤백되고 예외가 전달된다.
+
+    Returns:
+        적용 후 스키마 버전
+    """
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                description TEXT,
+                applied_at TEXT
+            )
+        ''')
+        conn.commit()
+
+        cursor.execute('SELECT version FROM schema_version')
+        applied = {row['version'] for row in cursor.fetchall()}
+
+        current = max(applied, default=0)
+        for version, description, migrate in _MIGRATIONS:
+            if version in applied:
+                continue
+            # sqlite3 모듈은 DDL 앞에서 트랜잭션을 자동으로 열지 않아 문장마다 바로 커밋되므로,
+            # 단계 전체를 직접 BEGIN으로 묶어 실패 시 버전 기록과 함께 롤백되도록 함
+            cursor.execute('BEGIN')
+            try:
+                migrate(cursor)
+                cursor.execute(
+                    'INSERT INTO schema_version (version, description, applied_at) VALUES (?, ?, ?)',
+                    (version, description, datetime.now().isoformat())
+                )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            current = version
+            print(f"[DB] 스키마 마이그레이션 {version} 적용: {description}")
+
+        # 새 인덱스 통계 반영 (변경이 필요한 경우에만 ANALYZE 수행)
+        cursor.execute('PRAGMA optimize')
+    finally:
+        conn.close()
+
+    return current
 
 def reset_database():
     """데이터베이스 초기화 (모든 데이터 삭제)"""
     conn = get_connection()
-    cursor = conn.cursor()
-    
-    # 모든 테이블 삭제
-    cursor.execute('DROP TABLE IF EXISTS weekly_status_messages')
-    cursor.execute('DROP TABLE IF EXISTS submissions')
-    cursor.execute('DROP TABLE IF EXISTS assignments')
-    cursor.execute('DROP TABLE IF EXISTS studies')
-    cursor.execute('DROP TABLE IF EXISTS blog_links')
-    cursor.execute('DROP TABLE IF EXISTS user_roles')
-    cursor.execute('DROP TABLE IF EXISTS role_tokens')
-    cursor.execute('DROP TABLE IF EXISTS users')
-    
-    conn.commit()
-    conn.close()
+    try:
+        cursor = conn.cursor()
+    
+        # 모든 테이블 삭제 (init_database와 마이그레이션으로 만든 테이블 전부)
+        # 다시 만든 테이블에 마이그레이션이 재적용되도록 버전 기록(schema_version)도 삭제됨
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'")
+        for (table,) in cursor.fetchall():
+            cursor.execute(f'DROP TABLE IF EXISTS "{table}"')
     
-    # 테이블 재생성
-    init_database()
+        conn.commit()
+        invalidate_caches()
+    
+        # 테이블 재생성
+        init_database()
+    finally:
+        conn.close()
 
 # ==================== 사용자 관리 ====================
 
 def get_user(user_id: str) -> Optional[Dict]:
     """사용자 정보 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
     
-    cursor.execute('SELECT * FROM users WHERE user_id = ?', (user_id,))
-    row = cursor.fetchone()
-    conn.close()
+        cursor.execute('SELECT * FROM users WHERE user_id = ?', (user_id,))
+        row = cursor.fetchone()
     
-    if row:
-        return dict(row)
-    return None
+        if row:
+            return dict(row)
+        return None
+    finally:
+        conn.close()
 
 def create_or_update_user(user_id: str, username: str, boj_handle: Optional[str] = None):
     """사용자 생성 또는 업데이트"""
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
     
-    now = datetime.now().isoformat()
-    user = get_user(user_id)
+        now = datetime.now().isoformat()
+        user = get_user(user_id)
     
-    if user:
-        cursor.execute('''
-            UPDATE users SET username = ?, boj_handle = ?, updated_at = ?
-            WHERE user_id = ?
-        ''', (username, boj_handle, now, user_id))
-    else:
-        cursor.execute('''
-            INSERT INTO users (user_id, username, boj_handle, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (user_id, username, boj_handle, now, now))
+        if user:
+            cursor.execute('''
+                UPDATE users SET username = ?, boj_handle = ?, updated_at = ?
+                WHERE user_id = ?
+            ''', (username, boj_handle, now, user_id))
+        else:
+            cursor.execute('''
+                INSERT INTO users (user_id, username, boj_handle, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (user_id, username, boj_handle, now, now))
     
-    conn.commit()
-    conn.close()
+        conn.commit()
+    finally:
+        conn.close()
 
 # -------------------- 사용자 조회/삭제 --------------------
 
@@ -283,174 +771,186 @@ def get_user_by_boj_handle(boj_handle: str) -> Optional[Dict]:
     """BOJ 핸들로 사용자 조회"""
     if not boj_handle:
         return None
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute('SELECT * FROM users WHERE boj_handle = ?', (boj_handle,))
-    row = cursor.fetchone()
-    conn.close()
-    if row:
-        return dict(row)
-    return None
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute('SELECT * FROM users WHERE boj_handle = ?', (boj_handle,))
+        row = cursor.fetchone()
+        if row:
+            return dict(row)
+        return None
+    finally:
+        conn.close()
 
 # ==================== 역할 관리 ====================
 # ==================== 역할 관리 ====================
 
+@_cached(_role_token_cache)
 def get_role_token(role_name: str) -> Optional[Dict]:
     """역할 토큰 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT * FROM role_tokens WHERE role_name = ?', (role_name,))
-    row = cursor.fetchone()
-    conn.close()
-    
-    if row:
-        return dict(row)
-    return None
+    return _role_token_cache.get(role_name)
 
 def save_role_token(role_name: str, token_hash: str, original_token: str):
     """역할 토큰 저장"""
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
     
-    now = datetime.now().isoformat()
-    cursor.execute('''
-        INSERT OR REPLACE INTO role_tokens (role_name, token_hash, original_token, created_at)
-        VALUES (?, ?, ?, ?)
-    ''', (role_name, token_hash, original_token, now))
+        now = datetime.now().isoformat()
+        cursor.execute('''
+            INSERT OR REPLACE INTO role_tokens (role_name, token_hash, original_token, created_at)
+            VALUES (?, ?, ?, ?)
+        ''', (role_name, token_hash, original_token, now))
     
-    conn.commit()
-    conn.close()
+        conn.commit()
+        _role_token_cache.put({
+            'role_name': role_name, 'token_hash': token_hash, 'original_token': original_token, 'created_at': now
+        })
+    finally:
+        conn.close()
 
+@_cached(_role_token_cache)
 def get_all_role_tokens() -> Dict[str, Dict]:
     """모든 역할 토큰 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT * FROM role_tokens')
-    rows = cursor.fetchall()
-    conn.close()
-    
-    return {row['role_name']: dict(row) for row in rows}
+    return {row['role_name']: row for row in _role_token_cache.all()}
 
 def delete_role_token(role_name: str):
     """역할 토큰 삭제"""
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
     
-    cursor.execute('DELETE FROM role_tokens WHERE role_name = ?', (role_name,))
-    conn.commit()
-    conn.close()
+        cursor.execute('DELETE FROM role_tokens WHERE role_name = ?', (role_name,))
+        conn.commit()
+        _role_token_cache.remove(role_name)
+    finally:
+        conn.close()
 
 # ==================== 사용자 역할 관리 ====================
 
 def add_user_role(user_id: str, role_name: str):
     """사용자에게 역할 추가"""
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
     
-    cursor.execute('''
-        INSERT OR IGNORE INTO user_roles (user_id, role_name)
-        VALUES (?, ?)
-    ''', (user_id, role_name))
+        cursor.execute('''
+            INSERT OR IGNORE INTO user_roles (user_id, role_name)
+            VALUES (?, ?)
+        ''', (user_id, role_name))
     
-    conn.commit()
-    conn.close()
+        conn.commit()
+    finally:
+        conn.close()
 
 def remove_user_role(user_id: str, role_name: str):
     """사용자에게서 역할 제거"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute('DELETE FROM user_roles WHERE user_id = ? AND role_name = ?', (user_id, role_name))
-    conn.commit()
-    conn.close()
+    try:
+        cursor = conn.cursor()
+        cursor.execute('DELETE FROM user_roles WHERE user_id = ? AND role_name = ?', (user_id, role_name))
+        conn.commit()
+    finally:
+        conn.close()
 
 def get_user_roles(user_id: str) -> List[str]:
     """사용자의 역할 목록 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
     
-    cursor.execute('SELECT role_name FROM user_roles WHERE user_id = ?', (user_id,))
-    rows = cursor.fetchall()
-    conn.close()
+        cursor.execute('SELECT role_name FROM user_roles WHERE user_id = ?', (user_id,))
+        rows = cursor.fetchall()
     
-    return [row['role_name'] for row in rows]
+        return [row['role_name'] for row in rows]
+    finally:
+        conn.close()
 
 def get_role_users(role_name: str) -> List[Dict]:
     """특정 역할을 가진 사용자 목록 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        SELECT u.user_id, u.username, u.boj_handle 
-        FROM users u
-        JOIN user_roles ur ON u.user_id = ur.user_id
-        WHERE ur.role_name = ?
-        ORDER BY u.username
-    ''', (role_name,))
-    rows = cursor.fetchall()
-    conn.close()
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
     
-    return [dict(row) for row in rows]
+        cursor.execute('''
+            SELECT u.user_id, u.username, u.boj_handle 
+            FROM users u
+            JOIN user_roles ur ON u.user_id = ur.user_id
+            WHERE ur.role_name = ?
+            ORDER BY u.username
+        ''', (role_name,))
+        rows = cursor.fetchall()
+    
+        return [dict(row) for row in rows]
+    finally:
+        conn.close()
 
 # ==================== 블로그 링크 관리 ====================
 
 def add_blog_link(user_id: str, link: str):
     """블로그 링크 추가"""
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
     
-    now = datetime.now().isoformat()
-    cursor.execute('''
-        INSERT OR IGNORE INTO blog_links (user_id, link, submitted_at)
-        VALUES (?, ?, ?)
-    ''', (user_id, link, now))
+        now = datetime.now().isoformat()
+        cursor.execute('''
+            INSERT OR IGNORE INTO blog_links (user_id, link, submitted_at)
+            VALUES (?, ?, ?)
+        ''', (user_id, link, now))
     
-    conn.commit()
-    conn.close()
+        conn.commit()
+    finally:
+        conn.close()
 
 def get_user_blog_links(user_id: str) -> List[Dict]:
     """사용자의 블로그 링크 목록 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        SELECT * FROM blog_links WHERE user_id = ?
-        ORDER BY submitted_at DESC
-    ''', (user_id,))
-    rows = cursor.fetchall()
-    conn.close()
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
     
-    return [dict(row) for row in rows]
-
+        cursor.execute('''
+            SELECT * FROM blog_links WHERE user_id = ?
+            ORDER BY submitted_at DESC
+        ''', (user_id,))
+        rows = cursor.fetchall()
+    
+        return [dict(row) for row in rows]
+    finally:
+        conn.close()
+
 # ==================== 스터디 관리 ====================
 
 def create_study(study_name: str):
     """스터디 생성"""
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
     
-    now = datetime.now().isoformat()
-    cursor.execute('''
-        INSERT OR IGNORE INTO studies (study_name, created_at)
-        VALUES (?, ?)
-    ''', (study_name, now))
+        now = datetime.now().isoformat()
+        cursor.execute('''
+            INSERT OR IGNORE INTO studies (study_name, created_at)
+            VALUES (?, ?)
+        ''', (study_name, now))
     
-    conn.commit()
-    conn.close()
+        conn.commit()
+    finally:
+        conn.close()
 
 def get_study(study_name: str) -> Optional[Dict]:
     """스터디 정보 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
     
-    cursor.execute('SELECT * FROM studies WHERE study_name = ?', (study_name,))
-    row = cursor.fetchone()
-    conn.close()
+        cursor.execute('SELECT * FROM studies WHERE study_name = ?', (study_name,))
+        row = cursor.fetchone()
     
-    if row:
-        return dict(row)
-    return None
+        if row:
+            return dict(row)
+        return None
+    finally:
+        conn.close()
 
 # ==================== 과제 관리 ====================
 
@@ -458,86 +958,96 @@ def create_assignment(assignment_id: str, study_name: str, assignment_type: str,
                      name: str, config: Dict, created_by: str):
     """과제 생성"""
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
     
-    now = datetime.now().isoformat()
-    config_json = json.dumps(config, ensure_ascii=False)
+        now = datetime.now().isoformat()
+        config_json = json.dumps(config, ensure_ascii=False)
     
-    cursor.execute('''
-        INSERT OR REPLACE INTO assignments 
-        (assignment_id, study_name, type, name, config, created_at, created_by)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-    ''', (assignment_id, study_name, assignment_type, name, config_json, now, created_by))
+        cursor.execute('''
+            INSERT OR REPLACE INTO assignments 
+            (assignment_id, study_name, type, name, config, created_at, created_by)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', (assignment_id, study_name, assignment_type, name, config_json, now, created_by))
     
-    conn.commit()
-    conn.close()
+        conn.commit()
+    finally:
+        conn.close()
 
 def get_assignment(assignment_id: str) -> Optional[Dict]:
     """과제 정보 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
     
-    cursor.execute('SELECT * FROM assignments WHERE assignment_id = ?', (assignment_id,))
-    row = cursor.fetchone()
-    conn.close()
+        cursor.execute('SELECT * FROM assignments WHERE assignment_id = ?', (assignment_id,))
+        row = cursor.fetchone()
     
-    if row:
-        result = dict(row)
-        result['config'] = json.loads(result['config'])
-        return result
-    return None
+        if row:
+            result = dict(row)
+            result['config'] = json.loads(result['config'])
+            return result
+        return None
+    finally:
+        conn.close()
 
 def get_study_assignments(study_name: str) -> Dict[str, Dict]:
     """스터디의 모든 과제 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
     
-    cursor.execute('SELECT * FROM assignments WHERE study_name = ?', (study_name,))
-    rows = cursor.fetchall()
-    conn.close()
+        cursor.execute('SELECT * FROM assignments WHERE study_name = ?', (study_name,))
+        rows = cursor.fetchall()
     
-    result = {}
-    for row in rows:
-        assignment = dict(row)
-        assignment['config'] = json.loads(assignment['config'])
-        result[assignment['assignment_id']] = assignment
+        result = {}
+        for row in rows:
+            assignment = dict(row)
+            assignment['config'] = json.loads(assignment['config'])
+            result[assignment['assignment_id']] = assignment
     
-    return result
+        return result
+    finally:
+        conn.close()
 
 def update_assignment(assignment_id: str, name: Optional[str] = None, config: Optional[Dict] = None):
     """과제 수정"""
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
     
-    updates = []
-    params = []
+        updates = []
+        params = []
     
-    if name:
-        updates.append('name = ?')
-        params.append(name)
+        if name:
+            updates.append('name = ?')
+            params.append(name)
     
-    if config:
-        updates.append('config = ?')
-        params.append(json.dumps(config, ensure_ascii=False))
+        if config:
+            updates.append('config = ?')
+            params.append(json.dumps(config, ensure_ascii=False))
     
-    if updates:
-        params.append(assignment_id)
-        cursor.execute(f'''
-            UPDATE assignments SET {', '.join(updates)}
-            WHERE assignment_id = ?
-        ''', params)
-        conn.commit()
+        if updates:
+            params.append(assignment_id)
+            cursor.execute(f'''
+                UPDATE assignments SET {', '.join(updates)}
+                WHERE assignment_id = ?
+            ''', params)
+            conn.commit()
+    finally:
+        conn.close()
     
-    conn.close()
 
 def delete_assignment(assignment_id: str):
     """과제 삭제"""
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
     
-    cursor.execute('DELETE FROM assignments WHERE assignment_id = ?', (assignment_id,))
-    conn.commit()
-    conn.close()
+        cursor.execute('DELETE FROM assignments WHERE assignment_id = ?', (assignment_id,))
+        conn.commit()
+    finally:
+        conn.close()
 
 # ==================== 제출 관리 ====================
 
@@ -594,132 +1104,129 @@ def add_submission(user_id: str, assignment_id: str, submission_type: str,
 
 def get_user_submissions(user_id: str, assignment_id: Optional[str] = None) -> List[Dict]:
     """사용자의 제출 목록 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
     
-    if assignment_id:
-        cursor.execute('''
-            SELECT * FROM submissions 
-            WHERE user_id = ? AND assignment_id = ?
-            ORDER BY submitted_at DESC
-        ''', (user_id, assignment_id))
-    else:
-        cursor.execute('''
-            SELECT * FROM submissions 
-            WHERE user_id = ?
-            ORDER BY submitted_at DESC
-        ''', (user_id,))
+        if assignment_id:
+            cursor.execute('''
+                SELECT * FROM submissions 
+                WHERE user_id = ? AND assignment_id = ?
+                ORDER BY submitted_at DESC
+            ''', (user_id, assignment_id))
+        else:
+            cursor.execute('''
+                SELECT * FROM submissions 
+                WHERE user_id = ?
+                ORDER BY submitted_at DESC
+            ''', (user_id,))
     
-    rows = cursor.fetchall()
-    conn.close()
+        rows = cursor.fetchall()
     
-    return [dict(row) for row in rows]
+        return [dict(row) for row in rows]
+    finally:
+        conn.close()
 
 def get_study_submissions(study_name: str) -> Dict[str, List[Dict]]:
     """스터디의 모든 제출 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        SELECT s.* FROM submissions s
-        JOIN assignments a ON s.assignment_id = a.assignment_id
-        WHERE a.study_name = ?
-        ORDER BY s.submitted_at DESC
-    ''', (study_name,))
-    
-    rows = cursor.fetchall()
-    conn.close()
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
     
-    result = {}
-    for row in rows:
-        submission = dict(row)
-        assignment_id = submission['assignment_id']
-        if assignment_id not in result:
-            result[assignment_id] = []
-        result[assignment_id].append(submission)
+        cursor.execute('''
+            SELECT s.* FROM submissions s
+            JOIN assignments a ON s.assignment_id = a.assignment_id
+            WHERE a.study_name = ?
+            ORDER BY s.submitted_at DESC
+        ''', (study_name,))
+    
+        rows = cursor.fetchall()
+    
+        result = {}
+        for row in rows:
+            submission = dict(row)
+            assignment_id = submission['assignment_id']
+            if assignment_id not in result:
+                result[assignment_id] = []
+            result[assignment_id].append(submission)
     
-    return result
+        return result
+    finally:
+        conn.close()
 
 # ==================== 주간 현황 메시지 관리 ====================
 
 def save_weekly_status_message(role_name: str, channel_id: str, message_id: str, week_start_date: str):
     """주간 현황 메시지 저장"""
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
     
-    now = datetime.now().isoformat()
-    cursor.execute('''
-        INSERT OR REPLACE INTO weekly_status_messages 
-        (role_name, channel_id, message_id, week_start_date, created_at)
-        VALUES (?, ?, ?, ?, ?)
-    ''', (role_name, channel_id, message_id, week_start_date, now))
+        now = datetime.now().isoformat()
+        cursor.execute('''
+            INSERT OR REPLACE INTO weekly_status_messages 
+            (role_name, channel_id, message_id, week_start_date, created_at)
+            VALUES (?, ?, ?, ?, ?)
+        ''', (role_name, channel_id, message_id, week_start_date, now))
     
-    conn.commit()
-    conn.close()
+        conn.commit()
+    finally:
+        conn.close()
 
 def save_group_weekly_status(group_name: str, role_name: str, channel_id: str,
                              message_id: str, week_start: str, week_end: str,
                              last_updated: Optional[str] = None):
     """그룹 주간 현황 메시지 저장"""
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
     
-    now = last_updated or datetime.now().isoformat()
-    cursor.execute('''
-        INSERT OR REPLACE INTO group_weekly_status
-        (group_name, role_name, channel_id, message_id, week_start, week_end, last_updated)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-    ''', (group_name, role_name, channel_id, message_id, week_start, week_end, now))
+        now = last_updated or datetime.now().isoformat()
+        cursor.execute('''
+            INSERT OR REPLACE INTO group_weekly_status
+            (group_name, role_name, channel_id, message_id, week_start, week_end, last_updated)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', (group_name, role_name, channel_id, message_id, week_start, week_end, now))
     
-    conn.commit()
-    conn.close()
+        conn.commit()
+        _group_weekly_status_cache.put({
+            'group_name': group_name,
+            'role_name': role_name,
+            'channel_id': str(channel_id),
+            'message_id': str(message_id),
+            'week_start': week_start,
+            'week_end': week_end,
+            'last_updated': now
+        })
+    finally:
+        conn.close()
 
+@_cached(_group_weekly_status_cache)
 def get_group_weekly_status(group_name: str) -> Optional[Dict]:
     """그룹 주간 현황 메시지 가져오기 (그룹 이름 기준)"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT * FROM group_weekly_status WHERE group_name = ?', (group_name,))
-    row = cursor.fetchone()
-    conn.close()
-    
-    if row:
-        return dict(row)
-    return None
+    return _group_weekly_status_cache.get(group_name)
 
+@_cached(_group_weekly_status_cache)
 def get_group_weekly_status_by_message(channel_id: str, message_id: str) -> Optional[Dict]:
     """채널/메시지 ID로 그룹 주간 현황 메시지 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT * FROM group_weekly_status WHERE channel_id = ? AND message_id = ?',
-                   (channel_id, message_id))
-    row = cursor.fetchone()
-    conn.close()
-    
-    if row:
-        return dict(row)
-    return None
+    return _group_weekly_status_cache.by_message(channel_id, message_id)
 
+@_cached(_group_weekly_status_cache)
 def get_all_group_weekly_status() -> List[Dict]:
     """모든 그룹 주간 현황 메시지 목록 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT * FROM group_weekly_status')
-    rows = cursor.fetchall()
-    conn.close()
-    
-    return [dict(row) for row in rows]
+    return _group_weekly_status_cache.all()
 
 def delete_group_weekly_status(group_name: str):
     """그룹 주간 현황 메시지 삭제"""
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
     
-    cursor.execute('DELETE FROM group_weekly_status WHERE group_name = ?', (group_name,))
-    conn.commit()
-    conn.close()
+        cursor.execute('DELETE FROM group_weekly_status WHERE group_name = ?', (group_name,))
+        conn.commit()
+        _group_weekly_status_cache.remove(group_name)
+    finally:
+        conn.close()
 
 # ==================== 문제집 과제 상태 관리 ====================
 
@@ -728,52 +1235,126 @@ def save_group_problem_set_status(group_name: str, problem_set_name: str, role_n
                                   last_updated: Optional[str] = None):
     """문제집 과제 상태 메시지 저장"""
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
     
-    now = last_updated or datetime.now().isoformat()
-    cursor.execute('''
-        INSERT OR REPLACE INTO group_problem_set_status
-        (group_name, problem_set_name, role_name, channel_id, message_id, week_start, week_end, last_updated)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    ''', (group_name, problem_set_name, role_name, channel_id, message_id, week_start, week_end, now))
+        now = last_updated or datetime.now().isoformat()
+        cursor.execute('''
+            INSERT OR REPLACE INTO group_problem_set_status
+            (group_name, problem_set_name, role_name, channel_id, message_id, week_start, week_end, last_updated)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (group_name, problem_set_name, role_name, channel_id, message_id, week_start, week_end, now))
     
-    conn.commit()
-    conn.close()
+        conn.commit()
+        _group_problem_set_status_cache.put({
+            'group_name': group_name,
+            'problem_set_name': problem_set_name,
+            'role_name': role_name,
+            'channel_id': str(channel_id),
+            'message_id': str(message_id),
+            'week_start': week_start,
+            'week_end': week_end,
+            'last_updated': now
+        })
+    finally:
+        conn.close()
 
+@_cached(_group_problem_set_status_cache)
 def get_group_problem_set_status(group_name: str, problem_set_name: str) -> Optional[Dict]:
     """문제집 과제 상태 메시지 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT * FROM group_problem_set_status WHERE group_name = ? AND problem_set_name = ?',
-                   (group_name, problem_set_name))
-    row = cursor.fetchone()
-    conn.close()
-    
-    if row:
-        return dict(row)
-    return None
+    return _group_problem_set_status_cache.get(group_name, problem_set_name)
 
+@_cached(_group_problem_set_status_cache)
 def get_all_group_problem_set_status() -> List[Dict]:
     """모든 문제집 과제 상태 메시지 목록 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT * FROM group_problem_set_status')
-    rows = cursor.fetchall()
-    conn.close()
-    
-    return [dict(row) for row in rows]
+    return _group_problem_set_status_cache.all()
+
+@_cached(_group_problem_set_status_cache)
+def get_group_problem_set_statuses(group_name: str) -> List[Dict]:
+    """특정 그룹의 문제집 과제 상태 메시지 목록"""
+    return _group_problem_set_status_cache.by_group(group_name)
+
+@_cached(_group_problem_set_status_cache)
+def get_group_problem_set_status_by_message(channel_id: str, message_id: str) -> Optional[Dict]:
+    """채널/메시지 ID로 문제집 과제 상태 메시지 가져오기"""
+    return _group_problem_set_status_cache.by_message(channel_id, message_id)
 
 def delete_group_problem_set_status(group_name: str, problem_set_name: str):
     """문제집 과제 상태 메시지 삭제"""
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
     
-    cursor.execute('DELETE FROM group_problem_set_status WHERE group_name = ? AND problem_set_name = ?',
-                   (group_name, problem_set_name))
-    conn.commit()
-    conn.close()
+        cursor.execute('DELETE FROM group_problem_set_status WHERE group_name = ? AND problem_set_name = ?',
+                       (group_name, problem_set_name))
+        cursor.execute('DELETE FROM problem_set_progress WHERE group_name = ? AND problem_set_name = ?',
+                       (group_name, problem_set_name))
+        conn.commit()
+        _group_problem_set_status_cache.remove(group_name, problem_set_name)
+    finally:
+        conn.close()
+
+# ==================== 문제집 과제 진행 상황 ====================
+# 멤버별로 마지막으로 확인한 해결 목록과 그때의 solvedCount를 저장한다.
+# solvedCount가 그대로면 해결 목록도 그대로이므로 다시 크롤링하지 않는다.
+
+def get_problem_set_progress(group_name: str, problem_set_name: str) -> Dict[str, Dict]:
+    """
+    문제집 과제의 멤버별 진행 상황
+
+    Returns:
+        {user_id: {'boj_handle', 'solved_problems', 'observed_count', 'updated_at'}}
+        observed_count가 None이면 확인이 끝나지 않은 기록 (다음 갱신 때 다시 크롤링)
+    """
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            SELECT user_id, boj_handle, solved_problems, observed_count, updated_at
+            FROM problem_set_progress
+            WHERE group_name = ? AND problem_set_name = ?
+        ''', (group_name, problem_set_name))
+        result = {}
+        for row in cursor.fetchall():
+            result[row['user_id']] = {
+                'boj_handle': row['boj_handle'],
+                'solved_problems': json.loads(row['solved_problems']) if row['solved_problems'] else [],
+                'observed_count': row['observed_count'],
+                'updated_at': row['updated_at'],
+            }
+
+        return result
+    finally:
+        conn.close()
+
+def save_problem_set_progress(group_name: str, problem_set_name: str, entries: List[Dict]):
+    """
+    멤버별 진행 상황 저장 (있으면 교체)
+
+    Args:
+        entries: [{'user_id', 'boj_handle', 'solved_problems', 'observed_count'}, ...]
+    """
+    if not entries:
+        return
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+
+        now = datetime.now().isoformat()
+        cursor.executemany('''
+            INSERT OR REPLACE INTO problem_set_progress
+            (group_name, problem_set_name, user_id, boj_handle, solved_problems, observed_count, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', [
+            (group_name, problem_set_name, str(entry['user_id']), entry.get('boj_handle'),
+             json.dumps(sorted(entry.get('solved_problems', []))), entry.get('observed_count'), now)
+            for entry in entries
+        ])
+
+        conn.commit()
+    finally:
+        conn.close()
 
 # ==================== 모의테스트 과제 상태 관리 ====================
 
@@ -782,52 +1363,62 @@ def save_group_mock_test_status(group_name: str, mock_test_name: str, role_name:
                                  last_updated: Optional[str] = None):
     """모의테스트 과제 상태 메시지 저장"""
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
     
-    now = last_updated or datetime.now().isoformat()
-    cursor.execute('''
-        INSERT OR REPLACE INTO group_mock_test_status
-        (group_name, mock_test_name, role_name, channel_id, message_id, week_start, week_end, last_updated)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    ''', (group_name, mock_test_name, role_name, channel_id, message_id, week_start, week_end, now))
+        now = last_updated or datetime.now().isoformat()
+        cursor.execute('''
+            INSERT OR REPLACE INTO group_mock_test_status
+            (group_name, mock_test_name, role_name, channel_id, message_id, week_start, week_end, last_updated)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (group_name, mock_test_name, role_name, channel_id, message_id, week_start, week_end, now))
     
-    conn.commit()
-    conn.close()
+        conn.commit()
+        _group_mock_test_status_cache.put({
+            'group_name': group_name,
+            'mock_test_name': mock_test_name,
+            'role_name': role_name,
+            'channel_id': str(channel_id),
+            'message_id': str(message_id),
+            'week_start': week_start,
+            'week_end': week_end,
+            'last_updated': now
+        })
+    finally:
+        conn.close()
 
+@_cached(_group_mock_test_status_cache)
 def get_group_mock_test_status(group_name: str, mock_test_name: str) -> Optional[Dict]:
     """모의테스트 과제 상태 메시지 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT * FROM group_mock_test_status WHERE group_name = ? AND mock_test_name = ?',
-                   (group_name, mock_test_name))
-    row = cursor.fetchone()
-    conn.close()
-    
-    if row:
-        return dict(row)
-    return None
+    return _group_mock_test_status_cache.get(group_name, mock_test_name)
 
+@_cached(_group_mock_test_status_cache)
 def get_all_group_mock_test_status() -> List[Dict]:
     """모든 모의테스트 과제 상태 메시지 목록 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT * FROM group_mock_test_status')
-    rows = cursor.fetchall()
-    conn.close()
-    
-    return [dict(row) for row in rows]
+    return _group_mock_test_status_cache.all()
+
+@_cached(_group_mock_test_status_cache)
+def get_group_mock_test_statuses(group_name: str) -> List[Dict]:
+    """특정 그룹의 모의테스트 과제 상태 메시지 목록"""
+    return _group_mock_test_status_cache.by_group(group_name)
+
+@_cached(_group_mock_test_status_cache)
+def get_group_mock_test_status_by_message(channel_id: str, message_id: str) -> Optional[Dict]:
+    """채널/메시지 ID로 모의테스트 과제 상태 메시지 가져오기"""
+    return _group_mock_test_status_cache.by_message(channel_id, message_id)
 
 def delete_group_mock_test_status(group_name: str, mock_test_name: str):
     """모의테스트 과제 상태 메시지 삭제"""
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
     
-    cursor.execute('DELETE FROM group_mock_test_status WHERE group_name = ? AND mock_test_name = ?',
-                   (group_name, mock_test_name))
-    conn.commit()
-    conn.close()
+        cursor.execute('DELETE FROM group_mock_test_status WHERE group_name = ? AND mock_test_name = ?',
+                       (group_name, mock_test_name))
+        conn.commit()
+        _group_mock_test_status_cache.remove(group_name, mock_test_name)
+    finally:
+        conn.close()
 
 # ==================== 전체과제현황 관리 ====================
 
@@ -836,63 +1427,143 @@ def save_group_all_assignment_status(group_name: str, role_name: str, channel_id
                                      last_updated: Optional[str] = None):
     """전체과제현황 메시지 저장"""
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
     
-    now = last_updated or datetime.now().isoformat()
-    cursor.execute('''
-        INSERT OR REPLACE INTO group_all_assignment_status
-        (group_name, role_name, channel_id, message_id, week_start, week_end, last_updated)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-    ''', (group_name, role_name, channel_id, message_id, week_start, week_end, now))
+        now = last_updated or datetime.now().isoformat()
+        cursor.execute('''
+            INSERT OR REPLACE INTO group_all_assignment_status
+            (group_name, role_name, channel_id, message_id, week_start, week_end, last_updated)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', (group_name, role_name, channel_id, message_id, week_start, week_end, now))
     
-    conn.commit()
-    conn.close()
+        conn.commit()
+        _group_all_assignment_status_cache.put({
+            'group_name': group_name,
+            'role_name': role_name,
+            'channel_id': str(channel_id),
+            'message_id': str(message_id),
+            'week_start': week_start,
+            'week_end': week_end,
+            'last_updated': now
+        })
+    finally:
+        conn.close()
 
+@_cached(_group_all_assignment_status_cache)
 def get_group_all_assignment_status(group_name: str) -> Optional[Dict]:
     """전체과제현황 메시지 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT * FROM group_all_assignment_status WHERE group_name = ?', (group_name,))
-    row = cursor.fetchone()
-    conn.close()
-    
-    if row:
-        return dict(row)
-    return None
+    return _group_all_assignment_status_cache.get(group_name)
 
+@_cached(_group_all_assignment_status_cache)
 def get_group_all_assignment_status_by_message(channel_id: str, message_id: str) -> Optional[Dict]:
     """메시지 기준으로 전체과제현황 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT * FROM group_all_assignment_status WHERE channel_id = ? AND message_id = ?', (channel_id, message_id))
-    row = cursor.fetchone()
-    conn.close()
-    
-    if row:
-        return dict(row)
-    return None
+    return _group_all_assignment_status_cache.by_message(channel_id, message_id)
 
+@_cached(_group_all_assignment_status_cache)
 def get_all_group_all_assignment_status() -> List[Dict]:
     """모든 전체과제현황 메시지 목록 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT * FROM group_all_assignment_status')
-    rows = cursor.fetchall()
-    conn.close()
-    
-    return [dict(row) for row in rows]
+    return _group_all_assignment_status_cache.all()
 
 def delete_group_all_assignment_status(group_name: str):
     """전체과제현황 메시지 삭제"""
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
     
-    cursor.execute('DELETE FROM group_all_assignment_status WHERE group_name = ?', (group_name,))
-    conn.commit()
-    conn.close()
+        cursor.execute('DELETE FROM group_all_assignment_status WHERE group_name = ?', (group_name,))
+        cursor.execute('DELETE FROM assignment_status_cells WHERE group_name = ?', (group_name,))
+        conn.commit()
+        _group_all_assignment_status_cache.remove(group_name)
+    finally:
+        conn.close()
+
+# ==================== 전체과제현황 표 ====================
+# 컬럼: "링크제출", "문제풀이", "문제집:{이름}", "모의테스트:{이름}"
+# 전체 갱신은 그룹의 표를 통째로 바꾸고, 부분 갱신은 해당 컬럼만 바꾼다.
+
+def get_assignment_status_matrix(group_name: str) -> Tuple[List[str], Dict[str, Dict[str, str]]]:
+    """
+    그룹의 전체과제현황 표
+
+    Returns:
+        (컬럼 목록(표시 순서), {user_id: {컬럼: 값}})
+    """
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            SELECT user_id, column_name, value FROM assignment_status_cells
+            WHERE group_name = ?
+            ORDER BY column_order, column_name
+        ''', (group_name,))
+        columns = []
+        cells = {}
+        for row in cursor.fetchall():
+            if row['column_name'] not in columns:
+                columns.append(row['column_name'])
+            cells.setdefault(row['user_id'], {})[row['column_name']] = row['value']
+
+        return columns, cells
+    finally:
+        conn.close()
+
+def replace_assignment_status_matrix(group_name: str, columns: List[str], cells: Dict[str, Dict[str, str]]):
+    """그룹의 표 전체 교체 (columns 순서대로 표시)"""
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+
+        now = datetime.now().isoformat()
+        cursor.execute('DELETE FROM assignment_status_cells WHERE group_name = ?', (group_name,))
+        cursor.executemany('''
+            INSERT INTO assignment_status_cells (group_name, user_id, column_name, column_order, value, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', [
+            (group_name, str(user_id), column, order, values[column], now)
+            for user_id, values in cells.items()
+            for order, column in enumerate(columns)
+            if column in values
+        ])
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+def save_assignment_status_column(group_name: str, column: str, values: Dict[str, str]):
+    """표의 한 컬럼만 저장 (새 컬럼이면 맨 뒤에 추가)"""
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+
+        now = datetime.now().isoformat()
+        cursor.execute('''
+            SELECT column_order FROM assignment_status_cells
+            WHERE group_name = ? AND column_name = ?
+            LIMIT 1
+        ''', (group_name, column))
+        row = cursor.fetchone()
+        if row is not None:
+            order = row['column_order']
+        else:
+            cursor.execute('SELECT MAX(column_order) AS max_order FROM assignment_status_cells WHERE group_name = ?',
+                           (group_name,))
+            max_order = cursor.fetchone()['max_order']
+            order = 0 if max_order is None else max_order + 1
+        cursor.executemany('''
+            INSERT OR REPLACE INTO assignment_status_cells
+            (group_name, user_id, column_name, column_order, value, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', [(group_name, str(user_id), column, order, value, now) for user_id, value in values.items()])
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
 
 # ==================== 그룹 주간 링크 제출 관리 ====================
 
@@ -901,459 +1572,1137 @@ def save_group_link_submission_status(group_name: str, role_name: str, channel_i
                                       last_updated: Optional[str] = None):
     """그룹 주간 링크 제출 메시지 저장"""
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
     
-    now = last_updated or datetime.now().isoformat()
-    cursor.execute('''
-        INSERT OR REPLACE INTO group_link_submissions
-        (group_name, role_name, channel_id, message_id, week_start, week_end, last_updated)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-    ''', (group_name, role_name, channel_id, message_id, week_start, week_end, now))
+        now = last_updated or datetime.now().isoformat()
+        cursor.execute('''
+            INSERT OR REPLACE INTO group_link_submissions
+            (group_name, role_name, channel_id, message_id, week_start, week_end, last_updated)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', (group_name, role_name, channel_id, message_id, week_start, week_end, now))
     
-    conn.commit()
-    conn.close()
+        conn.commit()
+        _group_link_submission_status_cache.put({
+            'group_name': group_name,
+            'role_name': role_name,
+            'channel_id': str(channel_id),
+            'message_id': str(message_id),
+            'week_start': week_start,
+            'week_end': week_end,
+            'last_updated': now
+        })
+    finally:
+        conn.close()
 
+@_cached(_group_link_submission_status_cache)
 def get_group_link_submission_status(group_name: str) -> Optional[Dict]:
     """그룹 주간 링크 제출 메시지 가져오기 (그룹 이름 기준)"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT * FROM group_link_submissions WHERE group_name = ?', (group_name,))
-    row = cursor.fetchone()
-    conn.close()
-    
-    if row:
-        return dict(row)
-    return None
+    return _group_link_submission_status_cache.get(group_name)
 
+@_cached(_group_link_submission_status_cache)
 def get_group_link_submission_status_by_message(channel_id: str, message_id: str) -> Optional[Dict]:
     """채널/메시지 ID로 그룹 주간 링크 제출 메시지 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT * FROM group_link_submissions WHERE channel_id = ? AND message_id = ?',
-                   (channel_id, message_id))
-    row = cursor.fetchone()
-    conn.close()
-    
-    if row:
-        return dict(row)
-    return None
+    return _group_link_submission_status_cache.by_message(channel_id, message_id)
 
+@_cached(_group_link_submission_status_cache)
 def get_all_group_link_submission_status() -> List[Dict]:
     """모든 그룹 주간 링크 제출 메시지 목록 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT * FROM group_link_submissions')
-    rows = cursor.fetchall()
-    conn.close()
-    
-    return [dict(row) for row in rows]
+    return _group_link_submission_status_cache.all()
 
 def delete_group_link_submission_status(group_name: str):
     """그룹 주간 링크 제출 메시지 삭제"""
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
     
-    cursor.execute('DELETE FROM group_link_submissions WHERE group_name = ?', (group_name,))
-    conn.commit()
-    conn.close()
+        cursor.execute('DELETE FROM group_link_submissions WHERE group_name = ?', (group_name,))
+        conn.commit()
+        _group_link_submission_status_cache.remove(group_name)
+    finally:
+        conn.close()
+
+def _load_link_items(cursor, group_name: str, week_start: str, user_id: Optional[str] = None) -> Dict[str, List[str]]:
+    """link_submission_items에서 {user_id: [링크, ...]} (제출 순서대로)"""
+    if user_id is None:
+        cursor.execute('''
+            SELECT user_id, link FROM link_submission_items
+            WHERE group_name = ? AND week_start = ?
+            ORDER BY user_id, ordinal
+        ''', (group_name, week_start))
+    else:
+        cursor.execute('''
+            SELECT user_id, link FROM link_submission_items
+            WHERE group_name = ? AND week_start = ? AND user_id = ?
+            ORDER BY ordinal
+        ''', (group_name, week_start, user_id))
+    result = {}
+    for row in cursor.fetchall():
+        result.setdefault(row['user_id'], []).append(row['link'])
+    return result
 
 def save_link_submission(group_name: str, user_id: str, week_start: str, links: List[str]):
     """링크 제출 저장 (업데이트 가능)"""
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
     
-    now = datetime.now().isoformat()
-    links_json = json.dumps(links, ensure_ascii=False)
+        now = datetime.now().isoformat()
     
-    cursor.execute('''
-        INSERT OR REPLACE INTO link_submission_data
-        (group_name, user_id, week_start, links, submitted_at, updated_at)
-        VALUES (?, ?, ?, ?, 
-                COALESCE((SELECT submitted_at FROM link_submission_data WHERE group_name = ? AND user_id = ? AND week_start = ?), ?),
-                ?)
-    ''', (group_name, user_id, week_start, links_json, group_name, user_id, week_start, now, now))
-    
-    conn.commit()
-    conn.close()
+        # 제출 정보 (처음 제출 시각 유지)
+        cursor.execute('''
+            INSERT INTO link_submission_data
+            (group_name, user_id, week_start, links, submitted_at, updated_at)
+            VALUES (?, ?, ?, NULL, ?, ?)
+            ON CONFLICT(group_name, user_id, week_start) DO UPDATE SET
+                links = NULL,
+                updated_at = excluded.updated_at
+        ''', (group_name, user_id, week_start, now, now))
+        
+        # 링크 목록
+        cursor.execute('''
+            DELETE FROM link_submission_items
+            WHERE group_name = ? AND week_start = ? AND user_id = ?
+        ''', (group_name, week_start, user_id))
+        cursor.executemany('''
+            INSERT INTO link_submission_items (group_name, week_start, user_id, ordinal, link)
+            VALUES (?, ?, ?, ?, ?)
+        ''', [(group_name, week_start, user_id, ordinal, link) for ordinal, link in enumerate(links)])
+        
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
 
 def get_link_submissions(group_name: str, week_start: str) -> List[Dict]:
     """특정 그룹/주차의 모든 링크 제출 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        SELECT * FROM link_submission_data
-        WHERE group_name = ? AND week_start = ?
-        ORDER BY updated_at DESC
-    ''', (group_name, week_start))
-    rows = cursor.fetchall()
-    conn.close()
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
     
-    result = []
-    for row in rows:
-        data = dict(row)
-        data['links'] = json.loads(data['links'])
-        result.append(data)
-    return result
+        cursor.execute('''
+            SELECT * FROM link_submission_data
+            WHERE group_name = ? AND week_start = ?
+            ORDER BY updated_at DESC
+        ''', (group_name, week_start))
+        rows = cursor.fetchall()
+        links_by_user = _load_link_items(cursor, group_name, week_start)
+    
+        result = []
+        for row in rows:
+            data = dict(row)
+            data['links'] = links_by_user.get(data['user_id'], [])
+            result.append(data)
+        return result
+    finally:
+        conn.close()
 
 def get_user_link_submission(group_name: str, user_id: str, week_start: str) -> Optional[Dict]:
     """특정 사용자의 링크 제출 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
     
-    cursor.execute('''
-        SELECT * FROM link_submission_data
-        WHERE group_name = ? AND user_id = ? AND week_start = ?
-    ''', (group_name, user_id, week_start))
-    row = cursor.fetchone()
-    conn.close()
+        cursor.execute('''
+            SELECT * FROM link_submission_data
+            WHERE group_name = ? AND user_id = ? AND week_start = ?
+        ''', (group_name, user_id, week_start))
+        row = cursor.fetchone()
+        links_by_user = _load_link_items(cursor, group_name, week_start, user_id) if row else {}
+    
+        if row:
+            data = dict(row)
+            data['links'] = links_by_user.get(user_id, [])
+            return data
+        return None
+    finally:
+        conn.close()
+
+def get_link_submission_counts(group_name: str, week_start: str) -> Dict[str, int]:
+    """특정 그룹/주차의 사용자별 제출 링크 수 ({user_id: 링크 수})"""
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
     
-    if row:
-        data = dict(row)
-        data['links'] = json.loads(data['links'])
-        return data
-    return None
+        cursor.execute('''
+            SELECT user_id, COUNT(*) AS link_count FROM link_submission_items
+            WHERE group_name = ? AND week_start = ?
+            GROUP BY user_id
+        ''', (group_name, week_start))
+        rows = cursor.fetchall()
+    
+        return {row['user_id']: row['link_count'] for row in rows}
+    finally:
+        conn.close()
 
 def delete_link_submissions_by_week(group_name: str, week_start: str):
     """특정 그룹/주차의 모든 링크 제출 삭제"""
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
     
-    cursor.execute('DELETE FROM link_submission_data WHERE group_name = ? AND week_start = ?',
-                   (group_name, week_start))
-    conn.commit()
-    conn.close()
+        cursor.execute('DELETE FROM link_submission_data WHERE group_name = ? AND week_start = ?',
+                       (group_name, week_start))
+        cursor.execute('DELETE FROM link_submission_items WHERE group_name = ? AND week_start = ?',
+                       (group_name, week_start))
+        conn.commit()
+    finally:
+        conn.close()
 
 def delete_all_link_submissions_by_group(group_name: str):
     """특정 그룹의 모든 링크 제출 데이터 삭제"""
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
     
-    cursor.execute('DELETE FROM link_submission_data WHERE group_name = ?', (group_name,))
-    conn.commit()
-    conn.close()
+        cursor.execute('DELETE FROM link_submission_data WHERE group_name = ?', (group_name,))
+        cursor.execute('DELETE FROM link_submission_items WHERE group_name = ?', (group_name,))
+        conn.commit()
+    finally:
+        conn.close()
 
 # ==================== 문제집 관리 ====================
+# 문제 목록은 problem_set_items / mock_test_items에 순서(ordinal)와 함께 저장한다.
+# (problem_sets.problem_ids / mock_tests.problem_ids 컬럼은 마이그레이션 2 이후 사용하지 않음)
+
+def _replace_problem_items(cursor, table: str, key_column: str, name: str, problem_ids: List[int]):
+    """문제 목록 하위 테이블의 name 항목을 problem_ids로 교체 (호출한 쪽 트랜잭션 안에서 실행)"""
+    cursor.execute(f'DELETE FROM {table} WHERE {key_column} = ?', (name,))
+    cursor.executemany(
+        f'INSERT INTO {table} ({key_column}, ordinal, problem_id) VALUES (?, ?, ?)',
+        [(name, ordinal, int(problem_id)) for ordinal, problem_id in enumerate(problem_ids)]
+    )
+
+def _load_problem_items(cursor, table: str, key_column: str, name: Optional[str] = None) -> Dict[str, List[int]]:
+    """문제 목록 하위 테이블에서 {이름: [문제 번호, ...]} (name이 없으면 전체)"""
+    if name is None:
+        cursor.execute(f'SELECT {key_column} AS name, problem_id FROM {table} ORDER BY {key_column}, ordinal')
+    else:
+        cursor.execute(
+            f'SELECT {key_column} AS name, problem_id FROM {table} WHERE {key_column} = ? ORDER BY ordinal',
+            (name,)
+        )
+    result = {}
+    for row in cursor.fetchall():
+        result.setdefault(row['name'], []).append(row['problem_id'])
+    return result
+
+def _fetch_problem_collection(cursor, parent: str, items: str, key_column: str, name: str) -> Optional[Dict]:
+    """문제집/모의테스트 한 개를 문제 목록과 함께 조회 (캐시 갱신용)"""
+    cursor.execute(f'SELECT * FROM {parent} WHERE name = ?', (name,))
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    result = dict(row)
+    result['problem_ids'] = _load_problem_items(cursor, items, key_column, name).get(name, [])
+    return result
 
 def create_problem_set(name: str, problem_ids: List[int], created_by: str):
     """문제집 생성"""
     conn = get_connection()
-    cursor = conn.cursor()
-    
-    now = datetime.now().isoformat()
-    problem_ids_str = ','.join(map(str, problem_ids))
+    try:
+        cursor = conn.cursor()
     
-    cursor.execute('''
-        INSERT OR REPLACE INTO problem_sets (name, problem_ids, created_at, created_by, updated_at)
-        VALUES (?, ?, ?, ?, ?)
-    ''', (name, problem_ids_str, now, created_by, now))
+        now = datetime.now().isoformat()
     
-    conn.commit()
-    conn.close()
+        cursor.execute('''
+            INSERT OR REPLACE INTO problem_sets (name, problem_ids, created_at, created_by, updated_at)
+            VALUES (?, NULL, ?, ?, ?)
+        ''', (name, now, created_by, now))
+        _replace_problem_items(cursor, 'problem_set_items', 'problem_set_name', name, problem_ids)
+        conn.commit()
+        written = _fetch_problem_collection(cursor, 'problem_sets', 'problem_set_items', 'problem_set_name', name)
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    _problem_set_cache.put(written)
 
+@_cached(_problem_set_cache)
 def get_problem_set(name: str) -> Optional[Dict]:
     """문제집 정보 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT * FROM problem_sets WHERE name = ?', (name,))
-    row = cursor.fetchone()
-    conn.close()
-    
-    if row:
-        result = dict(row)
-        # 문제 번호 리스트로 변환
-        if result['problem_ids']:
-            result['problem_ids'] = [int(x) for x in result['problem_ids'].split(',') if x.strip().isdigit()]
-        else:
-            result['problem_ids'] = []
-        return result
-    return None
+    return _problem_set_cache.get(name)
 
+@_cached(_problem_set_cache)
 def get_all_problem_sets() -> List[Dict]:
-    """모든 문제집 목록 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT * FROM problem_sets ORDER BY created_at DESC')
-    rows = cursor.fetchall()
-    conn.close()
+    """모든 문제집 목록 가져오기 (최근 생성 순)"""
+    return sorted(_problem_set_cache.all(), key=lambda item: item['created_at'] or '', reverse=True)
+
+def get_problem_sets_containing(problem_id: int) -> List[str]:
+    """특정 문제가 들어 있는 문제집 이름 목록"""
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
     
-    result = []
-    for row in rows:
-        item = dict(row)
-        if item['problem_ids']:
-            item['problem_ids'] = [int(x) for x in item['problem_ids'].split(',') if x.strip().isdigit()]
-        else:
-            item['problem_ids'] = []
-        result.append(item)
+        cursor.execute(
+            'SELECT DISTINCT problem_set_name FROM problem_set_items WHERE problem_id = ? ORDER BY problem_set_name',
+            (int(problem_id),)
+        )
+        rows = cursor.fetchall()
     
-    return result
+        return [row['problem_set_name'] for row in rows]
+    finally:
+        conn.close()
 
 def update_problem_set(name: str, problem_ids: List[int]):
     """문제집 수정"""
     conn = get_connection()
-    cursor = conn.cursor()
-    
-    now = datetime.now().isoformat()
-    problem_ids_str = ','.join(map(str, problem_ids))
+    try:
+        cursor = conn.cursor()
     
-    cursor.execute('''
-        UPDATE problem_sets 
-        SET problem_ids = ?, updated_at = ?
-        WHERE name = ?
-    ''', (problem_ids_str, now, name))
+        now = datetime.now().isoformat()
     
-    conn.commit()
-    conn.close()
+        cursor.execute('''
+            UPDATE problem_sets 
+            SET problem_ids = NULL, updated_at = ?
+            WHERE name = ?
+        ''', (now, name))
+        updated = cursor.rowcount > 0
+        if updated:
+            _replace_problem_items(cursor, 'problem_set_items', 'problem_set_name', name, problem_ids)
+            # 문제 구성이 바뀌면 기존 진행 상황은 새 문제를 확인하지 않은 기록이므로 버림
+            cursor.execute('DELETE FROM problem_set_progress WHERE problem_set_name = ?', (name,))
+        conn.commit()
+        written = _fetch_problem_collection(cursor, 'problem_sets', 'problem_set_items', 'problem_set_name', name) if updated else None
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    if written:
+        _problem_set_cache.put(written)
 
 def delete_problem_set(name: str):
     """문제집 삭제"""
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
     
-    cursor.execute('DELETE FROM problem_sets WHERE name = ?', (name,))
+        cursor.execute('DELETE FROM problem_sets WHERE name = ?', (name,))
+        cursor.execute('DELETE FROM problem_set_items WHERE problem_set_name = ?', (name,))
+        cursor.execute('DELETE FROM problem_set_progress WHERE problem_set_name = ?', (name,))
     
-    conn.commit()
-    conn.close()
+        conn.commit()
+        _problem_set_cache.remove(name)
+    finally:
+        conn.close()
 
 # ==================== 모의테스트 관리 ====================
 
 def create_mock_test(name: str, problem_ids: List[int], created_by: str):
     """모의테스트 생성"""
     conn = get_connection()
-    cursor = conn.cursor()
-    
-    now = datetime.now().isoformat()
-    problem_ids_str = ','.join(map(str, problem_ids))
+    try:
+        cursor = conn.cursor()
     
-    cursor.execute('''
-        INSERT OR REPLACE INTO mock_tests (name, problem_ids, created_at, created_by, updated_at)
-        VALUES (?, ?, ?, ?, ?)
-    ''', (name, problem_ids_str, now, created_by, now))
+        now = datetime.now().isoformat()
     
-    conn.commit()
-    conn.close()
+        cursor.execute('''
+            INSERT OR REPLACE INTO mock_tests (name, problem_ids, created_at, created_by, updated_at)
+            VALUES (?, NULL, ?, ?, ?)
+        ''', (name, now, created_by, now))
+        _replace_problem_items(cursor, 'mock_test_items', 'mock_test_name', name, problem_ids)
+        conn.commit()
+        written = _fetch_problem_collection(cursor, 'mock_tests', 'mock_test_items', 'mock_test_name', name)
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    _mock_test_cache.put(written)
 
+@_cached(_mock_test_cache)
 def get_mock_test(name: str) -> Optional[Dict]:
     """모의테스트 정보 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT * FROM mock_tests WHERE name = ?', (name,))
-    row = cursor.fetchone()
-    conn.close()
-    
-    if row:
-        result = dict(row)
-        # 문제 번호 리스트로 변환
-        if result['problem_ids']:
-            result['problem_ids'] = [int(x) for x in result['problem_ids'].split(',') if x.strip().isdigit()]
-        else:
-            result['problem_ids'] = []
-        return result
-    return None
+    return _mock_test_cache.get(name)
 
+@_cached(_mock_test_cache)
 def get_all_mock_tests() -> List[Dict]:
-    """모든 모의테스트 목록 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT * FROM mock_tests ORDER BY created_at DESC')
-    rows = cursor.fetchall()
-    conn.close()
+    """모든 모의테스트 목록 가져오기 (최근 생성 순)"""
+    return sorted(_mock_test_cache.all(), key=lambda item: item['created_at'] or '', reverse=True)
+
+def get_mock_tests_containing(problem_id: int) -> List[str]:
+    """특정 문제가 들어 있는 모의테스트 이름 목록"""
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
     
-    result = []
-    for row in rows:
-        item = dict(row)
-        if item['problem_ids']:
-            item['problem_ids'] = [int(x) for x in item['problem_ids'].split(',') if x.strip().isdigit()]
-        else:
-            item['problem_ids'] = []
-        result.append(item)
+        cursor.execute(
+            'SELECT DISTINCT mock_test_name FROM mock_test_items WHERE problem_id = ? ORDER BY mock_test_name',
+            (int(problem_id),)
+        )
+        rows = cursor.fetchall()
     
-    return result
+        return [row['mock_test_name'] for row in rows]
+    finally:
+        conn.close()
 
 def update_mock_test(name: str, problem_ids: List[int]):
     """모의테스트 수정"""
     conn = get_connection()
-    cursor = conn.cursor()
-    
-    now = datetime.now().isoformat()
-    problem_ids_str = ','.join(map(str, problem_ids))
+    try:
+        cursor = conn.cursor()
     
-    cursor.execute('''
-        UPDATE mock_tests 
-        SET problem_ids = ?, updated_at = ?
-        WHERE name = ?
-    ''', (problem_ids_str, now, name))
+        now = datetime.now().isoformat()
     
-    conn.commit()
-    conn.close()
+        cursor.execute('''
+            UPDATE mock_tests 
+            SET problem_ids = NULL, updated_at = ?
+            WHERE name = ?
+        ''', (now, name))
+        updated = cursor.rowcount > 0
+        if updated:
+            _replace_problem_items(cursor, 'mock_test_items', 'mock_test_name', name, problem_ids)
+        conn.commit()
+        written = _fetch_problem_collection(cursor, 'mock_tests', 'mock_test_items', 'mock_test_name', name) if updated else None
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    if written:
+        _mock_test_cache.put(written)
 
 def delete_mock_test(name: str):
     """모의테스트 삭제"""
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
     
-    cursor.execute('DELETE FROM mock_tests WHERE name = ?', (name,))
+        cursor.execute('DELETE FROM mock_tests WHERE name = ?', (name,))
+        cursor.execute('DELETE FROM mock_test_items WHERE mock_test_name = ?', (name,))
     
-    conn.commit()
-    conn.close()
+        conn.commit()
+        _mock_test_cache.remove(name)
+    finally:
+        conn.close()
 
 def get_weekly_status_message(role_name: str) -> Optional[Dict]:
     """주간 현황 메시지 가져오기"""
-    conn = get_connection()
-    cursor = conn.cursor()
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
     
-    cursor.execute('SELECT * FROM weekly_status_messages WHERE role_name = ?', (role_name,))
-    row = cursor.fetchone()
-    conn.close()
+        cursor.execute('SELECT * FROM weekly_status_messages WHERE role_name = ?', (role_name,))
+        row = cursor.fetchone()
     
-    if row:
-        return dict(row)
-    return None
+        if row:
+            return dict(row)
+        return None
+    finally:
+        conn.close()
 
 def delete_weekly_status_message(role_name: str):
     """주간 현황 메시지 삭제"""
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
     
-    cursor.execute('DELETE FROM weekly_status_messages WHERE role_name = ?', (role_name,))
-    conn.commit()
-    conn.close()
+        cursor.execute('DELETE FROM weekly_status_messages WHERE role_name = ?', (role_name,))
+        conn.commit()
+    finally:
+        conn.close()
 
-# ==================== 호환성 함수 (기존 JSON 방식과 호환) ====================
+# ==================== 상태 메시지 편집 기록 ====================
 
-def load_data() -> Dict:
-    """기존 JSON 방식과 호환되는 데이터 로드"""
-    # SQLite에서 데이터를 읽어서 JSON 형식으로 변환
-    users = {}
+def get_message_render_state(channel_id: str, message_id: str) -> Optional[Dict]:
+    """메시지의 마지막 편집 내용 해시와 시각 (epoch 초)"""
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            SELECT content_hash, edited_at FROM message_render_state
+            WHERE channel_id = ? AND message_id = ?
+        ''', (str(channel_id), str(message_id)))
+        row = cursor.fetchone()
+
+        if row:
+            return dict(row)
+        return None
+    finally:
+        conn.close()
+
+def save_message_render_state(channel_id: str, message_id: str, content_hash: str, edited_at: float):
+    """메시지 편집 기록 저장"""
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            INSERT OR REPLACE INTO message_render_state (channel_id, message_id, content_hash, edited_at)
+            VALUES (?, ?, ?, ?)
+        ''', (str(channel_id), str(message_id), content_hash, edited_at))
+
+        conn.commit()
+    finally:
+        conn.close()
+
+# ==================== 스케줄러 작업 실행 기록 ====================
+
+def get_scheduler_job_runs() -> Dict[str, str]:
+    """작업별 마지막으로 끝난 실행 시각 (job_name -> KST isoformat)"""
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
+
+        cursor.execute('SELECT job_name, last_slot FROM scheduler_job_runs')
+        rows = cursor.fetchall()
+
+        return {row['job_name']: row['last_slot'] for row in rows}
+    finally:
+        conn.close()
+
+def save_scheduler_job_run(job_name: str, last_slot: str):
+    """작업 실행 완료 기록 (last_slot: 실행 시각 isoformat)"""
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            INSERT OR REPLACE INTO scheduler_job_runs (job_name, last_slot, finished_at)
+            VALUES (?, ?, ?)
+        ''', (job_name, last_slot, datetime.now().isoformat()))
+
+        conn.commit()
+    finally:
+        conn.close()
+
+# ==================== solved.ac 히스토리 캐시 ====================
+
+def get_solved_history_cache(boj_handle: str) -> Optional[Dict]:
+    """핸들의 저장된 solvedCount 히스토리 가져오기 (times/solved_values는 바이트 배열)"""
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
     
-    # 사용자 정보
-    cursor.execute('SELECT * FROM users')
-    for row in cursor.fetchall():
-        user_id = row['user_id']
-        user_roles = get_user_roles(user_id)
-        blog_links = get_user_blog_links(user_id)
-        submissions = get_user_submissions(user_id)
-        
-        # submissions를 assignment_id별로 그룹화
-        submissions_dict = {}
-        for sub in submissions:
-            aid = sub['assignment_id']
-            if aid not in submissions_dict:
-                submissions_dict[aid] = []
-            submissions_dict[aid].append({
-                'type': sub['type'],
-                'content': sub['content'],
-                'problem_id': sub['problem_id'],
-                'verified': bool(sub['verified']),
-                'submitted_at': sub['submitted_at']
-            })
-        
-        users[user_id] = {
-            'username': row['username'],
-            'boj_handle': row['boj_handle'],
-            'roles': user_roles,
-            'tistory_links': [{'link': link['link'], 'submitted_at': link['submitted_at']} for link in blog_links],
-            'submissions': submissions_dict
-        }
-    
-    # 역할 토큰
-    role_tokens = get_all_role_tokens()
-    role_tokens_dict = {}
-    for role_name, token_data in role_tokens.items():
-        role_tokens_dict[role_name] = {
-            'token_hash': token_data['token_hash'],
-            'original_token': token_data['original_token']
-        }
-    
-    # 스터디 및 과제
-    studies = {}
-    cursor.execute('SELECT study_name FROM studies')
-    for row in cursor.fetchall():
-        study_name = row['study_name']
-        assignments = get_study_assignments(study_name)
-        studies[study_name] = {'assignments': assignments}
+        cursor.execute('SELECT * FROM solved_history_cache WHERE boj_handle = ?', (boj_handle.lower(),))
+        row = cursor.fetchone()
     
-    conn.close()
+        if row:
+            return dict(row)
+        return None
+    finally:
+        conn.close()
+
+def save_solved_history_cache(boj_handle: str, times: bytes, solved_values: bytes, fetched_at: float):
+    """핸들의 solvedCount 히스토리 저장"""
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
     
+        cursor.execute('''
+            INSERT OR REPLACE INTO solved_history_cache (boj_handle, times, solved_values, fetched_at)
+            VALUES (?, ?, ?, ?)
+        ''', (boj_handle.lower(), times, solved_values, fetched_at))
+    
+        conn.commit()
+    finally:
+        conn.close()
+
+# ==================== 해결한 문제 인덱스 ====================
+
+def get_solved_problem_index(boj_handle: str) -> Optional[Dict]:
+    """핸들의 해결한 문제 인덱스 가져오기 (problem_ids는 바이트 배열)"""
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
+    
+        cursor.execute('SELECT * FROM solved_problem_index WHERE boj_handle = ?', (boj_handle.lower(),))
+        row = cursor.fetchone()
+    
+        if row:
+            return dict(row)
+        return None
+    finally:
+        conn.close()
+
+def save_solved_problem_index(boj_handle: str, problem_ids: bytes, synced_count: Optional[int], full_synced_at: float):
+    """핸들의 해결한 문제 인덱스 저장"""
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+    
+        now = datetime.now().isoformat()
+        cursor.execute('''
+            INSERT OR REPLACE INTO solved_problem_index (boj_handle, problem_ids, synced_count, full_synced_at, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+        ''', (boj_handle.lower(), problem_ids, synced_count, full_synced_at, now))
+    
+        conn.commit()
+    finally:
+        conn.close()
+
+# ==================== 문제 정보 캐시 ====================
+
+def get_problem_metadata(problem_ids: List[int]) -> Dict[int, Dict]:
+    """여러 문제의 저장된 정보 가져오기 ({문제 번호: 정보})"""
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
+    
+        result = {}
+        ids = list(problem_ids)
+        # SQLite 변수 개수 제한을 피하기 위해 나눠서 조회
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            placeholders = ','.join('?' * len(chunk))
+            cursor.execute(f'SELECT * FROM problem_metadata WHERE problem_id IN ({placeholders})', chunk)
+            for row in cursor.fetchall():
+                item = dict(row)
+                item['tags'] = json.loads(item['tags']) if item['tags'] else []
+                result[item['problem_id']] = item
+    
+        return result
+    finally:
+        conn.close()
+
+def save_problem_metadata(items: List[Dict]):
+    """문제 정보 일괄 저장"""
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+    
+        cursor.executemany('''
+            INSERT OR REPLACE INTO problem_metadata (problem_id, title, level, tags, fetched_at)
+            VALUES (?, ?, ?, ?, ?)
+        ''', [
+            (item['problem_id'], item.get('title'), item.get('level'),
+             json.dumps(item.get('tags', []), ensure_ascii=False), item.get('fetched_at'))
+            for item in items
+        ])
+    
+        conn.commit()
+    finally:
+        conn.close()
+
+# ==================== 주간 결과 기록 ====================
+# 현황 메시지는 기간이 끝나면 DB에서 삭제되므로, 마지막 크롤링 결과를 여기에 남긴다.
+# 한 번 기록된 (그룹, 주, 멤버) 행은 바꾸지 않는다. (같은 주를 다시 기록하면 무시)
+
+def _week_key(week_start: str) -> int:
+    """주 시작 시각(ISO 문자열)을 정수 키(YYYYMMDD)로 변환"""
+    return int(datetime.fromisoformat(week_start).strftime('%Y%m%d'))
+
+def _week_label(week: int) -> str:
+    """정수 주 키를 'YYYY-MM-DD'로 변환"""
+    return f"{week // 10000:04d}-{week // 100 % 100:02d}-{week % 100:02d}"
+
+def _snapshot_name_id(cursor, name: str) -> int:
+    """그룹/문제집 이름의 정수 id (없으면 새로 발급)"""
+    cursor.execute('INSERT OR IGNORE INTO snapshot_names (name) VALUES (?)', (name,))
+    cursor.execute('SELECT id FROM snapshot_names WHERE name = ?', (name,))
+    return cursor.fetchone()['id']
+
+def _find_snapshot_name_id(cursor, name: str) -> Optional[int]:
+    cursor.execute('SELECT id FROM snapshot_names WHERE name = ?', (name,))
+    row = cursor.fetchone()
+    return row['id'] if row else None
+
+def _week_range(week_from: Optional[str], week_to: Optional[str]) -> Tuple[int, int]:
+    """조회 기간 (주 시작일 기준, 양 끝 포함)"""
+    low = _week_key(week_from) if week_from else 0
+    high = _week_key(week_to) if week_to else 99999999
+    return low, high
+
+def record_weekly_snapshot(group_name: str, week_start: str, members: List[Dict]) -> int:
+    """
+    그룹 주간 문제풀이 결과 기록
+
+    Args:
+        group_name: 그룹명
+        week_start: 주 시작 시각 (ISO 문자열)
+        members: [{'user_id', 'boj_handle', 'solved_count'}, ...]
+
+    Returns:
+        기록된 행 수 (이미 기록된 멤버는 새 값으로 덮어씀 - 최종 갱신 창 안의 재시도가 앞선 결과를 고칠 수 있도록)
+    """
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+
+        group_id = _snapshot_name_id(cursor, group_name)
+        week = _week_key(week_start)
+        cursor.executemany('''
+            INSERT INTO weekly_snapshots (group_id, week, user_id, boj_handle, solved_count)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(group_id, week, user_id) DO UPDATE SET
+                boj_handle = excluded.boj_handle,
+                solved_count = excluded.solved_count
+        ''', [
+            (group_id, week, int(member['user_id']), member.get('boj_handle'), int(member.get('solved_count') or 0))
+            for member in members
+        ])
+        recorded = cursor.rowcount
+
+        conn.commit()
+        return recorded
+    finally:
+        conn.close()
+
+def record_problem_set_snapshot(group_name: str, problem_set_name: str, week_start: str, members: List[Dict]) -> int:
+    """
+    그룹 문제집 과제 결과 기록
+
+    Args:
+        members: [{'user_id', 'solved_count', 'total'}, ...]
+
+    Returns:
+        기록된 행 수 (이미 기록된 멤버는 새 값으로 덮어씀)
+    """
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+
+        group_id = _snapshot_name_id(cursor, group_name)
+        problem_set_id = _snapshot_name_id(cursor, problem_set_name)
+        week = _week_key(week_start)
+        cursor.executemany('''
+            INSERT INTO problem_set_snapshots (group_id, week, user_id, problem_set_id, solved_count, total)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(group_id, week, user_id, problem_set_id) DO UPDATE SET
+                solved_count = excluded.solved_count,
+                total = excluded.total
+        ''', [
+            (group_id, week, int(member['user_id']), problem_set_id,
+             int(member.get('solved_count') or 0), int(member.get('total') or 0))
+            for member in members
+        ])
+        recorded = cursor.rowcount
+
+        conn.commit()
+        return recorded
+    finally:
+        conn.close()
+
+def get_snapshot_weeks(group_name: str) -> List[str]:
+    """기록이 있는 주 목록 (최근 주부터, 'YYYY-MM-DD')"""
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
+
+        group_id = _find_snapshot_name_id(cursor, group_name)
+        if group_id is None:
+            return []
+        cursor.execute('''
+            SELECT week FROM weekly_snapshots WHERE group_id = ?
+            UNION
+            SELECT week FROM problem_set_snapshots WHERE group_id = ?
+            ORDER BY week DESC
+        ''', (group_id, group_id))
+        weeks = [_week_label(row['week']) for row in cursor.fetchall()]
+
+        return weeks
+    finally:
+        conn.close()
+
+def get_weekly_snapshot(group_name: str, week_start: str) -> List[Dict]:
+    """
+    특정 주의 기록 (해결한 문제 수 많은 순)
+
+    Returns:
+        [{'user_id', 'boj_handle', 'solved_count', 'set_solved', 'set_total'}, ...]
+        set_solved/set_total은 그 주 문제집 과제 합계
+    """
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
+
+        group_id = _find_snapshot_name_id(cursor, group_name)
+        if group_id is None:
+            return []
+        week = _week_key(week_start)
+
+        members = {}
+        cursor.execute('''
+            SELECT user_id, boj_handle, solved_count FROM weekly_snapshots
+            WHERE group_id = ? AND week = ?
+        ''', (group_id, week))
+        for row in cursor.fetchall():
+            members[row['user_id']] = {
+                'user_id': str(row['user_id']),
+                'boj_handle': row['boj_handle'],
+                'solved_count': row['solved_count'],
+                'set_solved': 0,
+                'set_total': 0,
+            }
+        cursor.execute('''
+            SELECT user_id, SUM(solved_count) AS set_solved, SUM(total) AS set_total
+            FROM problem_set_snapshots
+            WHERE group_id = ? AND week = ?
+            GROUP BY user_id
+        ''', (group_id, week))
+        for row in cursor.fetchall():
+            member = members.setdefault(row['user_id'], {
+                'user_id': str(row['user_id']), 'boj_handle': None, 'solved_count': 0,
+            })
+            member['set_solved'] = row['set_solved']
+            member['set_total'] = row['set_total']
+
+        return sorted(members.values(), key=lambda m: (m['solved_count'], m['set_solved']), reverse=True)
+    finally:
+        conn.close()
+
+def get_season_totals(group_name: str, week_from: Optional[str] = None, week_to: Optional[str] = None) -> List[Dict]:
+    """
+    기간 내 멤버별 누적 기록 (해결한 문제 수 합계 많은 순)
+
+    Args:
+        week_from, week_to: 주 시작 시각 (ISO 문자열, 양 끝 포함, None이면 제한 없음)
+
+    Returns:
+        [{'user_id', 'boj_handle', 'weeks', 'solved_total', 'best_week', 'set_solved', 'set_total'}, ...]
+        boj_handle은 가장 최근 주의 핸들
+    """
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
+
+        group_id = _find_snapshot_name_id(cursor, group_name)
+        if group_id is None:
+            return []
+        low, high = _week_range(week_from, week_to)
+
+        totals = {}
+        # MAX(week)와 함께 고른 boj_handle은 SQLite에서 최근 주 행의 값이 된다
+        cursor.execute('''
+            SELECT user_id, MAX(week) AS last_week, boj_handle,
+                   COUNT(*) AS weeks, SUM(solved_count) AS solved_total
+            FROM weekly_snapshots
+            WHERE group_id = ? AND week BETWEEN ? AND ?
+            GROUP BY user_id
+        ''', (group_id, low, high))
+        for row in cursor.fetchall():
+            totals[row['user_id']] = {
+                'user_id': str(row['user_id']),
+                'boj_handle': row['boj_handle'],
+                'weeks': row['weeks'],
+                'solved_total': row['solved_total'],
+                'set_solved': 0,
+                'set_total': 0,
+            }
+        cursor.execute('''
+            SELECT user_id, MAX(solved_count) AS best_week FROM weekly_snapshots
+            WHERE group_id = ? AND week BETWEEN ? AND ?
+            GROUP BY user_id
+        ''', (group_id, low, high))
+        for row in cursor.fetchall():
+            totals[row['user_id']]['best_week'] = row['best_week']
+        cursor.execute('''
+            SELECT user_id, SUM(solved_count) AS set_solved, SUM(total) AS set_total
+            FROM problem_set_snapshots
+            WHERE group_id = ? AND week BETWEEN ? AND ?
+            GROUP BY user_id
+        ''', (group_id, low, high))
+        for row in cursor.fetchall():
+            member = totals.setdefault(row['user_id'], {
+                'user_id': str(row['user_id']), 'boj_handle': None, 'weeks': 0, 'solved_total': 0,
+            })
+            member['set_solved'] = row['set_solved']
+            member['set_total'] = row['set_total']
+
+        for member in totals.values():
+            member.setdefault('best_week', 0)
+        return sorted(totals.values(), key=lambda m: (m['solved_total'], m['set_solved']), reverse=True)
+    finally:
+        conn.close()
+
+def get_member_history(user_id: str, group_name: Optional[str] = None) -> List[Dict]:
+    """
+    멤버의 주별 기록 (최근 주부터)
+
+    Returns:
+        [{'group_name', 'week', 'boj_handle', 'solved_count', 'set_solved', 'set_total'}, ...]
+    """
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
+
+        params = [int(user_id)]
+        group_filter = ''
+        if group_name is not None:
+            group_id = _find_snapshot_name_id(cursor, group_name)
+            if group_id is None:
+                return []
+            group_filter = 'AND group_id = ?'
+            params.append(group_id)
+
+        history = {}
+        cursor.execute(f'''
+            SELECT group_id, week, boj_handle, solved_count FROM weekly_snapshots
+            WHERE user_id = ? {group_filter}
+        ''', params)
+        for row in cursor.fetchall():
+            history[(row['group_id'], row['week'])] = {
+                'group_id': row['group_id'], 'week': row['week'], 'boj_handle': row['boj_handle'],
+                'solved_count': row['solved_count'], 'set_solved': 0, 'set_total': 0,
+            }
+        cursor.execute(f'''
+            SELECT group_id, week, SUM(solved_count) AS set_solved, SUM(total) AS set_total
+            FROM problem_set_snapshots
+            WHERE user_id = ? {group_filter}
+            GROUP BY group_id, week
+        ''', params)
+        for row in cursor.fetchall():
+            entry = history.setdefault((row['group_id'], row['week']), {
+                'group_id': row['group_id'], 'week': row['week'], 'boj_handle': None, 'solved_count': 0,
+            })
+            entry['set_solved'] = row['set_solved']
+            entry['set_total'] = row['set_total']
+
+        cursor.execute('SELECT id, name FROM snapshot_names')
+        names = {row['id']: row['name'] for row in cursor.fetchall()}
+
+        result = []
+        for entry in sorted(history.values(), key=lambda e: e['week'], reverse=True):
+            entry['group_name'] = names.get(entry.pop('group_id'))
+            entry['week'] = _week_label(entry['week'])
+            result.append(entry)
+        return result
+    finally:
+        conn.close()
+
+# ==================== 호환성 함수 (기존 JSON 방식과 호환) ====================
+
+def load_users() -> Dict[str, Dict]:
+    """
+    사용자 정보 전체 로드 (테이블마다 한 번씩 조회 후 사용자별로 묶음)
+
+    Returns:
+        {user_id: {'username', 'boj_handle', 'roles', 'tistory_links', 'submissions'}}
+    """
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
+
+        users = {}
+        cursor.execute('SELECT user_id, username, boj_handle FROM users')
+        for row in cursor.fetchall():
+            users[row['user_id']] = {
+                'username': row['username'],
+                'boj_handle': row['boj_handle'],
+                'roles': [],
+                'tistory_links': [],
+                'submissions': {}
+            }
+
+        cursor.execute('SELECT user_id, role_name FROM user_roles ORDER BY user_id, role_name')
+        for row in cursor.fetchall():
+            user = users.get(row['user_id'])
+            if user is not None:
+                user['roles'].append(row['role_name'])
+
+        cursor.execute('SELECT user_id, link, submitted_at FROM blog_links ORDER BY submitted_at DESC')
+        for row in cursor.fetchall():
+            user = users.get(row['user_id'])
+            if user is not None:
+                user['tistory_links'].append({'link': row['link'], 'submitted_at': row['submitted_at']})
+
+        # submissions를 assignment_id별로 그룹화
+        cursor.execute('''
+            SELECT user_id, assignment_id, type, content, problem_id, verified, submitted_at
+            FROM submissions
+            ORDER BY submitted_at DESC
+        ''')
+        for row in cursor.fetchall():
+            user = users.get(row['user_id'])
+            if user is None:
+                continue
+            user['submissions'].setdefault(row['assignment_id'], []).append({
+                'type': row['type'],
+                'content': row['content'],
+                'problem_id': row['problem_id'],
+                'verified': bool(row['verified']),
+                'submitted_at': row['submitted_at']
+            })
+
+        return users
+    finally:
+        conn.close()
+
+@_cached(_role_token_cache)
+def load_role_tokens() -> Dict[str, Dict]:
+    """역할 토큰만 로드: {role_name: {'token_hash', 'original_token'}}"""
     return {
-        'users': users,
+        row['role_name']: {'token_hash': row['token_hash'], 'original_token': row['original_token']}
+        for row in _role_token_cache.all()
+    }
+
+def load_studies() -> Dict[str, Dict]:
+    """스터디와 과제만 로드: {study_name: {'assignments': {assignment_id: {...}}}}"""
+    conn = get_read_connection()
+    try:
+        cursor = conn.cursor()
+
+        studies = {}
+        cursor.execute('SELECT study_name FROM studies')
+        for row in cursor.fetchall():
+            studies[row['study_name']] = {'assignments': {}}
+
+        cursor.execute('SELECT * FROM assignments')
+        for row in cursor.fetchall():
+            study = studies.get(row['study_name'])
+            if study is None:
+                continue
+            assignment = dict(row)
+            assignment['config'] = json.loads(assignment['config'])
+            study['assignments'][assignment['assignment_id']] = assignment
+
+        return studies
+    finally:
+        conn.close()
+
+def load_data() -> Dict:
+    """기존 JSON 방식과 호환되는 데이터 로드"""
+    # SQLite에서 데이터를 읽어서 JSON 형식으로 변환
+    return {
+        'users': load_users(),
         'submissions': {},  # 호환성
-        'role_tokens': role_tokens_dict,
-        'studies': studies
+        'role_tokens': load_role_tokens(),
+        'studies': load_studies()
     }
 
-def save_data(data: Dict):
-    """기존 JSON 방식과 호환되는 데이터 저장"""
-    # JSON 데이터를 SQLite에 저장
-    # 사용자 정보
+def import_data(data: Dict) -> Dict:
+    """
+    JSON 형식 데이터를 한 트랜잭션으로 일괄 저장 (마이그레이션/복원용)
+
+    행마다 연결/커밋하지 않고 테이블별 executemany upsert로 처리한다.
+    기존 save_data와 같은 규칙을 따른다:
+    - 사용자: 있으면 이름/핸들만 갱신
+    - 역할/블로그 링크/스터디: 이미 있으면 무시
+    - 제출: 같은 (사용자, 과제, 종류, problem_id 또는 content)가 있으면 무시
+    - 과제: 있으면 이름/설정만 갱신 (빈 값은 유지)
+
+    Args:
+        data: load_data()와 같은 형식의 딕셔너리
+
+    Returns:
+        {'users', 'user_roles', 'blog_links', 'submissions', 'role_tokens', 'studies', 'assignments': 변경된 행 수,
+         'elapsed': 소요 시간(초)}
+    """
+    started = time.perf_counter()
+    now = datetime.now().isoformat()
+
+    users, user_roles, blog_links, submissions = [], [], [], []
     for user_id, user_data in data.get('users', {}).items():
-        create_or_update_user(
-            user_id,
-            user_data.get('username', ''),
-            user_data.get('boj_handle')
-        )
-        
-        # 역할
+        users.append((user_id, user_data.get('username', ''), user_data.get('boj_handle'), now, now))
         for role_name in user_data.get('roles', []):
-            add_user_role(user_id, role_name)
-        
-        # 블로그 링크
+            user_roles.append((user_id, role_name))
         for link_data in user_data.get('tistory_links', []):
             if isinstance(link_data, dict):
-                add_blog_link(user_id, link_data['link'])
+                blog_links.append((user_id, link_data['link'], link_data.get('submitted_at') or now))
             else:
-                add_blog_link(user_id, link_data)
-        
-        # 제출 (submissions는 별도로 처리)
-        for assignment_id, submissions in user_data.get('submissions', {}).items():
-            for sub in submissions:
-                add_submission(
-                    user_id,
-                    assignment_id,
-                    sub.get('type', '블로그'),
-                    sub.get('content') or sub.get('link'),
-                    sub.get('problem_id'),
-                    sub.get('verified', False)
-                )
-    
-    # 역할 토큰
-    for role_name, token_data in data.get('role_tokens', {}).items():
-        save_role_token(
-            role_name,
-            token_data.get('token_hash', ''),
-            token_data.get('original_token', '')
-        )
-    
-    # 스터디 및 과제
+                blog_links.append((user_id, link_data, now))
+        for assignment_id, subs in user_data.get('submissions', {}).items():
+            for sub in subs:
+                submissions.append({
+                    'user_id': user_id,
+                    'assignment_id': assignment_id,
+                    'type': sub.get('type', '블로그'),
+                    'content': sub.get('content') or sub.get('link'),
+                    'problem_id': sub.get('problem_id'),
+                    'verified': 1 if sub.get('verified', False) else 0,
+                    'submitted_at': sub.get('submitted_at') or now
+                })
+
+    role_tokens = [
+        (role_name, token_data.get('token_hash', ''), token_data.get('original_token', ''), now)
+        for role_name, token_data in data.get('role_tokens', {}).items()
+    ]
+
+    studies, assignments = [], []
     for study_name, study_data in data.get('studies', {}).items():
-        create_study(study_name)
+        studies.append((study_name, now))
         for assignment_id, assignment in study_data.get('assignments', {}).items():
-            # 과제가 이미 존재하는지 확인
-            existing = get_assignment(assignment_id)
-            if existing:
-                # 존재하면 업데이트만 수행 (제출은 다시 저장하지 않음)
-                update_assignment(
-                    assignment_id,
-                    name=assignment.get('name', ''),
-                    config=assignment.get('config', {})
-                )
-            else:
-                # 존재하지 않으면 생성
-                create_assignment(
-                    assignment_id,
-                    study_name,
-                    assignment.get('type', ''),
-                    assignment.get('name', ''),
-                    assignment.get('config', {}),
-                    assignment.get('created_by', '')
-                )
+            name = assignment.get('name', '')
+            config = assignment.get('config', {})
+            assignments.append({
+                'assignment_id': assignment_id,
+                'study_name': study_name,
+                'type': assignment.get('type', ''),
+                'name': name,
+                'config': json.dumps(config, ensure_ascii=False),
+                'created_at': assignment.get('created_at') or now,
+                'created_by': assignment.get('created_by', ''),
+                # 기존 과제 갱신 시 빈 이름/설정은 덮어쓰지 않음 (update_assignment와 동일)
+                'new_name': name or None,
+                'new_config': json.dumps(config, ensure_ascii=False) if config else None
+            })
+
+    statements = [
+        ('users', '''
+            INSERT INTO users (user_id, username, boj_handle, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(user_id) DO UPDATE SET
+                username = excluded.username,
+                boj_handle = excluded.boj_handle,
+                updated_at = excluded.updated_at
+        ''', users),
+        ('user_roles', '''
+            INSERT INTO user_roles (user_id, role_name) VALUES (?, ?)
+            ON CONFLICT DO NOTHING
+        ''', user_roles),
+        ('blog_links', '''
+            INSERT INTO blog_links (user_id, link, submitted_at) VALUES (?, ?, ?)
+            ON CONFLICT DO NOTHING
+        ''', blog_links),
+        ('role_tokens', '''
+            INSERT INTO role_tokens (role_name, token_hash, original_token, created_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(role_name) DO UPDATE SET
+                token_hash = excluded.token_hash,
+                original_token = excluded.original_token
+        ''', role_tokens),
+        ('studies', '''
+            INSERT INTO studies (study_name, created_at) VALUES (?, ?)
+            ON CONFLICT DO NOTHING
+        ''', studies),
+        ('assignments', '''
+            INSERT INTO assignments (assignment_id, study_name, type, name, config, created_at, created_by)
+            VALUES (:assignment_id, :study_name, :type, :name, :config, :created_at, :created_by)
+            ON CONFLICT(assignment_id) DO UPDATE SET
+                name = COALESCE(:new_name, name),
+                config = COALESCE(:new_config, config)
+        ''', assignments),
+        # add_submission과 같은 중복 체크 (problem_id가 있으면 problem_id, 없으면 content 기준)
+        ('submissions', '''
+            INSERT INTO submissions (user_id, assignment_id, type, content, problem_id, verified, submitted_at)
+            SELECT :user_id, :assignment_id, :type, :content, :problem_id, :verified, :submitted_at
+            WHERE NOT EXISTS (
+                SELECT 1 FROM submissions
+                WHERE user_id = :user_id AND assignment_id = :assignment_id AND type = :type
+                  AND (
+                    (:problem_id IS NOT NULL AND problem_id = :problem_id)
+                    OR (:problem_id IS NULL AND COALESCE(:content, '') != '' AND content = :content)
+                  )
+            )
+        ''', submissions),
+    ]
+
+    result = {}
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+        for table, sql, rows in statements:
+            before = conn.total_changes
+            if rows:
+                cursor.executemany(sql, rows)
+            result[table] = conn.total_changes - before
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    _role_token_cache.invalidate()
+
+    result['elapsed'] = time.perf_counter() - started
+    return result
+
+def save_data(data: Dict) -> Dict:
+    """기존 JSON 방식과 호환되는 데이터 저장 (import_data로 일괄 저장)"""
+    return import_data(data)
 
@@ -0,0 +1,105 @@
+"""
+멤버별 병렬 조회 유틸리티
+그룹/역할 멤버들의 solved.ac 조회를 동시에 보내되, 호스트별 동시 요청 수와 멤버별 제한 시간을 둔다.
+"""
+import asyncio
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from common.config import FANOUT_MAX_IN_FLIGHT, FANOUT_MEMBER_TIMEOUT
+
+# 호스트별 세마포어 (프로세스 전역, 여러 스케줄러가 동시에 돌아도 합산해서 제한)
+_host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+
+def _get_semaphore(host: str) -> asyncio.Semaphore:
+    """호스트별 세마포어 반환 (없으면 생성)"""
+    semaphore = _host_semaphores.get(host)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(FANOUT_MAX_IN_FLIGHT)
+        _host_semaphores[host] = semaphore
+    return semaphore
+
+
+async def gather_bounded(
+    items: Iterable[Any],
+    worker: Callable[[Any], Awaitable[Any]],
+    host: str = 'solved.ac',
+    timeout: Optional[float] = FANOUT_MEMBER_TIMEOUT,
+) -> List[Any]:
+    """
+    items 각각에 대해 worker를 병렬 실행하고 입력 순서대로 결과 반환
+
+    Args:
+        items: 조회 대상 목록 (예: 멤버 정보 dict)
+        worker: item 하나를 받아 결과를 돌려주는 코루틴 함수
+        host: 동시 요청 수를 공유할 호스트 이름
+        timeout: item 하나당 제한 시간 (초, None이면 무제한)
+
+    Returns:
+        입력 순서와 같은 결과 리스트. 실패/시간 초과한 item 자리에는 예외 객체가 들어간다.
+    """
+    semaphore = _get_semaphore(host)
+
+    async def run_one(item):
+        async with semaphore:
+            if timeout is None:
+                return await worker(item)
+            try:
+                return await asyncio.wait_for(worker(item), timeout=timeout)
+            except asyncio.TimeoutError:
+                # 기본 TimeoutError는 메시지가 비어 있어 임베드에 사유가 표시되지 않음
+                raise asyncio.TimeoutError(f"시간 초과 ({timeout}초)")
+
+    return await asyncio.gather(*(run_one(item) for item in items), return_exceptions=True)
+
+
+def _has_handle(row: Dict) -> bool:
+    handle = row.get('boj_handle')
+    return bool(handle) and handle != '미등록'
+
+
+async def gather_members(
+    rows: List[Dict],
+    worker: Callable[[Dict], Awaitable[Any]],
+) -> List[Tuple[Dict, Any]]:
+    """
+    BOJ 핸들이 등록된 멤버 행마다 worker를 병렬 실행
+
+    Args:
+        rows: 멤버 행 목록 ('boj_handle' 키, 미등록 행은 그대로 두고 건너뜀)
+        worker: 행 하나를 받아 조회 결과를 돌려주는 코루틴 함수
+
+    Returns:
+        [(행, 결과), ...] - 실패/시간 초과한 행의 결과 자리에는 예외 객체
+    """
+    targets = [row for row in rows if _has_handle(row)]
+    fetched = await gather_bounded(targets, worker)
+    return list(zip(targets, fetched))
+
+
+async def fetch_weekly_counts(rows: List[Dict], start: datetime, end: datetime, plan=None):
+    """
+    멤버 행마다 기간 내 해결 문제 수를 병렬 조회해서 행에 채움 (미등록 행은 그대로)
+
+    - 성공: solved_count, problems, status ('✅' 또는 해결 0개면 '⚠️')
+    - 실패: status ('❌ 오류: ...'), failed=True, error
+      (조회 함수가 solved.ac 조회 실패를 0개 대신 예외로 전달하므로 응답 오류/연결 실패/시간 초과 모두 해당)
+
+    Args:
+        rows: 멤버 행 목록 ('boj_handle' 키)
+        start, end: 조회 기간
+        plan: 자동 갱신의 조회 계획 (common/refresh_plan.py, None이면 직접 조회)
+    """
+    from common.refresh_plan import planned_weekly_solved_count
+
+    fetched = await gather_members(rows, lambda row: planned_weekly_solved_count(plan, row['boj_handle'], start, end))
+    for row, solved_data in fetched:
+        if isinstance(solved_data, Exception):
+            row.update({'status': f'❌ 오류: {str(solved_data)[:30]}', 'failed': True, 'error': solved_data})
+            continue
+        row.update({
+            'solved_count': solved_data['count'],
+            'problems': solved_data.get('problems', []),
+            'status': '✅' if solved_data['count'] > 0 else '⚠️',
+        })
@@ -484,6 +484,16 @@ def setup(bot):
                       "• 자동 갱신은 즉시 중단됩니다",
                 inline=False
             )
+            embed_problem_status.add_field(
+                name="`/그룹 기록 <그룹명>`",
+                value="**설명:** 종료된 주간 현황의 기록을 합쳐 멤버별 누적 순위를 보여줍니다.\n\n"
+                      "**사용법:**\n"
+                      "```\n/그룹 기록 21기-실전\n```\n\n"
+                      "**참고:**\n"
+                      "• 주간 현황/문제집 과제가 종료될 때 마지막 결과가 자동으로 기록됩니다\n"
+                      "• 저장된 기록만 사용하므로 바로 표시됩니다",
+                inline=False
+            )
             pages.append(embed_problem_status)
         
         # 페이지가 없으면
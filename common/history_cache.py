@@ -0,0 +1,155 @@
+"""
+solved.ac 누적 풀이 수(solvedCount) 히스토리 캐시
+핸들별 히스토리를 정렬된 시각/값 배열로 보관하고, 임의의 기간 풀이 수를 이진 탐색으로 계산한다.
+"""
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from common import async_db
+from common.config import HISTORY_CACHE_TTL, HISTORY_CACHE_MAX_HANDLES, HISTORY_CACHE_PERSIST
+from common.utils import KST
+
+
+def to_epoch(dt: datetime) -> float:
+    """datetime을 epoch 초로 변환 (timezone-naive면 KST로 간주)"""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=KST)
+    return dt.timestamp()
+
+
+class SolvedHistory:
+    """
+    한 핸들의 solvedCount 누적 시계열
+
+    times[i] 시각(epoch 초, 오름차순)에 누적 풀이 수가 values[i]였다는 뜻.
+    """
+    __slots__ = ('times', 'values', 'fetched_at')
+
+    def __init__(self, times: array, values: array, fetched_at: float):
+        self.times = times
+        self.values = values
+        self.fetched_at = fetched_at
+
+    @classmethod
+    def from_api(cls, data: List[Dict], fetched_at: Optional[float] = None) -> 'SolvedHistory':
+        """
+        solved.ac history API 응답으로 생성
+
+        응답 형식: [{"timestamp": "2021-09-12T04:37:27.000Z", "value": 445}, ...]
+        """
+        points = []
+        for entry in data:
+            timestamp_str = entry.get('timestamp')
+            value = entry.get('value')
+            if not timestamp_str or value is None:
+                continue
+            try:
+                dt = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+                points.append((dt.timestamp(), int(value)))
+            except Exception:
+                continue
+        # 같은 시각이 여러 개면 응답 순서를 유지 (뒤에 오는 값이 최종값)
+        points.sort(key=lambda x: x[0])
+        return cls(
+            array('d', (t for t, _ in points)),
+            array('q', (v for _, v in points)),
+            fetched_at if fetched_at is not None else time.time(),
+        )
+
+    @classmethod
+    def from_blobs(cls, times: bytes, values: bytes, fetched_at: float) -> 'SolvedHistory':
+        """DB에 저장된 바이트 배열로 생성"""
+        t = array('d')
+        t.frombytes(times or b'')
+        v = array('q')
+        v.frombytes(values or b'')
+        return cls(t, v, fetched_at)
+
+    def to_blobs(self) -> tuple:
+        """DB 저장용 (times, values) 바이트 배열"""
+        return self.times.tobytes(), self.values.tobytes()
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def cumulative_at(self, ts: float, inclusive: bool) -> int:
+        """ts 이전(inclusive면 이하)까지의 누적 풀이 수"""
+        index = bisect_right(self.times, ts) if inclusive else bisect_left(self.times, ts)
+        return self.values[index - 1] if index > 0 else 0
+
+    def solved_between(self, start_date: datetime, end_date: datetime) -> int:
+        """[start_date, end_date] 기간에 푼 문제 수"""
+        total_before = self.cumulative_at(to_epoch(start_date), inclusive=False)
+        total_end = self.cumulative_at(to_epoch(end_date), inclusive=True)
+        return max(0, total_end - total_before)
+
+    def latest_count(self) -> int:
+        """가장 최근 누적 풀이 수"""
+        return self.values[-1] if self.values else 0
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """TTL 안에 받아온 데이터인지"""
+        return ((now or time.time()) - self.fetched_at) < HISTORY_CACHE_TTL
+
+
+# 메모리 캐시 (LRU, 최대 HISTORY_CACHE_MAX_HANDLES개 핸들)
+_memory_cache: 'OrderedDict[str, SolvedHistory]' = OrderedDict()
+
+
+async def get_cached_history(boj_handle: str) -> Optional[SolvedHistory]:
+    """
+    캐시된 히스토리 반환 (메모리 -> SQLite 순, TTL 지난 데이터는 None)
+
+    Args:
+        boj_handle: BOJ 핸들
+
+    Returns:
+        TTL 안의 SolvedHistory 또는 None
+    """
+    key = boj_handle.lower()
+    history = _memory_cache.get(key)
+    if history is not None:
+        if history.is_fresh():
+            _memory_cache.move_to_end(key)
+            return history
+        del _memory_cache[key]
+
+    if HISTORY_CACHE_PERSIST:
+        try:
+            row = await async_db.get_solved_history_cache(key)
+        except Exception:
+            row = None
+        if row:
+            history = SolvedHistory.from_blobs(row['times'], row['solved_values'], row['fetched_at'] or 0.0)
+            if history.is_fresh():
+                _remember(key, history)
+                return history
+    return None
+
+
+async def store_history(boj_handle: str, history: SolvedHistory):
+    """히스토리를 메모리 캐시(및 SQLite)에 저장"""
+    key = boj_handle.lower()
+    _remember(key, history)
+    if HISTORY_CACHE_PERSIST:
+        try:
+            times, values = history.to_blobs()
+            await async_db.save_solved_history_cache(key, times, values, history.fetched_at)
+        except Exception:
+            pass
+
+
+def invalidate_history(boj_handle: str):
+    """핸들의 메모리 캐시 제거 (다음 조회 시 다시 받아옴)"""
+    _memory_cache.pop(boj_handle.lower(), None)
+
+
+def _remember(key: str, history: SolvedHistory):
+    _memory_cache[key] = history
+    _memory_cache.move_to_end(key)
+    while len(_memory_cache) > HISTORY_CACHE_MAX_HANDLES:
+        _memory_cache.popitem(last=False)
@@ -0,0 +1,136 @@
+"""
+solved.ac / BOJ 공용 HTTP 클라이언트
+봇 전체가 하나의 aiohttp 세션(커넥션 풀)을 공유해 매 요청마다 TCP/TLS 핸드셰이크를 반복하지 않도록 한다.
+"""
+import asyncio
+import time
+
+import aiohttp
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from common.config import (
+    HTTP_POOL_LIMIT,
+    HTTP_POOL_LIMIT_PER_HOST,
+    HTTP_DNS_CACHE_TTL,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_DEFAULT_TIMEOUT,
+    HTTP_USER_AGENT,
+    RATE_LIMIT_MAX_RETRIES,
+    RATE_LIMIT_429_BACKOFF,
+)
+from common import circuit_breaker, rate_limiter
+
+# 공용 세션 (KoalaBot.setup_hook에서 생성, KoalaBot.close에서 종료)
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def _create_session() -> aiohttp.ClientSession:
+    """커넥션 풀/keep-alive/DNS 캐시가 설정된 세션 생성"""
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_POOL_LIMIT,
+        limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+        ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+        keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers={'User-Agent': HTTP_USER_AGENT},
+        timeout=aiohttp.ClientTimeout(total=HTTP_DEFAULT_TIMEOUT),
+    )
+
+
+async def init_http_client() -> aiohttp.ClientSession:
+    """공용 세션 초기화 (이미 열려 있으면 그대로 사용)"""
+    global _session
+    if _session is None or _session.closed:
+        _session = _create_session()
+    return _session
+
+
+async def close_http_client():
+    """공용 세션 종료"""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+def get_session() -> aiohttp.ClientSession:
+    """
+    공용 세션 반환
+
+    봇 밖(테스트 스크립트 등)에서 호출되어 세션이 아직 없으면 즉석에서 생성한다.
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = _create_session()
+    return _session
+
+
+# 서버 장애로 보는 오류 (연결 실패, 타임아웃, 응답 도중 끊김)
+_OUTAGE_ERRORS = (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError)
+
+
+@asynccontextmanager
+async def http_get(url: str, headers: Optional[dict] = None, timeout: Optional[float] = None, **kwargs):
+    """
+    공용 세션으로 GET 요청
+
+    요청 전에 호스트별 토큰 버킷(rate_limiter)을 거치고,
+    429 응답을 받으면 Retry-After 동안 해당 호스트 전체를 멈춘 뒤 재시도한다.
+    요청 결과(연결 실패/타임아웃/5xx, 응답 시간)는 호스트별 서킷 브레이커(circuit_breaker)에 기록하고,
+    장애로 판단된 호스트로는 요청을 보내지 않고 바로 CircuitOpenError를 발생시킨다.
+
+    Args:
+        url: 요청 URL
+        headers: 기본 헤더에 덧붙일 헤더
+        timeout: 요청 타임아웃 (초, None이면 기본값)
+
+    Usage:
+        async with http_get(url) as response:
+            data = await response.json()
+    """
+    if timeout is not None:
+        kwargs['timeout'] = aiohttp.ClientTimeout(total=timeout)
+    health = circuit_breaker.get_health(url)
+    trial = health.before_request()
+    recorded = False
+    attempt = 0
+    started = time.monotonic()
+    try:
+        while True:
+            await rate_limiter.acquire(url)
+            started = time.monotonic()
+            async with get_session().get(url, headers=headers, **kwargs) as response:
+                latency = time.monotonic() - started
+                if response.status == 429:
+                    retry_after = rate_limiter.parse_retry_after(response.headers.get('Retry-After'))
+                    rate_limiter.block_host(url, retry_after if retry_after is not None else RATE_LIMIT_429_BACKOFF)
+                    if attempt < RATE_LIMIT_MAX_RETRIES:
+                        attempt += 1
+                        continue
+                elif response.status == 503 and 'Retry-After' in response.headers:
+                    retry_after = rate_limiter.parse_retry_after(response.headers.get('Retry-After'))
+                    if retry_after is not None:
+                        rate_limiter.block_host(url, retry_after)
+                failure = f"HTTP {response.status}" if response.status >= 500 else None
+                try:
+                    yield response
+                except _OUTAGE_ERRORS as e:
+                    # 본문을 읽다가 끊기거나 타임아웃
+                    failure = f"{type(e).__name__}: {e}"
+                    raise
+                finally:
+                    recorded = True
+                    if failure:
+                        health.record_failure(latency, failure, trial)
+                    else:
+                        health.record_success(latency, trial)
+                return
+    except _OUTAGE_ERRORS as e:
+        if not recorded:
+            health.record_failure(time.monotonic() - started, f"{type(e).__name__}: {e}", trial)
+        raise
+    finally:
+        health.release(trial)
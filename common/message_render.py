@@ -0,0 +1,75 @@
+"""
+상태 메시지 편집 생략
+매시 갱신 때 '마지막 갱신' 시각만 바뀐 편집은 Discord 요청 한도만 쓰므로,
+시각 줄을 뺀 임베드/버튼 내용의 해시를 메시지별로 저장해 두고 내용이 같으면 편집하지 않는다.
+(내용이 같아도 RENDER_TIMESTAMP_REFRESH_HOURS가 지나면 시각 갱신을 위해 한 번 편집,
+ 갱신 버튼으로 실행한 갱신은 force=True로 항상 편집)
+"""
+import hashlib
+import json
+import re
+import time
+
+from common import async_db
+from common.config import RENDER_TIMESTAMP_REFRESH_HOURS
+from common.logger import get_logger
+
+logger = get_logger()
+
+# 갱신 시각 줄 (예: "마지막 갱신: 2026-01-12 13:00", "**마지막 갱신:** ...", "마지막 업데이트: ...")
+_TIMESTAMP_LINE = re.compile(r'^.*마지막 (?:갱신|업데이트).*$\n?', re.MULTILINE)
+
+
+def _strip_timestamp(text):
+    if not isinstance(text, str):
+        return text
+    return _TIMESTAMP_LINE.sub('', text)
+
+
+def render_hash(embed, view=None) -> str:
+    """임베드(와 버튼)에서 갱신 시각을 뺀 내용의 해시"""
+    payload = embed.to_dict()
+    payload.pop('timestamp', None)
+    payload['description'] = _strip_timestamp(payload.get('description'))
+    for field in payload.get('fields', []):
+        field['value'] = _strip_timestamp(field.get('value'))
+    if view is not None:
+        # 기간이 끝나 버튼이 비활성화되는 등 버튼 상태 변화도 편집 대상
+        payload['components'] = [
+            [type(item).__name__, getattr(item, 'custom_id', None), getattr(item, 'label', None),
+             getattr(item, 'disabled', None), getattr(item, 'url', None)]
+            for item in view.children
+        ]
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+async def edit_if_changed(message, embed, view=None, force: bool = False) -> bool:
+    """
+    내용이 바뀌었을 때만 메시지 편집
+
+    Args:
+        message: 편집할 메시지 (Message 또는 PartialMessage)
+        embed: 새 임베드
+        view: 새 View (None이면 기존 버튼 유지)
+        force: 내용이 같아도 편집 (갱신 버튼 - 사용자가 '마지막 갱신' 시각이 바뀌는 것을 확인하도록)
+
+    Returns:
+        실제로 편집했는지 여부
+    """
+    content_hash = render_hash(embed, view)
+    channel_id, message_id = str(message.channel.id), str(message.id)
+    now = time.time()
+
+    state = await async_db.get_message_render_state(channel_id, message_id)
+    if (not force and state and state['content_hash'] == content_hash
+            and now - (state['edited_at'] or 0) < RENDER_TIMESTAMP_REFRESH_HOURS * 3600):
+        logger.debug(f"[메시지 편집 생략] {channel_id}/{message_id} - 내용 변경 없음")
+        return False
+
+    if view is not None:
+        await message.edit(embed=embed, view=view)
+    else:
+        await message.edit(embed=embed)
+    await async_db.save_message_render_state(channel_id, message_id, content_hash, now)
+    return True
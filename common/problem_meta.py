@@ -0,0 +1,130 @@
+"""
+solved.ac 문제 정보(난이도/제목/태그) 캐시
+/api/v3/problem/lookup으로 여러 문제를 한 번에 조회하고, 결과를 메모리와 SQLite(problem_metadata)에 보관한다.
+"""
+import asyncio
+import time
+from typing import Dict, Iterable, List, Optional
+
+from common import async_db
+from common.config import PROBLEM_LOOKUP_BATCH, PROBLEM_META_TTL, PROBLEM_META_UNRATED_TTL
+from common.http_client import http_get
+from common.logger import get_logger
+
+logger = get_logger()
+
+# 메모리 캐시: problem_id -> {'problem_id', 'title', 'level', 'tags', 'fetched_at'}
+_memory_cache: Dict[int, Dict] = {}
+
+
+def _is_fresh(meta: Dict, now: float) -> bool:
+    """갱신 주기 안의 정보인지 (Unrated 문제는 난이도가 곧 매겨질 수 있어 더 자주 갱신)"""
+    ttl = PROBLEM_META_TTL if meta.get('level') else PROBLEM_META_UNRATED_TTL
+    return (now - (meta.get('fetched_at') or 0.0)) < ttl
+
+
+async def _lookup_batch(problem_ids: List[int]) -> Optional[List[Dict]]:
+    """
+    solved.ac에서 문제 정보 일괄 조회
+    https://solved.ac/api/v3/problem/lookup?problemIds=1000,1001,...
+
+    Returns:
+        문제 정보 리스트, 요청 실패 시 None
+    """
+    url = "https://solved.ac/api/v3/problem/lookup?problemIds=" + ",".join(map(str, problem_ids))
+    try:
+        async with http_get(url, headers={'Accept': 'application/json'}, timeout=10) as response:
+            if response.status != 200:
+                logger.warning(f"[solved.ac 문제 정보] HTTP {response.status} 에러 ({len(problem_ids)}문제)")
+                return None
+            data = await response.json()
+    except Exception as e:
+        logger.error(f"[solved.ac 문제 정보] 조회 실패: {e}")
+        return None
+
+    fetched_at = time.time()
+    result = []
+    for item in data:
+        problem_id = item.get('problemId')
+        if problem_id is None:
+            continue
+        result.append({
+            'problem_id': int(problem_id),
+            'title': item.get('titleKo') or item.get('title') or '',
+            'level': int(item.get('level') or 0),
+            'tags': [tag.get('key') for tag in item.get('tags', []) if tag.get('key')],
+            'fetched_at': fetched_at,
+        })
+    return result
+
+
+async def get_problem_metadata(problem_ids: Iterable[int]) -> Dict[int, Dict]:
+    """
+    여러 문제의 정보 가져오기 (메모리 -> SQLite -> solved.ac 순)
+
+    Args:
+        problem_ids: 문제 번호 목록
+
+    Returns:
+        {문제 번호: {'problem_id', 'title', 'level', 'tags', 'fetched_at'}}
+        solved.ac에 없는 문제는 빠진다. 갱신에 실패하면 오래된 정보라도 돌려준다.
+    """
+    ids = list(dict.fromkeys(int(problem_id) for problem_id in problem_ids))
+    now = time.time()
+    result = {}
+    stale = {}
+
+    missing = []
+    for problem_id in ids:
+        meta = _memory_cache.get(problem_id)
+        if meta and _is_fresh(meta, now):
+            result[problem_id] = meta
+        else:
+            missing.append(problem_id)
+
+    if missing:
+        try:
+            stored = await async_db.get_problem_metadata(missing)
+        except Exception as e:
+            logger.error(f"[solved.ac 문제 정보] DB 조회 오류: {e}")
+            stored = {}
+        still_missing = []
+        for problem_id in missing:
+            meta = stored.get(problem_id)
+            if meta and _is_fresh(meta, now):
+                _memory_cache[problem_id] = meta
+                result[problem_id] = meta
+            else:
+                if meta:
+                    stale[problem_id] = meta
+                still_missing.append(problem_id)
+        missing = still_missing
+
+    if missing:
+        batches = [missing[i:i + PROBLEM_LOOKUP_BATCH] for i in range(0, len(missing), PROBLEM_LOOKUP_BATCH)]
+        fetched_batches = await asyncio.gather(*(_lookup_batch(batch) for batch in batches))
+        fetched = [meta for batch in fetched_batches if batch for meta in batch]
+        for meta in fetched:
+            _memory_cache[meta['problem_id']] = meta
+            result[meta['problem_id']] = meta
+        if fetched:
+            try:
+                await async_db.save_problem_metadata(fetched)
+            except Exception as e:
+                logger.error(f"[solved.ac 문제 정보] DB 저장 오류: {e}")
+
+    # 갱신 실패한 문제는 오래된 정보로 대체
+    for problem_id, meta in stale.items():
+        result.setdefault(problem_id, meta)
+
+    return result
+
+
+async def warm_problem_metadata(problem_ids: Iterable[int]):
+    """문제집/모의테스트 생성 시 문제 정보를 미리 채워둠 (실패해도 무시)"""
+    ids = list(problem_ids)
+    try:
+        metadata = await get_problem_metadata(ids)
+        logger.info(f"[solved.ac 문제 정보] 캐시 준비 완료: {len(metadata)}/{len(ids)}문제")
+    except Exception as e:
+        logger.error(f"[solved.ac 문제 정보] 캐시 준비 오류: {e}", exc_info=True)
@@ -0,0 +1,110 @@
+"""
+호스트별 요청 속도 제한 (토큰 버킷)
+여러 스케줄러가 동시에 크롤링해도 solved.ac / acmicpc.net 전체 요청 속도를 설정값 이하로 유지한다.
+"""
+import asyncio
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from common.config import RATE_LIMITS, RATE_LIMIT_DEFAULT, RATE_LIMIT_MAX_RETRY_AFTER
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0  # 429/Retry-After로 막힌 시각 (monotonic)
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self.updated
+        self.updated = now
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+
+    async def acquire(self):
+        """토큰 하나를 얻을 때까지 대기 (대기 순서대로 처리)"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def block_for(self, seconds: float):
+        """seconds 동안 이 호스트로의 요청을 멈춤 (남은 토큰도 비움)"""
+        now = time.monotonic()
+        self.blocked_until = max(self.blocked_until, now + seconds)
+        self.tokens = 0.0
+        self.updated = now
+
+
+# 호스트별 버킷 (프로세스 전역)
+_buckets: Dict[str, TokenBucket] = {}
+
+
+def normalize_host(url_or_host: str) -> str:
+    """URL 또는 호스트에서 버킷 키 추출 (www. 접두사 제거)"""
+    host = urlparse(url_or_host).hostname if '://' in url_or_host else url_or_host
+    host = (host or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    return host
+
+
+def get_bucket(url_or_host: str) -> TokenBucket:
+    """호스트에 해당하는 버킷 반환 (없으면 설정값으로 생성)"""
+    host = normalize_host(url_or_host)
+    bucket = _buckets.get(host)
+    if bucket is None:
+        rate, burst = RATE_LIMITS.get(host, RATE_LIMIT_DEFAULT)
+        bucket = TokenBucket(rate, burst)
+        _buckets[host] = bucket
+    return bucket
+
+
+async def acquire(url_or_host: str):
+    """요청 전에 호출: 해당 호스트의 토큰을 하나 얻을 때까지 대기"""
+    await get_bucket(url_or_host).acquire()
+
+
+def block_host(url_or_host: str, seconds: float):
+    """해당 호스트로의 요청을 seconds 동안 멈춤 (최대 RATE_LIMIT_MAX_RETRY_AFTER초)"""
+    get_bucket(url_or_host).block_for(min(max(seconds, 0.0), RATE_LIMIT_MAX_RETRY_AFTER))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After 헤더 값을 초 단위로 변환
+
+    Args:
+        value: 헤더 값 (초 단위 숫자 또는 HTTP 날짜)
+
+    Returns:
+        대기할 초, 해석할 수 없으면 None
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
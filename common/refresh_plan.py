@@ -0,0 +1,202 @@
+"""
+매시 자동 갱신 조회 계획
+같은 BOJ 핸들을 그룹 주간 현황, 전체과제현황(문제풀이/문제집/모의테스트 컬럼), 문제집, 모의테스트가
+그룹/과제마다 따로 조회하지 않도록, 실행 시각마다 필요한 조회를 모아 핸들별로 한 번씩만 실행한다.
+
+- 정각에는 진행 중인 현황(group_weekly_status, group_problem_set_status, group_mock_test_status,
+  group_all_assignment_status)을 모아 (핸들, 조회 종류) 합집합만 계산 (DB 조회만, 크롤링 없음)
+  - 'history': solvedCount 히스토리 (주간 해결 수, 현재 solvedCount)
+  - 'solved': 문제집/모의테스트 문제 중 해결한 문제 (핸들별로 모든 대상 문제를 합쳐 한 번)
+- 실제 조회는 스케줄러가 분산해 둔 각 실행 단위가 자기 차례에 처음 필요로 하는 핸들만 실행하고,
+  같은 시각의 다른 실행 단위는 그 결과를 공유한다. (정각에 모든 핸들을 한꺼번에 크롤링하지 않음)
+- 메시지의 '마지막 갱신'은 실제 조회 시각(planned_fetch_time)으로 표시한다.
+  (계획에 없는 핸들은 직접 조회, 수동 갱신 버튼은 계획 없이 항상 새로 조회)
+"""
+import asyncio
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set
+
+from common import async_db
+from common.boj_utils import get_solved_history, get_user_solved_problems_from_solved_ac, get_weekly_solved_count
+from common.logger import get_logger
+from common.utils import ensure_kst, get_kst_now
+
+logger = get_logger()
+
+
+class RefreshPlan:
+    """한 실행 시각의 핸들별 조회 결과"""
+
+    def __init__(self, slot: datetime):
+        self.slot = slot
+        self.targets: Dict[str, Set[int]] = {}  # 핸들 -> 해결 여부를 확인할 문제 (없으면 히스토리만)
+        self.histories: Dict[str, object] = {}  # 핸들 -> SolvedHistory (조회에 성공한 핸들만)
+        self.solved: Dict[str, Set[int]] = {}   # 핸들 -> targets 중 해결한 문제
+        self.fetched_at: Dict[str, datetime] = {}  # 핸들 -> 조회 시각
+        self._tasks: Dict[str, asyncio.Task] = {}  # 핸들 -> 조회 작업 (처음 필요로 한 실행 단위에서 시작)
+
+    def want(self, handle: Optional[str], problem_ids: Iterable[int] = ()):
+        """조회 대상 추가"""
+        if not handle or handle == '미등록':
+            return
+        self.targets.setdefault(handle, set()).update(problem_ids)
+
+    async def _fetch(self, handle: str) -> bool:
+        """핸들의 히스토리/해결한 문제 조회 (실패하면 계획에서 빠져 각 갱신에서 직접 조회)"""
+        fetched_at = get_kst_now()
+        try:
+            history = await get_solved_history(handle)
+            solved = None
+            if self.targets[handle]:
+                solved = set(await get_user_solved_problems_from_solved_ac(handle, sorted(self.targets[handle])))
+        except Exception as e:
+            logger.warning(f"[조회 계획] {handle} 조회 실패 - 각 갱신에서 직접 조회: {e}")
+            return False
+        if history is None:
+            logger.warning(f"[조회 계획] {handle} 히스토리 조회 실패 - 각 갱신에서 직접 조회")
+            return False
+        self.histories[handle] = history
+        if solved is not None:
+            self.solved[handle] = solved
+        self.fetched_at[handle] = fetched_at
+        return True
+
+    async def ensure(self, handle: Optional[str]) -> bool:
+        """
+        계획에 있는 핸들이면 조회를 마칠 때까지 기다림
+
+        처음 요청한 실행 단위에서 조회를 시작하고, 이미 조회 중이거나 끝났으면 그 결과를 공유한다.
+        (요청한 쪽이 시간 초과로 취소되어도 조회는 계속되어 다음 실행 단위가 결과를 씀)
+
+        Returns:
+            계획 결과를 쓸 수 있는지 (계획에 없거나 조회에 실패했으면 False)
+        """
+        if handle not in self.targets:
+            return False
+        task = self._tasks.get(handle)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(handle))
+            self._tasks[handle] = task
+        return await asyncio.shield(task)
+
+
+# 가장 최근 실행 시각의 계획
+_current_plan: Optional[RefreshPlan] = None
+
+
+def _active(info: dict, slot: datetime, grace: timedelta) -> bool:
+    week_start = ensure_kst(datetime.fromisoformat(info['week_start']))
+    week_end = ensure_kst(datetime.fromisoformat(info['week_end']))
+    return week_start <= slot <= week_end + grace
+
+
+async def build_refresh_plan(slot: datetime, include_final: bool = False) -> RefreshPlan:
+    """
+    실행 시각의 조회 계획 생성 (조회 대상만 모으고, 조회는 각 실행 단위 차례에 실행)
+
+    Args:
+        slot: 실행 시각 (KST)
+        include_final: 월요일 01시처럼 모의테스트/전체과제현황까지 최종 갱신하는 시각인지
+
+    Returns:
+        RefreshPlan (get_refresh_plan(slot)으로도 얻을 수 있음)
+    """
+    global _current_plan
+    plan = RefreshPlan(slot)
+    grace = timedelta(minutes=5) if include_final else timedelta(0)
+    handles_by_role: Dict[str, List[str]] = {}
+
+    async def role_handles(role_name: str) -> List[str]:
+        if role_name not in handles_by_role:
+            users = await async_db.get_role_users(role_name)
+            handles_by_role[role_name] = [u.get('boj_handle') for u in users]
+        return handles_by_role[role_name]
+
+    # 그룹별 확인할 문제 (전체과제현황의 문제집/모의테스트 컬럼용)
+    group_targets: Dict[str, Set[int]] = {}
+
+    for info in await async_db.get_all_group_weekly_status():
+        if _active(info, slot, grace):
+            for handle in await role_handles(info['role_name']):
+                plan.want(handle)
+
+    for info in await async_db.get_all_group_problem_set_status():
+        if not _active(info, slot, grace):
+            continue
+        problem_set = await async_db.get_problem_set(info['problem_set_name'])
+        if not problem_set:
+            continue
+        group_targets.setdefault(info['group_name'], set()).update(problem_set['problem_ids'])
+        for handle in await role_handles(info['role_name']):
+            plan.want(handle, problem_set['problem_ids'])
+
+    if include_final:
+        # 모의테스트와 전체과제현황 전체 갱신은 최종 갱신 시각에만 실행됨
+        for info in await async_db.get_all_group_mock_test_status():
+            if not _active(info, slot, grace):
+                continue
+            mock_test = await async_db.get_mock_test(info['mock_test_name'])
+            if not mock_test:
+                continue
+            problem_ids = mock_test['problem_ids']
+            group_targets.setdefault(info['group_name'], set()).update(problem_ids)
+            for handle in await role_handles(info['role_name']):
+                plan.want(handle, problem_ids)
+
+        for status in await async_db.get_all_group_all_assignment_status():
+            if _active(status, slot, grace):
+                for handle in await role_handles(status['role_name']):
+                    plan.want(handle, group_targets.get(status['group_name'], ()))
+
+    logger.info(
+        f"[조회 계획] {slot.strftime('%m-%d %H:%M')} - 핸들 {len(plan.targets)}개"
+        f" (문제 확인 {sum(1 for ids in plan.targets.values() if ids)}개)"
+    )
+    _current_plan = plan
+    return plan
+
+
+def get_refresh_plan(slot: datetime) -> Optional[RefreshPlan]:
+    """실행 시각의 조회 계획 (아직 없거나 다른 시각의 계획이면 None)"""
+    if _current_plan is not None and _current_plan.slot == slot:
+        return _current_plan
+    return None
+
+
+# ==================== 계획 결과 조회 (계획이 없거나 계획에 없는 핸들은 직접 조회) ====================
+
+async def planned_weekly_solved_count(plan: Optional[RefreshPlan], handle: str,
+                                      start_date: datetime, end_date: datetime) -> Dict:
+    """get_weekly_solved_count와 같은 형식의 기간 내 해결 수 (조회에 실패하면 0개가 아니라 예외)"""
+    if plan is not None and await plan.ensure(handle):
+        return {'count': plan.histories[handle].solved_between(start_date, end_date), 'problems': []}
+    return await get_weekly_solved_count(handle, start_date, end_date)
+
+
+async def planned_solved_count(plan: Optional[RefreshPlan], handle: str) -> Optional[int]:
+    """계획에서 얻은 현재 solvedCount (계획에 없으면 None)"""
+    if plan is not None and await plan.ensure(handle):
+        return plan.histories[handle].latest_count()
+    return None
+
+
+async def planned_solved_problems(plan: Optional[RefreshPlan], handle: str, problem_ids: List[int]) -> List[int]:
+    """get_user_solved_problems_from_solved_ac와 같은 형식의 해결한 문제 목록"""
+    if (plan is not None and await plan.ensure(handle)
+            and handle in plan.solved and plan.targets[handle].issuperset(problem_ids)):
+        solved = plan.solved[handle]
+        return [pid for pid in problem_ids if pid in solved]
+    return await get_user_solved_problems_from_solved_ac(handle, target_problems=problem_ids)
+
+
+def planned_fetch_time(plan: Optional[RefreshPlan], handles: Iterable[Optional[str]], default: datetime) -> datetime:
+    """
+    메시지에 '마지막 갱신'으로 표시할 시각
+
+    계획 결과를 쓴 핸들 중 가장 먼저 조회한 시각 (다른 실행 단위가 먼저 조회한 결과를 공유했을 수 있음).
+    계획 결과를 쓰지 않았으면 default (직접 조회한 현재 시각)
+    """
+    if plan is None:
+        return default
+    times = [plan.fetched_at[handle] for handle in handles if handle in plan.fetched_at]
+    return min(times) if times else default
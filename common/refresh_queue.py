@@ -0,0 +1,133 @@
+"""
+갱신 버튼 요청 큐
+버튼을 누를 때마다 상호작용 안에서 크롤링하지 않고, 메시지 단위로 스케줄러 큐에 넣어 백그라운드에서 실행한다.
+
+- 누르자마자 현재 메시지가 언제 기준인지와 예상 소요 시간으로 응답, 끝나면 결과를 다시 알림
+- 같은 메시지의 갱신은 한 번에 하나씩 실행 (컬럼별 갱신이 같은 표를 동시에 읽고 고쳐 쓰지 않도록)
+  - 아직 시작하지 않은 갱신이 있으면 그 갱신에 컬럼을 추가 (같은 컬럼이면 그 결과를 함께 받음)
+  - 대기 중인 전체 갱신("전체")은 컬럼별 요청을 흡수
+  - 실행 중이면 끝난 뒤 다음 갱신을 실행
+- 갱신이 끝난 지 REFRESH_BUTTON_COOLDOWN초 안에 다시 누르면 갱신하지 않고 현재 메시지를 안내
+"""
+import asyncio
+import time
+from datetime import datetime
+from functools import partial
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from common import async_db
+from common.config import REFRESH_BUTTON_COOLDOWN, REFRESH_ETA_DEFAULT, SCHEDULER_WORKERS
+from common.logger import get_logger
+from common.scheduler import backlog, submit
+from common.utils import KST
+
+logger = get_logger()
+
+_JOB_NAME = 'refresh_button'
+
+_FULL = '전체'  # 메시지 전체를 다시 그리는 갱신 (컬럼별 갱신을 포함)
+
+_last_finished: Dict[str, float] = {}  # (메시지, 컬럼) 키 -> 마지막 갱신 완료 시각 (monotonic)
+_durations: Dict[str, float] = {}      # 컬럼 종류 -> 평균 소요 시간 (초)
+# 메시지 키 -> 아직 시작하지 않은 컬럼별 요청 (run, 완료 안내 문구, 결과 future)
+_waiting: Dict[str, Dict[str, Tuple[Callable[[], Awaitable[Optional[str]]], str, asyncio.Future]]] = {}
+
+
+async def _rendered_label(channel_id: int, message_id: int) -> str:
+    """메시지를 마지막으로 편집한 시각 안내 문구"""
+    try:
+        state = await async_db.get_message_render_state(str(channel_id), str(message_id))
+    except Exception:
+        state = None
+    if not state or not state.get('edited_at'):
+        return ""
+    edited = datetime.fromtimestamp(state['edited_at'], KST)
+    return f" (현재 메시지: {edited.strftime('%m-%d %H:%M')} 기준)"
+
+
+def _estimate_seconds(kind: str, ahead: int) -> int:
+    """앞에 ahead개가 있을 때 예상 소요 시간 (초)"""
+    duration = _durations.get(kind, REFRESH_ETA_DEFAULT)
+    return max(1, round((ahead // SCHEDULER_WORKERS + 1) * duration))
+
+
+async def _run_column(message_key: str, column: str, run: Callable[[], Awaitable[Optional[str]]],
+                      done_message: str) -> str:
+    """컬럼 하나 갱신 후 사용자에게 보낼 안내 문구 반환"""
+    kind = column.split(':')[0]
+    started = time.monotonic()
+    try:
+        message = await run()
+    except Exception as e:
+        logger.error(f"[갱신 버튼] {message_key}:{column} 갱신 오류: {e}", exc_info=True)
+        return f"❌ 갱신 처리 중 오류가 발생했습니다: {type(e).__name__}: {e}"
+    finished = time.monotonic()
+    elapsed = finished - started
+    _durations[kind] = elapsed if kind not in _durations else 0.7 * _durations[kind] + 0.3 * elapsed
+    _last_finished[f"{message_key}:{column}"] = finished
+    return message or done_message
+
+
+async def _drain(message_key: str):
+    """메시지에 쌓인 요청을 차례로 실행 (전체 갱신이 있으면 그것만 실행하고 결과를 함께 전달)"""
+    waiting = _waiting.pop(message_key, {})
+    if _FULL in waiting:
+        run, done_message, _ = waiting[_FULL]
+        result = await _run_column(message_key, _FULL, run, done_message)
+        for column, (_, _, future) in waiting.items():
+            if column != _FULL:
+                _last_finished[f"{message_key}:{column}"] = time.monotonic()
+            if not future.done():
+                future.set_result(result)
+        return
+    for column, (run, done_message, future) in waiting.items():
+        result = await _run_column(message_key, column, run, done_message)
+        if not future.done():
+            future.set_result(result)
+
+
+async def request_refresh(interaction, column: str, run: Callable[[], Awaitable[Optional[str]]],
+                          done_message: str):
+    """
+    갱신 버튼 요청을 큐에 넣고 즉시 응답 (아직 응답하지 않은 상호작용에서 호출)
+
+    Args:
+        interaction: 버튼 상호작용
+        column: 갱신 대상 (예: "전체", "문제풀이", "문제집") - 같은 메시지의 같은 컬럼 요청은 하나로 합침
+        run: 실제 갱신 코루틴 함수, 사용자에게 보낼 안내 문구를 반환 (None이면 done_message)
+        done_message: 갱신 완료 안내 문구
+    """
+    channel_id, message_id = interaction.channel.id, interaction.message.id
+    message_key = f"{channel_id}:{message_id}"
+    kind = column.split(':')[0]
+    rendered = await _rendered_label(channel_id, message_id)
+
+    last = _last_finished.get(f"{message_key}:{column}")
+    if last is not None and time.monotonic() - last < REFRESH_BUTTON_COOLDOWN:
+        remaining = int(REFRESH_BUTTON_COOLDOWN - (time.monotonic() - last)) + 1
+        await interaction.response.send_message(
+            f"ℹ️ 방금 갱신되었습니다{rendered}. {remaining}초 후 다시 갱신할 수 있습니다.", ephemeral=True
+        )
+        return
+
+    waiting = _waiting.get(message_key)
+    joined = (waiting.get(column) or waiting.get(_FULL)) if waiting else None
+    if joined is not None:
+        future = joined[2]
+        notice = f"⏳ 같은 갱신이 이미 진행 중입니다{rendered}. 끝나면 함께 알려드립니다."
+    else:
+        ahead = backlog() + (len(waiting) if waiting else 0)
+        future = asyncio.get_running_loop().create_future()
+        if waiting:
+            # 아직 시작하지 않은 이 메시지의 갱신에 함께 실행
+            waiting[column] = (run, done_message, future)
+        else:
+            _waiting[message_key] = {column: (run, done_message, future)}
+            # 실행 중인 갱신이 있으면 스케줄러가 그 뒤에 실행
+            submit(_JOB_NAME, message_key, partial(_drain, message_key), replace=True)
+        notice = f"⏳ 갱신을 시작했습니다{rendered}. 예상 소요 시간: 약 {_estimate_seconds(kind, ahead)}초"
+    await interaction.response.send_message(notice, ephemeral=True)
+
+    result = await future
+    if result:
+        await interaction.followup.send(result, ephemeral=True)
@@ -0,0 +1,364 @@
+"""
+통합 작업 스케줄러
+모듈마다 따로 돌던 tasks.loop(매시 정각에 동시에 실행)를 하나로 합친다.
+
+- register_job으로 작업을 등록 (실행 시각은 KST 기준 시/분/요일)
+- 매 분 실행 시각이 된 작업을 모아, 작업마다 실행 단위(그룹/과제 하나 등)로 나눠 큐에 넣는다.
+- 실행 단위는 작업의 분산 시간(spread) 안에서 키별로 고정된 오프셋 + 약간의 무작위 지연 뒤 실행
+  (같은 그룹은 매시 비슷한 시각에 갱신되고, 크롤링이 정각에 몰리지 않음)
+- 실행 시각이 된 단위는 우선순위 순으로 SCHEDULER_WORKERS개까지 동시에 실행
+- 같은 시각에 실행되는 작업끼리는 선행 작업(after)이 모두 끝난 뒤 시작
+  (예: 월요일 01시 최종 갱신 -> 전체과제현황 갱신 -> 정리/새 주 생성)
+- 같은 (작업, 키) 단위가 아직 대기 중이면 새 실행 시각의 단위로 교체해 한 번만 실행
+  (실행 중이면 끝난 뒤 새 단위를 따로 실행 - 이전 시각의 조회 계획/시각으로 그리지 않도록)
+- submit으로 스케줄 밖 실행 단위(갱신 버튼 등)도 같은 큐/워커로 실행
+- 작업별 마지막 실행 시각을 DB(scheduler_job_runs)에 남겨, 재시작/지연으로 놓친 실행은
+  작업마다 가장 최근 것 한 번만 보충 (SCHEDULER_CATCHUP_MAX_AGE보다 오래된 실행은 버림)
+"""
+import asyncio
+import heapq
+import itertools
+import random
+import zlib
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from discord.ext import tasks
+
+from common import async_db
+from common.config import (
+    SCHEDULER_WORKERS, SCHEDULER_TICK_SECONDS, SCHEDULER_SPREAD, SCHEDULER_JITTER, SCHEDULER_CATCHUP_MAX_AGE,
+    SCHEDULER_MANUAL_PRIORITY,
+)
+from common.logger import get_logger
+from common.utils import get_kst_now, ensure_kst
+
+logger = get_logger()
+
+
+class WorkItem(NamedTuple):
+    """작업의 실행 단위"""
+    key: str
+    run: Callable[[], Awaitable]
+    spread: bool = True  # False면 분산하지 않고 바로 실행 (기간 종료 직후 마지막 크롤링 등)
+
+
+class Job:
+    """등록된 작업"""
+
+    def __init__(self, name: str, units: Callable[[datetime], Awaitable[List[WorkItem]]],
+                 hours: Iterable[int], minute: int, weekdays: Optional[Iterable[int]],
+                 priority: int, spread: int, after: Sequence[str]):
+        self.name = name
+        self.units = units
+        self.hours = frozenset(hours)
+        self.minute = minute
+        self.weekdays = frozenset(weekdays) if weekdays is not None else None
+        self.priority = priority
+        self.spread = spread
+        self.after = tuple(after)
+
+    def is_due(self, slot: datetime) -> bool:
+        """slot(KST, 분 단위)이 실행 시각인지"""
+        return (slot.minute == self.minute and slot.hour in self.hours
+                and (self.weekdays is None or slot.weekday() in self.weekdays))
+
+
+class _Entry:
+    """큐에 들어간 실행 단위 (대기 중에는 run이 새 실행 시각의 것으로 교체될 수 있음)"""
+
+    def __init__(self, job_name: str, key: str, run: Callable[[], Awaitable], priority: int,
+                 future: asyncio.Future):
+        self.job_name = job_name
+        self.key = key
+        self.run = run
+        self.priority = priority
+        self.future = future
+        self.started = False
+
+
+_jobs: Dict[str, Job] = {}
+
+# 대기 중: (실행 시각, 순번, 단위) / 실행 가능: (우선순위, 실행 시각, 순번, 단위)
+_pending: List[tuple] = []
+_ready: List[tuple] = []
+_active: Dict[tuple, _Entry] = {}  # (작업, 키) -> 대기/실행 중인 단위
+_running = 0  # 실행 중인 단위 수
+_sequence = itertools.count()
+_wakeup: Optional[asyncio.Event] = None
+_slots: Optional[asyncio.Semaphore] = None
+_dispatcher_task: Optional[asyncio.Task] = None
+# 실행 중인 태스크 (이벤트 루프는 약한 참조만 가지므로 끝날 때까지 여기서 붙잡아 둠)
+_tasks: Set[asyncio.Task] = set()
+# 작업별로 마지막으로 실행을 시작한 시각 (None이면 아직 DB에서 읽지 않음)
+_last_checked: Optional[Dict[str, datetime]] = None
+
+
+def register_job(name: str, units: Callable[[datetime], Awaitable[List[WorkItem]]] = None, *,
+                 run: Callable[[datetime], Awaitable] = None, hours: Iterable[int] = range(24),
+                 minute: int = 0, weekdays: Optional[Iterable[int]] = None, priority: int = 5,
+                 spread: int = SCHEDULER_SPREAD, after: Sequence[str] = ()):
+    """
+    작업 등록 (같은 이름이면 교체)
+
+    Args:
+        name: 작업 이름
+        units: async (실행 시각) -> [WorkItem, ...] 실행 단위 목록을 만드는 함수
+        run: 나눌 필요 없는 작업이면 units 대신 async (실행 시각) -> None
+        hours: 실행할 시 (KST)
+        minute: 실행할 분
+        weekdays: 실행할 요일 (0=월요일, None이면 매일)
+        priority: 낮을수록 먼저 실행
+        spread: 실행 단위를 나눠 실행할 시간 (초, 0이면 바로 실행)
+        after: 같은 시각에 실행될 때 먼저 끝나야 하는 작업 이름들
+    """
+    if (units is None) == (run is None):
+        raise ValueError("units와 run 중 하나만 지정해야 합니다.")
+    if run is not None:
+        async def units(slot, run=run):
+            # 실행 시각마다 별개의 실행 (보충 실행에서 시각이 다른 실행끼리 합쳐지지 않도록)
+            return [WorkItem(slot.strftime('%Y-%m-%d %H:%M'), lambda: run(slot), spread=False)]
+    _jobs[name] = Job(name, units, hours, minute, weekdays, priority, spread, after)
+
+
+def _offset(job: Job, item: WorkItem) -> float:
+    """실행 단위의 지연 시간 (초) - 키별 고정 오프셋 + 무작위 지연, 최대 job.spread"""
+    if not item.spread or job.spread <= 0:
+        return 0.0
+    base = zlib.crc32(f"{job.name}:{item.key}".encode('utf-8')) % job.spread
+    return min(job.spread, base + random.uniform(0, SCHEDULER_JITTER))
+
+
+def _enqueue(job_name: str, key: str, run: Callable[[], Awaitable], priority: int,
+             delay: float = 0.0, replace: bool = False) -> Tuple[asyncio.Future, bool]:
+    """
+    실행 단위를 큐에 넣고 (완료 future, 새로 넣었는지) 반환
+
+    같은 (작업, 키)가 이미 있을 때:
+    - replace=False (갱신 버튼): 대기/실행 중인 그 실행의 future를 돌려줌
+    - replace=True (스케줄 실행): 아직 대기 중이면 run을 새 것으로 교체하고 그 future를 돌려줌,
+      이미 실행 중이면 끝난 뒤 새 run을 실행하는 단위를 따로 넣음
+    """
+    active_key = (job_name, key)
+    existing = _active.get(active_key)
+    if existing is not None:
+        if not replace:
+            logger.debug(f"[스케줄러] {job_name}:{key} - 이전 실행이 끝나지 않아 합침")
+            return existing.future, False
+        if not existing.started:
+            logger.debug(f"[스케줄러] {job_name}:{key} - 대기 중인 이전 실행을 새 실행으로 교체")
+            existing.run = run
+            return existing.future, False
+        # 같은 메시지를 동시에 편집하지 않도록 실행 중인 이전 단위가 끝난 뒤 실행
+        previous, latest = existing.future, run
+
+        async def run():
+            await previous
+            return await latest()
+
+    _ensure_dispatcher()
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    entry = _Entry(job_name, key, run, priority, future)
+    _active[active_key] = entry
+    heapq.heappush(_pending, (loop.time() + delay, next(_sequence), entry))
+    _wakeup.set()
+    return future, True
+
+
+def submit(job_name: str, key: str, run: Callable[[], Awaitable],
+           priority: int = SCHEDULER_MANUAL_PRIORITY, replace: bool = False) -> Tuple[asyncio.Future, bool]:
+    """
+    스케줄 밖 실행 단위를 바로 큐에 추가 (갱신 버튼 등)
+
+    같은 (job_name, key)가 대기/실행 중이면 새로 넣지 않고 그 실행의 future를 돌려준다.
+    (replace=True면 대기 중인 실행의 run을 교체하고, 실행 중이면 끝난 뒤 run을 따로 실행)
+    future의 결과는 run의 반환값 (run에서 예외가 나면 로그만 남기고 None)
+
+    Returns:
+        (완료 future, 새로 추가했는지)
+    """
+    return _enqueue(job_name, key, run, priority, replace=replace)
+
+
+def backlog(priority: int = SCHEDULER_MANUAL_PRIORITY) -> int:
+    """지금 priority로 넣은 단위보다 먼저 실행될 단위 수 (실행 중 포함, 예상 대기 시간 계산용)"""
+    now = asyncio.get_running_loop().time()
+    waiting = sum(1 for _, _, _, entry in _ready if entry.priority <= priority)
+    waiting += sum(1 for run_at, _, entry in _pending if run_at <= now and entry.priority <= priority)
+    return _running + waiting
+
+
+def _spawn(coro: Awaitable) -> asyncio.Task:
+    """백그라운드 태스크 시작 (끝날 때까지 _tasks에 보관)"""
+    task = asyncio.create_task(coro)
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+    return task
+
+
+async def _execute(entry: _Entry):
+    global _running
+    _running += 1
+    result = None
+    try:
+        result = await entry.run()
+    except Exception as e:
+        logger.error(f"[스케줄러] {entry.job_name}:{entry.key} 실행 오류: {e}", exc_info=True)
+    finally:
+        _running -= 1
+        _slots.release()
+        if _active.get((entry.job_name, entry.key)) is entry:
+            del _active[(entry.job_name, entry.key)]
+        if not entry.future.done():
+            entry.future.set_result(result)
+
+
+def _promote_due(now: float):
+    """실행 시각이 된 단위를 실행 가능 큐로 옮김"""
+    while _pending and _pending[0][0] <= now:
+        run_at, seq, entry = heapq.heappop(_pending)
+        heapq.heappush(_ready, (entry.priority, run_at, seq, entry))
+
+
+async def _dispatch():
+    """실행 가능한 단위를 우선순위 순으로 워커 수만큼 실행"""
+    loop = asyncio.get_running_loop()
+    while True:
+        _promote_due(loop.time())
+        if _ready:
+            await _slots.acquire()
+            # 빈 자리를 기다리는 동안 실행 시각이 된 단위도 우선순위 비교에 포함
+            _promote_due(loop.time())
+            _, _, _, entry = heapq.heappop(_ready)
+            entry.started = True
+            _spawn(_execute(entry))
+            continue
+
+        timeout = _pending[0][0] - loop.time() if _pending else None
+        _wakeup.clear()
+        try:
+            await asyncio.wait_for(_wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def _run_job(job: Job, slot: datetime, finished: Dict[str, asyncio.Event]):
+    try:
+        for dependency in job.after:
+            if dependency in finished:
+                await finished[dependency].wait()
+        items = await job.units(slot)
+        futures = [
+            _enqueue(job.name, item.key, item.run, job.priority, _offset(job, item), replace=True)[0]
+            for item in items
+        ]
+        if futures:
+            await asyncio.gather(*futures)
+        await async_db.save_scheduler_job_run(job.name, slot.isoformat())
+        logger.info(f"[스케줄러] {job.name} ({slot.strftime('%m-%d %H:%M')}) 완료: {len(futures)}개")
+    except Exception as e:
+        logger.error(f"[스케줄러] {job.name} ({slot.strftime('%m-%d %H:%M')}) 오류: {e}", exc_info=True)
+    finally:
+        finished[job.name].set()
+
+
+async def run_slot(slot: datetime, jobs: Sequence[Job]):
+    """한 실행 시각의 작업들을 선행 관계에 맞춰 실행"""
+    finished = {job.name: asyncio.Event() for job in jobs}
+    await asyncio.gather(*(_run_job(job, slot, finished) for job in jobs))
+
+
+async def _run_slots(slots: List[tuple]):
+    """여러 실행 시각을 시간순으로 하나씩 실행 (보충한 월요일 01시 최종 갱신이 이후 시각의 정리보다 먼저 끝나도록)"""
+    for slot, jobs in slots:
+        await run_slot(slot, jobs)
+
+
+def _latest_due(job: Job, after: datetime, until: datetime) -> Optional[datetime]:
+    """(after, until] 중 작업의 가장 최근 실행 시각"""
+    slot = until
+    while slot > after:
+        if job.is_due(slot):
+            return slot
+        slot -= timedelta(minutes=1)
+    return None
+
+
+def _with_dependencies(slot: datetime, names: Iterable[str]) -> List[Job]:
+    """
+    slot에 실행할 작업 + 같은 시각에 실행 시각인 선행 작업들
+    (보충 실행에서 선행 작업의 마지막 실행이 더 나중이어도 같은 시각 기준으로 다시 실행)
+    """
+    selected = {}
+    stack = list(names)
+    while stack:
+        name = stack.pop()
+        job = _jobs.get(name)
+        if job is None or name in selected:
+            continue
+        selected[name] = job
+        stack.extend(dep for dep in job.after if dep in _jobs and _jobs[dep].is_due(slot))
+    return list(selected.values())
+
+
+async def _load_last_runs(current: datetime) -> Dict[str, datetime]:
+    """DB에 남은 작업별 마지막 실행 시각 (기록이 없는 새 작업은 지금부터 시작)"""
+    try:
+        stored = await async_db.get_scheduler_job_runs()
+    except Exception as e:
+        logger.error(f"[스케줄러] 실행 기록 로드 실패, 놓친 실행은 보충하지 않음: {e}")
+        stored = {}
+    last_runs = {}
+    for name in _jobs:
+        last_runs[name] = ensure_kst(datetime.fromisoformat(stored[name])) if name in stored else current
+    return last_runs
+
+
+@tasks.loop(seconds=SCHEDULER_TICK_SECONDS)
+async def scheduler_tick():
+    """작업별로 지난 확인 이후 실행 시각이 있으면 실행 (놓친 실행은 가장 최근 것 한 번만)"""
+    global _last_checked
+    current = get_kst_now().replace(second=0, microsecond=0)
+    if _last_checked is None:
+        _last_checked = await _load_last_runs(current)
+
+    # 보충 한도: 너무 오래된 실행까지 한꺼번에 돌리지 않음
+    floor = current - timedelta(seconds=SCHEDULER_CATCHUP_MAX_AGE)
+    by_slot: Dict[datetime, List[str]] = {}
+    for job in _jobs.values():
+        last = _last_checked.setdefault(job.name, current)
+        if last >= current:
+            continue
+        if last < floor and _latest_due(job, last, floor) is not None:
+            logger.warning(f"[스케줄러] {job.name} - {last.strftime('%m-%d %H:%M')} 이후 "
+                           f"{SCHEDULER_CATCHUP_MAX_AGE // 3600}시간보다 오래된 실행은 보충하지 않음")
+        slot = _latest_due(job, max(last, floor), current)
+        _last_checked[job.name] = current
+        if slot is None:
+            continue
+        if slot < current - timedelta(minutes=1):
+            logger.info(f"[스케줄러] {job.name} - 놓친 실행 보충 ({slot.strftime('%m-%d %H:%M')})")
+        by_slot.setdefault(slot, []).append(job.name)
+
+    if by_slot:
+        _spawn(_run_slots([
+            (slot, _with_dependencies(slot, names)) for slot, names in sorted(by_slot.items())
+        ]))
+
+
+def _ensure_dispatcher():
+    """큐를 실행하는 디스패처 시작 (이미 실행 중이면 그대로)"""
+    global _wakeup, _slots, _dispatcher_task
+    if _dispatcher_task is None or _dispatcher_task.done():
+        _wakeup = asyncio.Event()
+        _slots = asyncio.Semaphore(SCHEDULER_WORKERS)
+        _dispatcher_task = asyncio.create_task(_dispatch())
+
+
+def start_scheduler():
+    """스케줄러 시작 (이벤트 루프가 준비된 뒤 호출, 여러 번 호출해도 한 번만 시작)"""
+    _ensure_dispatcher()
+    if not scheduler_tick.is_running():
+        scheduler_tick.start()
+        logger.info(f"[스케줄러] 시작: 작업 {len(_jobs)}개 ({', '.join(_jobs)})")
@@ -0,0 +1,56 @@
+"""
+핸들별 해결한 문제 인덱스
+해결한 문제 번호를 정렬된 int 배열로 SQLite에 저장해두고, "이 문제들 중 무엇을 풀었나"를 로컬 집합 연산으로 답한다.
+"""
+import time
+from array import array
+from typing import Iterable, List, Optional, Set
+
+from common.config import SOLVED_INDEX_FULL_SYNC_INTERVAL
+
+
+class SolvedIndex:
+    """
+    한 핸들의 해결한 문제 집합
+
+    synced_count: problems가 빠짐없이 담고 있는 시점의 solvedCount (None이면 일부만 알고 있음)
+    full_synced_at: 마지막 전체 수집 시각 (epoch 초)
+    """
+    __slots__ = ('problems', 'synced_count', 'full_synced_at')
+
+    def __init__(self, problems: Set[int], synced_count: Optional[int], full_synced_at: float):
+        self.problems = problems
+        self.synced_count = synced_count
+        self.full_synced_at = full_synced_at
+
+    def is_up_to_date(self, solved_count: int) -> bool:
+        """현재 solvedCount 기준으로 빠짐없는 인덱스인지"""
+        return self.synced_count is not None and self.synced_count == solved_count
+
+    def full_sync_due(self, now: Optional[float] = None) -> bool:
+        """전체 재수집 간격이 지났는지"""
+        return ((now or time.time()) - self.full_synced_at) >= SOLVED_INDEX_FULL_SYNC_INTERVAL
+
+    def filter(self, target_problems: Optional[Iterable[int]] = None) -> List[int]:
+        """target_problems 중 해결한 문제 (None이면 전체) - 정렬된 리스트"""
+        if target_problems is None:
+            return sorted(self.problems)
+        return sorted(set(target_problems) & self.problems)
+
+
+def load_solved_index(boj_handle: str) -> Optional[SolvedIndex]:
+    """저장된 인덱스 불러오기 (없으면 None)"""
+    from common.database import get_solved_problem_index
+    row = get_solved_problem_index(boj_handle)
+    if not row:
+        return None
+    ids = array('i')
+    ids.frombytes(row['problem_ids'] or b'')
+    return SolvedIndex(set(ids), row['synced_count'], row['full_synced_at'] or 0.0)
+
+
+def save_solved_index(boj_handle: str, index: SolvedIndex):
+    """인덱스 저장"""
+    from common.database import save_solved_problem_index
+    ids = array('i', sorted(index.problems))
+    save_solved_problem_index(boj_handle, ids.tobytes(), index.synced_count, index.full_synced_at)
@@ -0,0 +1,143 @@
+"""
+자주 읽고 가끔 쓰는 테이블의 메모리 캐시 (write-through)
+처음 조회할 때 테이블 전체를 한 번 읽어 두고, 이후에는 database의 save_/delete_ 함수가
+커밋 직후 캐시도 함께 고친다. 읽기는 SQLite 대신 딕셔너리 조회로 끝난다.
+
+- 키/그룹(group_name)/메시지(channel_id, message_id) 기준 인덱스 제공
+- version: 쓰기마다 증가 (로딩 중 쓰기가 끼어들면 다시 로딩해 오래된 스냅샷을 막음)
+- 반환값은 복사본이라 호출한 쪽에서 수정해도 캐시에 영향 없음
+"""
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def _copy_row(row: Dict) -> Dict:
+    return {k: (list(v) if isinstance(v, list) else v) for k, v in row.items()}
+
+
+class TableCache:
+    """테이블 한 개의 메모리 캐시"""
+
+    def __init__(self, name: str, loader: Callable[[], Iterable[Dict]], key: Tuple[str, ...],
+                 group_field: Optional[str] = None, message_index: bool = False):
+        """
+        Args:
+            name: 캐시 이름 (로그/디버깅용)
+            loader: 테이블 전체 행을 dict로 돌려주는 함수
+            key: 기본 키 컬럼들
+            group_field: 그룹 조회용 컬럼 (예: 'group_name')
+            message_index: (channel_id, message_id) 조회 인덱스를 만들지 여부
+        """
+        self.name = name
+        self._loader = loader
+        self._key = key
+        self._group_field = group_field
+        self._message_index = message_index
+        self._lock = threading.RLock()
+        self._loaded = False
+        self.version = 0
+        self._rows: Dict[tuple, Dict] = {}
+        self._groups: Dict[str, Dict[tuple, Dict]] = {}
+        self._messages: Dict[tuple, tuple] = {}
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+    def key_of(self, row: Dict) -> tuple:
+        return tuple(row[field] for field in self._key)
+
+    def _message_key(self, row: Dict) -> tuple:
+        return str(row.get('channel_id')), str(row.get('message_id'))
+
+    def _index(self, key: tuple, row: Dict):
+        self._rows[key] = row
+        if self._group_field:
+            self._groups.setdefault(row.get(self._group_field), {})[key] = row
+        if self._message_index:
+            self._messages[self._message_key(row)] = key
+
+    def _unindex(self, key: tuple):
+        row = self._rows.pop(key, None)
+        if row is None:
+            return
+        if self._group_field:
+            group = self._groups.get(row.get(self._group_field))
+            if group is not None:
+                group.pop(key, None)
+                if not group:
+                    del self._groups[row.get(self._group_field)]
+        if self._message_index and self._messages.get(self._message_key(row)) == key:
+            del self._messages[self._message_key(row)]
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        while True:
+            with self._lock:
+                if self._loaded:
+                    return
+                start_version = self.version
+            rows = list(self._loader())
+            with self._lock:
+                # 읽는 동안 쓰기가 있었으면 스냅샷이 오래됐을 수 있으므로 다시 읽음
+                if self.version != start_version:
+                    continue
+                self._rows, self._groups, self._messages = {}, {}, {}
+                for row in rows:
+                    self._index(self.key_of(row), row)
+                self._loaded = True
+                return
+
+    # -------------------- 읽기 --------------------
+
+    def all(self) -> List[Dict]:
+        """전체 행"""
+        self._ensure_loaded()
+        with self._lock:
+            return [_copy_row(row) for row in self._rows.values()]
+
+    def get(self, *key) -> Optional[Dict]:
+        """기본 키로 한 행"""
+        self._ensure_loaded()
+        with self._lock:
+            row = self._rows.get(tuple(key))
+            return _copy_row(row) if row is not None else None
+
+    def by_group(self, group) -> List[Dict]:
+        """group_field 값이 같은 행들"""
+        self._ensure_loaded()
+        with self._lock:
+            return [_copy_row(row) for row in self._groups.get(group, {}).values()]
+
+    def by_message(self, channel_id, message_id) -> Optional[Dict]:
+        """(channel_id, message_id)로 한 행"""
+        self._ensure_loaded()
+        with self._lock:
+            key = self._messages.get((str(channel_id), str(message_id)))
+            return _copy_row(self._rows[key]) if key is not None else None
+
+    # -------------------- 쓰기 (DB 커밋 후 호출) --------------------
+
+    def put(self, row: Dict):
+        """행 추가/교체"""
+        with self._lock:
+            self.version += 1
+            if self._loaded:
+                key = self.key_of(row)
+                self._unindex(key)
+                self._index(key, _copy_row(row))
+
+    def remove(self, *key):
+        """기본 키로 행 삭제"""
+        with self._lock:
+            self.version += 1
+            if self._loaded:
+                self._unindex(tuple(key))
+
+    def invalidate(self):
+        """캐시 비우기 (다음 조회 때 다시 읽음)"""
+        with self._lock:
+            self.version += 1
+            self._loaded = False
+            self._rows, self._groups, self._messages = {}, {}, {}
@@ -49,6 +49,30 @@ def load_data():
         'studies': {}  # {study_name: {assignments: {assignment_id: {...}}}}
     }
 
+def _load_section(section):
+    """데이터 일부만 로드 (SQLite면 해당 테이블만 조회, 아니면 JSON 전체에서 꺼냄)"""
+    if USE_SQLITE:
+        try:
+            from common import database
+            return getattr(database, f'load_{section}')()
+        except ImportError:
+            print("⚠️ database.py를 찾을 수 없습니다. JSON 방식으로 전환합니다.")
+        except Exception as e:
+            print(f"⚠️ SQLite 로드 오류: {e}. JSON 방식으로 전환합니다.")
+    return load_data().get(section, {})
+
+def load_users():
+    """사용자 정보만 로드 ({user_id: {...}})"""
+    return _load_section('users')
+
+def load_role_tokens():
+    """역할 토큰만 로드 ({role_name: {'token_hash', 'original_token'}})"""
+    return _load_section('role_tokens')
+
+def load_studies():
+    """스터디/과제만 로드 ({study_name: {'assignments': {...}}})"""
+    return _load_section('studies')
+
 def save_data(data):
     """데이터 파일 저장 (SQLite 우선, 없으면 JSON)"""
     if USE_SQLITE:
@@ -3,41 +3,25 @@
 """
 import discord
 from discord.ext import commands
-from datetime import datetime, timedelta, time
-from common.utils import load_data, save_data, get_kst_now, ensure_kst
-from common.database import (
-    get_role_users,
-    save_group_weekly_status,
-    get_group_weekly_status,
-    get_group_weekly_status_by_message,
-    get_all_group_weekly_status,
-    delete_group_weekly_status,
-    save_group_problem_set_status,
-    get_group_problem_set_status,
-    get_all_group_problem_set_status,
-    delete_group_problem_set_status,
-    save_group_mock_test_status,
-    get_group_mock_test_status,
-    get_all_group_mock_test_status,
-    delete_group_mock_test_status,
-    save_group_all_assignment_status,
-    get_group_all_assignment_status,
-    get_group_all_assignment_status_by_message,
-    get_all_group_all_assignment_status,
-    delete_group_all_assignment_status,
-    get_group_link_submission_status,
-    get_all_group_link_submission_status,
+from datetime import datetime, timedelta
+from functools import partial
+from common.utils import get_kst_now, ensure_kst
+from common.boj_utils import get_weekly_solved_from_boj_status
+from common.fanout import fetch_weekly_counts
+from common.scheduler import WorkItem, register_job
+from common.refresh_plan import (
+    build_refresh_plan, get_refresh_plan, planned_fetch_time, planned_weekly_solved_count, planned_solved_problems,
 )
-from common.boj_utils import get_weekly_solved_count, get_weekly_solved_from_boj_status
-from discord.ext import tasks
 from common.logger import get_logger
+from common import async_db
+from common.message_render import edit_if_changed
+from common.refresh_queue import request_refresh
 
 logger = get_logger()
 
-def find_role_by_group_name(group_name: str, data: dict) -> str:
-    """그룹 이름으로 역할 이름 찾기 (대소문자/공백 무시)"""
+def find_role_by_group_name(group_name: str, studies: dict) -> str:
+    """그룹 이름으로 역할 이름 찾기 (대소문자/공백 무시, studies는 load_studies() 결과)"""
     target = (group_name or "").strip().lower()
-    studies = data.get('studies', {})
     for role_name, study_data in studies.items():
         stored_group = (study_data.get('group_name') or role_name or "").strip().lower()
         stored_role = (role_name or "").strip().lower()
@@ -51,9 +35,9 @@ def find_role_by_group_name(group_name: str, data: dict) -> str:
 _bot_for_group_weekly = None
 
 
-async def update_group_weekly_status(group_name: str, bot_instance):
-    """특정 그룹의 주간 문제풀이 현황 메시지 갱신 (기존 메시지 편집)"""
-    status_info = get_group_weekly_status(group_name)
+async def update_group_weekly_status(group_name: str, bot_instance, plan=None, force: bool = False):
+    """특정 그룹의 주간 문제풀이 현황 메시지 갱신 (기존 메시지 편집, plan: 자동 갱신의 조회 계획, force: 갱신 버튼처럼 내용이 같아도 편집)"""
+    status_info = await async_db.get_group_weekly_status(group_name)
     if not status_info:
         return
 
@@ -68,8 +52,10 @@ async def update_group_weekly_status(group_name: str, bot_instance):
     week_end = ensure_kst(week_end)
 
     now = get_kst_now()  # 한국 시간 사용
+    # 자동 갱신은 예정된 실행 시각 기준으로 기간 확인 (재시작 후 늦게 보충된 마지막 크롤링도 처리)
+    as_of = plan.slot if plan else now
     # 기간 밖이면 갱신하지 않음 (단, 월요일 01시 정각은 마지막 크롤링 허용)
-    if not (week_start <= now <= week_end + timedelta(minutes=5)):
+    if not (week_start <= as_of <= week_end + timedelta(minutes=5)):
         return
 
     channel = bot_instance.get_channel(channel_id)
@@ -79,14 +65,11 @@ async def update_group_weekly_status(group_name: str, bot_instance):
     try:
         message = await channel.fetch_message(message_id)
     except discord.NotFound:
-        delete_group_weekly_status(group_name)
+        await async_db.delete_group_weekly_status(group_name)
         return
 
-    # 최신 데이터 로드
-    data = load_data()
-
     # 역할을 가진 유저 목록 가져오기
-    users = get_role_users(role_name)
+    users = await async_db.get_role_users(role_name)
     if not users:
         embed = discord.Embed(
             title=f"📊 '{group_name}' 그룹 백준 문제풀이 현황",
@@ -97,7 +80,7 @@ async def update_group_weekly_status(group_name: str, bot_instance):
             ),
             color=discord.Color.blue(),
         )
-        await message.edit(embed=embed, view=GroupWeeklyStatusView())
+        await edit_if_changed(message, embed, view=GroupWeeklyStatusView(), force=force)
         return
 
     # 각 유저의 백준 문제풀이 현황 조회
@@ -126,6 +109,7 @@ async def update_group_weekly_status(group_name: str, bot_instance):
         if not boj_handle or boj_handle == '미등록':
             results.append(
                 {
+                    'user_id': user_id,
                     'username': display_name,  # display_name 사용
                     'boj_handle': boj_handle or '미등록',
                     'solved_count': 0,
@@ -134,35 +118,28 @@ async def update_group_weekly_status(group_name: str, bot_instance):
             )
             continue
 
-        try:
-            solved_data = await get_weekly_solved_count(boj_handle, week_start, week_end)
-            results.append(
-                {
-                    'username': display_name,  # display_name 사용
-                    'boj_handle': boj_handle,
-                    'solved_count': solved_data['count'],
-                    'problems': solved_data.get('problems', []),
-                    'status': '✅' if solved_data['count'] > 0 else '⚠️',
-                }
-            )
-        except Exception as e:
-            results.append(
-                {
-                    'username': display_name,  # display_name 사용
-                    'boj_handle': boj_handle,
-                    'solved_count': 0,
-                    'status': f'❌ 오류: {str(e)[:30]}',
-                }
-            )
+        results.append(
+            {
+                'user_id': user_id,
+                'username': display_name,  # display_name 사용
+                'boj_handle': boj_handle,
+                'solved_count': 0,
+            }
+        )
+
+    # solved.ac 조회는 멤버별로 병렬 실행 (동시 요청 수/멤버별 제한 시간은 config 참고)
+    await fetch_weekly_counts(results, week_start, week_end, plan)
 
     # 결과 정렬 (해결한 문제 수 많은 순)
     results.sort(key=lambda x: x['solved_count'], reverse=True)
 
+    # 자동 갱신은 계획 결과를 실제로 조회한 시각을 표시
+    refreshed_at = planned_fetch_time(plan, [row['boj_handle'] for row in results], now)
     embed = discord.Embed(
         title=f"📊 '{group_name}' 그룹 백준 문제풀이 현황",
         description=(
             f"기간: {week_start.strftime('%Y-%m-%d %H:%M')} ~ {week_end.strftime('%Y-%m-%d %H:%M')}\n"
-            f"마지막 갱신: {now.strftime('%Y-%m-%d %H:%M')}"
+            f"마지막 갱신: {refreshed_at.strftime('%Y-%m-%d %H:%M')}"
         ),
         color=discord.Color.blue(),
     )
@@ -229,7 +206,7 @@ async def update_group_weekly_status(group_name: str, bot_instance):
     )
 
     # DB에 마지막 갱신 시간 저장
-    save_group_weekly_status(
+    await async_db.save_group_weekly_status(
         group_name,
         role_name,
         str(channel_id),
@@ -239,13 +216,29 @@ async def update_group_weekly_status(group_name: str, bot_instance):
         now.isoformat(),
     )
 
-    await message.edit(embed=embed, view=GroupWeeklyStatusView())
+    await edit_if_changed(message, embed, view=GroupWeeklyStatusView(), force=force)
+
+    # 기간 종료 후 마지막 크롤링이면 결과를 주간 기록으로 남김 (현황은 곧 DB에서 삭제됨)
+    if as_of >= week_end:
+        recorded = await async_db.record_weekly_snapshot(
+            group_name,
+            week_start.isoformat(),
+            [
+                {
+                    'user_id': r['user_id'],
+                    'boj_handle': None if r['boj_handle'] == '미등록' else r['boj_handle'],
+                    'solved_count': r['solved_count'],
+                }
+                for r in results if not r.get('failed')
+            ],
+        )
+        logger.info(f"[그룹 주간 현황] {group_name} - 주간 기록 {recorded}명 저장")
     
     # 전체과제현황도 갱신 (문제풀이 부분만)
-    await update_all_assignment_status(group_name, bot_instance, assignment_type="문제풀이")
+    await update_all_assignment_status(group_name, bot_instance, assignment_type="문제풀이", plan=plan, force=force)
 
 
-async def update_all_assignment_status(group_name: str, bot_instance, assignment_type: str = None):
+async def update_all_assignment_status(group_name: str, bot_instance, assignment_type: str = None, plan=None, force: bool = False):
     """
     전체과제현황 메시지 갱신 - 모든 과제의 상세 정보를 합쳐서 표시
     
@@ -253,8 +246,10 @@ async def update_all_assignment_status(group_name: str, bot_instance, assignment
         group_name: 그룹명
         bot_instance: 봇 인스턴스
         assignment_type: 갱신할 과제 타입 (None이면 전체 갱신, "문제풀이", "링크제출", "문제집:{name}", "모의테스트:{name}" 등)
+        plan: 자동 갱신의 조회 계획 (common/refresh_plan.py, None이면 직접 조회)
+        force: 내용이 같아도 편집 (갱신 버튼 - '마지막 갱신' 시각이 바뀌도록)
     """
-    status_info = get_group_all_assignment_status(group_name)
+    status_info = await async_db.get_group_all_assignment_status(group_name)
     if not status_info:
         return
     
@@ -268,19 +263,18 @@ async def update_all_assignment_status(group_name: str, bot_instance, assignment
     week_end = ensure_kst(week_end)
     
     now = get_kst_now()
+    # 자동 갱신은 예정된 실행 시각 기준으로 기간 확인 (재시작 후 늦게 보충된 마지막 크롤링도 처리)
+    as_of = plan.slot if plan else now
     # 기간 밖이면 갱신하지 않음
-    if not (week_start <= now <= week_end + timedelta(minutes=5)):
+    if not (week_start <= as_of <= week_end + timedelta(minutes=5)):
         return
     
     channel = bot_instance.get_channel(channel_id)
     if not channel:
         return
     
-    try:
-        message = await channel.fetch_message(message_id)
-    except discord.NotFound:
-        delete_group_all_assignment_status(group_name)
-        return
+    # 이전 표는 DB에서 읽으므로 메시지를 가져오지 않고 바로 편집
+    message = channel.get_partial_message(message_id)
     
     # solved.ac 서버 응답 확인
     from common.boj_utils import check_solved_ac_server_available
@@ -292,33 +286,29 @@ async def update_all_assignment_status(group_name: str, bot_instance, assignment
         logger.warning(f"[전체과제현황 갱신] solved.ac 서버 응답 없음: {group_name}")
     
     # 모든 과제 정보 수집
-    link_status = get_group_link_submission_status(group_name)
-    problem_status = get_group_weekly_status(group_name)
-    all_problem_sets = get_all_group_problem_set_status()
-    problem_set_statuses = [ps for ps in all_problem_sets if ps['group_name'] == group_name]
-    all_mock_tests = get_all_group_mock_test_status()
-    mock_test_statuses = [mt for mt in all_mock_tests if mt['group_name'] == group_name]
+    link_status = await async_db.get_group_link_submission_status(group_name)
+    problem_status = await async_db.get_group_weekly_status(group_name)
+    problem_set_statuses = await async_db.get_group_problem_set_statuses(group_name)
+    mock_test_statuses = await async_db.get_group_mock_test_statuses(group_name)
     
-    # 임베드 생성
-    description_text = (
-        f"**기간:** {week_start.strftime('%Y-%m-%d')} ~ {week_end.strftime('%Y-%m-%d %H:%M')}\n"
-        f"**마지막 갱신:** {now.strftime('%Y-%m-%d %H:%M')}"
-    )
-    if server_error_message:
-        description_text += f"\n\n{server_error_message}"
+    # 임베드 생성 ('마지막 갱신'은 조회를 마친 뒤 실제 조회 시각으로 다시 채움)
+    def describe(refreshed_at: datetime) -> str:
+        description_text = (
+            f"**기간:** {week_start.strftime('%Y-%m-%d')} ~ {week_end.strftime('%Y-%m-%d %H:%M')}\n"
+            f"**마지막 갱신:** {refreshed_at.strftime('%Y-%m-%d %H:%M')}"
+        )
+        if server_error_message:
+            description_text += f"\n\n{server_error_message}"
+        return description_text
     
     embed = discord.Embed(
         title=f"📋 '{group_name}' 전체 과제 현황",
-        description=description_text,
+        description=describe(now),
         color=discord.Color.gold() if server_available else discord.Color.orange()
     )
     
     # 필요한 import
-    from common.database import get_link_submissions
-    from common.boj_utils import get_weekly_solved_count, get_user_solved_problems_from_solved_ac, check_problems_individual_queries
-    from domain.problem_set import get_problem_set, get_mock_test
-    from common.logger import get_logger
-    logger = get_logger()
+    from common.boj_utils import check_problems_individual_queries
     
     guild = channel.guild if channel else None
     
@@ -339,15 +329,19 @@ async def update_all_assignment_status(group_name: str, bot_instance, assignment
     
     # 모든 멤버 수집 (역할 기준)
     role_name = status_info['role_name']
-    all_users = get_role_users(role_name)
+    all_users = await async_db.get_role_users(role_name)
     if not all_users:
         embed.add_field(
             name="과제 현황",
             value="멤버가 없습니다.",
             inline=False
         )
-        await message.edit(embed=embed, view=view)
-        save_group_all_assignment_status(
+        try:
+            await edit_if_changed(message, embed, view=view, force=force)
+        except discord.NotFound:
+            await async_db.delete_group_all_assignment_status(group_name)
+            return
+        await async_db.save_group_all_assignment_status(
             group_name,
             status_info['role_name'],
             str(channel_id),
@@ -376,84 +370,35 @@ async def update_all_assignment_status(group_name: str, bot_instance, assignment
             'boj_handle': boj_handle,
         }
     
-    # 기존 메시지의 embed를 읽어서 현재 상태 복원 (부분 갱신을 위해)
-    existing_user_status_map = {user_id: {} for user_id in user_map.keys()}
-    existing_assignment_columns = []
-    
+    # 부분 갱신이면 저장된 표에서 시작해 해당 컬럼만 다시 계산
+    assignment_columns, stored_cells = [], {}
     if assignment_type:
-        # 부분 갱신: 기존 메시지의 embed를 읽어서 현재 상태 복원
-        try:
-            existing_embed = message.embeds[0] if message.embeds else None
-            if existing_embed:
-                # 기존 embed의 필드에서 표 정보 추출
-                for field in existing_embed.fields:
-                    if field.name.startswith("과제 현황"):
-                        # 표 파싱 (코드 블록 형식)
-                        value = field.value
-                        if value:
-                            # 코드 블록 제거 (```로 감싸져 있음)
-                            if value.startswith("```"):
-                                # 첫 번째 줄과 마지막 줄의 ``` 제거
-                                lines = value.split("\n")
-                                if len(lines) > 2:
-                                    lines = lines[1:-1]  # 첫 줄(```)과 마지막 줄(```) 제거
-                                else:
-                                    lines = []
-                            else:
-                                lines = value.split("\n")
-                            
-                            if len(lines) >= 2:
-                                header_line = lines[0]
-                                # 공백으로 구분된 헤더 파싱 (코드 블록 형식: "ID  링크제출  문제풀이")
-                                header_parts = [p.strip() for p in header_line.split("  ") if p.strip()]
-                                if len(header_parts) > 1 and header_parts[0].upper() == "ID":
-                                    existing_assignment_columns = header_parts[1:]  # ID 제외
-                                    
-                                    # 각 행 파싱
-                                    for line in lines[2:]:  # 헤더와 구분선 제외
-                                        if line.strip():
-                                            row_parts = [p.strip() for p in line.split("  ") if p.strip()]
-                                            if len(row_parts) > 0:
-                                                user_id_display = row_parts[0]
-                                                # user_id_display로 user_id 찾기
-                                                found_user_id = None
-                                                for uid, uinfo in user_map.items():
-                                                    if uinfo.get('boj_handle') == user_id_display or uinfo['username'][:15] == user_id_display:
-                                                        found_user_id = uid
-                                                        break
-                                                
-                                                if found_user_id:
-                                                    for i, col in enumerate(existing_assignment_columns):
-                                                        if i + 1 < len(row_parts):
-                                                            existing_user_status_map[found_user_id][col] = row_parts[i + 1]
-        except Exception as e:
-            logger.error(f"기존 embed 파싱 오류: {e}", exc_info=True)
-            # 파싱 실패 시 전체 갱신으로 폴백
+        assignment_columns, stored_cells = await async_db.get_assignment_status_matrix(group_name)
+        if not assignment_columns:
+            # 저장된 표가 없으면 (처음 만든 메시지 등) 전체 갱신
             assignment_type = None
+    user_status_map = {user_id: dict(stored_cells.get(user_id, {})) for user_id in user_map.keys()}
+    refreshed_columns = []  # 이번에 다시 계산한 컬럼
     
-    # 각 과제별 정보 수집 (표 형식)
-    # 부분 갱신 시에도 모든 컬럼을 포함해야 함 (해당 타입만 갱신, 나머지는 기존 값 유지)
-    if assignment_type and existing_assignment_columns:
-        assignment_columns = existing_assignment_columns.copy()
-        user_status_map = existing_user_status_map.copy()
-    else:
-        assignment_columns = []
-        user_status_map = {user_id: {} for user_id in user_map.keys()}
+    def should_refresh(column: str) -> bool:
+        """전체 갱신이거나 해당 컬럼의 부분 갱신인지"""
+        return not assignment_type or assignment_type == column
     
     # 링크제출 현황 (진행 중인 것만)
     # 부분 갱신이 아니거나 링크제출 갱신인 경우에만 처리
     if link_status:
-        if not assignment_type or assignment_type == "링크제출":
+        if should_refresh("링크제출"):
             link_week_start = datetime.fromisoformat(link_status['week_start'])
             link_week_end = datetime.fromisoformat(link_status['week_end'])
             link_week_start = ensure_kst(link_week_start)
             link_week_end = ensure_kst(link_week_end)
             
-            if link_week_start <= now <= link_week_end:
+            if link_week_start <= as_of <= link_week_end:
                 if "링크제출" not in assignment_columns:
                     assignment_columns.append("링크제출")
+                refreshed_columns.append("링크제출")
                 week_start_str = link_week_start.isoformat()
-                submissions = get_link_submissions(group_name, week_start_str)
+                submissions = await async_db.get_link_submissions(group_name, week_start_str)
                 
                 submission_map = {}
                 for sub in submissions:
@@ -466,15 +411,16 @@ async def update_all_assignment_status(group_name: str, bot_instance, assignment
     # 문제풀이 현황 (진행 중인 것만)
     # 부분 갱신이 아니거나 문제풀이 갱신인 경우에만 처리
     if problem_status:
-        if not assignment_type or assignment_type == "문제풀이":
+        if should_refresh("문제풀이"):
             problem_week_start = datetime.fromisoformat(problem_status['week_start'])
             problem_week_end = datetime.fromisoformat(problem_status['week_end'])
             problem_week_start = ensure_kst(problem_week_start)
             problem_week_end = ensure_kst(problem_week_end)
             
-            if problem_week_start <= now <= problem_week_end:
+            if problem_week_start <= as_of <= problem_week_end:
                 if "문제풀이" not in assignment_columns:
                     assignment_columns.append("문제풀이")
+                refreshed_columns.append("문제풀이")
                 
                 for user_id, user_info in user_map.items():
                     boj_handle = user_info['boj_handle']
@@ -488,7 +434,7 @@ async def update_all_assignment_status(group_name: str, bot_instance, assignment
                         continue
                     
                     try:
-                        solved_data = await get_weekly_solved_count(boj_handle, problem_week_start, problem_week_end)
+                        solved_data = await planned_weekly_solved_count(plan, boj_handle, problem_week_start, problem_week_end)
                         user_status_map[user_id]["문제풀이"] = f"{solved_data['count']}개"
                     except Exception as e:
                         logger.error(f"문제풀이 현황 조회 오류 ({boj_handle}): {e}", exc_info=True)
@@ -501,30 +447,21 @@ async def update_all_assignment_status(group_name: str, bot_instance, assignment
         ps_week_start = ensure_kst(ps_week_start)
         ps_week_end = ensure_kst(ps_week_end)
         
-        if ps_week_start <= now <= ps_week_end:
+        if ps_week_start <= as_of <= ps_week_end:
             problem_set_name = ps_status['problem_set_name']
             
-            # 부분 갱신: 해당 문제집만 갱신, 나머지는 기존 값 유지
-            if assignment_type:
-                if assignment_type == f"문제집:{problem_set_name}":
-                    # 해당 문제집 갱신
-                    pass
-                elif f"문제집:{problem_set_name}" in assignment_columns:
-                    # 기존 컬럼에 있으면 유지 (갱신하지 않음)
-                    continue
-                else:
-                    # 기존 컬럼에 없으면 추가하지 않음
-                    continue
-            
-            # 부분 갱신이 아니거나 해당 문제집 갱신인 경우
+            # 부분 갱신: 해당 문제집만 갱신, 나머지는 저장된 값 유지
+            if not should_refresh(f"문제집:{problem_set_name}"):
+                continue
             
-            problem_set = get_problem_set(problem_set_name)
+            problem_set = await async_db.get_problem_set(problem_set_name)
             
             if not problem_set:
                 continue
             
             if f"문제집:{problem_set_name}" not in assignment_columns:
                 assignment_columns.append(f"문제집:{problem_set_name}")
+            refreshed_columns.append(f"문제집:{problem_set_name}")
             
             problem_ids = problem_set['problem_ids']
             total_problems = len(problem_ids)
@@ -541,7 +478,7 @@ async def update_all_assignment_status(group_name: str, bot_instance, assignment
                     continue
                 
                 try:
-                    solved_problems = await get_user_solved_problems_from_solved_ac(boj_handle, target_problems=problem_ids)
+                    solved_problems = await planned_solved_problems(plan, boj_handle, problem_ids)
                     solved_set = set(solved_problems)
                     solved_count = len([pid for pid in problem_ids if pid in solved_set])
                     user_status_map[user_id][f"문제집:{problem_set_name}"] = f"[{solved_count}/{total_problems}]"
@@ -551,35 +488,27 @@ async def update_all_assignment_status(group_name: str, bot_instance, assignment
     
     # 모의테스트 과제 현황 (진행 중인 것만)
     for mt_status in mock_test_statuses:
-        # 부분 갱신이 아니거나 모의테스트 갱신인 경우에만 처리
-        if assignment_type and not assignment_type.startswith("모의테스트:"):
-            # 기존 컬럼에 있으면 유지 (갱신하지 않음)
-            mock_test_name = mt_status['mock_test_name']
-            if f"모의테스트:{mock_test_name}" in assignment_columns:
-                continue  # 기존 값 유지
-            else:
-                continue  # 추가하지 않음
+        # 부분 갱신: 해당 모의테스트만 갱신, 나머지는 저장된 값 유지
+        if not should_refresh(f"모의테스트:{mt_status['mock_test_name']}"):
+            continue
         mt_week_start = datetime.fromisoformat(mt_status['week_start'])
         mt_week_end = datetime.fromisoformat(mt_status['week_end'])
         mt_week_start = ensure_kst(mt_week_start)
         mt_week_end = ensure_kst(mt_week_end)
         
-        if mt_week_start <= now <= mt_week_end:
+        if mt_week_start <= as_of <= mt_week_end:
             mock_test_name = mt_status['mock_test_name']
             
-            # 부분 갱신: 해당 모의테스트만 갱신
-            if assignment_type and assignment_type != f"모의테스트:{mock_test_name}":
-                continue
-            
-            mock_test = get_mock_test(mock_test_name)
+            mock_test = await async_db.get_mock_test(mock_test_name)
             
             if not mock_test:
                 continue
             
             if f"모의테스트:{mock_test_name}" not in assignment_columns:
                 assignment_columns.append(f"모의테스트:{mock_test_name}")
+            refreshed_columns.append(f"모의테스트:{mock_test_name}")
             # 모의테스트 문제 목록 (get_mock_test가 이미 리스트로 반환함)
-            problem_ids = mock_test['problem_ids'] if isinstance(mock_test['problem_ids'], list) else [int(x) for x in str(mock_test['problem_ids']).split(',') if x.strip()]
+            problem_ids = mock_test['problem_ids']
             total_problems = len(problem_ids)
             
             for user_id, user_info in user_map.items():
@@ -594,7 +523,7 @@ async def update_all_assignment_status(group_name: str, bot_instance, assignment
                     continue
                 
                 try:
-                    solved_problems = await get_user_solved_problems_from_solved_ac(boj_handle, target_problems=problem_ids)
+                    solved_problems = await planned_solved_problems(plan, boj_handle, problem_ids)
                     solved_set = set(solved_problems)
                     solved_count = len([pid for pid in problem_ids if pid in solved_set])
                     user_status_map[user_id][f"모의테스트:{mock_test_name}"] = f"[{solved_count}/{total_problems}]"
@@ -602,6 +531,17 @@ async def update_all_assignment_status(group_name: str, bot_instance, assignment
                     logger.error(f"모의테스트 과제 현황 조회 오류 ({boj_handle}): {e}", exc_info=True)
                     user_status_map[user_id][f"모의테스트:{mock_test_name}"] = "[0/" + str(total_problems) + "]"
     
+    # 표 저장 (전체 갱신이면 통째로 교체, 부분 갱신이면 다시 계산한 컬럼만)
+    if not assignment_type:
+        await async_db.replace_assignment_status_matrix(group_name, assignment_columns, user_status_map)
+    else:
+        for column in refreshed_columns:
+            await async_db.save_assignment_status_column(
+                group_name,
+                column,
+                {user_id: values[column] for user_id, values in user_status_map.items() if column in values},
+            )
+    
     # 표 형식으로 정리
     if not assignment_columns:
         embed.add_field(
@@ -696,10 +636,16 @@ async def update_all_assignment_status(group_name: str, bot_instance, assignment
                 inline=False
             )
     
-    await message.edit(embed=embed, view=view)
+    # 자동 갱신은 계획 결과를 실제로 조회한 시각을 표시
+    embed.description = describe(planned_fetch_time(plan, [info['boj_handle'] for info in user_map.values()], now))
+    try:
+        await edit_if_changed(message, embed, view=view, force=force)
+    except discord.NotFound:
+        await async_db.delete_group_all_assignment_status(group_name)
+        return
     
     # DB에 마지막 갱신 시간 저장
-    save_group_all_assignment_status(
+    await async_db.save_group_all_assignment_status(
         group_name,
         status_info['role_name'],
         str(channel_id),
@@ -710,199 +656,226 @@ async def update_all_assignment_status(group_name: str, bot_instance, assignment
     )
 
 
-@tasks.loop(time=[time(hour=h, minute=0) for h in range(0, 24)])
-async def group_weekly_auto_update():
-    """매시 정각 그룹 주간 현황 자동 갱신"""
-    global _bot_for_group_weekly
-    if not _bot_for_group_weekly:
-        return
+# ==================== 자동 갱신 작업 (common/scheduler.py) ====================
 
-    now = get_kst_now()  # 한국 시간 사용
-    for info in get_all_group_weekly_status():
-        week_start = datetime.fromisoformat(info['week_start'])
-        week_end = datetime.fromisoformat(info['week_end'])
-        
-        # timezone-naive면 KST timezone 추가
-        week_start = ensure_kst(week_start)
-        week_end = ensure_kst(week_end)
+def is_weekly_rollover_slot(slot: datetime) -> bool:
+    """월요일 01시 정각 (모든 과제 최종 갱신 -> 전체과제현황 갱신 -> 정리/새 주 생성 시각)인지"""
+    return slot.weekday() == 0 and slot.hour == 1 and slot.minute == 0
 
-        # 기간 내: 정상 크롤링
-        if week_start <= now < week_end:
-            await update_group_weekly_status(info['group_name'], _bot_for_group_weekly)
-        # 월요일 01시 정각: 마지막 크롤링 후 DB 삭제
-        elif now >= week_end and now < week_end + timedelta(minutes=5):
-            # 마지막 크롤링 수행
-            logger.info(f"[그룹 주간 현황] {info['group_name']} - 마지막 크롤링 수행 (월요일 01시)")
-            await update_group_weekly_status(info['group_name'], _bot_for_group_weekly)
-            # 크롤링 후 DB에서 정리 (메시지는 그대로 둠)
-            delete_group_weekly_status(info['group_name'])
-            logger.info(f"[그룹 주간 현황] {info['group_name']} - DB에서 삭제됨")
-            
-            # 봇 알림 채널에 알림 전송
-            from common.utils import send_bot_notification
-            if _bot_for_group_weekly and _bot_for_group_weekly.guilds:
-                guild = _bot_for_group_weekly.guilds[0]
-                await send_bot_notification(
-                    guild,
-                    "📊 문제풀이 현황 종료",
-                    f"**그룹:** {info['group_name']}\n"
-                    f"**기간:** {week_start.strftime('%Y-%m-%d %H:%M')} ~ {week_end.strftime('%Y-%m-%d %H:%M')}\n"
-                    f"**상태:** 주간 현황이 종료되었고 DB에서 삭제되었습니다.",
-                    discord.Color.orange()
-                )
+
+def _status_period(info: dict):
+    """DB 현황 정보의 (week_start, week_end) - timezone-naive면 KST timezone 추가"""
+    week_start = ensure_kst(datetime.fromisoformat(info['week_start']))
+    week_end = ensure_kst(datetime.fromisoformat(info['week_end']))
+    return week_start, week_end
+
+
+def _in_final_window(info: dict, slot: datetime) -> bool:
+    """기간 내이거나 종료 직후(마지막 크롤링 허용 5분)인지"""
+    week_start, week_end = _status_period(info)
+    return week_start <= slot <= week_end + timedelta(minutes=5)
+
+
+async def _finish_group_weekly(info: dict, crawl: bool = True, plan=None):
+    """기간이 끝난 그룹 주간 현황 마지막 크롤링 후 DB 정리 및 알림"""
+    group_name = info['group_name']
+    week_start, week_end = _status_period(info)
+    if crawl:
+        logger.info(f"[그룹 주간 현황] {group_name} - 마지막 크롤링 수행 (월요일 01시)")
+        await update_group_weekly_status(group_name, _bot_for_group_weekly, plan)
+    # 크롤링 후 DB에서 정리 (메시지는 그대로 둠)
+    await async_db.delete_group_weekly_status(group_name)
+    logger.info(f"[그룹 주간 현황] {group_name} - DB에서 삭제됨")
+
+    # 봇 알림 채널에 알림 전송
+    from common.utils import send_bot_notification
+    if _bot_for_group_weekly and _bot_for_group_weekly.guilds:
+        guild = _bot_for_group_weekly.guilds[0]
+        await send_bot_notification(
+            guild,
+            "📊 문제풀이 현황 종료",
+            f"**그룹:** {group_name}\n"
+            f"**기간:** {week_start.strftime('%Y-%m-%d %H:%M')} ~ {week_end.strftime('%Y-%m-%d %H:%M')}\n"
+            f"**상태:** 주간 현황이 종료되었고 DB에서 삭제되었습니다.",
+            discord.Color.orange()
+        )
+
+
+async def _build_refresh_plan(slot: datetime):
+    """매시 자동 갱신에 필요한 solved.ac 조회 계획 생성 (조회는 각 실행 단위 차례에 핸들별로 한 번씩)"""
+    await build_refresh_plan(slot, include_final=is_weekly_rollover_slot(slot))
+
+
+async def _group_weekly_units(slot: datetime):
+    """매시 그룹 주간 현황 자동 갱신 (그룹별 실행 단위)"""
+    if not _bot_for_group_weekly:
+        return []
+
+    plan = get_refresh_plan(slot)
+    units = []
+    for info in await async_db.get_all_group_weekly_status():
+        group_name = info['group_name']
+        week_start, week_end = _status_period(info)
+
+        # 기간 내: 정상 크롤링 (시간 안에 나눠서 실행)
+        if week_start <= slot < week_end:
+            units.append(WorkItem(group_name, partial(update_group_weekly_status, group_name, _bot_for_group_weekly, plan)))
+        # 종료 직후: 마지막 크롤링 후 DB 삭제
+        # (월요일 01시에는 weekly_final_refresh에서 이미 크롤링했으므로 정리만)
+        elif week_end <= slot < week_end + timedelta(minutes=5):
+            crawl = not is_weekly_rollover_slot(slot)
+            units.append(WorkItem(group_name, partial(_finish_group_weekly, info, crawl, plan), spread=False))
         # 기간이 지난 경우: DB만 삭제 (이미 삭제되었을 수 있음)
-        elif now > week_end + timedelta(minutes=5):
-            delete_group_weekly_status(info['group_name'])
+        else:
+            units.append(WorkItem(group_name, partial(async_db.delete_group_weekly_status, group_name), spread=False))
+    return units
 
 
-@tasks.loop(time=[time(hour=1, minute=0)])
-async def all_assignment_auto_create():
-    """월요일 01시 정각 전체과제현황 자동 생성 및 삭제
-    
-    월요일 01시에 실행 순서:
-    1. 모든 등록된 과제들 최종 갱신 (링크제출, 문제풀이, 문제집, 모의테스트)
-    2. 전체과제현황 갱신
-    3. 모든 과제 및 전체과제현황 삭제
-    """
-    global _bot_for_group_weekly
+async def _weekly_final_refresh_units(slot: datetime):
+    """월요일 01시 모든 등록된 과제 최종 갱신 (링크제출, 문제풀이, 문제집, 모의테스트)"""
     if not _bot_for_group_weekly:
-        return
-    
-    now = get_kst_now()
-    # 월요일 01시에만 실행
-    if now.weekday() != 0 or now.hour != 1 or now.minute != 0:
-        return
-    
-    logger.info("[월요일 01시] 모든 과제 최종 갱신 시작")
-    
-    # 1. 모든 등록된 과제들 최종 갱신
-    from common.database import (
-        get_all_group_link_submission_status, get_all_group_weekly_status,
-        get_all_group_problem_set_status, get_all_group_mock_test_status
-    )
+        return []
+
     from domain.link_submission import update_link_submission_status
     from domain.problem_set import update_problem_set_status, update_mock_test_status
-    
-    # 링크제출 최종 갱신
-    for info in get_all_group_link_submission_status():
-        week_start = datetime.fromisoformat(info['week_start'])
-        week_end = datetime.fromisoformat(info['week_end'])
-        week_start = ensure_kst(week_start)
-        week_end = ensure_kst(week_end)
-        if week_start <= now <= week_end + timedelta(minutes=5):
+
+    bot = _bot_for_group_weekly
+    plan = get_refresh_plan(slot)
+    logger.info("[월요일 01시] 모든 과제 최종 갱신 시작")
+    units = []
+
+    for info in await async_db.get_all_group_link_submission_status():
+        if _in_final_window(info, slot):
             logger.info(f"[월요일 01시] 링크제출 최종 갱신: {info['group_name']}")
-            await update_link_submission_status(info['group_name'], _bot_for_group_weekly)
-    
-    # 문제풀이 최종 갱신
-    for info in get_all_group_weekly_status():
-        week_start = datetime.fromisoformat(info['week_start'])
-        week_end = datetime.fromisoformat(info['week_end'])
-        week_start = ensure_kst(week_start)
-        week_end = ensure_kst(week_end)
-        if week_start <= now <= week_end + timedelta(minutes=5):
+            units.append(WorkItem(
+                f"링크제출:{info['group_name']}",
+                partial(update_link_submission_status, info['group_name'], bot, plan),
+                spread=False,
+            ))
+
+    for info in await async_db.get_all_group_weekly_status():
+        if _in_final_window(info, slot):
             logger.info(f"[월요일 01시] 문제풀이 최종 갱신: {info['group_name']}")
-            await update_group_weekly_status(info['group_name'], _bot_for_group_weekly)
-    
-    # 문제집 최종 갱신
-    for info in get_all_group_problem_set_status():
-        week_start = datetime.fromisoformat(info['week_start'])
-        week_end = datetime.fromisoformat(info['week_end'])
-        week_start = ensure_kst(week_start)
-        week_end = ensure_kst(week_end)
-        if week_start <= now <= week_end + timedelta(minutes=5):
+            units.append(WorkItem(
+                f"문제풀이:{info['group_name']}",
+                partial(update_group_weekly_status, info['group_name'], bot, plan),
+                spread=False,
+            ))
+
+    for info in await async_db.get_all_group_problem_set_status():
+        if _in_final_window(info, slot):
             logger.info(f"[월요일 01시] 문제집 최종 갱신: {info['group_name']} - {info['problem_set_name']}")
-            await update_problem_set_status(info['group_name'], info['problem_set_name'], _bot_for_group_weekly)
-    
-    # 모의테스트 최종 갱신
-    for info in get_all_group_mock_test_status():
-        week_start = datetime.fromisoformat(info['week_start'])
-        week_end = datetime.fromisoformat(info['week_end'])
-        week_start = ensure_kst(week_start)
-        week_end = ensure_kst(week_end)
-        if week_start <= now <= week_end + timedelta(minutes=5):
+            units.append(WorkItem(
+                f"문제집:{info['group_name']}:{info['problem_set_name']}",
+                partial(update_problem_set_status, info['group_name'], info['problem_set_name'], bot, plan),
+                spread=False,
+            ))
+
+    for info in await async_db.get_all_group_mock_test_status():
+        if _in_final_window(info, slot):
             logger.info(f"[월요일 01시] 모의테스트 최종 갱신: {info['group_name']} - {info['mock_test_name']}")
-            await update_mock_test_status(info['group_name'], info['mock_test_name'], _bot_for_group_weekly)
-    
-    # 2. 전체과제현황 갱신
-    from common.database import get_all_group_all_assignment_status
-    all_assignment_statuses = get_all_group_all_assignment_status()
-    for status in all_assignment_statuses:
-        week_start = datetime.fromisoformat(status['week_start'])
-        week_end = datetime.fromisoformat(status['week_end'])
-        week_start = ensure_kst(week_start)
-        week_end = ensure_kst(week_end)
-        if week_start <= now <= week_end + timedelta(minutes=5):
+            units.append(WorkItem(
+                f"모의테스트:{info['group_name']}:{info['mock_test_name']}",
+                partial(update_mock_test_status, info['group_name'], info['mock_test_name'], bot, plan),
+                spread=False,
+            ))
+    return units
+
+
+async def _all_assignment_refresh_units(slot: datetime):
+    """월요일 01시 전체과제현황 최종 갱신 (최종 갱신이 끝난 뒤)"""
+    if not _bot_for_group_weekly:
+        return []
+
+    plan = get_refresh_plan(slot)
+    units = []
+    for status in await async_db.get_all_group_all_assignment_status():
+        if _in_final_window(status, slot):
             logger.info(f"[월요일 01시] 전체과제현황 최종 갱신: {status['group_name']}")
-            await update_all_assignment_status(status['group_name'], _bot_for_group_weekly, assignment_type=None)
-    
-    # 3. 모든 과제 및 전체과제현황 삭제 (solved.ac 서버 확인 후 실행)
-    from common.database import (
-        delete_group_link_submission_status, delete_group_weekly_status,
-        delete_group_problem_set_status, delete_group_mock_test_status,
-        delete_group_all_assignment_status
-    )
+            units.append(WorkItem(
+                status['group_name'],
+                partial(update_all_assignment_status, status['group_name'], _bot_for_group_weekly, assignment_type=None, plan=plan),
+                spread=False,
+            ))
+    return units
+
+
+async def weekly_rollover(slot: datetime):
+    """월요일 01시 모든 과제 및 전체과제현황 삭제 후 새 전체과제현황 생성
+
+    월요일 01시에 실행 순서 (스케줄러의 선행 작업으로 보장):
+    1. weekly_final_refresh: 모든 등록된 과제들 최종 갱신 (링크제출, 문제풀이, 문제집, 모의테스트)
+    2. all_assignment_refresh: 전체과제현황 갱신
+    3. weekly_rollover: 모든 과제 및 전체과제현황 삭제, 새 주 전체과제현황 생성
+    """
+    if not _bot_for_group_weekly:
+        return
+
+    now = get_kst_now()
+
+    # 모든 과제 및 전체과제현황 삭제 (solved.ac 서버 확인 후 실행)
     from common.boj_utils import check_solved_ac_server_available
-    
+
     # solved.ac 서버 응답 확인
     server_available = await check_solved_ac_server_available()
-    
+
     if not server_available:
         logger.warning("[월요일 01시] solved.ac 서버가 응답하지 않아 삭제 작업을 2시간 유예합니다.")
         return
-    
+
     # 링크제출 삭제
-    for info in get_all_group_link_submission_status():
+    for info in await async_db.get_all_group_link_submission_status():
         week_end = datetime.fromisoformat(info['week_end'])
         week_end = ensure_kst(week_end)
         # 2시간 유예: week_end + 2시간이 지났을 때만 삭제
         if now >= week_end + timedelta(hours=2):
-            delete_group_link_submission_status(info['group_name'])
+            await async_db.delete_group_link_submission_status(info['group_name'])
             logger.info(f"[월요일 01시] 링크제출 삭제: {info['group_name']}")
-    
+
     # 문제풀이 삭제
-    for info in get_all_group_weekly_status():
+    for info in await async_db.get_all_group_weekly_status():
         week_end = datetime.fromisoformat(info['week_end'])
         week_end = ensure_kst(week_end)
         # 2시간 유예: week_end + 2시간이 지났을 때만 삭제
         if now >= week_end + timedelta(hours=2):
-            delete_group_weekly_status(info['group_name'])
+            await async_db.delete_group_weekly_status(info['group_name'])
             logger.info(f"[월요일 01시] 문제풀이 삭제: {info['group_name']}")
-    
+
     # 문제집 삭제
-    for info in get_all_group_problem_set_status():
+    for info in await async_db.get_all_group_problem_set_status():
         week_end = datetime.fromisoformat(info['week_end'])
         week_end = ensure_kst(week_end)
         # 2시간 유예: week_end + 2시간이 지났을 때만 삭제
         if now >= week_end + timedelta(hours=2):
-            delete_group_problem_set_status(info['group_name'], info['problem_set_name'])
+            await async_db.delete_group_problem_set_status(info['group_name'], info['problem_set_name'])
             logger.info(f"[월요일 01시] 문제집 삭제: {info['group_name']} - {info['problem_set_name']}")
-    
+
     # 모의테스트 삭제
-    for info in get_all_group_mock_test_status():
+    for info in await async_db.get_all_group_mock_test_status():
         week_end = datetime.fromisoformat(info['week_end'])
         week_end = ensure_kst(week_end)
         # 2시간 유예: week_end + 2시간이 지났을 때만 삭제
         if now >= week_end + timedelta(hours=2):
-            delete_group_mock_test_status(info['group_name'], info['mock_test_name'])
+            await async_db.delete_group_mock_test_status(info['group_name'], info['mock_test_name'])
             logger.info(f"[월요일 01시] 모의테스트 삭제: {info['group_name']} - {info['mock_test_name']}")
-    
+
     # 전체과제현황 삭제
-    for status in all_assignment_statuses:
+    for status in await async_db.get_all_group_all_assignment_status():
         week_end = datetime.fromisoformat(status['week_end'])
         week_end = ensure_kst(week_end)
         # 2시간 유예: week_end + 2시간이 지났을 때만 삭제
         if now >= week_end + timedelta(hours=2):
-            delete_group_all_assignment_status(status['group_name'])
+            await async_db.delete_group_all_assignment_status(status['group_name'])
             logger.info(f"[월요일 01시] 전체과제현황 삭제: {status['group_name']}")
     
-    data = load_data()
-    studies = data.get('studies', {})
+    studies = await async_db.load_studies()
+    role_tokens = await async_db.load_role_tokens()
     
     for role_name, study_data in studies.items():
         group_name = study_data.get('group_name') or role_name
         
         # 역할 등록 여부 확인
-        if role_name not in data.get('role_tokens', {}):
+        if role_name not in role_tokens:
             continue
         
         # 기준 주 계산 (명령어 실행일이 속한 주의 월요일 00시 ~ 다음 주 월요일 01시)
@@ -912,17 +885,15 @@ async def all_assignment_auto_create():
         week_end = week_start + timedelta(days=7, hours=1)
         
         # 기존 전체과제현황이 있으면 삭제 (매주 새로 생성)
-        existing = get_group_all_assignment_status(group_name)
+        existing = await async_db.get_group_all_assignment_status(group_name)
         if existing:
-            delete_group_all_assignment_status(group_name)
+            await async_db.delete_group_all_assignment_status(group_name)
         
         # 과제가 하나라도 있는지 확인
-        link_status = get_group_link_submission_status(group_name)
-        problem_status = get_group_weekly_status(group_name)
-        all_problem_sets = get_all_group_problem_set_status()
-        problem_set_statuses = [ps for ps in all_problem_sets if ps['group_name'] == group_name]
-        all_mock_tests = get_all_group_mock_test_status()
-        mock_test_statuses = [mt for mt in all_mock_tests if mt['group_name'] == group_name]
+        link_status = await async_db.get_group_link_submission_status(group_name)
+        problem_status = await async_db.get_group_weekly_status(group_name)
+        problem_set_statuses = await async_db.get_group_problem_set_statuses(group_name)
+        mock_test_statuses = await async_db.get_group_mock_test_statuses(group_name)
         
         # 과제가 하나도 없으면 생성하지 않음
         if not link_status and not problem_status and not problem_set_statuses and not mock_test_statuses:
@@ -960,7 +931,7 @@ async def all_assignment_auto_create():
         msg = await channel.send(embed=embed)
         
         # DB에 저장
-        save_group_all_assignment_status(
+        await async_db.save_group_all_assignment_status(
             group_name,
             role_name,
             str(channel.id),
@@ -1049,7 +1020,7 @@ class AllAssignmentStatusView(discord.ui.View):
 
     async def refresh_all_button(self, interaction: discord.Interaction):
         # 메시지 기준으로 그룹 찾기
-        info = get_group_all_assignment_status_by_message(str(interaction.channel.id), str(interaction.message.id))
+        info = await async_db.get_group_all_assignment_status_by_message(str(interaction.channel.id), str(interaction.message.id))
         if not info:
             if interaction.response.is_done():
                 await interaction.followup.send("❌ 이 메시지는 전체과제현황으로 등록되어 있지 않습니다.", ephemeral=True)
@@ -1070,23 +1041,19 @@ class AllAssignmentStatusView(discord.ui.View):
                 await interaction.response.send_message("⚠️ 이 메시지의 기간이 종료되어 더 이상 갱신할 수 없습니다.", ephemeral=True)
             return
 
-        if not interaction.response.is_done():
-            await interaction.response.defer(ephemeral=True)
-        
-        # solved.ac 서버 응답 확인
-        from common.boj_utils import check_solved_ac_server_available
-        server_available = await check_solved_ac_server_available()
-        
-        if not server_available:
-            await interaction.followup.send("⚠️ **solved.ac 서버 응답 없음** - 나중에 다시 시도해주세요.", ephemeral=True)
-            return
-        
-        # 전체 갱신
-        await update_all_assignment_status(info['group_name'], interaction.client, assignment_type=None)
-        await interaction.followup.send("✅ 전체과제현황이 갱신되었습니다.", ephemeral=True)
+        # 크롤링은 백그라운드 큐에서 실행 (같은 메시지/컬럼 요청은 하나로 합침)
+        async def refresh():
+            # solved.ac 서버 응답 확인
+            from common.boj_utils import check_solved_ac_server_available
+            if not await check_solved_ac_server_available():
+                return "⚠️ **solved.ac 서버 응답 없음** - 나중에 다시 시도해주세요."
+            # 전체 갱신
+            await update_all_assignment_status(info['group_name'], interaction.client, assignment_type=None, force=True)
+
+        await request_refresh(interaction, "전체", refresh, "✅ 전체과제현황이 갱신되었습니다.")
 
     async def refresh_problem_button(self, interaction: discord.Interaction):
-        info = get_group_all_assignment_status_by_message(str(interaction.channel.id), str(interaction.message.id))
+        info = await async_db.get_group_all_assignment_status_by_message(str(interaction.channel.id), str(interaction.message.id))
         if not info:
             if interaction.response.is_done():
                 await interaction.followup.send("❌ 이 메시지는 전체과제현황으로 등록되어 있지 않습니다.", ephemeral=True)
@@ -1107,28 +1074,23 @@ class AllAssignmentStatusView(discord.ui.View):
                 await interaction.response.send_message("⚠️ 이 메시지의 기간이 종료되어 더 이상 갱신할 수 없습니다.", ephemeral=True)
             return
 
-        if not interaction.response.is_done():
-            await interaction.response.defer(ephemeral=True)
-        
-        # solved.ac 서버 응답 확인
-        from common.boj_utils import check_solved_ac_server_available
-        server_available = await check_solved_ac_server_available()
-        
-        if not server_available:
-            await interaction.followup.send("⚠️ **solved.ac 서버 응답 없음** - 나중에 다시 시도해주세요.", ephemeral=True)
-            return
-        
-        # 문제풀이 갱신 (자동으로 전체과제현황도 갱신됨)
         bot_instance = interaction.client
         if not bot_instance:
-            await interaction.followup.send("❌ 봇 인스턴스를 찾을 수 없습니다.", ephemeral=True)
+            await interaction.response.send_message("❌ 봇 인스턴스를 찾을 수 없습니다.", ephemeral=True)
             return
-        
-        await update_group_weekly_status(info['group_name'], bot_instance)
-        await interaction.followup.send("✅ 문제풀이 현황이 갱신되었습니다.", ephemeral=True)
+
+        async def refresh():
+            # solved.ac 서버 응답 확인
+            from common.boj_utils import check_solved_ac_server_available
+            if not await check_solved_ac_server_available():
+                return "⚠️ **solved.ac 서버 응답 없음** - 나중에 다시 시도해주세요."
+            # 문제풀이 갱신 (자동으로 전체과제현황도 갱신됨)
+            await update_group_weekly_status(info['group_name'], bot_instance, force=True)
+
+        await request_refresh(interaction, "문제풀이", refresh, "✅ 문제풀이 현황이 갱신되었습니다.")
 
     async def refresh_link_button(self, interaction: discord.Interaction):
-        info = get_group_all_assignment_status_by_message(str(interaction.channel.id), str(interaction.message.id))
+        info = await async_db.get_group_all_assignment_status_by_message(str(interaction.channel.id), str(interaction.message.id))
         if not info:
             if interaction.response.is_done():
                 await interaction.followup.send("❌ 이 메시지는 전체과제현황으로 등록되어 있지 않습니다.", ephemeral=True)
@@ -1149,20 +1111,20 @@ class AllAssignmentStatusView(discord.ui.View):
                 await interaction.response.send_message("⚠️ 이 메시지의 기간이 종료되어 더 이상 갱신할 수 없습니다.", ephemeral=True)
             return
 
-        if not interaction.response.is_done():
-            await interaction.response.defer(ephemeral=True)
-        
-        # 링크제출 갱신 (자동으로 전체과제현황도 갱신됨)
         bot_instance = interaction.client
         if not bot_instance:
-            await interaction.followup.send("❌ 봇 인스턴스를 찾을 수 없습니다.", ephemeral=True)
+            await interaction.response.send_message("❌ 봇 인스턴스를 찾을 수 없습니다.", ephemeral=True)
             return
-        from domain.link_submission import update_link_submission_status
-        await update_link_submission_status(info['group_name'], bot_instance)
-        await interaction.followup.send("✅ 링크제출 현황이 갱신되었습니다.", ephemeral=True)
+
+        async def refresh():
+            # 링크제출 갱신 (자동으로 전체과제현황도 갱신됨)
+            from domain.link_submission import update_link_submission_status
+            await update_link_submission_status(info['group_name'], bot_instance, force=True)
+
+        await request_refresh(interaction, "링크제출", refresh, "✅ 링크제출 현황이 갱신되었습니다.")
 
     async def refresh_problem_set_button(self, interaction: discord.Interaction):
-        info = get_group_all_assignment_status_by_message(str(interaction.channel.id), str(interaction.message.id))
+        info = await async_db.get_group_all_assignment_status_by_message(str(interaction.channel.id), str(interaction.message.id))
         if not info:
             if interaction.response.is_done():
                 await interaction.followup.send("❌ 이 메시지는 전체과제현황으로 등록되어 있지 않습니다.", ephemeral=True)
@@ -1183,43 +1145,39 @@ class AllAssignmentStatusView(discord.ui.View):
                 await interaction.response.send_message("⚠️ 이 메시지의 기간이 종료되어 더 이상 갱신할 수 없습니다.", ephemeral=True)
             return
 
-        if not interaction.response.is_done():
-            await interaction.response.defer(ephemeral=True)
-        
-        # solved.ac 서버 응답 확인
-        from common.boj_utils import check_solved_ac_server_available
-        server_available = await check_solved_ac_server_available()
-        
-        if not server_available:
-            await interaction.followup.send("⚠️ **solved.ac 서버 응답 없음** - 나중에 다시 시도해주세요.", ephemeral=True)
-            return
-        
-        # 문제집 갱신 (모든 문제집 갱신)
         bot_instance = interaction.client
         if not bot_instance:
-            await interaction.followup.send("❌ 봇 인스턴스를 찾을 수 없습니다.", ephemeral=True)
-            return
-        from domain.problem_set import get_all_group_problem_set_status, update_problem_set_status
-        problem_set_statuses = [ps for ps in get_all_group_problem_set_status() if ps['group_name'] == info['group_name']]
-        
-        updated_count = 0
-        for ps_status in problem_set_statuses:
-            ps_week_start = datetime.fromisoformat(ps_status['week_start'])
-            ps_week_end = datetime.fromisoformat(ps_status['week_end'])
-            ps_week_start = ensure_kst(ps_week_start)
-            ps_week_end = ensure_kst(ps_week_end)
+            await interaction.response.send_message("❌ 봇 인스턴스를 찾을 수 없습니다.", ephemeral=True)
+            return
+
+        async def refresh():
+            # solved.ac 서버 응답 확인
+            from common.boj_utils import check_solved_ac_server_available
+            if not await check_solved_ac_server_available():
+                return "⚠️ **solved.ac 서버 응답 없음** - 나중에 다시 시도해주세요."
+            # 문제집 갱신 (모든 문제집 갱신)
+            from domain.problem_set import update_problem_set_status
+            problem_set_statuses = await async_db.get_group_problem_set_statuses(info['group_name'])
+            
+            updated_count = 0
+            for ps_status in problem_set_statuses:
+                ps_week_start = datetime.fromisoformat(ps_status['week_start'])
+                ps_week_end = datetime.fromisoformat(ps_status['week_end'])
+                ps_week_start = ensure_kst(ps_week_start)
+                ps_week_end = ensure_kst(ps_week_end)
+                
+                if ps_week_start <= now <= ps_week_end:
+                    await update_problem_set_status(info['group_name'], ps_status['problem_set_name'], bot_instance, force=True)
+                    updated_count += 1
             
-            if ps_week_start <= now <= ps_week_end:
-                await update_problem_set_status(info['group_name'], ps_status['problem_set_name'], bot_instance)
-                updated_count += 1
-        
-        if updated_count > 0:
-            await interaction.followup.send(f"✅ 문제집 현황 {updated_count}개가 갱신되었습니다.", ephemeral=True)
-        else:
-            await interaction.followup.send("⚠️ 갱신 가능한 문제집이 없습니다.", ephemeral=True)
+            if updated_count > 0:
+                return f"✅ 문제집 현황 {updated_count}개가 갱신되었습니다."
+            return "⚠️ 갱신 가능한 문제집이 없습니다."
+
+        await request_refresh(interaction, "문제집", refresh, "✅ 문제집 현황이 갱신되었습니다.")
 
     async def refresh_mock_test_button(self, interaction: discord.Interaction):
-        info = get_group_all_assignment_status_by_message(str(interaction.channel.id), str(interaction.message.id))
+        info = await async_db.get_group_all_assignment_status_by_message(str(interaction.channel.id), str(interaction.message.id))
         if not info:
             if interaction.response.is_done():
                 await interaction.followup.send("❌ 이 메시지는 전체과제현황으로 등록되어 있지 않습니다.", ephemeral=True)
@@ -1240,40 +1198,36 @@ class AllAssignmentStatusView(discord.ui.View):
                 await interaction.response.send_message("⚠️ 이 메시지의 기간이 종료되어 더 이상 갱신할 수 없습니다.", ephemeral=True)
             return
 
-        if not interaction.response.is_done():
-            await interaction.response.defer(ephemeral=True)
-        
-        # solved.ac 서버 응답 확인
-        from common.boj_utils import check_solved_ac_server_available
-        server_available = await check_solved_ac_server_available()
-        
-        if not server_available:
-            await interaction.followup.send("⚠️ **solved.ac 서버 응답 없음** - 나중에 다시 시도해주세요.", ephemeral=True)
-            return
-        
-        # 모의테스트 갱신 (모든 모의테스트 갱신)
         bot_instance = interaction.client
         if not bot_instance:
-            await interaction.followup.send("❌ 봇 인스턴스를 찾을 수 없습니다.", ephemeral=True)
-            return
-        from domain.problem_set import get_all_group_mock_test_status, update_mock_test_status
-        mock_test_statuses = [mt for mt in get_all_group_mock_test_status() if mt['group_name'] == info['group_name']]
-        
-        updated_count = 0
-        for mt_status in mock_test_statuses:
-            mt_week_start = datetime.fromisoformat(mt_status['week_start'])
-            mt_week_end = datetime.fromisoformat(mt_status['week_end'])
-            mt_week_start = ensure_kst(mt_week_start)
-            mt_week_end = ensure_kst(mt_week_end)
+            await interaction.response.send_message("❌ 봇 인스턴스를 찾을 수 없습니다.", ephemeral=True)
+            return
+
+        async def refresh():
+            # solved.ac 서버 응답 확인
+            from common.boj_utils import check_solved_ac_server_available
+            if not await check_solved_ac_server_available():
+                return "⚠️ **solved.ac 서버 응답 없음** - 나중에 다시 시도해주세요."
+            # 모의테스트 갱신 (모든 모의테스트 갱신)
+            from domain.problem_set import update_mock_test_status
+            mock_test_statuses = await async_db.get_group_mock_test_statuses(info['group_name'])
+            
+            updated_count = 0
+            for mt_status in mock_test_statuses:
+                mt_week_start = datetime.fromisoformat(mt_status['week_start'])
+                mt_week_end = datetime.fromisoformat(mt_status['week_end'])
+                mt_week_start = ensure_kst(mt_week_start)
+                mt_week_end = ensure_kst(mt_week_end)
+                
+                if mt_week_start <= now <= mt_week_end:
+                    await update_mock_test_status(info['group_name'], mt_status['mock_test_name'], bot_instance, force=True)
+                    updated_count += 1
             
-            if mt_week_start <= now <= mt_week_end:
-                await update_mock_test_status(info['group_name'], mt_status['mock_test_name'], bot_instance)
-                updated_count += 1
-        
-        if updated_count > 0:
-            await interaction.followup.send(f"✅ 모의테스트 현황 {updated_count}개가 갱신되었습니다.", ephemeral=True)
-        else:
-            await interaction.followup.send("⚠️ 갱신 가능한 모의테스트가 없습니다.", ephemeral=True)
+            if updated_count > 0:
+                return f"✅ 모의테스트 현황 {updated_count}개가 갱신되었습니다."
+            return "⚠️ 갱신 가능한 모의테스트가 없습니다."
+
+        await request_refresh(interaction, "모의테스트", refresh, "✅ 모의테스트 현황이 갱신되었습니다.")
 
 
 class GroupWeeklyStatusView(discord.ui.View):
@@ -1298,7 +1252,7 @@ class GroupWeeklyStatusView(discord.ui.View):
     )
     async def refresh_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         # 메시지 기준으로 그룹 찾기
-        info = get_group_weekly_status_by_message(str(interaction.channel.id), str(interaction.message.id))
+        info = await async_db.get_group_weekly_status_by_message(str(interaction.channel.id), str(interaction.message.id))
         if not info:
             if interaction.response.is_done():
                 await interaction.followup.send("❌ 이 메시지는 주간 현황으로 등록되어 있지 않습니다.", ephemeral=True)
@@ -1322,10 +1276,11 @@ class GroupWeeklyStatusView(discord.ui.View):
                 await interaction.response.send_message("⚠️ 이 메시지의 기간이 종료되어 더 이상 갱신할 수 없습니다.", ephemeral=True)
             return
 
-        if not interaction.response.is_done():
-            await interaction.response.defer(ephemeral=True)
-        await update_group_weekly_status(info['group_name'], interaction.client)
-        await interaction.followup.send("✅ 주간 현황이 갱신되었습니다.", ephemeral=True)
+        # 크롤링은 백그라운드 큐에서 실행 (같은 메시지 요청은 하나로 합침)
+        async def refresh():
+            await update_group_weekly_status(info['group_name'], interaction.client, force=True)
+
+        await request_refresh(interaction, "문제풀이", refresh, "✅ 주간 현황이 갱신되었습니다.")
 
 
 def register_group_weekly_views(bot):
@@ -1346,63 +1301,60 @@ def register_all_assignment_status_views(bot):
 
 
 async def cleanup_expired_assignments():
-    """봇 시작 시 만료된 과제들 자동 삭제"""
-    from common.database import (
-        get_all_group_link_submission_status, get_all_group_weekly_status,
-        get_all_group_problem_set_status, get_all_group_mock_test_status,
-        get_all_group_all_assignment_status,
-        delete_group_link_submission_status, delete_group_weekly_status,
-        delete_group_problem_set_status, delete_group_mock_test_status,
-        delete_group_all_assignment_status
-    )
+    """봇 시작 시 만료된 과제들 자동 삭제
+
+    방금 끝난 과제(SCHEDULER_CATCHUP_MAX_AGE 이내)는 스케줄러가 놓친 최종 갱신을 보충한 뒤 정리하도록 남겨 둔다.
+    """
+    from common.config import SCHEDULER_CATCHUP_MAX_AGE
     
     now = get_kst_now()
+    expired_before = now - timedelta(seconds=SCHEDULER_CATCHUP_MAX_AGE)
     deleted_count = 0
     
     logger.info("[봇 시작] 만료된 과제 정리 시작")
     
     # 링크제출 삭제
-    for info in get_all_group_link_submission_status():
+    for info in await async_db.get_all_group_link_submission_status():
         week_end = datetime.fromisoformat(info['week_end'])
         week_end = ensure_kst(week_end)
-        if now >= week_end:
-            delete_group_link_submission_status(info['group_name'])
+        if week_end <= expired_before:
+            await async_db.delete_group_link_submission_status(info['group_name'])
             deleted_count += 1
             logger.info(f"[봇 시작] 만료된 링크제출 삭제: {info['group_name']}")
     
     # 문제풀이 삭제
-    for info in get_all_group_weekly_status():
+    for info in await async_db.get_all_group_weekly_status():
         week_end = datetime.fromisoformat(info['week_end'])
         week_end = ensure_kst(week_end)
-        if now >= week_end:
-            delete_group_weekly_status(info['group_name'])
+        if week_end <= expired_before:
+            await async_db.delete_group_weekly_status(info['group_name'])
             deleted_count += 1
             logger.info(f"[봇 시작] 만료된 문제풀이 삭제: {info['group_name']}")
     
     # 문제집 삭제
-    for info in get_all_group_problem_set_status():
+    for info in await async_db.get_all_group_problem_set_status():
         week_end = datetime.fromisoformat(info['week_end'])
         week_end = ensure_kst(week_end)
-        if now >= week_end:
-            delete_group_problem_set_status(info['group_name'], info['problem_set_name'])
+        if week_end <= expired_before:
+            await async_db.delete_group_problem_set_status(info['group_name'], info['problem_set_name'])
             deleted_count += 1
             logger.info(f"[봇 시작] 만료된 문제집 삭제: {info['group_name']} - {info['problem_set_name']}")
     
     # 모의테스트 삭제
-    for info in get_all_group_mock_test_status():
+    for info in await async_db.get_all_group_mock_test_status():
         week_end = datetime.fromisoformat(info['week_end'])
         week_end = ensure_kst(week_end)
-        if now >= week_end:
-            delete_group_mock_test_status(info['group_name'], info['mock_test_name'])
+        if week_end <= expired_before:
+            await async_db.delete_group_mock_test_status(info['group_name'], info['mock_test_name'])
             deleted_count += 1
             logger.info(f"[봇 시작] 만료된 모의테스트 삭제: {info['group_name']} - {info['mock_test_name']}")
     
     # 전체과제현황 삭제
-    for status in get_all_group_all_assignment_status():
+    for status in await async_db.get_all_group_all_assignment_status():
         week_end = datetime.fromisoformat(status['week_end'])
         week_end = ensure_kst(week_end)
-        if now >= week_end:
-            delete_group_all_assignment_status(status['group_name'])
+        if week_end <= expired_before:
+            await async_db.delete_group_all_assignment_status(status['group_name'])
             deleted_count += 1
             logger.info(f"[봇 시작] 만료된 전체과제현황 삭제: {status['group_name']}")
     
@@ -1412,14 +1364,18 @@ async def cleanup_expired_assignments():
         logger.info("[봇 시작] 만료된 과제가 없습니다.")
 
 
-def start_group_weekly_scheduler(bot):
-    """그룹 주간 현황 자동 갱신 스케줄러 시작"""
+def register_scheduled_jobs(bot):
+    """그룹 주간 현황 자동 갱신 및 월요일 01시 최종 갱신/정리 작업 등록"""
     global _bot_for_group_weekly
     _bot_for_group_weekly = bot
-    if not group_weekly_auto_update.is_running():
-        group_weekly_auto_update.start()
-    if not all_assignment_auto_create.is_running():
-        all_assignment_auto_create.start()
+    register_job('refresh_plan', run=_build_refresh_plan, priority=0, spread=0)
+    register_job('group_weekly', _group_weekly_units, after=('refresh_plan', 'all_assignment_refresh'))
+    register_job('weekly_final_refresh', _weekly_final_refresh_units,
+                 hours=[1], weekdays=[0], priority=0, spread=0, after=('refresh_plan',))
+    register_job('all_assignment_refresh', _all_assignment_refresh_units,
+                 hours=[1], weekdays=[0], priority=1, spread=0, after=('weekly_final_refresh',))
+    register_job('weekly_rollover', run=weekly_rollover,
+                 hours=[1], weekdays=[0], priority=1, spread=0, after=('all_assignment_refresh', 'group_weekly'))
 def setup(bot):
     """봇에 명령어 등록"""
     
@@ -1502,7 +1458,7 @@ def setup(bot):
             )
             
             # 데이터베이스에 그룹 정보 저장
-            data = load_data()
+            data = await async_db.load_data()
             if 'studies' not in data:
                 data['studies'] = {}
             if role_name not in data['studies']:
@@ -1515,7 +1471,7 @@ def setup(bot):
             else:
                 data['studies'][role_name]['group_name'] = group_name
             
-            save_data(data)
+            await async_db.save_data(data)
             
             # 봇 알림 채널에 알림 전송
             from common.utils import send_bot_notification
@@ -1563,7 +1519,6 @@ def setup(bot):
         예시: /그룹 과제 생성 링크제출 21기-실전 #제출현황
         """
         from domain.link_submission import (
-            save_group_link_submission_status,
             update_link_submission_status,
             LinkSubmissionView,
         )
@@ -1571,10 +1526,10 @@ def setup(bot):
         # 채널이 지정되지 않았으면 현재 채널 사용
         target_channel = channel if channel else ctx.channel
 
-        data = load_data()
+        studies = await async_db.load_studies()
 
         # 그룹 이름으로 역할 찾기
-        role_name = find_role_by_group_name(group_name, data)
+        role_name = find_role_by_group_name(group_name, studies)
         if not role_name:
             await ctx.send(
                 f"❌ '{group_name}' 그룹을 찾을 수 없습니다.\n💡 `/그룹 목록` 명령어로 등록된 그룹을 확인하세요."
@@ -1582,7 +1537,7 @@ def setup(bot):
             return
 
         # 역할 등록 여부 확인
-        if role_name not in data.get('role_tokens', {}):
+        if not await async_db.get_role_token(role_name):
             await ctx.send(
                 f"❌ '{group_name}' 그룹에 연결된 역할('{role_name}')이 등록되지 않았습니다."
             )
@@ -1609,7 +1564,7 @@ def setup(bot):
         msg = await target_channel.send(embed=embed, view=LinkSubmissionView())
 
         # DB에 저장
-        save_group_link_submission_status(
+        await async_db.save_group_link_submission_status(
             group_name,
             role_name,
             str(target_channel.id),
@@ -1651,13 +1606,13 @@ def setup(bot):
         사용법: /그룹 과제 생성 문제풀이 [그룹명] [채널링크(선택)]
         예시: /그룹 과제 생성 문제풀이 21기-실전 #풀이현황
         """
-        data = load_data()
+        studies = await async_db.load_studies()
 
         # 채널이 지정되지 않았으면 현재 채널 사용
         target_channel = channel if channel else ctx.channel
 
         # 그룹 이름으로 역할 찾기
-        role_name = find_role_by_group_name(group_name, data)
+        role_name = find_role_by_group_name(group_name, studies)
         if not role_name:
             await ctx.send(
                 f"❌ '{group_name}' 그룹을 찾을 수 없습니다.\n💡 `/그룹 목록` 명령어로 등록된 그룹을 확인하세요."
@@ -1665,7 +1620,7 @@ def setup(bot):
             return
 
         # 역할 등록 여부 확인
-        if role_name not in data.get('role_tokens', {}):
+        if not await async_db.get_role_token(role_name):
             await ctx.send(f"❌ '{group_name}' 그룹에 연결된 역할('{role_name}')이 등록되지 않았습니다.")
             return
 
@@ -1690,7 +1645,7 @@ def setup(bot):
         msg = await target_channel.send(embed=embed, view=GroupWeeklyStatusView())
 
         # DB에 저장
-        save_group_weekly_status(
+        await async_db.save_group_weekly_status(
             group_name,
             role_name,
             str(target_channel.id),
@@ -1732,21 +1687,21 @@ def setup(bot):
         사용법: /그룹 과제 생성 문제집 [그룹명] [문제집명] [채널링크(선택)]
         예시: /그룹 과제 생성 문제집 21기-기초 21기-기초-1주차 #과제현황
         """
-        from domain.problem_set import get_problem_set, update_problem_set_status
+        from domain.problem_set import update_problem_set_status
         
         # 채널이 지정되지 않았으면 현재 채널 사용
         target_channel = channel if channel else ctx.channel
         
         # 문제집 확인
-        problem_set = get_problem_set(problem_set_name)
+        problem_set = await async_db.get_problem_set(problem_set_name)
         if not problem_set:
             await ctx.send(f"❌ '{problem_set_name}' 문제집을 찾을 수 없습니다.\n💡 `/문제집 목록` 명령어로 등록된 문제집을 확인하세요.")
             return
         
-        data = load_data()
+        studies = await async_db.load_studies()
         
         # 그룹 이름으로 역할 찾기
-        role_name = find_role_by_group_name(group_name, data)
+        role_name = find_role_by_group_name(group_name, studies)
         if not role_name:
             await ctx.send(
                 f"❌ '{group_name}' 그룹을 찾을 수 없습니다.\n💡 `/그룹 목록` 명령어로 등록된 그룹을 확인하세요."
@@ -1754,12 +1709,12 @@ def setup(bot):
             return
         
         # 역할 등록 여부 확인
-        if role_name not in data.get('role_tokens', {}):
+        if not await async_db.get_role_token(role_name):
             await ctx.send(f"❌ '{group_name}' 그룹에 연결된 역할('{role_name}')이 등록되지 않았습니다.")
             return
         
         # 이미 존재하는지 확인
-        existing = get_group_problem_set_status(group_name, problem_set_name)
+        existing = await async_db.get_group_problem_set_status(group_name, problem_set_name)
         if existing:
             await ctx.send(f"❌ '{group_name}' 그룹의 '{problem_set_name}' 문제집 과제가 이미 존재합니다.")
             return
@@ -1795,7 +1750,7 @@ def setup(bot):
         msg = await target_channel.send(embed=embed, view=view)
         
         # DB에 저장
-        save_group_problem_set_status(
+        await async_db.save_group_problem_set_status(
             group_name,
             problem_set_name,
             role_name,
@@ -1842,21 +1797,21 @@ def setup(bot):
         사용법: /그룹 과제 생성 모의테스트 [그룹명] [모의테스트명] [채널링크(선택)]
         예시: /그룹 과제 생성 모의테스트 21기-기초 2024-기말모의고사 #과제현황
         """
-        from domain.problem_set import get_mock_test, update_mock_test_status
+        from domain.problem_set import update_mock_test_status
         
         # 채널이 지정되지 않았으면 현재 채널 사용
         target_channel = channel if channel else ctx.channel
         
         # 모의테스트 확인
-        mock_test = get_mock_test(mock_test_name)
+        mock_test = await async_db.get_mock_test(mock_test_name)
         if not mock_test:
             await ctx.send(f"❌ '{mock_test_name}' 모의테스트를 찾을 수 없습니다.\n💡 `/모의테스트 목록` 명령어로 등록된 모의테스트를 확인하세요.")
             return
         
-        data = load_data()
+        studies = await async_db.load_studies()
         
         # 그룹 이름으로 역할 찾기
-        role_name = find_role_by_group_name(group_name, data)
+        role_name = find_role_by_group_name(group_name, studies)
         if not role_name:
             await ctx.send(
                 f"❌ '{group_name}' 그룹을 찾을 수 없습니다.\n💡 `/그룹 목록` 명령어로 등록된 그룹을 확인하세요."
@@ -1864,12 +1819,12 @@ def setup(bot):
             return
         
         # 역할 등록 여부 확인
-        if role_name not in data.get('role_tokens', {}):
+        if not await async_db.get_role_token(role_name):
             await ctx.send(f"❌ '{group_name}' 그룹에 연결된 역할('{role_name}')이 등록되지 않았습니다.")
             return
         
         # 이미 존재하는지 확인
-        existing = get_group_mock_test_status(group_name, mock_test_name)
+        existing = await async_db.get_group_mock_test_status(group_name, mock_test_name)
         if existing:
             await ctx.send(f"❌ '{group_name}' 그룹의 '{mock_test_name}' 모의테스트 과제가 이미 존재합니다.")
             return
@@ -1882,12 +1837,12 @@ def setup(bot):
         week_end = week_start + timedelta(days=7, hours=1)
         
         # 모의테스트 문제 수 (get_mock_test가 이미 리스트로 반환함)
-        problem_ids = mock_test['problem_ids'] if isinstance(mock_test['problem_ids'], list) else [int(x) for x in str(mock_test['problem_ids']).split(',') if x.strip()]
+        problem_ids = mock_test['problem_ids']
         total_problems = len(problem_ids)
         
         # DB에만 저장 (메시지는 생성하지 않음)
         # 채널과 메시지 ID는 None으로 저장 (월요일 01시에만 체크)
-        save_group_mock_test_status(
+        await async_db.save_group_mock_test_status(
             group_name,
             mock_test_name,
             role_name,
@@ -1919,8 +1874,8 @@ def setup(bot):
             await ctx.send("❌ 과제 유형은 '링크제출' 또는 '문제풀이'만 가능합니다.")
             return
 
-        data = load_data()
-        role_name = find_role_by_group_name(group_name, data)
+        studies = await async_db.load_studies()
+        role_name = find_role_by_group_name(group_name, studies)
         if not role_name:
             await ctx.send(
                 f"❌ '{group_name}' 그룹을 찾을 수 없습니다.\n💡 `/그룹 목록` 명령어로 등록된 그룹을 확인하세요."
@@ -1956,12 +1911,12 @@ def setup(bot):
                 return
             
             group_name = args.strip()
-            info = get_group_all_assignment_status(group_name)
+            info = await async_db.get_group_all_assignment_status(group_name)
             if not info:
                 await ctx.send(f"❌ '{group_name}' 그룹의 전체과제현황을 찾을 수 없습니다.")
                 return
             
-            delete_group_all_assignment_status(group_name)
+            await async_db.delete_group_all_assignment_status(group_name)
             channel = ctx.guild.get_channel(int(info['channel_id']))
             channel_name = channel.mention if channel else f"<#{info['channel_id']}>"
             await ctx.send(
@@ -1979,12 +1934,12 @@ def setup(bot):
             group_name = parts[0]
             problem_set_name = parts[1]
             
-            info = get_group_problem_set_status(group_name, problem_set_name)
+            info = await async_db.get_group_problem_set_status(group_name, problem_set_name)
             if not info:
                 await ctx.send(f"❌ '{group_name}' 그룹의 '{problem_set_name}' 문제집 과제를 찾을 수 없습니다.")
                 return
             
-            delete_group_problem_set_status(group_name, problem_set_name)
+            await async_db.delete_group_problem_set_status(group_name, problem_set_name)
             channel = ctx.guild.get_channel(int(info['channel_id']))
             channel_name = channel.mention if channel else f"<#{info['channel_id']}>"
             
@@ -2017,12 +1972,12 @@ def setup(bot):
             group_name = parts[0]
             mock_test_name = parts[1]
             
-            info = get_group_mock_test_status(group_name, mock_test_name)
+            info = await async_db.get_group_mock_test_status(group_name, mock_test_name)
             if not info:
                 await ctx.send(f"❌ '{group_name}' 그룹의 '{mock_test_name}' 모의테스트 과제를 찾을 수 없습니다.")
                 return
             
-            delete_group_mock_test_status(group_name, mock_test_name)
+            await async_db.delete_group_mock_test_status(group_name, mock_test_name)
             channel = ctx.guild.get_channel(int(info['channel_id']))
             channel_name = channel.mention if channel else f"<#{info['channel_id']}>"
             
@@ -2048,8 +2003,8 @@ def setup(bot):
         
         # 링크제출, 문제풀이의 경우 기존 로직
         group_name = args
-        data = load_data()
-        role_name = find_role_by_group_name(group_name, data)
+        studies = await async_db.load_studies()
+        role_name = find_role_by_group_name(group_name, studies)
         if not role_name:
             await ctx.send(
                 f"❌ '{group_name}' 그룹을 찾을 수 없습니다.\n💡 `/그룹 목록` 명령어로 등록된 그룹을 확인하세요."
@@ -2057,18 +2012,13 @@ def setup(bot):
             return
 
         if assignment_type == '링크제출':
-            from domain.link_submission import (
-                get_group_link_submission_status,
-                delete_group_link_submission_status,
-            )
-            from common.database import delete_all_link_submissions_by_group
-            info = get_group_link_submission_status(group_name)
+            info = await async_db.get_group_link_submission_status(group_name)
             if not info:
                 await ctx.send(f"❌ '{group_name}' 그룹의 링크 제출 메시지를 찾을 수 없습니다.")
                 return
-            delete_group_link_submission_status(group_name)
+            await async_db.delete_group_link_submission_status(group_name)
             # 해당 그룹의 모든 링크 제출 데이터도 삭제
-            delete_all_link_submissions_by_group(group_name)
+            await async_db.delete_all_link_submissions_by_group(group_name)
             channel = ctx.guild.get_channel(int(info['channel_id']))
             channel_name = channel.mention if channel else f"<#{info['channel_id']}>"
             await ctx.send(
@@ -2079,11 +2029,11 @@ def setup(bot):
             # 전체과제현황이 있으면 즉시 반영 (버튼/컬럼 포함)
             await update_all_assignment_status(group_name, ctx.bot, assignment_type=None)
         elif assignment_type == '문제풀이':
-            info = get_group_weekly_status(group_name)
+            info = await async_db.get_group_weekly_status(group_name)
             if not info:
                 await ctx.send(f"❌ '{group_name}' 그룹의 주간 현황 메시지를 찾을 수 없습니다.")
                 return
-            delete_group_weekly_status(group_name)
+            await async_db.delete_group_weekly_status(group_name)
             channel = ctx.guild.get_channel(int(info['channel_id']))
             channel_name = channel.mention if channel else f"<#{info['channel_id']}>"
             await ctx.send(
@@ -2101,16 +2051,9 @@ def setup(bot):
         
         특정 그룹의 링크제출, 문제풀이, 문제집 과제 현황 메시지 목록을 확인합니다.
         """
-        from common.database import (
-            get_group_weekly_status,
-            get_group_link_submission_status,
-            get_all_group_problem_set_status,
-            get_all_group_mock_test_status,
-            get_group_all_assignment_status,
-        )
         
-        data = load_data()
-        role_name = find_role_by_group_name(group_name, data)
+        studies = await async_db.load_studies()
+        role_name = find_role_by_group_name(group_name, studies)
         if not role_name:
             await ctx.send(
                 f"❌ '{group_name}' 그룹을 찾을 수 없습니다.\n💡 `/그룹 목록` 명령어로 등록된 그룹을 확인하세요."
@@ -2118,17 +2061,15 @@ def setup(bot):
             return
         
         # 링크제출 현황 확인
-        link_status = get_group_link_submission_status(group_name)
+        link_status = await async_db.get_group_link_submission_status(group_name)
         # 문제풀이 현황 확인
-        problem_status = get_group_weekly_status(group_name)
+        problem_status = await async_db.get_group_weekly_status(group_name)
         # 문제집 과제 현황 확인
-        all_problem_sets = get_all_group_problem_set_status()
-        problem_set_statuses = [ps for ps in all_problem_sets if ps['group_name'] == group_name]
+        problem_set_statuses = await async_db.get_group_problem_set_statuses(group_name)
         # 모의테스트 과제 현황 확인
-        all_mock_tests = get_all_group_mock_test_status()
-        mock_test_statuses = [mt for mt in all_mock_tests if mt['group_name'] == group_name]
+        mock_test_statuses = await async_db.get_group_mock_test_statuses(group_name)
         # 전체과제현황 확인
-        all_assignment_status = get_group_all_assignment_status(group_name)
+        all_assignment_status = await async_db.get_group_all_assignment_status(group_name)
         
         if not link_status and not problem_status and not problem_set_statuses and not mock_test_statuses and not all_assignment_status:
             await ctx.send(f"❌ '{group_name}' 그룹에 생성된 과제가 없습니다.")
@@ -2291,17 +2232,9 @@ def setup(bot):
         사용법: /그룹 과제 전체현황 [그룹명] [채널링크(선택)]
         예시: /그룹 과제 전체현황 21기-기초 #풀이현황
         """
-        from common.database import (
-            get_group_all_assignment_status,
-            save_group_all_assignment_status,
-            get_group_link_submission_status,
-            get_group_weekly_status,
-            get_all_group_problem_set_status,
-            get_all_group_mock_test_status,
-        )
         
-        data = load_data()
-        role_name = find_role_by_group_name(group_name, data)
+        studies = await async_db.load_studies()
+        role_name = find_role_by_group_name(group_name, studies)
         if not role_name:
             await ctx.send(
                 f"❌ '{group_name}' 그룹을 찾을 수 없습니다.\n💡 `/그룹 목록` 명령어로 등록된 그룹을 확인하세요."
@@ -2319,7 +2252,7 @@ def setup(bot):
         week_end = week_start + timedelta(days=7, hours=1)
         
         # 기존 전체과제현황 확인
-        existing_status = get_group_all_assignment_status(group_name)
+        existing_status = await async_db.get_group_all_assignment_status(group_name)
         
         if existing_status:
             # 기존 메시지가 있으면 갱신
@@ -2328,12 +2261,10 @@ def setup(bot):
         else:
             # 기존 메시지가 없으면 새로 생성
             # 과제가 하나라도 있는지 확인
-            link_status = get_group_link_submission_status(group_name)
-            problem_status = get_group_weekly_status(group_name)
-            all_problem_sets = get_all_group_problem_set_status()
-            problem_set_statuses = [ps for ps in all_problem_sets if ps['group_name'] == group_name]
-            all_mock_tests = get_all_group_mock_test_status()
-            mock_test_statuses = [mt for mt in all_mock_tests if mt['group_name'] == group_name]
+            link_status = await async_db.get_group_link_submission_status(group_name)
+            problem_status = await async_db.get_group_weekly_status(group_name)
+            problem_set_statuses = await async_db.get_group_problem_set_statuses(group_name)
+            mock_test_statuses = await async_db.get_group_mock_test_statuses(group_name)
             
             # 과제가 하나도 없으면 생성하지 않음
             if not link_status and not problem_status and not problem_set_statuses and not mock_test_statuses:
@@ -2369,7 +2300,7 @@ def setup(bot):
             msg = await target_channel.send(embed=embed, view=view)
             
             # DB에 저장
-            save_group_all_assignment_status(
+            await async_db.save_group_all_assignment_status(
                 group_name,
                 role_name,
                 str(target_channel.id),
@@ -2390,9 +2321,8 @@ def setup(bot):
     @commands.has_permissions(administrator=True)
     async def group_weekly_status_list(ctx):
         """생성된 그룹 주간 현황 메시지 목록 확인 (관리자 전용)"""
-        from common.database import get_all_group_weekly_status
         
-        all_status = get_all_group_weekly_status()
+        all_status = await async_db.get_all_group_weekly_status()
         
         if not all_status:
             await ctx.send("❌ 생성된 주간 현황 메시지가 없습니다.")
@@ -2443,15 +2373,14 @@ def setup(bot):
         """그룹 주간 현황 메시지 삭제 (관리자 전용)
         - DB에서 정보만 삭제 (메시지는 채널에 그대로 남음)
         """
-        from common.database import get_group_weekly_status, delete_group_weekly_status
         
-        info = get_group_weekly_status(group_name)
+        info = await async_db.get_group_weekly_status(group_name)
         if not info:
             await ctx.send(f"❌ '{group_name}' 그룹의 주간 현황 메시지를 찾을 수 없습니다.")
             return
         
         # DB에서 삭제
-        delete_group_weekly_status(group_name)
+        await async_db.delete_group_weekly_status(group_name)
         
         channel = ctx.guild.get_channel(int(info['channel_id']))
         channel_name = channel.mention if channel else f"<#{info['channel_id']}>"
@@ -2461,25 +2390,73 @@ def setup(bot):
             f"📝 메시지는 {channel_name}에 그대로 남아있습니다."
         )
 
+    @group_group.command(name='기록')
+    @commands.has_permissions(administrator=True)
+    async def group_snapshot_history(ctx, *, group_name: str):
+        """지난 주간 기록을 합친 멤버별 누적 순위 (관리자 전용)
+        - 저장된 기록만 사용하므로 solved.ac를 다시 조회하지 않음
+        """
+        # 입력한 이름을 등록된 그룹 이름으로 맞춤 (대소문자/공백 무시)
+        studies = await async_db.load_studies()
+        role_name = find_role_by_group_name(group_name, studies)
+        if role_name:
+            group_name = studies[role_name].get('group_name') or role_name
+
+        totals = await async_db.get_season_totals(group_name)
+        if not totals:
+            await ctx.send(f"❌ '{group_name}' 그룹의 주간 기록이 없습니다.\n💡 주간 현황이 종료될 때 마지막 결과가 기록됩니다.")
+            return
+        weeks = await async_db.get_snapshot_weeks(group_name)
+
+        lines = []
+        for i, member_total in enumerate(totals[:25], 1):
+            rank_label = {1: "👑", 2: "🥈", 3: "🥉"}.get(i, f"{i}.")
+            member = ctx.guild.get_member(int(member_total['user_id'])) if ctx.guild else None
+            boj_handle = member_total['boj_handle']
+            if member:
+                name_display = f"{member.display_name} ({boj_handle})" if boj_handle else member.display_name
+            else:
+                name_display = boj_handle or member_total['user_id']
+
+            line = (
+                f"{rank_label} {name_display} - {member_total['solved_total']}개 "
+                f"({member_total['weeks']}주, 최고 {member_total['best_week']}개)"
+            )
+            if member_total['set_total']:
+                line += f" · 문제집 {member_total['set_solved']}/{member_total['set_total']}"
+            lines.append(line)
+        if len(totals) > 25:
+            lines.append(f"\n... 외 {len(totals) - 25}명")
+
+        embed = discord.Embed(
+            title=f"🏆 '{group_name}' 그룹 누적 기록",
+            description=(
+                f"**기록된 주:** {len(weeks)}주 ({weeks[-1]} ~ {weeks[0]})\n\n"
+                + "\n".join(lines)
+            ),
+            color=discord.Color.gold(),
+        )
+        await ctx.send(embed=embed)
+
     @group_group.command(name='문제풀이현황')
     @commands.has_permissions(administrator=True)
     async def group_problem_status(ctx, *, group_name: str):
         """특정 그룹 멤버들의 최근 7일(월~일) 백준 문제풀이 현황 (관리자 전용)"""
-        data = load_data()
+        studies = await async_db.load_studies()
         
         # 그룹 이름으로 역할 찾기
-        role_name = find_role_by_group_name(group_name, data)
+        role_name = find_role_by_group_name(group_name, studies)
         if not role_name:
             await ctx.send(f"❌ '{group_name}' 그룹을 찾을 수 없습니다.\n💡 `/그룹 목록` 명령어로 등록된 그룹을 확인하세요.")
             return
         
         # 역할이 등록되어 있는지 확인
-        if role_name not in data.get('role_tokens', {}):
+        if not await async_db.get_role_token(role_name):
             await ctx.send(f"❌ '{group_name}' 그룹에 연결된 역할('{role_name}')이 등록되지 않았습니다.")
             return
         
         # 역할을 가진 유저 목록 가져오기
-        users = get_role_users(role_name)
+        users = await async_db.get_role_users(role_name)
         
         if not users:
             await ctx.send(f"❌ '{group_name}' 그룹에 멤버가 없습니다.")
@@ -2509,23 +2486,14 @@ def setup(bot):
                 })
                 continue
             
-            # 백준에서 최근 7일간 해결한 문제 수 조회
-            try:
-                solved_data = await get_weekly_solved_count(boj_handle, monday, sunday)
-                results.append({
-                    'username': username,
-                    'boj_handle': boj_handle,
-                    'solved_count': solved_data['count'],
-                    'problems': solved_data.get('problems', []),
-                    'status': '✅' if solved_data['count'] > 0 else '⚠️'
-                })
-            except Exception as e:
-                results.append({
-                    'username': username,
-                    'boj_handle': boj_handle,
-                    'solved_count': 0,
-                    'status': f'❌ 오류: {str(e)[:30]}'
-                })
+            results.append({
+                'username': username,
+                'boj_handle': boj_handle,
+                'solved_count': 0
+            })
+        
+        # 백준에서 최근 7일간 해결한 문제 수 조회 (멤버별 병렬)
+        await fetch_weekly_counts(results, monday, sunday)
         
         # 결과 정렬 (해결한 문제 수 많은 순)
         results.sort(key=lambda x: x['solved_count'], reverse=True)
@@ -2593,21 +2561,21 @@ def setup(bot):
         """특정 그룹 멤버들의 주간 백준 문제풀이 현황 - 백준 직접 크롤링 (관리자 전용)
         기간: 월요일 00시 ~ 다음 주 월요일 01시
         """
-        data = load_data()
+        studies = await async_db.load_studies()
         
         # 그룹 이름으로 역할 찾기
-        role_name = find_role_by_group_name(group_name, data)
+        role_name = find_role_by_group_name(group_name, studies)
         if not role_name:
             await ctx.send(f"❌ '{group_name}' 그룹을 찾을 수 없습니다.\n💡 `/그룹 목록` 명령어로 등록된 그룹을 확인하세요.")
             return
         
         # 역할이 등록되어 있는지 확인
-        if role_name not in data.get('role_tokens', {}):
+        if not await async_db.get_role_token(role_name):
             await ctx.send(f"❌ '{group_name}' 그룹에 연결된 역할('{role_name}')이 등록되지 않았습니다.")
             return
         
         # 역할을 가진 유저 목록 가져오기
-        users = get_role_users(role_name)
+        users = await async_db.get_role_users(role_name)
         
         if not users:
             await ctx.send(f"❌ '{group_name}' 그룹에 멤버가 없습니다.")
@@ -2730,9 +2698,9 @@ def setup(bot):
     @commands.has_permissions(administrator=True)
     async def group_submissions(ctx, *, role_name: str):
         """그룹 제출 현황 확인 (관리자 전용)"""
-        from common.utils import load_data
         
-        data = load_data()
+        studies = await async_db.load_studies()
+        users = await async_db.load_users()
         
         # 그룹(역할) 확인
         role = discord.utils.get(ctx.guild.roles, name=role_name)
@@ -2748,7 +2716,6 @@ def setup(bot):
             return
         
         # 과제 정보 가져오기
-        studies = data.get('studies', {})
         study_data = studies.get(role_name, {})
         assignments = study_data.get('assignments', {})
         
@@ -2765,7 +2732,7 @@ def setup(bot):
         # 각 멤버별 제출 현황
         for member in members_with_role[:20]:  # 최대 20명
             user_id = str(member.id)
-            user_data = data.get('users', {}).get(user_id, {})
+            user_data = users.get(user_id, {})
             submissions = user_data.get('submissions', {})
             
             submission_info = []
@@ -2801,8 +2768,7 @@ def setup(bot):
     @commands.has_permissions(administrator=True)
     async def group_list(ctx):
         """등록된 그룹 목록 확인 (관리자 전용)"""
-        data = load_data()
-        studies = data.get('studies', {})
+        studies = await async_db.load_studies()
         
         if not studies:
             await ctx.send("❌ 등록된 그룹이 없습니다.")
@@ -2839,8 +2805,7 @@ def setup(bot):
         
         사용법: /그룹 정보
         """
-        data = load_data()
-        studies = data.get('studies', {})
+        studies = await async_db.load_studies()
         
         if not studies:
             await ctx.send("❌ 등록된 그룹이 없습니다.")
@@ -2871,7 +2836,7 @@ def setup(bot):
     @commands.has_permissions(administrator=True)
     async def group_modify(ctx, role_name: str, *, new_group_name: str):
         """그룹 이름 수정 (관리자 전용)"""
-        data = load_data()
+        data = await async_db.load_data()
         
         if role_name not in data.get('studies', {}):
             await ctx.send(f"❌ '{role_name}' 그룹을 찾을 수 없습니다.")
@@ -2898,7 +2863,7 @@ def setup(bot):
         
         # 데이터베이스 업데이트
         data['studies'][role_name]['group_name'] = new_group_name
-        save_data(data)
+        await async_db.save_data(data)
         
         await ctx.send(f"✅ 그룹 이름이 '{old_group_name}'에서 '{new_group_name}'으로 변경되었습니다.")
 
@@ -2906,15 +2871,15 @@ def setup(bot):
     @commands.has_permissions(administrator=True)
     async def group_delete(ctx, role_name: str):
         """그룹 삭제 (관리자 전용) - 데이터만 삭제, 카테고리는 수동 삭제"""
-        data = load_data()
+        studies = await async_db.load_studies()
         
-        if role_name not in data.get('studies', {}):
+        if role_name not in studies:
             await ctx.send(f"❌ '{role_name}' 그룹을 찾을 수 없습니다.")
             return
         
         # 그룹 정보 확인
-        group_name = data['studies'][role_name].get('group_name', role_name)
-        assignments = data['studies'][role_name].get('assignments', {})
+        group_name = studies[role_name].get('group_name', role_name)
+        assignments = studies[role_name].get('assignments', {})
         assignment_count = len(assignments)
         
         # 확인 View 생성
@@ -2939,15 +2904,15 @@ def setup(bot):
     @commands.has_permissions(administrator=True)
     async def group_delete_full(ctx, role_name: str):
         """그룹 전체 삭제 (관리자 전용) - 데이터, 카테고리, 채널 모두 삭제"""
-        data = load_data()
+        studies = await async_db.load_studies()
         
-        if role_name not in data.get('studies', {}):
+        if role_name not in studies:
             await ctx.send(f"❌ '{role_name}' 그룹을 찾을 수 없습니다.")
             return
         
         # 그룹 정보 확인
-        group_name = data['studies'][role_name].get('group_name', role_name)
-        assignments = data['studies'][role_name].get('assignments', {})
+        group_name = studies[role_name].get('group_name', role_name)
+        assignments = studies[role_name].get('assignments', {})
         assignment_count = len(assignments)
         
         # 카테고리 확인
@@ -3007,10 +2972,8 @@ def setup(bot):
             
             role_name = self.select.values[0]
             
-            from common.utils import load_data
-            data = load_data()
+            studies = await async_db.load_studies()
             
-            studies = data.get('studies', {})
             study_data = studies.get(role_name)
             if not study_data:
                 await interaction.response.send_message("❌ 그룹 데이터를 찾을 수 없습니다.", ephemeral=True)
@@ -3023,7 +2986,7 @@ def setup(bot):
             # 소속 인원 (discord id(BOJ 핸들) 형식)
             members = [m for m in guild.members if role in m.roles] if role else []
             member_count = len(members)
-            users_data = data.get('users', {})
+            users_data = await async_db.load_users()
             
             # 과제 현황 (진행중 / 시작 전 / 종료)
             assignments = study_data.get('assignments', {})
@@ -3530,10 +3493,9 @@ def setup(bot):
                 await interaction.response.send_message("❌ 이 버튼은 명령어를 실행한 사용자만 사용할 수 있습니다.", ephemeral=True)
                 return
             
-            from common.utils import load_data, save_data
-            from common.database import get_study_assignments, delete_assignment
+            from common.database import get_study_assignments
             
-            data = load_data()
+            data = await async_db.load_data()
             
             if self.role_name not in data.get('studies', {}):
                 await interaction.response.send_message("❌ 그룹을 찾을 수 없습니다.", ephemeral=True)
@@ -3546,13 +3508,13 @@ def setup(bot):
             # DB에서 과제 삭제
             for assignment_id in assignment_ids:
                 try:
-                    delete_assignment(assignment_id)
+                    await async_db.delete_assignment(assignment_id)
                 except Exception as e:
                     print(f"[그룹 삭제] 과제 삭제 오류 (무시 가능): {assignment_id} - {e}")
             
             # 데이터에서 그룹 삭제
             del data['studies'][self.role_name]
-            save_data(data)
+            await async_db.save_data(data)
             
             # 봇 알림 채널에 알림 전송
             from common.utils import send_bot_notification
@@ -3606,10 +3568,9 @@ def setup(bot):
             
             await interaction.response.defer(ephemeral=True)
             
-            from common.utils import load_data, save_data
-            from common.database import get_study_assignments, delete_assignment
+            from common.database import get_study_assignments
             
-            data = load_data()
+            data = await async_db.load_data()
             
             if self.role_name not in data.get('studies', {}):
                 await interaction.followup.send("❌ 그룹을 찾을 수 없습니다.", ephemeral=True)
@@ -3650,13 +3611,13 @@ def setup(bot):
             # DB에서 과제 삭제
             for assignment_id in assignment_ids:
                 try:
-                    delete_assignment(assignment_id)
+                    await async_db.delete_assignment(assignment_id)
                 except Exception as e:
                     print(f"[그룹 전체삭제] 과제 삭제 오류 (무시 가능): {assignment_id} - {e}")
             
             # 데이터에서 그룹 삭제
             del data['studies'][self.role_name]
-            save_data(data)
+            await async_db.save_data(data)
             
             # 봇 알림 채널에 알림 전송
             from common.utils import send_bot_notification
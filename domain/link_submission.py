@@ -2,28 +2,20 @@
 그룹 주간 링크 제출 관리 명령어
 """
 import discord
-from discord.ext import commands, tasks
-from datetime import datetime, timedelta, time
-from common.utils import load_data, get_kst_now, ensure_kst
-from common.database import (
-    get_role_users,
-    save_group_link_submission_status,
-    get_group_link_submission_status,
-    get_group_link_submission_status_by_message,
-    get_all_group_link_submission_status,
-    delete_group_link_submission_status,
-    save_link_submission,
-    get_link_submissions,
-    get_user_link_submission,
-    get_user_roles,
-    get_user,
-)
-from discord.ext import tasks
-
-def find_role_by_group_name(group_name: str, data: dict) -> str:
-    """그룹 이름으로 역할 이름 찾기 (대소문자/공백 무시)"""
+from discord.ext import commands
+from datetime import datetime, timedelta
+from functools import partial
+from common.utils import get_kst_now, ensure_kst
+from common.database import get_user
+from common import async_db
+from common.message_render import edit_if_changed
+from common.refresh_queue import request_refresh
+from common.scheduler import WorkItem, register_job
+from common.refresh_plan import get_refresh_plan
+
+def find_role_by_group_name(group_name: str, studies: dict) -> str:
+    """그룹 이름으로 역할 이름 찾기 (대소문자/공백 무시, studies는 load_studies() 결과)"""
     target = (group_name or "").strip().lower()
-    studies = data.get('studies', {})
     for role_name, study_data in studies.items():
         stored_group = (study_data.get('group_name') or role_name or "").strip().lower()
         stored_role = (role_name or "").strip().lower()
@@ -36,9 +28,9 @@ def find_role_by_group_name(group_name: str, data: dict) -> str:
 _bot_for_link_submission = None
 
 
-async def update_link_submission_status(group_name: str, bot_instance):
-    """특정 그룹의 주간 링크 제출 현황 메시지 갱신 (기존 메시지 편집)"""
-    status_info = get_group_link_submission_status(group_name)
+async def update_link_submission_status(group_name: str, bot_instance, plan=None, force: bool = False):
+    """특정 그룹의 주간 링크 제출 현황 메시지 갱신 (기존 메시지 편집, plan: 자동 갱신의 조회 계획, force: 갱신 버튼처럼 내용이 같아도 편집)"""
+    status_info = await async_db.get_group_link_submission_status(group_name)
     if not status_info:
         return
 
@@ -53,8 +45,10 @@ async def update_link_submission_status(group_name: str, bot_instance):
     week_end = ensure_kst(week_end)
 
     now = get_kst_now()  # 한국 시간 사용
+    # 자동 갱신은 예정된 실행 시각 기준으로 기간 확인 (재시작 후 늦게 보충된 마지막 크롤링도 처리)
+    as_of = plan.slot if plan else now
     # 기간 밖이면 갱신하지 않음 (단, 월요일 01시 정각은 마지막 크롤링 허용)
-    if not (week_start <= now <= week_end + timedelta(minutes=5)):
+    if not (week_start <= as_of <= week_end + timedelta(minutes=5)):
         return
 
     channel = bot_instance.get_channel(channel_id)
@@ -64,14 +58,11 @@ async def update_link_submission_status(group_name: str, bot_instance):
     try:
         message = await channel.fetch_message(message_id)
     except discord.NotFound:
-        delete_group_link_submission_status(group_name)
+        await async_db.delete_group_link_submission_status(group_name)
         return
 
-    # 최신 데이터 로드
-    data = load_data()
-
     # 역할을 가진 유저 목록 가져오기
-    users = get_role_users(role_name)
+    users = await async_db.get_role_users(role_name)
     if not users:
         embed = discord.Embed(
             title=f"📝 '{group_name}' 그룹 풀이 제출",
@@ -82,12 +73,12 @@ async def update_link_submission_status(group_name: str, bot_instance):
             ),
             color=discord.Color.blue(),
         )
-        await message.edit(embed=embed, view=LinkSubmissionView())
+        await edit_if_changed(message, embed, view=LinkSubmissionView(), force=force)
         return
 
     # 링크 제출 데이터 가져오기
     week_start_str = week_start.isoformat()
-    submissions = get_link_submissions(group_name, week_start_str)
+    submissions = await async_db.get_link_submissions(group_name, week_start_str)
 
     # 유저별 제출 정보 매핑
     submission_map = {}
@@ -185,7 +176,7 @@ async def update_link_submission_status(group_name: str, bot_instance):
     )
 
     # DB에 마지막 갱신 시간 저장
-    save_group_link_submission_status(
+    await async_db.save_group_link_submission_status(
         group_name,
         role_name,
         str(channel_id),
@@ -195,22 +186,26 @@ async def update_link_submission_status(group_name: str, bot_instance):
         now.isoformat(),
     )
 
-    await message.edit(embed=embed, view=LinkSubmissionView())
+    await edit_if_changed(message, embed, view=LinkSubmissionView(), force=force)
     
     # 전체과제현황도 갱신 (링크제출 부분만)
     from domain.channel import update_all_assignment_status
-    await update_all_assignment_status(group_name, bot_instance, assignment_type="링크제출")
+    await update_all_assignment_status(group_name, bot_instance, assignment_type="링크제출", plan=plan, force=force)
 
 
-@tasks.loop(time=[time(hour=h, minute=0) for h in range(0, 24)])
-async def link_submission_auto_update():
-    """매시 정각 링크 제출 현황 자동 갱신"""
-    global _bot_for_link_submission
+async def _link_submission_units(slot: datetime):
+    """매시 링크 제출 현황 자동 갱신 (그룹별 실행 단위)"""
     if not _bot_for_link_submission:
-        return
+        return []
 
-    now = get_kst_now()  # 한국 시간 사용
-    for info in get_all_group_link_submission_status():
+    # 월요일 01시는 weekly_final_refresh(domain/channel.py)에서 처리하므로 여기서는 건너뜀
+    from domain.channel import is_weekly_rollover_slot
+    if is_weekly_rollover_slot(slot):
+        return []
+
+    plan = get_refresh_plan(slot)
+    units = []
+    for info in await async_db.get_all_group_link_submission_status():
         week_start = datetime.fromisoformat(info['week_start'])
         week_end = datetime.fromisoformat(info['week_end'])
         
@@ -218,13 +213,13 @@ async def link_submission_auto_update():
         week_start = ensure_kst(week_start)
         week_end = ensure_kst(week_end)
 
-        # 월요일 01시는 all_assignment_auto_create에서 처리하므로 여기서는 건너뜀
-        if now.weekday() == 0 and now.hour == 1 and now.minute == 0:
-            continue
-        
         # 기간 내: 정상 크롤링
-        if week_start <= now < week_end:
-            await update_link_submission_status(info['group_name'], _bot_for_link_submission)
+        if week_start <= slot < week_end:
+            units.append(WorkItem(
+                info['group_name'],
+                partial(update_link_submission_status, info['group_name'], _bot_for_link_submission, plan),
+            ))
+    return units
 
 
 class LinkSubmissionView(discord.ui.View):
@@ -248,7 +243,7 @@ class LinkSubmissionView(discord.ui.View):
     )
     async def refresh_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         # 메시지 기준으로 그룹 찾기
-        info = get_group_link_submission_status_by_message(
+        info = await async_db.get_group_link_submission_status_by_message(
             str(interaction.channel.id), str(interaction.message.id)
         )
         if not info:
@@ -282,17 +277,18 @@ class LinkSubmissionView(discord.ui.View):
                 )
             return
 
-        if not interaction.response.is_done():
-            await interaction.response.defer(ephemeral=True)
-        await update_link_submission_status(info['group_name'], interaction.client)
-        await interaction.followup.send("✅ 링크 제출 현황이 갱신되었습니다.", ephemeral=True)
+        # 갱신은 백그라운드 큐에서 실행 (같은 메시지 요청은 하나로 합침)
+        async def refresh():
+            await update_link_submission_status(info['group_name'], interaction.client, force=True)
+
+        await request_refresh(interaction, "링크제출", refresh, "✅ 링크 제출 현황이 갱신되었습니다.")
 
     @discord.ui.button(
         label="제출", emoji="📝", style=discord.ButtonStyle.primary, custom_id="link_submission_submit"
     )
     async def submit_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         # 메시지 기준으로 그룹 찾기
-        info = get_group_link_submission_status_by_message(
+        info = await async_db.get_group_link_submission_status_by_message(
             str(interaction.channel.id), str(interaction.message.id)
         )
         if not info:
@@ -328,9 +324,8 @@ class LinkSubmissionView(discord.ui.View):
 
         # 사용자가 속한 그룹 확인
         user_id = str(interaction.user.id)
-        user_roles = get_user_roles(user_id)
-        data = load_data()
-        studies = data.get('studies', {})
+        user_roles = await async_db.get_user_roles(user_id)
+        studies = await async_db.load_studies()
 
         # 사용자가 속한 그룹 목록 생성
         available_groups = []
@@ -354,7 +349,7 @@ class LinkSubmissionView(discord.ui.View):
 
         # 기존 제출 데이터 가져오기
         week_start_str = week_start.isoformat()
-        existing_submission = get_user_link_submission(
+        existing_submission = await async_db.get_user_link_submission(
             info['group_name'], user_id, week_start_str
         )
         existing_links = existing_submission['links'] if existing_submission else []
@@ -408,7 +403,7 @@ class LinkSubmissionModal(discord.ui.Modal, title="링크 제출"):
             return
 
         # 링크 저장
-        save_link_submission(self.group_name, user_id, self.week_start, links)
+        await async_db.save_link_submission(self.group_name, user_id, self.week_start, links)
 
         # 메시지 갱신
         await update_link_submission_status(self.group_name, interaction.client)
@@ -439,12 +434,11 @@ def register_link_submission_views(bot):
         print(f"[ERROR] 링크 제출 persistent view 등록 실패: {e}")
 
 
-def start_link_submission_scheduler(bot):
-    """링크 제출 자동 갱신 스케줄러 시작"""
+def register_scheduled_jobs(bot):
+    """링크 제출 자동 갱신 작업 등록"""
     global _bot_for_link_submission
     _bot_for_link_submission = bot
-    if not link_submission_auto_update.is_running():
-        link_submission_auto_update.start()
+    register_job('link_submission', _link_submission_units, after=('refresh_plan',))
 
 
 def setup(bot):
@@ -2,36 +2,24 @@
 문제집 및 모의테스트 관리 명령어
 """
 import discord
-from discord.ext import commands, tasks
-from typing import List
-from datetime import datetime, timedelta, time
-from common.database import (
-    create_problem_set,
-    get_problem_set,
-    get_all_problem_sets,
-    update_problem_set,
-    delete_problem_set,
-    create_mock_test,
-    get_mock_test,
-    get_all_mock_tests,
-    update_mock_test,
-    delete_mock_test,
-    get_role_users,
-    get_user,
-    save_group_problem_set_status,
-    get_group_problem_set_status,
-    get_all_group_problem_set_status,
-    delete_group_problem_set_status,
-    save_group_mock_test_status,
-    get_group_mock_test_status,
-    get_all_group_mock_test_status,
-    delete_group_mock_test_status,
-)
-from common.utils import load_data, get_kst_now, ensure_kst
+from discord.ext import commands
+from typing import Dict, List, Optional
+from datetime import datetime, timedelta
+from functools import partial
+from common.database import get_user
+from common.utils import get_kst_now, ensure_kst
 from domain.channel import find_role_by_group_name
-from common.boj_utils import get_user_solved_problems_from_solved_ac, check_problems_individual_queries, check_problems_individual_queries
+from common.boj_utils import get_user_solved_problems_from_solved_ac, get_user_solved_count, check_problems_individual_queries, check_problems_individual_queries
 from common.utils import send_bot_notification
+from common.problem_meta import warm_problem_metadata
+from common.fanout import gather_members
+from common.solved_index import load_solved_index
 from common.logger import get_logger
+from common import async_db
+from common.message_render import edit_if_changed
+from common.refresh_queue import request_refresh
+from common.scheduler import WorkItem, register_job, submit
+from common.refresh_plan import get_refresh_plan, planned_fetch_time, planned_solved_count, planned_solved_problems
 
 logger = get_logger()
 
@@ -42,9 +30,48 @@ _bot_for_problem_set = None
 _bot_for_mock_test = None
 
 
-async def update_problem_set_status(group_name: str, problem_set_name: str, bot_instance):
-    """문제집 과제 현황 메시지 갱신"""
-    status_info = get_group_problem_set_status(group_name, problem_set_name)
+async def _fetch_member_progress(boj_handle: str, problem_ids: List[int], previous: Optional[Dict], plan=None):
+    """
+    멤버 한 명의 문제집 해결 현황 (바뀐 멤버만 크롤링)
+
+    이전 진행 상황이 같은 핸들로 기록되어 있으면
+    - 문제집을 모두 풀었으면 요청 없이 그대로 사용
+    - solvedCount(히스토리 캐시)가 기록 당시와 같으면 그대로 사용
+    나머지 경우에만 solved.ac에서 문제집 문제를 다시 확인한다.
+    (자동 갱신의 조회 계획(plan)이 있으면 solvedCount와 해결한 문제를 계획 결과에서 사용)
+
+    Returns:
+        (해결한 문제 집합, 관측한 solvedCount, 다시 크롤링했는지)
+    """
+    usable = previous is not None and previous['boj_handle'] == boj_handle
+    previous_solved = set(previous['solved_problems']) & set(problem_ids) if usable else set()
+    if usable and previous['observed_count'] is not None and previous_solved >= set(problem_ids):
+        return previous_solved, previous['observed_count'], False
+    
+    observed_count = await planned_solved_count(plan, boj_handle)
+    if observed_count is None:
+        try:
+            observed_count = await get_user_solved_count(boj_handle)
+        except Exception as e:
+            logger.warning(f"[문제집 갱신] {boj_handle} - solvedCount 조회 실패: {e}")
+            observed_count = None
+    if usable and observed_count is not None and observed_count == previous['observed_count']:
+        return previous_solved, observed_count, False
+    
+    solved_problems = await planned_solved_problems(plan, boj_handle, problem_ids)
+    # 해결 기록은 사라지지 않으므로 이전 결과와 합침
+    solved_set = (set(solved_problems) & set(problem_ids)) | previous_solved
+    if observed_count is not None:
+        # 크롤링이 일부 실패했을 수 있으므로, 인덱스가 이 solvedCount까지 빠짐없을 때만 확인된 기록으로 남김
+        index = await async_db.run_read(load_solved_index, boj_handle)
+        if index is None or not index.is_up_to_date(observed_count):
+            observed_count = None
+    return solved_set, observed_count, True
+
+
+async def update_problem_set_status(group_name: str, problem_set_name: str, bot_instance, plan=None, force: bool = False):
+    """문제집 과제 현황 메시지 갱신 (plan: 자동 갱신의 조회 계획, force: 갱신 버튼처럼 내용이 같아도 편집)"""
+    status_info = await async_db.get_group_problem_set_status(group_name, problem_set_name)
     if not status_info:
         return
     
@@ -59,8 +86,10 @@ async def update_problem_set_status(group_name: str, problem_set_name: str, bot_
     week_end = ensure_kst(week_end)
     
     now = get_kst_now()
+    # 자동 갱신은 예정된 실행 시각 기준으로 기간 확인 (재시작 후 늦게 보충된 마지막 크롤링도 처리)
+    as_of = plan.slot if plan else now
     # 기간 밖이면 갱신하지 않음 (단, 월요일 01시 정각은 마지막 크롤링 허용)
-    if not (week_start <= now <= week_end + timedelta(minutes=5)):
+    if not (week_start <= as_of <= week_end + timedelta(minutes=5)):
         return
     
     channel = bot_instance.get_channel(channel_id)
@@ -70,11 +99,11 @@ async def update_problem_set_status(group_name: str, problem_set_name: str, bot_
     try:
         message = await channel.fetch_message(message_id)
     except discord.NotFound:
-        delete_group_problem_set_status(group_name, problem_set_name)
+        await async_db.delete_group_problem_set_status(group_name, problem_set_name)
         return
     
     # 문제집 정보 가져오기
-    problem_set = get_problem_set(problem_set_name)
+    problem_set = await async_db.get_problem_set(problem_set_name)
     if not problem_set:
         return
     
@@ -82,7 +111,7 @@ async def update_problem_set_status(group_name: str, problem_set_name: str, bot_
     total_problems = len(problem_ids)
     
     # 그룹 멤버 가져오기
-    users = get_role_users(role_name)
+    users = await async_db.get_role_users(role_name)
     if not users:
         embed = discord.Embed(
             title=f"📚 '{problem_set_name}' 문제집 과제",
@@ -95,7 +124,7 @@ async def update_problem_set_status(group_name: str, problem_set_name: str, bot_
             ),
             color=discord.Color.blue(),
         )
-        await message.edit(embed=embed, view=ProblemSetStatusView(group_name, problem_set_name))
+        await edit_if_changed(message, embed, view=ProblemSetStatusView(group_name, problem_set_name), force=force)
         return
     
     # solved.ac 서버 응답 확인
@@ -107,7 +136,8 @@ async def update_problem_set_status(group_name: str, problem_set_name: str, bot_
         server_error_message = "⚠️ **solved.ac 서버 응답 없음** - 나중에 다시 시도해주세요."
         logger.warning(f"[문제집 갱신] solved.ac 서버 응답 없음: {group_name} - {problem_set_name}")
     
-    # 각 멤버의 해결 현황 조회
+    # 각 멤버의 해결 현황 조회 (solvedCount가 그대로인 멤버는 저장된 진행 상황 사용)
+    progress = await async_db.get_problem_set_progress(group_name, problem_set_name)
     results = []
     for user_info in users:
         user_id = user_info['user_id']
@@ -116,6 +146,7 @@ async def update_problem_set_status(group_name: str, problem_set_name: str, bot_
         
         if not boj_handle:
             results.append({
+                'user_id': user_id,
                 'username': username,
                 'boj_handle': None,
                 'solved_count': 0,
@@ -128,6 +159,7 @@ async def update_problem_set_status(group_name: str, problem_set_name: str, bot_
         # 서버 응답 없으면 조회 건너뛰기
         if not server_available:
             results.append({
+                'user_id': user_id,
                 'username': username,
                 'boj_handle': boj_handle,
                 'solved_count': 0,
@@ -137,45 +169,62 @@ async def update_problem_set_status(group_name: str, problem_set_name: str, bot_
             })
             continue
         
-        try:
-            # solved.ac에서 해결한 문제 목록 가져오기
-            solved_problems = await get_user_solved_problems_from_solved_ac(boj_handle, target_problems=problem_ids)
-            solved_set = set(solved_problems)
-            
-            # 문제집 문제 중 해결한 문제 수
-            solved_count = len([pid for pid in problem_ids if pid in solved_set])
-            
-            # 안 푼 문제 번호 찾기
-            unsolved_problems = [pid for pid in problem_ids if pid not in solved_set]
-            
-            results.append({
-                'username': username,
-                'boj_handle': boj_handle,
-                'solved_count': solved_count,
-                'total': total_problems,
-                'unsolved_problems': unsolved_problems,
-                'status': '✅' if solved_count == total_problems else '📝'
-            })
-        except Exception as e:
-            logger.error(f"문제집 과제 현황 조회 오류 ({boj_handle}): {e}", exc_info=True)
-            results.append({
-                'username': username,
+        results.append({
+            'user_id': user_id,
+            'username': username,
+            'boj_handle': boj_handle,
+            'solved_count': 0,
+            'total': total_problems,
+            'unsolved_problems': problem_ids.copy(),
+            'status': '❌'
+        })
+    
+    # 서버 응답이 없으면 조회하지 않음 (위에서 상태만 표시)
+    fetched = await gather_members(
+        results if server_available else [],
+        lambda row: _fetch_member_progress(row['boj_handle'], problem_ids, progress.get(row['user_id']), plan),
+    )
+    changed = []
+    for row, member_progress in fetched:
+        user_id, boj_handle = row['user_id'], row['boj_handle']
+        if isinstance(member_progress, Exception):
+            logger.error(f"문제집 과제 현황 조회 오류 ({boj_handle}): {member_progress}")
+            continue
+        solved_set, observed_count, crawled = member_progress
+        
+        # 문제집 문제 중 해결한 문제 수 / 안 푼 문제 번호
+        solved_count = len([pid for pid in problem_ids if pid in solved_set])
+        unsolved_problems = [pid for pid in problem_ids if pid not in solved_set]
+        row.update({
+            'solved_count': solved_count,
+            'unsolved_problems': unsolved_problems,
+            'status': '✅' if solved_count == total_problems else '📝'
+        })
+        if crawled:
+            changed.append({
+                'user_id': user_id,
                 'boj_handle': boj_handle,
-                'solved_count': 0,
-                'total': total_problems,
-                'unsolved_problems': problem_ids.copy(),
-                'status': '❌'
+                'solved_problems': sorted(solved_set),
+                'observed_count': observed_count,
             })
     
+    if changed:
+        await async_db.save_problem_set_progress(group_name, problem_set_name, changed)
+    logger.info(
+        f"[문제집 갱신] {group_name} - {problem_set_name}: "
+        f"{len(fetched)}명 중 {len(changed)}명 다시 크롤링"
+    )
+    
     # 결과 정렬 (해결한 문제 수 내림차순)
     results.sort(key=lambda x: x['solved_count'], reverse=True)
     
-    # 임베드 생성
+    # 임베드 생성 (자동 갱신은 계획 결과를 실제로 조회한 시각을 표시)
+    refreshed_at = planned_fetch_time(plan, [row['boj_handle'] for row in results], now)
     description_text = (
         f"**그룹:** {group_name}\n"
         f"**전체 문제 수:** {total_problems}개\n"
         f"**기간:** {week_start.strftime('%Y-%m-%d')} ~ {week_end.strftime('%Y-%m-%d %H:%M')}\n"
-        f"**마지막 갱신:** {now.strftime('%Y-%m-%d %H:%M')}"
+        f"**마지막 갱신:** {refreshed_at.strftime('%Y-%m-%d %H:%M')}"
     )
     if server_error_message:
         description_text += f"\n\n{server_error_message}"
@@ -232,7 +281,7 @@ async def update_problem_set_status(group_name: str, problem_set_name: str, bot_
     )
     
     # DB에 마지막 갱신 시간 저장
-    save_group_problem_set_status(
+    await async_db.save_group_problem_set_status(
         group_name,
         problem_set_name,
         role_name,
@@ -243,16 +292,25 @@ async def update_problem_set_status(group_name: str, problem_set_name: str, bot_
         now.isoformat(),
     )
 
-    await message.edit(embed=embed, view=ProblemSetStatusView(group_name, problem_set_name))
+    await edit_if_changed(message, embed, view=ProblemSetStatusView(group_name, problem_set_name), force=force)
+
+    # 기간 종료 후 마지막 크롤링이면 결과를 주간 기록으로 남김 (조회 실패한 멤버는 제외)
+    if as_of >= week_end and server_available:
+        await async_db.record_problem_set_snapshot(
+            group_name,
+            problem_set_name,
+            week_start.isoformat(),
+            [r for r in results if r['status'] != '❌'],
+        )
     
     # 전체과제현황도 갱신 (문제집 부분만)
     from domain.channel import update_all_assignment_status
-    await update_all_assignment_status(group_name, bot_instance, assignment_type=f"문제집:{problem_set_name}")
+    await update_all_assignment_status(group_name, bot_instance, assignment_type=f"문제집:{problem_set_name}", plan=plan, force=force)
 
 
-async def update_mock_test_status(group_name: str, mock_test_name: str, bot_instance):
-    """모의테스트 과제 현황 갱신 (월요일 01시에만 실행, 메시지 생성 없음)"""
-    status_info = get_group_mock_test_status(group_name, mock_test_name)
+async def update_mock_test_status(group_name: str, mock_test_name: str, bot_instance, plan=None, force: bool = False):
+    """모의테스트 과제 현황 갱신 (월요일 01시에만 실행, 메시지 생성 없음, plan: 자동 갱신의 조회 계획, force: 갱신 버튼처럼 내용이 같아도 편집)"""
+    status_info = await async_db.get_group_mock_test_status(group_name, mock_test_name)
     if not status_info:
         return
     
@@ -265,8 +323,10 @@ async def update_mock_test_status(group_name: str, mock_test_name: str, bot_inst
     week_end = ensure_kst(week_end)
     
     now = get_kst_now()
+    # 자동 갱신은 예정된 실행 시각 기준으로 기간 확인 (재시작 후 늦게 보충된 마지막 크롤링도 처리)
+    as_of = plan.slot if plan else now
     # 기간 밖이면 갱신하지 않음 (단, 월요일 01시 정각은 마지막 크롤링 허용)
-    if not (week_start <= now <= week_end + timedelta(minutes=5)):
+    if not (week_start <= as_of <= week_end + timedelta(minutes=5)):
         return
     
     # 메시지 ID가 없으면 메시지 생성 없이 바로 진행 (할당만 된 경우)
@@ -274,7 +334,7 @@ async def update_mock_test_status(group_name: str, mock_test_name: str, bot_inst
     if not message_id:
         # 메시지가 없으므로 바로 전체과제현황만 갱신
         from domain.channel import update_all_assignment_status
-        await update_all_assignment_status(group_name, bot_instance, assignment_type=f"모의테스트:{mock_test_name}")
+        await update_all_assignment_status(group_name, bot_instance, assignment_type=f"모의테스트:{mock_test_name}", plan=plan, force=force)
         return
     
     channel_id = int(status_info['channel_id'])
@@ -285,20 +345,20 @@ async def update_mock_test_status(group_name: str, mock_test_name: str, bot_inst
     try:
         message = await channel.fetch_message(message_id)
     except discord.NotFound:
-        delete_group_mock_test_status(group_name, mock_test_name)
+        await async_db.delete_group_mock_test_status(group_name, mock_test_name)
         return
     
     # 모의테스트 정보 가져오기
-    mock_test = get_mock_test(mock_test_name)
+    mock_test = await async_db.get_mock_test(mock_test_name)
     if not mock_test:
         return
     
     # 모의테스트 문제 목록 (get_mock_test가 이미 리스트로 반환함)
-    problem_ids = mock_test['problem_ids'] if isinstance(mock_test['problem_ids'], list) else [int(x) for x in str(mock_test['problem_ids']).split(',') if x.strip()]
+    problem_ids = mock_test['problem_ids']
     total_problems = len(problem_ids)
     
     # 그룹 멤버 가져오기
-    users = get_role_users(role_name)
+    users = await async_db.get_role_users(role_name)
     if not users:
         embed = discord.Embed(
             title=f"📝 '{mock_test_name}' 모의테스트 과제",
@@ -311,7 +371,7 @@ async def update_mock_test_status(group_name: str, mock_test_name: str, bot_inst
             ),
             color=discord.Color.blue(),
         )
-        await message.edit(embed=embed, view=MockTestStatusView(group_name, mock_test_name))
+        await edit_if_changed(message, embed, view=MockTestStatusView(group_name, mock_test_name), force=force)
         return
     
     # 각 멤버의 해결 현황 조회
@@ -334,7 +394,7 @@ async def update_mock_test_status(group_name: str, mock_test_name: str, bot_inst
         
         try:
             # solved.ac에서 해결한 문제 목록 가져오기
-            solved_problems = await get_user_solved_problems_from_solved_ac(boj_handle, target_problems=problem_ids)
+            solved_problems = await planned_solved_problems(plan, boj_handle, problem_ids)
             solved_set = set(solved_problems)
             
             # 모의테스트 문제 중 해결한 문제 수
@@ -365,14 +425,15 @@ async def update_mock_test_status(group_name: str, mock_test_name: str, bot_inst
     # 결과 정렬 (해결한 문제 수 내림차순)
     results.sort(key=lambda x: x['solved_count'], reverse=True)
     
-    # 임베드 생성
+    # 임베드 생성 (자동 갱신은 계획 결과를 실제로 조회한 시각을 표시)
+    refreshed_at = planned_fetch_time(plan, [row['boj_handle'] for row in results], now)
     embed = discord.Embed(
         title=f"📝 '{mock_test_name}' 모의테스트 과제",
         description=(
             f"**그룹:** {group_name}\n"
             f"**전체 문제 수:** {total_problems}개\n"
             f"**기간:** {week_start.strftime('%Y-%m-%d')} ~ {week_end.strftime('%Y-%m-%d %H:%M')}\n"
-            f"**마지막 갱신:** {now.strftime('%Y-%m-%d %H:%M')}"
+            f"**마지막 갱신:** {refreshed_at.strftime('%Y-%m-%d %H:%M')}"
         ),
         color=discord.Color.blue()
     )
@@ -423,7 +484,7 @@ async def update_mock_test_status(group_name: str, mock_test_name: str, bot_inst
     )
     
     # DB에 마지막 갱신 시간 저장
-    save_group_mock_test_status(
+    await async_db.save_group_mock_test_status(
         group_name,
         mock_test_name,
         role_name,
@@ -434,22 +495,26 @@ async def update_mock_test_status(group_name: str, mock_test_name: str, bot_inst
         now.isoformat(),
     )
 
-    await message.edit(embed=embed, view=MockTestStatusView(group_name, mock_test_name))
+    await edit_if_changed(message, embed, view=MockTestStatusView(group_name, mock_test_name), force=force)
     
     # 전체과제현황도 갱신 (모의테스트 부분만)
     from domain.channel import update_all_assignment_status
-    await update_all_assignment_status(group_name, bot_instance, assignment_type=f"모의테스트:{mock_test_name}")
+    await update_all_assignment_status(group_name, bot_instance, assignment_type=f"모의테스트:{mock_test_name}", plan=plan, force=force)
 
 
-@tasks.loop(time=[time(hour=h, minute=0) for h in range(0, 24)])
-async def problem_set_auto_update():
-    """매시 정각 문제집 과제 자동 갱신"""
-    global _bot_for_problem_set
+async def _problem_set_units(slot: datetime):
+    """매시 문제집 과제 자동 갱신 (문제집별 실행 단위)"""
     if not _bot_for_problem_set:
-        return
-    
-    now = get_kst_now()
-    for info in get_all_group_problem_set_status():
+        return []
+
+    # 월요일 01시는 weekly_final_refresh(domain/channel.py)에서 처리하므로 여기서는 건너뜀
+    from domain.channel import is_weekly_rollover_slot
+    if is_weekly_rollover_slot(slot):
+        return []
+
+    plan = get_refresh_plan(slot)
+    units = []
+    for info in await async_db.get_all_group_problem_set_status():
         week_start = datetime.fromisoformat(info['week_start'])
         week_end = datetime.fromisoformat(info['week_end'])
         
@@ -457,28 +522,44 @@ async def problem_set_auto_update():
         week_start = ensure_kst(week_start)
         week_end = ensure_kst(week_end)
         
-        # 월요일 01시는 all_assignment_auto_create에서 처리하므로 여기서는 건너뜀
-        if now.weekday() == 0 and now.hour == 1 and now.minute == 0:
-            continue
-        
         # 기간 내에만 갱신
-        if week_start <= now <= week_end:
-            await update_problem_set_status(info['group_name'], info['problem_set_name'], _bot_for_problem_set)
+        if week_start <= slot <= week_end:
+            units.append(WorkItem(
+                f"{info['group_name']}:{info['problem_set_name']}",
+                partial(update_problem_set_status, info['group_name'], info['problem_set_name'], _bot_for_problem_set, plan),
+            ))
+    return units
 
 
-@tasks.loop(time=[time(hour=1, minute=0)])
-async def mock_test_auto_update():
-    """월요일 01시 정각 모의테스트 과제 자동 갱신 (한번만 수행)"""
-    global _bot_for_mock_test
-    if not _bot_for_mock_test:
-        return
-    
+async def _expire_mock_test(info: dict):
+    """종료된 모의테스트 삭제 (solved.ac 서버 확인, 2시간 유예)"""
+    week_end = ensure_kst(datetime.fromisoformat(info['week_end']))
     now = get_kst_now()
-    # 월요일 01시에만 실행
-    if now.weekday() != 0 or now.hour != 1 or now.minute != 0:
-        return
+
+    from common.boj_utils import check_solved_ac_server_available
+    server_available = await check_solved_ac_server_available()
     
-    for info in get_all_group_mock_test_status():
+    if server_available:
+        # 서버가 정상이면 삭제 (2시간 유예 적용)
+        if now >= week_end + timedelta(hours=2):
+            await async_db.delete_group_mock_test_status(info['group_name'], info['mock_test_name'])
+            logger.info(f"[월요일 01시] 모의테스트 삭제: {info['group_name']} - {info['mock_test_name']}")
+        else:
+            logger.info(f"[월요일 01시] 모의테스트 삭제 유예 중: {info['group_name']} - {info['mock_test_name']} (2시간 유예)")
+    else:
+        logger.warning(f"[월요일 01시] solved.ac 서버가 응답하지 않아 모의테스트 삭제를 유예합니다: {info['group_name']} - {info['mock_test_name']}")
+
+
+async def _mock_test_units(slot: datetime):
+    """월요일 01시 모의테스트 정리 (한번만 수행)
+
+    마지막 크롤링은 weekly_final_refresh(domain/channel.py)에서 먼저 끝나므로 여기서는 삭제만 확인한다.
+    """
+    if not _bot_for_mock_test:
+        return []
+
+    units = []
+    for info in await async_db.get_all_group_mock_test_status():
         week_start = datetime.fromisoformat(info['week_start'])
         week_end = datetime.fromisoformat(info['week_end'])
         
@@ -486,24 +567,14 @@ async def mock_test_auto_update():
         week_start = ensure_kst(week_start)
         week_end = ensure_kst(week_end)
         
-        # 기간 내에만 갱신 (월요일 01시 정각은 마지막 크롤링 허용)
-        if week_start <= now <= week_end + timedelta(minutes=5):
-            # 모의테스트 현황 갱신 (전체과제현황도 함께 갱신됨)
-            await update_mock_test_status(info['group_name'], info['mock_test_name'], _bot_for_mock_test)
-            
-            # solved.ac 서버 응답 확인 후 삭제
-            from common.boj_utils import check_solved_ac_server_available
-            server_available = await check_solved_ac_server_available()
-            
-            if server_available:
-                # 서버가 정상이면 삭제 (2시간 유예 적용)
-                if now >= week_end + timedelta(hours=2):
-                    delete_group_mock_test_status(info['group_name'], info['mock_test_name'])
-                    logger.info(f"[월요일 01시] 모의테스트 삭제: {info['group_name']} - {info['mock_test_name']}")
-                else:
-                    logger.info(f"[월요일 01시] 모의테스트 삭제 유예 중: {info['group_name']} - {info['mock_test_name']} (2시간 유예)")
-            else:
-                logger.warning(f"[월요일 01시] solved.ac 서버가 응답하지 않아 모의테스트 삭제를 유예합니다: {info['group_name']} - {info['mock_test_name']}")
+        # 기간 내에만 (월요일 01시 정각은 마지막 크롤링 허용)
+        if week_start <= slot <= week_end + timedelta(minutes=5):
+            units.append(WorkItem(
+                f"{info['group_name']}:{info['mock_test_name']}",
+                partial(_expire_mock_test, info),
+                spread=False,
+            ))
+    return units
 
 
 class ProblemSetStatusView(discord.ui.View):
@@ -529,17 +600,14 @@ class ProblemSetStatusView(discord.ui.View):
         custom_id="problem_set_status_refresh"  # 고정된 custom_id 사용
     )
     async def refresh_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        # 메시지 기준으로 문제집 과제 찾기 (모든 문제집 과제를 확인하여 해당 메시지 찾기)
-        all_statuses = get_all_group_problem_set_status()
-        info = None
-        for status in all_statuses:
-            if str(status['channel_id']) == str(interaction.channel.id) and str(status['message_id']) == str(interaction.message.id):
-                info = status
-                break
+        # 메시지 기준으로 문제집 과제 찾기
+        info = await async_db.get_group_problem_set_status_by_message(
+            str(interaction.channel.id), str(interaction.message.id)
+        )
         
         if not info:
             # fallback: self에 저장된 정보 사용
-            info = get_group_problem_set_status(self.group_name, self.problem_set_name)
+            info = await async_db.get_group_problem_set_status(self.group_name, self.problem_set_name)
         if not info:
             if interaction.response.is_done():
                 await interaction.followup.send("❌ 이 메시지는 문제집 과제로 등록되어 있지 않습니다.", ephemeral=True)
@@ -563,22 +631,19 @@ class ProblemSetStatusView(discord.ui.View):
                 await interaction.response.send_message("⚠️ 이 메시지의 기간이 종료되어 더 이상 갱신할 수 없습니다.", ephemeral=True)
             return
         
-        if not interaction.response.is_done():
-            await interaction.response.defer(ephemeral=True)
-        
-        # solved.ac 서버 응답 확인
-        from common.boj_utils import check_solved_ac_server_available
-        server_available = await check_solved_ac_server_available()
-        
-        if not server_available:
-            await interaction.followup.send("⚠️ **solved.ac 서버 응답 없음** - 나중에 다시 시도해주세요.", ephemeral=True)
-            return
-        
         # info에서 그룹명과 문제집명 가져오기
         group_name = info['group_name']
         problem_set_name = info['problem_set_name']
-        await update_problem_set_status(group_name, problem_set_name, interaction.client)
-        await interaction.followup.send("✅ 문제집 과제 현황이 갱신되었습니다.", ephemeral=True)
+        
+        # 크롤링은 백그라운드 큐에서 실행 (같은 메시지 요청은 하나로 합침)
+        async def refresh():
+            # solved.ac 서버 응답 확인
+            from common.boj_utils import check_solved_ac_server_available
+            if not await check_solved_ac_server_available():
+                return "⚠️ **solved.ac 서버 응답 없음** - 나중에 다시 시도해주세요."
+            await update_problem_set_status(group_name, problem_set_name, interaction.client, force=True)
+        
+        await request_refresh(interaction, "문제집", refresh, "✅ 문제집 과제 현황이 갱신되었습니다.")
 
 
 class MockTestStatusView(discord.ui.View):
@@ -604,17 +669,14 @@ class MockTestStatusView(discord.ui.View):
         custom_id="mock_test_status_refresh"  # 고정된 custom_id 사용
     )
     async def refresh_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        # 메시지 기준으로 모의테스트 과제 찾기 (모든 모의테스트 과제를 확인하여 해당 메시지 찾기)
-        all_statuses = get_all_group_mock_test_status()
-        info = None
-        for status in all_statuses:
-            if str(status['channel_id']) == str(interaction.channel.id) and str(status['message_id']) == str(interaction.message.id):
-                info = status
-                break
+        # 메시지 기준으로 모의테스트 과제 찾기
+        info = await async_db.get_group_mock_test_status_by_message(
+            str(interaction.channel.id), str(interaction.message.id)
+        )
         
         if not info:
             # fallback: self에 저장된 정보 사용
-            info = get_group_mock_test_status(self.group_name, self.mock_test_name)
+            info = await async_db.get_group_mock_test_status(self.group_name, self.mock_test_name)
         if not info:
             if interaction.response.is_done():
                 await interaction.followup.send("❌ 이 메시지는 모의테스트 과제로 등록되어 있지 않습니다.", ephemeral=True)
@@ -638,22 +700,19 @@ class MockTestStatusView(discord.ui.View):
                 await interaction.response.send_message("⚠️ 이 메시지의 기간이 종료되어 더 이상 갱신할 수 없습니다.", ephemeral=True)
             return
         
-        if not interaction.response.is_done():
-            await interaction.response.defer(ephemeral=True)
-        
-        # solved.ac 서버 응답 확인
-        from common.boj_utils import check_solved_ac_server_available
-        server_available = await check_solved_ac_server_available()
-        
-        if not server_available:
-            await interaction.followup.send("⚠️ **solved.ac 서버 응답 없음** - 나중에 다시 시도해주세요.", ephemeral=True)
-            return
-        
         # info에서 그룹명과 모의테스트명 가져오기
         group_name = info['group_name']
         mock_test_name = info['mock_test_name']
-        await update_mock_test_status(group_name, mock_test_name, interaction.client)
-        await interaction.followup.send("✅ 모의테스트 과제 현황이 갱신되었습니다.", ephemeral=True)
+        
+        # 크롤링은 백그라운드 큐에서 실행 (같은 메시지 요청은 하나로 합침)
+        async def refresh():
+            # solved.ac 서버 응답 확인
+            from common.boj_utils import check_solved_ac_server_available
+            if not await check_solved_ac_server_available():
+                return "⚠️ **solved.ac 서버 응답 없음** - 나중에 다시 시도해주세요."
+            await update_mock_test_status(group_name, mock_test_name, interaction.client, force=True)
+        
+        await request_refresh(interaction, "모의테스트", refresh, "✅ 모의테스트 과제 현황이 갱신되었습니다.")
 
 
 def setup(bot):
@@ -672,7 +731,7 @@ def setup(bot):
     async def problem_set_create(ctx, *, name: str):
         """문제집 생성 (관리자 전용) - 폼으로 문제 번호 입력"""
         # 이미 존재하는지 확인
-        existing = get_problem_set(name)
+        existing = await async_db.get_problem_set(name)
         if existing:
             await ctx.send(f"❌ '{name}' 문제집이 이미 존재합니다.")
             return
@@ -686,20 +745,20 @@ def setup(bot):
     async def problem_set_status(ctx, name: str, *, group_name: str):
         """문제집 풀이 현황 조회 (관리자 전용)"""
         # 문제집 확인
-        problem_set = get_problem_set(name)
+        problem_set = await async_db.get_problem_set(name)
         if not problem_set:
             await ctx.send(f"❌ '{name}' 문제집을 찾을 수 없습니다.")
             return
         
         # 그룹 확인
-        data = load_data()
-        role_name = find_role_by_group_name(group_name, data)
+        studies = await async_db.load_studies()
+        role_name = find_role_by_group_name(group_name, studies)
         if not role_name:
             await ctx.send(f"❌ '{group_name}' 그룹을 찾을 수 없습니다.")
             return
         
         # 그룹 멤버 가져오기
-        users = get_role_users(role_name)
+        users = await async_db.get_role_users(role_name)
         if not users:
             await ctx.send(f"❌ '{group_name}' 그룹에 멤버가 없습니다.")
             return
@@ -825,7 +884,7 @@ def setup(bot):
     async def problem_set_update(ctx, *, name: str):
         """문제집 수정 (관리자 전용) - 폼으로 문제 번호 수정"""
         # 문제집 확인
-        problem_set = get_problem_set(name)
+        problem_set = await async_db.get_problem_set(name)
         if not problem_set:
             await ctx.send(f"❌ '{name}' 문제집을 찾을 수 없습니다.")
             return
@@ -842,7 +901,7 @@ def setup(bot):
     async def problem_set_delete(ctx, *, name: str):
         """문제집 삭제 (관리자 전용)"""
         # 문제집 확인
-        problem_set = get_problem_set(name)
+        problem_set = await async_db.get_problem_set(name)
         if not problem_set:
             await ctx.send(f"❌ '{name}' 문제집을 찾을 수 없습니다.")
             return
@@ -865,7 +924,7 @@ def setup(bot):
     @problem_set_group.command(name='목록')
     async def problem_set_list(ctx):
         """문제집 목록 조회"""
-        problem_sets = get_all_problem_sets()
+        problem_sets = await async_db.get_all_problem_sets()
         
         if not problem_sets:
             await ctx.send("❌ 등록된 문제집이 없습니다.")
@@ -902,7 +961,7 @@ def setup(bot):
     async def mock_test_create(ctx, *, name: str):
         """모의테스트 생성 (관리자 전용) - 폼으로 문제 번호 입력"""
         # 이미 존재하는지 확인
-        existing = get_mock_test(name)
+        existing = await async_db.get_mock_test(name)
         if existing:
             await ctx.send(f"❌ '{name}' 모의테스트가 이미 존재합니다.")
             return
@@ -916,26 +975,26 @@ def setup(bot):
     async def mock_test_status(ctx, name: str, *, group_name: str):
         """모의테스트 풀이 현황 조회 (관리자 전용)"""
         # 모의테스트 확인
-        mock_test = get_mock_test(name)
+        mock_test = await async_db.get_mock_test(name)
         if not mock_test:
             await ctx.send(f"❌ '{name}' 모의테스트를 찾을 수 없습니다.")
             return
         
         # 그룹 확인
-        data = load_data()
-        role_name = find_role_by_group_name(group_name, data)
+        studies = await async_db.load_studies()
+        role_name = find_role_by_group_name(group_name, studies)
         if not role_name:
             await ctx.send(f"❌ '{group_name}' 그룹을 찾을 수 없습니다.")
             return
         
         # 그룹 멤버 가져오기
-        users = get_role_users(role_name)
+        users = await async_db.get_role_users(role_name)
         if not users:
             await ctx.send(f"❌ '{group_name}' 그룹에 멤버가 없습니다.")
             return
         
         # 모의테스트 문제 목록 (get_mock_test가 이미 리스트로 반환함)
-        problem_ids = mock_test['problem_ids'] if isinstance(mock_test['problem_ids'], list) else [int(x) for x in str(mock_test['problem_ids']).split(',') if x.strip()]
+        problem_ids = mock_test['problem_ids']
         total_problems = len(problem_ids)
         
         if total_problems == 0:
@@ -1059,7 +1118,7 @@ def setup(bot):
     async def mock_test_update(ctx, *, name: str):
         """모의테스트 수정 (관리자 전용) - 폼으로 문제 번호 수정"""
         # 모의테스트 확인
-        mock_test = get_mock_test(name)
+        mock_test = await async_db.get_mock_test(name)
         if not mock_test:
             await ctx.send(f"❌ '{name}' 모의테스트를 찾을 수 없습니다.")
             return
@@ -1076,7 +1135,7 @@ def setup(bot):
     async def mock_test_delete(ctx, *, name: str):
         """모의테스트 삭제 (관리자 전용)"""
         # 모의테스트 확인
-        mock_test = get_mock_test(name)
+        mock_test = await async_db.get_mock_test(name)
         if not mock_test:
             await ctx.send(f"❌ '{name}' 모의테스트를 찾을 수 없습니다.")
             return
@@ -1099,7 +1158,7 @@ def setup(bot):
     @mock_test_group.command(name='목록')
     async def mock_test_list(ctx):
         """모의테스트 목록 조회"""
-        mock_tests = get_all_mock_tests()
+        mock_tests = await async_db.get_all_mock_tests()
         
         if not mock_tests:
             await ctx.send("❌ 등록된 모의테스트가 없습니다.")
@@ -1127,13 +1186,22 @@ def setup(bot):
     # 자동 갱신 태스크는 on_ready에서 시작 (봇이 준비된 후)
 
 
-def start_problem_set_scheduler(bot_instance):
-    """문제집 과제 자동 갱신 스케줄러 시작"""
-    global _bot_for_problem_set
+def register_scheduled_jobs(bot_instance):
+    """문제집 과제 자동 갱신 및 월요일 01시 모의테스트 정리 작업 등록"""
+    global _bot_for_problem_set, _bot_for_mock_test
     _bot_for_problem_set = bot_instance
-    if not problem_set_auto_update.is_running():
-        problem_set_auto_update.start()
-        logger.info("문제집 과제 자동 갱신 스케줄러 시작")
+    _bot_for_mock_test = bot_instance
+    register_job('problem_set', _problem_set_units, after=('refresh_plan',))
+    register_job('mock_test_expire', _mock_test_units,
+                 hours=[1], weekdays=[0], priority=1, spread=0, after=('weekly_final_refresh',))
+
+
+def _warm_metadata_later(key: str, problem_ids: List[int]):
+    """
+    현황 렌더링이 문제별 요청을 기다리지 않도록 문제 정보 캐시를 백그라운드에서 미리 채움
+    (스케줄러 큐로 실행 - 같은 문제집/모의테스트를 다시 수정하면 대기 중인 준비를 새 문제 목록으로 교체)
+    """
+    submit('problem_metadata', key, partial(warm_problem_metadata, problem_ids), replace=True)
 
 
 class ProblemSetCreateModal(discord.ui.Modal, title="문제집 생성"):
@@ -1176,7 +1244,7 @@ class ProblemSetCreateModal(discord.ui.Modal, title="문제집 생성"):
             problem_ids = sorted(list(set(problem_ids)))
             
             # DB에 저장
-            create_problem_set(self.name, problem_ids, str(interaction.user.id))
+            await async_db.create_problem_set(self.name, problem_ids, str(interaction.user.id))
             
             # 알림 전송
             await send_bot_notification(
@@ -1192,6 +1260,8 @@ class ProblemSetCreateModal(discord.ui.Modal, title="문제집 생성"):
                 f"✅ 문제집 '{self.name}'이(가) 생성되었습니다!\n문제 수: {len(problem_ids)}개",
                 ephemeral=True
             )
+            
+            _warm_metadata_later(f"문제집:{self.name}", problem_ids)
         except Exception as e:
             logger.error(f"문제집 생성 오류: {e}", exc_info=True)
             await interaction.response.send_message("❌ 문제집 생성 중 오류가 발생했습니다.", ephemeral=True)
@@ -1254,12 +1324,14 @@ class ProblemSetUpdateModal(discord.ui.Modal, title="문제집 수정"):
             problem_ids = sorted(list(set(problem_ids)))
             
             # DB에 저장
-            update_problem_set(self.name, problem_ids)
+            await async_db.update_problem_set(self.name, problem_ids)
             
             await interaction.response.send_message(
                 f"✅ 문제집 '{self.name}'이(가) 수정되었습니다!\n문제 수: {len(problem_ids)}개",
                 ephemeral=True
             )
+            
+            _warm_metadata_later(f"문제집:{self.name}", problem_ids)
         except Exception as e:
             logger.error(f"문제집 수정 오류: {e}", exc_info=True)
             await interaction.response.send_message("❌ 문제집 수정 중 오류가 발생했습니다.", ephemeral=True)
@@ -1296,7 +1368,7 @@ class ProblemSetDeleteConfirmView(discord.ui.View):
             return
         
         # 삭제
-        delete_problem_set(self.name)
+        await async_db.delete_problem_set(self.name)
         
         # 알림 전송
         await send_bot_notification(
@@ -1366,7 +1438,7 @@ class MockTestCreateModal(discord.ui.Modal, title="모의테스트 생성"):
             problem_ids = sorted(list(set(problem_ids)))
             
             # DB에 저장
-            create_mock_test(self.name, problem_ids, str(interaction.user.id))
+            await async_db.create_mock_test(self.name, problem_ids, str(interaction.user.id))
             
             # 알림 전송
             await send_bot_notification(
@@ -1382,6 +1454,8 @@ class MockTestCreateModal(discord.ui.Modal, title="모의테스트 생성"):
                 f"✅ 모의테스트 '{self.name}'이(가) 생성되었습니다!\n문제 수: {len(problem_ids)}개",
                 ephemeral=True
             )
+            
+            _warm_metadata_later(f"모의테스트:{self.name}", problem_ids)
         except Exception as e:
             logger.error(f"모의테스트 생성 오류: {e}", exc_info=True)
             await interaction.response.send_message("❌ 모의테스트 생성 중 오류가 발생했습니다.", ephemeral=True)
@@ -1444,12 +1518,14 @@ class MockTestUpdateModal(discord.ui.Modal, title="모의테스트 수정"):
             problem_ids = sorted(list(set(problem_ids)))
             
             # DB에 저장
-            update_mock_test(self.name, problem_ids)
+            await async_db.update_mock_test(self.name, problem_ids)
             
             await interaction.response.send_message(
                 f"✅ 모의테스트 '{self.name}'이(가) 수정되었습니다!\n문제 수: {len(problem_ids)}개",
                 ephemeral=True
             )
+            
+            _warm_metadata_later(f"모의테스트:{self.name}", problem_ids)
         except Exception as e:
             logger.error(f"모의테스트 수정 오류: {e}", exc_info=True)
             await interaction.response.send_message("❌ 모의테스트 수정 중 오류가 발생했습니다.", ephemeral=True)
@@ -1487,7 +1563,7 @@ class MockTestDeleteConfirmView(discord.ui.View):
             return
         
         # 삭제
-        delete_mock_test(self.name)
+        await async_db.delete_mock_test(self.name)
         
         # 알림 전송
         await send_bot_notification(
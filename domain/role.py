@@ -2,22 +2,17 @@
 역할 관리 명령어
 """
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 import random
-from datetime import datetime, timedelta, time
-from common.utils import load_data, save_data, generate_token, hash_token, verify_token
-from common.database import (
-    get_role_users,
-    save_weekly_status_message,
-    get_weekly_status_message,
-    get_user_by_boj_handle,
-    get_user,
-    create_or_update_user,
-    add_user_role,
-    remove_user_role,
-)
-from common.boj_utils import get_weekly_solved_count, verify_user_exists
+from datetime import datetime, timedelta
+from functools import partial
+from common.utils import generate_token, hash_token, verify_token, get_kst_now
+from common.boj_utils import verify_user_exists
+from common.fanout import fetch_weekly_counts
 from common.logger import setup_logger
+from common import async_db
+from common.message_render import edit_if_changed
+from common.scheduler import WorkItem, register_job
 
 logger = setup_logger()
 
@@ -45,10 +40,8 @@ def setup(bot):
             await ctx.send(f"⚠️ '{role_name}' 역할이 이미 서버에 존재합니다.")
             return
         
-        data = load_data()
-        
         # 이미 등록된 역할인지 확인
-        if role_name in data.get('role_tokens', {}):
+        if await async_db.get_role_token(role_name):
             await ctx.send(f"⚠️ '{role_name}' 역할은 이미 등록되어 있습니다. `/역할 토큰 {role_name}` 명령어로 토큰을 확인하세요.")
             return
         
@@ -67,15 +60,8 @@ def setup(bot):
             token = generate_token()
             token_hash = hash_token(token)
             
-            # 데이터 저장
-            if 'role_tokens' not in data:
-                data['role_tokens'] = {}
-            
-            data['role_tokens'][role_name] = {
-                'token_hash': token_hash,
-                'original_token': token  # 관리자가 확인할 수 있도록 원본 토큰도 저장
-            }
-            save_data(data)
+            # 데이터 저장 (관리자가 확인할 수 있도록 원본 토큰도 저장)
+            await async_db.save_role_token(role_name, token_hash, token)
             
             # 봇 알림 채널에 알림 전송
             from common.utils import send_bot_notification
@@ -111,13 +97,12 @@ def setup(bot):
     @commands.has_permissions(administrator=True)
     async def role_token(ctx, *, role_name: str):
         """역할의 토큰 확인 (관리자 전용)"""
-        data = load_data()
+        token_info = await async_db.get_role_token(role_name)
         
-        if role_name not in data.get('role_tokens', {}):
+        if not token_info:
             await ctx.send(f"❌ '{role_name}' 역할이 등록되지 않았습니다. `/역할 생성 {role_name}` 명령어로 먼저 생성해주세요.")
             return
         
-        token_info = data['role_tokens'][role_name]
         original_token = token_info.get('original_token', '토큰 정보 없음')
         
         # DM으로 토큰 전송
@@ -137,8 +122,7 @@ def setup(bot):
     @commands.has_permissions(administrator=True)
     async def role_list(ctx):
         """등록된 역할 목록 확인 (관리자 전용)"""
-        data = load_data()
-        role_tokens = data.get('role_tokens', {})
+        role_tokens = await async_db.load_role_tokens()
         
         if not role_tokens:
             await ctx.send("❌ 등록된 역할이 없습니다.")
@@ -163,16 +147,14 @@ def setup(bot):
     @commands.has_permissions(administrator=True)
     async def role_members(ctx, *, role_name: str):
         """특정 역할을 가진 멤버 목록 확인 (관리자 전용)"""
-        from common.database import get_role_users
         
         # 역할이 등록되어 있는지 확인
-        data = load_data()
-        if role_name not in data.get('role_tokens', {}):
+        if not await async_db.get_role_token(role_name):
             await ctx.send(f"❌ '{role_name}' 역할이 등록되지 않았습니다.")
             return
         
         # 역할을 가진 유저 목록 가져오기
-        users = get_role_users(role_name)
+        users = await async_db.get_role_users(role_name)
         
         if not users:
             await ctx.send(f"❌ '{role_name}' 역할을 가진 멤버가 없습니다.")
@@ -234,8 +216,7 @@ def setup(bot):
         사용법: /역할 부여 <역할명> <discord_id 또는 멘션> <boj_handle>
         """
         # 역할이 등록되어 있는지 확인
-        data = load_data()
-        if role_name not in data.get('role_tokens', {}):
+        if not await async_db.get_role_token(role_name):
             await ctx.send(f"❌ '{role_name}' 역할이 등록되지 않았습니다.")
             return
 
@@ -263,7 +244,11 @@ def setup(bot):
             return
 
         # BOJ 핸들 검증
-        exists = await verify_user_exists(boj_handle)
+        try:
+            exists = await verify_user_exists(boj_handle)
+        except Exception:
+            await ctx.send("❌ 백준 아이디를 확인하지 못했습니다. (solved.ac 응답 없음) 잠시 후 다시 시도해주세요.")
+            return
         if not exists:
             await ctx.send(f"❌ 백준 아이디 '{boj_handle}'를 찾을 수 없습니다.")
             return
@@ -280,8 +265,8 @@ def setup(bot):
 
         # DB에 사용자/역할/BOJ 핸들 저장
         user_id_str = str(member.id)
-        create_or_update_user(user_id_str, str(member), boj_handle)
-        add_user_role(user_id_str, role_name)
+        await async_db.create_or_update_user(user_id_str, str(member), boj_handle)
+        await async_db.add_user_role(user_id_str, role_name)
 
         # 봇 알림 채널에 알림 전송
         from common.utils import send_bot_notification
@@ -306,13 +291,12 @@ def setup(bot):
         """특정 역할 멤버들의 최근 7일(월~일) 백준 문제풀이 현황 (관리자 전용)"""
         
         # 역할이 등록되어 있는지 확인
-        data = load_data()
-        if role_name not in data.get('role_tokens', {}):
+        if not await async_db.get_role_token(role_name):
             await ctx.send(f"❌ '{role_name}' 역할이 등록되지 않았습니다.")
             return
         
         # 역할을 가진 유저 목록 가져오기
-        users = get_role_users(role_name)
+        users = await async_db.get_role_users(role_name)
         
         if not users:
             await ctx.send(f"❌ '{role_name}' 역할을 가진 멤버가 없습니다.")
@@ -344,23 +328,14 @@ def setup(bot):
                 })
                 continue
             
-            # 백준에서 최근 7일간 해결한 문제 수 조회
-            try:
-                solved_data = await get_weekly_solved_count(boj_handle, monday, sunday)
-                results.append({
-                    'username': username,
-                    'boj_handle': boj_handle,
-                    'solved_count': solved_data['count'],
-                    'problems': solved_data.get('problems', []),
-                    'status': '✅' if solved_data['count'] > 0 else '⚠️'
-                })
-            except Exception as e:
-                results.append({
-                    'username': username,
-                    'boj_handle': boj_handle,
-                    'solved_count': 0,
-                    'status': f'❌ 오류: {str(e)[:30]}'
-                })
+            results.append({
+                'username': username,
+                'boj_handle': boj_handle,
+                'solved_count': 0
+            })
+        
+        # 백준에서 최근 7일간 해결한 문제 수 조회 (멤버별 병렬)
+        await fetch_weekly_counts(results, monday, sunday)
         
         # 결과 정렬 (해결한 문제 수 많은 순)
         results.sort(key=lambda x: x['solved_count'], reverse=True)
@@ -430,8 +405,7 @@ def setup(bot):
     async def role_weekly_status_setup(ctx, *, role_name: str):
         """주간 문제풀이 현황 메시지 설정 (관리자 전용)"""
         # 역할이 등록되어 있는지 확인
-        data = load_data()
-        if role_name not in data.get('role_tokens', {}):
+        if not await async_db.get_role_token(role_name):
             await ctx.send(f"❌ '{role_name}' 역할이 등록되지 않았습니다.")
             return
         
@@ -452,7 +426,7 @@ def setup(bot):
         message = await ctx.send(embed=embed)
         
         # 메시지 정보 저장
-        save_weekly_status_message(role_name, str(ctx.channel.id), str(message.id), monday.strftime('%Y-%m-%d'))
+        await async_db.save_weekly_status_message(role_name, str(ctx.channel.id), str(message.id), monday.strftime('%Y-%m-%d'))
         
         # 즉시 업데이트
         await update_weekly_status_for_role(role_name, ctx.bot)
@@ -464,8 +438,7 @@ def setup(bot):
     async def role_weekly_status_refresh(ctx, *, role_name: str):
         """주간 문제풀이 현황 메시지 수동 갱신 (관리자 전용)"""
         # 역할이 등록되어 있는지 확인
-        data = load_data()
-        if role_name not in data.get('role_tokens', {}):
+        if not await async_db.get_role_token(role_name):
             await ctx.send(f"❌ '{role_name}' 역할이 등록되지 않았습니다.")
             return
         
@@ -489,16 +462,13 @@ def setup(bot):
             await ctx.send(f"❌ 봇 역할보다 위에 있는 역할은 삭제할 수 없습니다.")
             return
         
-        data = load_data()
-        
         try:
             # 디스코드에서 역할 삭제
             await role.delete(reason=f"봇에 의해 삭제됨 - {ctx.author}")
             
             # 데이터에서 토큰 정보 삭제
-            if role_name in data.get('role_tokens', {}):
-                del data['role_tokens'][role_name]
-                save_data(data)
+            if await async_db.get_role_token(role_name):
+                await async_db.delete_role_token(role_name)
             
             await ctx.send(f"✅ '{role_name}' 역할이 삭제되었습니다.")
         except discord.Forbidden:
@@ -515,13 +485,12 @@ def setup(bot):
         사용법: /역할 제거 <역할명> <boj_handle>
         """
         # 역할 등록 여부 확인
-        data = load_data()
-        if role_name not in data.get('role_tokens', {}):
+        if not await async_db.get_role_token(role_name):
             await ctx.send(f"❌ '{role_name}' 역할이 등록되지 않았습니다.")
             return
 
         # BOJ 핸들로 사용자 찾기
-        user = get_user_by_boj_handle(boj_handle)
+        user = await async_db.get_user_by_boj_handle(boj_handle)
         if not user:
             await ctx.send(f"❌ BOJ 핸들 '{boj_handle}'로 등록된 사용자를 찾을 수 없습니다.")
             return
@@ -546,7 +515,7 @@ def setup(bot):
                 return
 
         # DB에서 역할 매핑 제거
-        remove_user_role(user_id, role_name)
+        await async_db.remove_user_role(user_id, role_name)
 
         await ctx.send(f"✅ '{boj_handle}' 사용자를 '{role_name}' 역할에서 제거했습니다.")
 
@@ -557,8 +526,7 @@ def setup(bot):
         사용법: /역할 제거디스코드 <역할명> <discord_id>
         """
         # 역할 등록 여부 확인
-        data = load_data()
-        if role_name not in data.get('role_tokens', {}):
+        if not await async_db.get_role_token(role_name):
             await ctx.send(f"❌ '{role_name}' 역할이 등록되지 않았습니다.")
             return
 
@@ -567,7 +535,7 @@ def setup(bot):
         target_id = clean_id if clean_id else discord_id
 
         # 디스코드 ID로 사용자 찾기 (DB)
-        user = get_user(target_id)
+        user = await async_db.get_user(target_id)
         if not user:
             await ctx.send(f"❌ 디스코드 ID '{discord_id}'로 등록된 사용자를 찾을 수 없습니다.")
             return
@@ -592,7 +560,7 @@ def setup(bot):
                 return
 
         # DB에서 역할 매핑 제거
-        remove_user_role(user_id, role_name)
+        await async_db.remove_user_role(user_id, role_name)
 
         await ctx.send(f"✅ 디스코드 ID '{discord_id}' 사용자를 '{role_name}' 역할에서 제거했습니다.")
 
@@ -663,17 +631,20 @@ class RoleRegisterModal(discord.ui.Modal, title="역할 및 BOJ 핸들 등록"):
         self.add_item(self.boj_input)
     
     async def on_submit(self, interaction: discord.Interaction):
-        from common.utils import load_data, save_data, verify_token
+        from common.utils import verify_token
         from common.boj_utils import verify_user_exists
         
-        data = load_data()
-        role_tokens = data.get('role_tokens', {})
+        role_tokens = await async_db.load_role_tokens()
         
         token = self.token_input.value.strip()
         boj_handle = self.boj_input.value.strip()
         
         # BOJ 핸들 검증
-        exists = await verify_user_exists(boj_handle)
+        try:
+            exists = await verify_user_exists(boj_handle)
+        except Exception:
+            await interaction.response.send_message("❌ 백준 아이디를 확인하지 못했습니다. (solved.ac 응답 없음) 잠시 후 다시 시도해주세요.", ephemeral=True)
+            return
         if not exists:
             await interaction.response.send_message(f"❌ 백준 아이디 '{boj_handle}'를 찾을 수 없습니다.", ephemeral=True)
             return
@@ -705,25 +676,12 @@ class RoleRegisterModal(discord.ui.Modal, title="역할 및 BOJ 핸들 등록"):
         try:
             await interaction.user.add_roles(role)
             
-            # 데이터 저장
+            # 데이터 저장 (BOJ 핸들 + 역할 정보)
             user_id = str(interaction.user.id)
-            if user_id not in data['users']:
-                data['users'][user_id] = {
-                    'username': str(interaction.user),
-                    'boj_handle': None,
-                    'tistory_links': [],
-                    'roles': [],
-                    'submissions': {}
-                }
-            
-            # 역할 정보 저장
-            if role_name not in data['users'][user_id]['roles']:
-                data['users'][user_id]['roles'].append(role_name)
-            
-            # BOJ 핸들 저장
-            data['users'][user_id]['boj_handle'] = boj_handle
-            
-            save_data(data)
+            user = await async_db.get_user(user_id)
+            username = user['username'] if user else str(interaction.user)
+            await async_db.create_or_update_user(user_id, username, boj_handle)
+            await async_db.add_user_role(user_id, role_name)
             
             # 봇 알림 채널에 알림 전송
             from common.utils import send_bot_notification
@@ -752,7 +710,7 @@ async def update_weekly_status_for_role(role_name: str, bot_instance):
     """특정 역할의 주간 문제풀이 현황 메시지 업데이트"""
     try:
         # 저장된 메시지 정보 가져오기
-        msg_info = get_weekly_status_message(role_name)
+        msg_info = await async_db.get_weekly_status_message(role_name)
         if not msg_info:
             return
         
@@ -769,8 +727,7 @@ async def update_weekly_status_for_role(role_name: str, bot_instance):
             message = await channel.fetch_message(message_id)
         except discord.NotFound:
             # 메시지가 삭제되었으면 DB에서도 삭제
-            from common.database import delete_weekly_status_message
-            delete_weekly_status_message(role_name)
+            await async_db.delete_weekly_status_message(role_name)
             return
         
         # 이번 주 월요일~일요일 계산
@@ -778,7 +735,7 @@ async def update_weekly_status_for_role(role_name: str, bot_instance):
         week_end = week_start + timedelta(days=6, hours=23, minutes=59, seconds=59)
         
         # 역할을 가진 유저 목록 가져오기
-        users = get_role_users(role_name)
+        users = await async_db.get_role_users(role_name)
         
         if not users:
             embed = discord.Embed(
@@ -787,26 +744,22 @@ async def update_weekly_status_for_role(role_name: str, bot_instance):
                 color=discord.Color.blue()
             )
             embed.add_field(name="멤버 없음", value="이 역할을 가진 멤버가 없습니다.", inline=False)
-            await message.edit(embed=embed)
+            await edit_if_changed(message, embed)
             return
         
         # 각 유저의 백준 문제풀이 현황 조회
+        rows = [
+            {'username': user_info['username'], 'boj_handle': user_info.get('boj_handle'), 'solved_count': 0}
+            for user_info in users
+            if user_info.get('boj_handle') and user_info.get('boj_handle') != '미등록'
+        ]
+        await fetch_weekly_counts(rows, week_start, week_end)
         results = []
-        for user_info in users:
-            boj_handle = user_info.get('boj_handle')
-            if not boj_handle or boj_handle == '미등록':
+        for row in rows:
+            if row.get('failed'):
+                print(f"[주간 현황] {row['boj_handle']} 조회 오류: {row['error']}")
                 continue
-            
-            try:
-                solved_data = await get_weekly_solved_count(boj_handle, week_start, week_end)
-                results.append({
-                    'username': user_info['username'],
-                    'boj_handle': boj_handle,
-                    'solved_count': solved_data['count'],
-                    'problems': solved_data['problems']
-                })
-            except Exception as e:
-                print(f"[주간 현황] {boj_handle} 조회 오류: {e}")
+            results.append(row)
         
         # 결과 정렬 (해결한 문제 수 많은 순)
         results.sort(key=lambda x: x['solved_count'], reverse=True)
@@ -858,54 +811,41 @@ async def update_weekly_status_for_role(role_name: str, bot_instance):
             inline=False
         )
         
-        await message.edit(embed=embed)
+        await edit_if_changed(message, embed)
     except Exception as e:
         print(f"[주간 현황 업데이트 오류] {role_name}: {e}")
 
-@tasks.loop(hours=1)
-async def hourly_weekly_status_update():
-    """매시간 주간 현황 메시지 업데이트 (12시~00시)"""
+async def _weekly_status_units(slot):
+    """매시간 주간 현황 메시지 업데이트 (12시~23시, 역할별 실행 단위)"""
     if not _bot_instance_for_schedule:
-        return
-    
-    current_hour = datetime.now().hour
-    
-    # 12시~23시만 실행 (00시는 월요일 새 메시지 생성 시간)
-    if current_hour < 12 or current_hour >= 24:
-        return
+        return []
     
     # 모든 역할에 대해 업데이트
-    data = load_data()
-    role_tokens = data.get('role_tokens', {})
-    
-    for role_name in role_tokens.keys():
-        await update_weekly_status_for_role(role_name, _bot_instance_for_schedule)
+    role_tokens = await async_db.load_role_tokens()
+    return [
+        WorkItem(role_name, partial(update_weekly_status_for_role, role_name, _bot_instance_for_schedule))
+        for role_name in role_tokens.keys()
+    ]
 
-@tasks.loop(time=time(hour=0, minute=0))
-async def monday_weekly_status_reset():
+async def monday_weekly_status_reset(slot):
     """월요일 00시에 새 주간 현황 메시지 생성"""
     if not _bot_instance_for_schedule:
         return
     
-    # 월요일인지 확인
-    if datetime.now().weekday() != 0:  # 0 = 월요일
-        return
-    
     # 모든 역할에 대해 새 메시지 생성
-    data = load_data()
-    role_tokens = data.get('role_tokens', {})
+    role_tokens = await async_db.load_role_tokens()
     
     for role_name in role_tokens.keys():
         try:
             # 이번 주 월요일 계산
-            today = datetime.now()
+            today = get_kst_now()
             days_since_monday = today.weekday()
             monday = today - timedelta(days=days_since_monday)
             monday = monday.replace(hour=0, minute=0, second=0, microsecond=0)
             sunday = monday + timedelta(days=6, hours=23, minutes=59, seconds=59)
             
             # 기존 메시지가 있으면 채널 찾기
-            old_msg_info = get_weekly_status_message(role_name)
+            old_msg_info = await async_db.get_weekly_status_message(role_name)
             if old_msg_info:
                 channel_id = int(old_msg_info['channel_id'])
                 channel = _bot_instance_for_schedule.get_channel(channel_id)
@@ -919,23 +859,19 @@ async def monday_weekly_status_reset():
                     message = await channel.send(embed=embed)
                     
                     # 새 메시지 정보 저장
-                    save_weekly_status_message(role_name, str(channel.id), str(message.id), monday.strftime('%Y-%m-%d'))
+                    await async_db.save_weekly_status_message(role_name, str(channel.id), str(message.id), monday.strftime('%Y-%m-%d'))
                     
                     # 즉시 업데이트
                     await update_weekly_status_for_role(role_name, _bot_instance_for_schedule)
         except Exception as e:
             print(f"[주간 현황 리셋 오류] {role_name}: {e}")
 
-def start_weekly_status_scheduler(bot_instance):
-    """주간 현황 스케줄러 시작"""
+def register_scheduled_jobs(bot_instance):
+    """주간 현황 갱신 작업 등록 (12시~23시 매시, 월요일 00시 새 메시지)"""
     global _bot_instance_for_schedule
     _bot_instance_for_schedule = bot_instance
     
-    if not hourly_weekly_status_update.is_running():
-        hourly_weekly_status_update.start()
-    
-    if not monday_weekly_status_reset.is_running():
-        monday_weekly_status_reset.start()
-    
-    print("[OK] 주간 문제풀이 현황 스케줄러 시작됨")
+    # 00시는 월요일 새 메시지 생성 시간
+    register_job('role_weekly_status', _weekly_status_units, hours=range(12, 24), priority=6)
+    register_job('role_weekly_reset', run=monday_weekly_status_reset, hours=[0], weekdays=[0], priority=6, spread=0)
 
@@ -3,8 +3,8 @@
 """
 import discord
 from discord.ext import commands
-from common.utils import load_data, save_data
 from common.boj_utils import verify_user_exists
+from common import async_db
 
 def setup(bot):
     """봇에 명령어 등록"""
@@ -12,39 +12,31 @@ def setup(bot):
     @bot.command(name='유저등록')
     async def user_register(ctx, boj_handle: str):
         """유저 등록 (BOJ 핸들 필수)"""
-        data = load_data()
         user_id = str(ctx.author.id)
         
         # BOJ 핸들 검증
-        exists = await verify_user_exists(boj_handle)
+        try:
+            exists = await verify_user_exists(boj_handle)
+        except Exception:
+            await ctx.send("❌ 백준 아이디를 확인하지 못했습니다. (solved.ac 응답 없음) 잠시 후 다시 시도해주세요.")
+            return
         if not exists:
             await ctx.send(f"❌ 백준 아이디 '{boj_handle}'를 찾을 수 없습니다.")
             return
         
-        if user_id not in data['users']:
-            data['users'][user_id] = {
-                'username': str(ctx.author),
-                'boj_handle': boj_handle,
-                'tistory_links': [],
-                'roles': [],
-                'submissions': {}
-            }
-        else:
-            data['users'][user_id]['boj_handle'] = boj_handle
-        
-        save_data(data)
+        user = await async_db.get_user(user_id)
+        username = user['username'] if user else str(ctx.author)
+        await async_db.create_or_update_user(user_id, username, boj_handle)
         await ctx.send(f"✅ 유저 등록이 완료되었습니다!\n**백준 핸들:** {boj_handle}")
 
     @bot.command(name='내정보')
     async def my_info(ctx):
         """내 정보 확인"""
-        from common.database import get_user_roles
         
         user_id = str(ctx.author.id)
         
         # DB에서 사용자 정보 가져오기
-        from common.database import get_user
-        user_db = get_user(user_id)
+        user_db = await async_db.get_user(user_id)
         
         if not user_db:
             await ctx.send("❌ 등록된 정보가 없습니다. `/역할 등록` 명령어로 먼저 등록해주세요.")
@@ -63,11 +55,10 @@ def setup(bot):
             embed.add_field(name="백준 핸들", value="미등록", inline=True)
         
         # 참여 그룹 (역할) 목록
-        roles = get_user_roles(user_id)
+        roles = await async_db.get_user_roles(user_id)
         if roles:
             # 그룹 이름도 함께 표시
-            data = load_data()
-            studies = data.get('studies', {})
+            studies = await async_db.load_studies()
             group_info = []
             for role_name in roles:
                 study_data = studies.get(role_name, {})
@@ -82,10 +73,9 @@ def setup(bot):
         else:
             embed.add_field(name="참여 그룹", value="없음", inline=False)
         
-        # 제출한 링크 수 (기존 JSON 데이터에서)
-        data = load_data()
-        user_data = data.get('users', {}).get(user_id, {})
-        embed.add_field(name="제출한 링크 수", value=f"{len(user_data.get('tistory_links', []))}개", inline=True)
+        # 제출한 링크 수
+        blog_links = await async_db.get_user_blog_links(user_id)
+        embed.add_field(name="제출한 링크 수", value=f"{len(blog_links)}개", inline=True)
         
         await ctx.send(embed=embed)
 
@@ -36,6 +36,10 @@ class KoalaBot(commands.Bot):
         discord.py가 내부 이벤트 루프를 준비한 뒤 호출됨.
         persistent view 등록은 여기서 해야 'no running event loop'가 나지 않음.
         """
+        # solved.ac / BOJ 공용 HTTP 세션 (커넥션 풀)
+        from common.http_client import init_http_client
+        await init_http_client()
+
         from domain.role import register_persistent_view
         from domain.channel import register_group_weekly_views, register_all_assignment_status_views
         from domain.link_submission import register_link_submission_views
@@ -46,6 +50,18 @@ class KoalaBot(commands.Bot):
         register_all_assignment_status_views(self)
         print("[OK] Persistent views 등록 완료")
 
+    async def close(self) -> None:
+        """봇 종료 시 공용 HTTP 세션과 DB 연결도 함께 정리"""
+        from common.http_client import close_http_client
+        from common.database import close_all_connections
+        from common import async_db
+        try:
+            await close_http_client()
+            async_db.shutdown()
+            close_all_connections()
+        finally:
+            await super().close()
+
 
 bot = KoalaBot(command_prefix='/', intents=intents)
 
@@ -64,17 +80,14 @@ async def on_ready():
     except Exception as e:
         logger.error(f"[봇 시작] 만료된 과제 정리 중 오류: {e}", exc_info=True)
     
-    # 스케줄러는 이벤트 루프가 준비된 뒤 시작
-    from domain.role import start_weekly_status_scheduler
-    from domain.channel import start_group_weekly_scheduler
-    from domain.link_submission import start_link_submission_scheduler
-    from domain.problem_set import start_problem_set_scheduler, start_mock_test_scheduler
-
-    start_weekly_status_scheduler(bot)
-    start_group_weekly_scheduler(bot)
-    start_link_submission_scheduler(bot)
-    start_problem_set_scheduler(bot)
-    start_mock_test_scheduler(bot)
+    # 스케줄러는 이벤트 루프가 준비된 뒤 시작 (각 모듈의 작업을 등록한 뒤 통합 스케줄러 시작)
+    from domain import role, channel, link_submission, problem_set
+    from common import backup
+    from common.scheduler import start_scheduler
+
+    for module in (role, channel, link_submission, problem_set, backup):
+        module.register_scheduled_jobs(bot)
+    start_scheduler()
 
 @bot.event
 async def on_command_error(ctx, error):